@@ -0,0 +1,44 @@
+"""Store ctr_feedback CTR values as numeric columns
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b2c3d4e5f6
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, None] = "a7b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = (("predicted_ctr", False), ("actual_ctr", True), ("error", True))
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("ctr_feedback") as batch_op:
+        for name, nullable in _COLUMNS:
+            batch_op.alter_column(
+                name,
+                existing_type=sa.String(20),
+                type_=sa.Float(),
+                existing_nullable=nullable,
+                postgresql_using=f"{name}::double precision",
+            )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("ctr_feedback") as batch_op:
+        for name, nullable in _COLUMNS:
+            batch_op.alter_column(
+                name,
+                existing_type=sa.Float(),
+                type_=sa.String(20),
+                existing_nullable=nullable,
+                postgresql_using=f"{name}::varchar(20)",
+            )
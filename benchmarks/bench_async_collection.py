@@ -0,0 +1,147 @@
+"""
+데이터 수집/댓글 분석 비동기 경로 오버헤드 벤치마크 (네트워크 없음)
+
+실행: PYTHONPATH=src python benchmarks/bench_async_collection.py [--runs 200]
+
+기존 구현은 실행마다
+  - collect_all_data를 asyncio.to_thread로 넘긴 뒤 워커 스레드에서 새 이벤트 루프를 만들어
+    PipelineOrchestrator.run_pipeline을 실행하고
+  - CommentAnalysisService가 ThreadPoolExecutor + asyncio.run으로 같은 작업을 반복했다.
+현재 구현은 호출 측 루프에서 바로 await 한다. 둘 다 즉시 끝나는 오케스트레이터로
+실행당 순수 오버헤드(시간, 생성된 스레드/이벤트 루프 수)를 비교한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.concurrency import run_coroutine_sync
+
+
+class InstantOrchestrator:
+    async def run_pipeline(self, comments):
+        await asyncio.sleep(0)
+        return {"insights": comments[:3], "stats": {}}
+
+
+COMMENTS = [{"text": f"댓글 {i}", "likes": i} for i in range(50)]
+
+
+def legacy_data_collection_run_async(coro):
+    """기존 DataCollectionService._run_async (루프 안에서 호출되면 스레드 + 새 루프)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        try:
+            asyncio.set_event_loop(loop)
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+    box = {}
+
+    def runner():
+        loop = asyncio.new_event_loop()
+        try:
+            asyncio.set_event_loop(loop)
+            box["result"] = loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    thread = threading.Thread(target=runner, daemon=True)
+    thread.start()
+    thread.join()
+    return box["result"]
+
+
+def legacy_comment_analysis_run_async(coro):
+    """기존 CommentAnalysisService._run_async"""
+    try:
+        asyncio.get_running_loop()
+        running = True
+    except RuntimeError:
+        running = False
+    if running:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+    return asyncio.run(coro)
+
+
+class Counters:
+    """실행 중 생성된 스레드/이벤트 루프 수 집계"""
+
+    def __init__(self) -> None:
+        self.threads = 0
+        self.loops = 0
+
+    def __enter__(self):
+        self._thread_start = threading.Thread.start
+        self._new_loop = asyncio.events.new_event_loop
+        counters = self
+
+        def start(thread, *args, **kwargs):
+            counters.threads += 1
+            return counters._thread_start(thread, *args, **kwargs)
+
+        def new_event_loop():
+            counters.loops += 1
+            return counters._new_loop()
+
+        threading.Thread.start = start
+        asyncio.events.new_event_loop = new_event_loop
+        asyncio.new_event_loop = new_event_loop
+        return self
+
+    def __exit__(self, *exc):
+        threading.Thread.start = self._thread_start
+        asyncio.events.new_event_loop = self._new_loop
+        asyncio.new_event_loop = self._new_loop
+
+
+async def legacy_run(orchestrator: InstantOrchestrator) -> None:
+    def collect():
+        return legacy_data_collection_run_async(orchestrator.run_pipeline(COMMENTS))
+
+    await asyncio.to_thread(collect)
+    legacy_comment_analysis_run_async(orchestrator.run_pipeline(COMMENTS))
+
+
+async def native_run(orchestrator: InstantOrchestrator) -> None:
+    await orchestrator.run_pipeline(COMMENTS)
+    await orchestrator.run_pipeline(COMMENTS)
+
+
+async def measure(label: str, run, runs: int) -> None:
+    orchestrator = InstantOrchestrator()
+    await run(orchestrator)  # 워밍업 (to_thread 기본 풀 생성 등)
+    with Counters() as counters:
+        started = time.perf_counter()
+        for _ in range(runs):
+            await run(orchestrator)
+        elapsed = time.perf_counter() - started
+    print(
+        f"  {label}: {elapsed / runs * 1e6:9.1f} us/run, "
+        f"스레드 {counters.threads / runs:.1f}개/run, 이벤트 루프 {counters.loops / runs:.1f}개/run"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"[파이프라인 실행 {args.runs}회: 수집 단계 + 심층 댓글 분석]")
+    asyncio.run(measure("기존 (스레드 + 새 루프)", legacy_run, args.runs))
+    asyncio.run(measure("현재 (호출 측 루프)", native_run, args.runs))
+    # 동기 호환 경로는 루프 밖에서 호출하면 루프 1개만 생성
+    with Counters() as counters:
+        run_coroutine_sync(InstantOrchestrator().run_pipeline(COMMENTS))
+    print(f"  동기 래퍼 (루프 밖): 스레드 {counters.threads}개, 이벤트 루프 {counters.loops}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+댓글 규칙 기반 분석 처리량 벤치마크 (네트워크/AI 없음)
+
+실행: PYTHONPATH=src python benchmarks/bench_comment_analytics.py [--comments 200000] [--chunk 5000]
+
+합성 댓글 N개(고유 어휘가 계속 늘어나는 긴 꼬리 포함)를 청크 단위로 처리하고
+처리량(댓글/초)과 n-gram 요약 크기(capacity로 고정)를 출력한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from services.comment_analysis_service import CommentAnalysisService
+
+WORDS = [
+    "가격이", "배송은", "효과가", "피부에", "제품을", "사용감이", "향기도", "용량이",
+    "포장은", "색상이", "좋아요", "별로예요", "만족해요", "고민이에요", "추천합니다",
+    "어디서", "사나요", "괜찮네요",
+]
+
+
+def synthetic_comments(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    for i in range(count):
+        words = rng.choices(WORDS, k=rng.randint(4, 14))
+        # 긴 꼬리 어휘 (고유 토큰이 계속 늘어나는 상황)
+        tail = chr(0xAC00 + rng.randrange(11172)) + chr(0xAC00 + rng.randrange(11172))
+        words.append("모델" + tail)
+        text = " ".join(words) + ("?" if i % 7 == 0 else "")
+        yield {"text": text, "likes": i % 13}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--comments", type=int, default=200000)
+    parser.add_argument("--chunk", type=int, default=5000)
+    args = parser.parse_args()
+
+    service = CommentAnalysisService(gemini_client=None)
+    analyzer = service.create_stream_analyzer()
+    started = time.perf_counter()
+    analyzer.feed_stream((c["text"] for c in synthetic_comments(args.comments)), args.chunk)
+    elapsed = time.perf_counter() - started
+    result = analyzer.result()
+
+    print(f"[댓글 {args.comments:,}개, 청크 {args.chunk}]")
+    print(f"  처리 시간 : {elapsed:8.2f} s  ({args.comments / elapsed:,.0f} 댓글/초)")
+    sizes = {n: len(summary) for n, summary in analyzer._ngrams.items()}
+    print(f"  n-gram 요약 크기: {sizes}")
+    print(f"  상위 키워드: {[k['word'] for k in result['top_keywords'][:5]]}")
+    print(f"  상위 2-gram: {[k['word'] for k in result['top_bigrams'][:3]]}")
+
+
+if __name__ == "__main__":
+    main()
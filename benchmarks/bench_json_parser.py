@@ -0,0 +1,101 @@
+"""
+LLM JSON 파서 벤치마크 (대용량 Hydration 응답)
+
+실행: PYTHONPATH=src python benchmarks/bench_json_parser.py [--batches 200]
+
+기존 구현(정규식 다중 패스 + 문자 단위 괄호 매칭)과 utils.json_parser를 비교합니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import timeit
+
+from utils.json_parser import backend_name, extract_json, parse_llm_json
+
+
+def _legacy_extract_first_json_object(text: str) -> str | None:
+    start = text.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == "{":
+            depth += 1
+        elif text[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : i + 1]
+    return None
+
+
+def _legacy_validate_json_output(text: str) -> dict:
+    text = re.sub(r"```json\s*", "", text)
+    text = re.sub(r"```\s*", "", text)
+    text = text.strip()
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        json_str = _legacy_extract_first_json_object(text)
+        if not json_str:
+            return {"error": "JSON을 찾을 수 없음"}
+        json_str = re.sub(r",\s*}", "}", json_str)
+        json_str = re.sub(r",\s*]", "]", json_str)
+        try:
+            return json.loads(json_str)
+        except json.JSONDecodeError:
+            return {"error": "JSON 파싱 실패"}
+
+
+def build_hydration_response(batches: int) -> str:
+    """Hydration 프롬프트 형식의 대용량 응답 (설명문 + 코드 블록 + 끝 쉼표)"""
+    results = []
+    for i in range(batches * 5):
+        results.append(
+            {
+                "index": i,
+                "features": {
+                    "purchase_intent": 0.8,
+                    "constructive_feedback": 0.4,
+                    "viral_potential": 0.3,
+                    "keywords": ["가격 {할인}", "배송", "효과"],
+                    "topics": ["리뷰", "비교"],
+                },
+            }
+        )
+    body = json.dumps({"results": results}, ensure_ascii=False, indent=2)
+    body = body.replace("\n  ]\n}", ",\n  ]\n}")  # 흔한 끝 쉼표 오류
+    return f"분석 결과입니다.\n```json\n{body}\n```\n추가 설명 {{참고}}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batches", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    text = build_hydration_response(args.batches)
+    clean = text.replace(",\n  ]\n}", "\n  ]\n}")
+    truncated = text[: int(len(text) * 0.7)]
+
+    print(f"backend={backend_name()} size={len(text) / 1024:.0f}KB")
+    for case, sample in (("clean", clean), ("trailing-comma", text)):
+        assert _legacy_validate_json_output(sample) == parse_llm_json(sample), "결과 불일치"
+        for label, func in (
+            ("legacy", lambda s=sample: _legacy_validate_json_output(s)),
+            ("json_parser", lambda s=sample: parse_llm_json(s)),
+        ):
+            best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+            print(f"{case:15s} {label:12s} {best * 1000:8.2f} ms")
+
+    partial = extract_json(truncated, allow_partial=True) or {}
+    print(
+        f"truncated(70%): legacy={_legacy_validate_json_output(truncated).get('error')} "
+        f"recovered={len(partial.get('results', []))}/{args.batches * 5} results"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+YouTube 클라이언트 콜드 스타트/메타데이터 조회 벤치마크 (네트워크 없음)
+
+실행: PYTHONPATH=src python benchmarks/bench_youtube_client.py [--threads 8] [--videos 120]
+
+1) 클라이언트 생성: 기존 build("youtube", "v3") vs 공유 정적 디스커버리 문서 + build_from_document
+   (워커 스레드마다 클라이언트를 만들므로 스레드 수만큼 반복)
+2) 영상 N개 상세 조회 시 videos.list 요청 수: 영상별 1회 vs 50개 단위 일괄
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import time
+
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpMockSequence
+
+import infrastructure.clients.youtube_client as youtube_client
+
+
+def bench_cold_start(threads: int) -> None:
+    started = time.perf_counter()
+    for _ in range(threads):
+        build("youtube", "v3", developerKey="bench", cache_discovery=False)
+    legacy = time.perf_counter() - started
+
+    importlib.reload(youtube_client)  # 공유 문서 캐시 초기화 (콜드 상태)
+    started = time.perf_counter()
+    for _ in range(threads):
+        youtube_client.build_from_document(
+            youtube_client._youtube_discovery_doc(), developerKey="bench"
+        )
+    shared = time.perf_counter() - started
+
+    print(f"[클라이언트 생성 x{threads}]")
+    print(f"  build()                 : {legacy * 1000:8.1f} ms")
+    print(f"  정적 문서 1회 파싱 공유 : {shared * 1000:8.1f} ms  ({legacy / shared:.1f}x)")
+
+
+def bench_batching(videos: int) -> None:
+    ids = [f"vid{i:04d}" for i in range(videos)]
+
+    def fake_http(batches: list[list[str]]) -> HttpMockSequence:
+        return HttpMockSequence(
+            [
+                (
+                    {"status": "200"},
+                    json.dumps(
+                        {
+                            "items": [
+                                {
+                                    "id": vid,
+                                    "snippet": {
+                                        "title": vid,
+                                        "description": "",
+                                        "channelTitle": "c",
+                                        "publishedAt": "2026-10-01T00:00:00Z",
+                                    },
+                                    "statistics": {"viewCount": "1"},
+                                }
+                                for vid in batch
+                            ]
+                        }
+                    ),
+                )
+                for batch in batches
+            ]
+        )
+
+    doc = youtube_client._youtube_discovery_doc()
+
+    per_video = build_client(doc, fake_http([[vid] for vid in ids]))
+    started = time.perf_counter()
+    for vid in ids:
+        per_video.videos().list(part="snippet,statistics", id=vid).execute()
+    legacy = time.perf_counter() - started
+
+    batches = [ids[i : i + 50] for i in range(0, len(ids), 50)]
+    client = youtube_client.YouTubeClient(api_key="bench")
+    client._get_client = lambda: build_client(doc, fake_http(batches))
+    started = time.perf_counter()
+    details = client.get_videos_details(ids)
+    batched = time.perf_counter() - started
+    assert len(details) == videos
+
+    print(f"[영상 {videos}개 상세 조회]")
+    print(f"  영상별 videos.list : 요청 {len(ids):4d}회 ({len(ids)} units), {legacy * 1000:7.1f} ms")
+    print(
+        f"  50개 단위 일괄     : 요청 {len(batches):4d}회 ({len(batches)} units), "
+        f"{batched * 1000:7.1f} ms (실제 네트워크에서는 왕복 횟수만큼 차이)"
+    )
+
+
+def build_client(doc, http):
+    return youtube_client.build_from_document(doc, http=http, developerKey="bench")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--videos", type=int, default=120)
+    args = parser.parse_args()
+
+    bench_cold_start(args.threads)
+    bench_batching(args.videos)
+
+
+if __name__ == "__main__":
+    main()
@@ -87,7 +87,8 @@ export interface GeneratedContent {
   thumbnail_url?: string;
   multi_thumbnails?: GeneratedThumbnail[];
   video_url?: string;
-  video_bytes?: string; // base64
+  video_path?: string;
+  video_gcs_uri?: string;
 }
 
 export interface PipelineResultDetails {
@@ -2,15 +2,14 @@
 제네시스코리아 API Utilities & Exports
 """
 
-import json
 import logging
-import re
 import time
 from collections.abc import Callable
 from typing import Any
 
 from config.constants import HOOK_TEMPLATES, HOOK_TYPES
 from core.prompts.veo_prompt_engine import VeoPromptEngine
+from utils.json_parser import parse_llm_json
 
 logger = logging.getLogger(__name__)
 
@@ -54,30 +53,6 @@ def retry_with_backoff(
 # === 2. Validation Utilities ===
 
 
-def _extract_first_json_object(text: str) -> str | None:
-    """첫 번째 완전한 { ... } 블록만 추출 (중첩 괄호 대응)."""
-    start = text.find("{")
-    if start == -1:
-        return None
-    depth = 0
-    for i in range(start, len(text)):
-        if text[i] == "{":
-            depth += 1
-        elif text[i] == "}":
-            depth -= 1
-            if depth == 0:
-                return text[start : i + 1]
-    return None
-
-
-def _fix_common_json_issues(raw: str) -> str:
-    """LLM이 자주 내는 JSON 오류 보정 (끝 쉼표 등)."""
-    # trailing comma before } or ]
-    raw = re.sub(r",\s*}", "}", raw)
-    raw = re.sub(r",\s*]", "]", raw)
-    return raw
-
-
 def validate_json_output(
     text: str,
     required_fields: list[str] | None = None,
@@ -90,33 +65,7 @@ def validate_json_output(
     - 끝 쉼표 등 흔한 오류 보정 후 파싱
     - 필수 필드 확인
     """
-    # 1. 마크다운 코드 블록 제거
-    text = re.sub(r"```json\s*", "", text)
-    text = re.sub(r"```\s*", "", text)
-    text = text.strip()
-
-    result: dict[str, Any] = {}
-    json_str: str | None = None
-
-    try:
-        result = json.loads(text)
-    except json.JSONDecodeError:
-        json_str = _extract_first_json_object(text)
-        if json_str:
-            fixed = _fix_common_json_issues(json_str)
-            try:
-                result = json.loads(fixed)
-            except json.JSONDecodeError:
-                return {"error": "JSON 파싱 실패", "raw_text": text[:500]}
-        else:
-            return {"error": "JSON을 찾을 수 없음", "raw_text": text[:500]}
-
-    if required_fields:
-        missing = [f for f in required_fields if f not in result]
-        if missing:
-            result["_validation_warning"] = f"누락된 필드: {missing}"
-
-    return result
+    return parse_llm_json(text, required_fields=required_fields)
 
 
 # === 3. Hook Utilities ===
@@ -3,6 +3,10 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 
+# config/core/utils는 src. 접두어 없이 import: 서비스 계층과 같은 모듈 인스턴스
+# (서비스 컨테이너/프롬프트 레지스트리/API 캐시)를 봐야 통계가 공유된다
+from config.dependencies import get_services as get_app_services
+from core.prompts import prompt_registry
 from src.api.deps import CurrentUser, get_scheduler_client, require_role
 from src.config.dependencies import get_services
 from src.core.audit import record_audit_log
@@ -12,7 +16,7 @@ from src.infrastructure.database.models import PipelineSchedule
 from src.schemas.requests import RoleCreateRequest, ScheduleRequest, TeamCreateRequest
 from src.schemas.responses import ScheduleResponse
 from src.services.scheduler_service import SchedulerService
-from src.utils.cache import clear_all_api_cache, get_cache_stats
+from utils.cache import clear_all_api_cache, clear_api_cache_namespace, get_cache_stats
 
 router = APIRouter()
 
@@ -21,17 +25,33 @@ router = APIRouter()
 async def get_cache_stats_endpoint(
     user: Annotated[CurrentUser, Depends(require_role(["admin"]))],
 ):
-    return {"stats": get_cache_stats()}
+    return {
+        "stats": get_cache_stats(),
+        "collection_snapshots": get_app_services().collection_snapshot_store.stats(),
+    }
 
 
 @router.post("/cache/clear")
 async def clear_cache_endpoint(
     user: Annotated[CurrentUser, Depends(require_role(["admin"]))],
+    namespace: str | None = None,
 ):
+    if namespace:
+        cleared = clear_api_cache_namespace(namespace)
+        return {"cleared": cleared, "namespace": namespace}
     cleared = clear_all_api_cache()
     return {"cleared": cleared}
 
 
+@router.post("/cache/warm")
+async def warm_cache_endpoint(
+    user: Annotated[CurrentUser, Depends(require_role(["admin"]))],
+):
+    """다가오는 스케줄의 수집 데이터 캐시 예열 (1회 주기 즉시 실행)"""
+    report = await get_app_services().cache_warmer.warm_upcoming()
+    return {"warmed": report}
+
+
 from src.services.admin_service import AdminService
 
 # ... (Previous imports kept if needed, removing unused)
@@ -178,9 +198,9 @@ async def get_prompt_logs(
     user: Annotated[CurrentUser, Depends(require_role(["admin"]))], limit: int = 20
 ):
     services = get_services()
-    history = services.history_service.get_history_list()
+    history, _ = services.history_service.query_history(limit=max(1, min(limit, 50)))
     logs = []
-    for item in history[: max(1, min(limit, 50))]:
+    for item in history:
         record = services.history_service.load_history(item.get("id", ""))
         prompt_log = getattr(record, "prompt_log", None) if record else None
         logs.append(
@@ -194,6 +214,14 @@ async def get_prompt_logs(
     return {"logs": logs}
 
 
+@router.get("/prompts/usage")
+async def get_prompt_usage(
+    user: Annotated[CurrentUser, Depends(require_role(["admin"]))],
+):
+    """템플릿별 누적 렌더링 횟수/크기/추정 토큰"""
+    return {"templates": prompt_registry.usage_report()}
+
+
 # 스케줄 목록 조회
 @router.get("/schedules", response_model=list[ScheduleResponse])
 async def list_schedules(
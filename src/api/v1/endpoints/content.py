@@ -1,9 +1,12 @@
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 
 from api.deps import CurrentUser
 from config.dependencies import get_services
 from config.products import get_product_by_name
 from core.exceptions import ThumbnailGenerationError
+from core.models import VideoArtifact
 from infrastructure.clients.veo_client import AdvancedPromptBuilder
 from schemas.requests import (
     HookGenerateRequest,
@@ -14,8 +17,8 @@ from schemas.requests import (
 from utils.gcs_store import (
     build_gcs_prefix,
     detect_image_ext,
-    detect_video_ext,
     gcs_url_for,
+    transfer_video,
 )
 from utils.logger import get_logger
 
@@ -246,22 +249,23 @@ async def generate_video(request: VideoGenerateRequest, user: CurrentUser):
                 prompt_builder.ambient = request.ambient
 
             prompt = prompt_builder.build()
-    video_result = services.video_service.generate(
+    video_result = await services.video_service.generate_async(
         prompt=prompt,
         duration_seconds=request.duration_seconds,
         resolution=request.resolution,
     )
 
-    if isinstance(video_result, bytes):
+    if isinstance(video_result, VideoArtifact):
         storage = services.storage_service
         storage.ensure_bucket()
         prefix = build_gcs_prefix(product_dict, "video")
-        ext = detect_video_ext(video_result)
-        gcs_path = f"{prefix}/video{ext}"
-        storage.upload(
-            data=video_result,
-            path=gcs_path,
-            content_type="video/mp4" if ext == ".mp4" else "application/octet-stream",
+        gcs_path = f"{prefix}/video.mp4"
+        await asyncio.to_thread(
+            transfer_video,
+            storage,
+            gcs_path,
+            gcs_uri=video_result.gcs_uri,
+            local_path=video_result.local_path,
         )
         url = gcs_url_for(storage, gcs_path)
         return {"url": url, "gcs_path": gcs_path, "prompt": prompt}
@@ -285,13 +289,13 @@ async def extend_video(request: VideoExtendRequest, user: CurrentUser):
         bucket = settings.gcp.gcs_bucket_name
         video_uri = f"gs://{bucket}/{video_uri.lstrip('/')}"
 
-    video_result = services.video_service.extend_generated_video(
+    video_result = await services.video_service.extend_generated_video_async(
         video_uri=video_uri,
         prompt=request.prompt,
         duration_seconds=request.duration_seconds,
     )
 
-    if isinstance(video_result, bytes):
+    if isinstance(video_result, VideoArtifact):
         storage = services.storage_service
         storage.ensure_bucket()
 
@@ -300,14 +304,15 @@ async def extend_video(request: VideoExtendRequest, user: CurrentUser):
 
         date_str = datetime.now().strftime("%Y%m%d")
         file_id = str(uuid.uuid4())[:8]
-        ext = detect_video_ext(video_result)
         # Organized path for extensions
-        gcs_path = f"extensions/{date_str}/ext_{file_id}{ext}"
-
-        storage.upload(
-            data=video_result,
-            path=gcs_path,
-            content_type="video/mp4" if ext == ".mp4" else "application/octet-stream",
+        gcs_path = f"extensions/{date_str}/ext_{file_id}.mp4"
+
+        await asyncio.to_thread(
+            transfer_video,
+            storage,
+            gcs_path,
+            gcs_uri=video_result.gcs_uri,
+            local_path=video_result.local_path,
         )
         url = gcs_url_for(storage, gcs_path)
         return {"url": url, "gcs_path": gcs_path, "prompt": request.prompt}
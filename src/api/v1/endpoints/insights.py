@@ -93,8 +93,7 @@ async def ingest_naver_insights(
         "period_end": request.period_end,
     }
     try:
-        result = await asyncio.to_thread(
-            services.insight_external_service.ingest_naver,
+        result = await services.insight_external_service.ingest_naver_async(
             request.query,
             request.max_results,
             request.include_products,
@@ -2,6 +2,7 @@ import json
 from datetime import datetime
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from api.deps import CurrentUser, OptionalUser
 from config.dependencies import get_services
@@ -33,18 +34,12 @@ async def create_lead(request: LeadRequest):
     return {"status": "ok"}
 
 
-@router.post("/chat")
-async def chat(
-    chat_request: ChatRequest,
-    http_request: Request,
-    user: OptionalUser = None,
-):
+def _resolve_chat_data_store(http_request: Request, user) -> str | None:
     """
-    Chat endpoint with optional authentication.
-    - Authenticated users: unlimited access with role-based data store
-    - Non-authenticated users: limited to 3 requests per IP with guest data store
+    Resolve the RAG data store for a chat request.
+    - Authenticated users: role-based data store
+    - Non-authenticated users: rate limited (3 per IP), guest data store
     """
-    services = get_services()
     settings = get_settings()
 
     # Get client IP address
@@ -67,9 +62,25 @@ async def chat(
         if not data_store_id:
             # Fallback to default data store if guest not configured
             data_store_id = settings.rag_data_stores.get("editor")
-    else:
-        # Authenticated user - use role-based data store
-        data_store_id = settings.rag_data_stores.get(getattr(user, "role", "editor"))
+        return data_store_id
+
+    # Authenticated user - use role-based data store
+    return settings.rag_data_stores.get(getattr(user, "role", "editor"))
+
+
+@router.post("/chat")
+async def chat(
+    chat_request: ChatRequest,
+    http_request: Request,
+    user: OptionalUser = None,
+):
+    """
+    Chat endpoint with optional authentication.
+    - Authenticated users: unlimited access with role-based data store
+    - Non-authenticated users: limited to 3 requests per IP with guest data store
+    """
+    services = get_services()
+    data_store_id = _resolve_chat_data_store(http_request, user)
 
     reply = services.chatbot_service.generate_reply(
         message=chat_request.message,
@@ -79,6 +90,38 @@ async def chat(
     return reply
 
 
+@router.post("/chat/stream")
+async def chat_stream(
+    chat_request: ChatRequest,
+    http_request: Request,
+    user: OptionalUser = None,
+):
+    """
+    Streaming chat endpoint (Server-Sent Events).
+    Emits `session`, `sources`, `token` events and a final `done` event
+    carrying the same payload as `/chat`.
+    """
+    services = get_services()
+    data_store_id = _resolve_chat_data_store(http_request, user)
+
+    events = services.chatbot_service.stream_reply(
+        message=chat_request.message,
+        session_id=chat_request.session_id or "",
+        data_store_id=data_store_id,
+    )
+
+    def event_generator():
+        for item in events:
+            payload = json.dumps(item["data"], ensure_ascii=False)
+            yield f"event: {item['event']}\ndata: {payload}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/refresh-url")
 async def refresh_signed_url(request: RefreshUrlRequest):
     services = get_services()
@@ -1,10 +1,10 @@
 import asyncio
 import json
-from datetime import datetime
+from datetime import date, datetime
 from typing import Annotated, Any
 from uuid import uuid4
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
 from api.deps import CurrentUser, require_role
@@ -27,6 +27,9 @@ from utils.file_store import ensure_output_dir
 
 router = APIRouter()
 
+# /history 페이지 크기 상한
+HISTORY_PAGE_MAX = 500
+
 
 def _get_task_status_and_result(task_id: str) -> tuple[dict[str, Any], dict[str, Any]]:
     status = PIPELINE_STATUS.get(task_id)
@@ -44,9 +47,33 @@ def _extract_collected_data(result: dict[str, Any]) -> dict[str, Any]:
 
 
 @router.get("/history")
-async def get_pipeline_history(user: CurrentUser):
+async def get_pipeline_history(
+    user: CurrentUser,
+    product: str | None = None,
+    success: bool | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    cursor: str | None = None,
+    limit: Annotated[int | None, Query(ge=1, le=HISTORY_PAGE_MAX)] = None,
+):
+    """
+    실행 히스토리 목록 (최신순)
+
+    limit을 주면 next_cursor로 다음 페이지를 이어 조회한다.
+    진행 중(메모리) 작업은 첫 페이지에만 필터를 적용해 합친다.
+    """
     services = get_services()
-    history_items = services.history_service.get_history_list()
+    try:
+        history_items, next_cursor = services.history_service.query_history(
+            product=product,
+            success=success,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     history_tasks = []
     for item in history_items:
@@ -70,6 +97,8 @@ async def get_pipeline_history(user: CurrentUser):
             "updated_at": task.get("updated_at"),
         }
         for task in PIPELINE_STATUS.values()
+        if cursor is None
+        and _matches_history_filter(task, product, success, date_from, date_to)
     ]
 
     tasks_by_id = {
@@ -82,7 +111,25 @@ async def get_pipeline_history(user: CurrentUser):
 
     tasks = list(tasks_by_id.values())
     tasks.sort(key=lambda item: item.get("updated_at") or "", reverse=True)
-    return {"tasks": tasks}
+    return {"tasks": tasks, "next_cursor": next_cursor}
+
+
+def _matches_history_filter(
+    task: dict[str, Any],
+    product: str | None,
+    success: bool | None,
+    date_from: date | None,
+    date_to: date | None,
+) -> bool:
+    if product is not None and task.get("product") != product:
+        return False
+    # 진행 중(queued/running) 작업은 성공/실패 어느 쪽에도 속하지 않음
+    if success is not None and task.get("status") != ("success" if success else "failed"):
+        return False
+    day = str(task.get("created_at") or "")[:10]
+    if date_from is not None and day < date_from.isoformat():
+        return False
+    return date_to is None or day <= date_to.isoformat()
 
 
 @router.get("/status/{task_id}")
@@ -283,7 +330,7 @@ async def analyze_comments_deep(request: AnalysisTaskRequest):
     comments = youtube_data.get("comments", [])
     if not comments:
         raise HTTPException(status_code=400, detail="No comments available")
-    analysis = services.comment_analysis_service.analyze_with_ai(comments)
+    analysis = await services.comment_analysis_service.analyze_with_ai_async(comments)
     return {"analysis": analysis}
 
 
@@ -291,6 +338,24 @@ async def analyze_comments_deep(request: AnalysisTaskRequest):
 async def predict_ctr(request: CTRPredictRequest):
     services = get_services()
     _, result = _get_task_status_and_result(request.task_id)
+
+    # 경쟁 제목 색인 카테고리: 요청 값 우선, 없으면 작업 제품의 카테고리
+    product = get_product_by_name(result.get("product_name", ""))
+    category = request.category or (product.category if product else "general")
+
+    # 배치 형태: A/B 후보 전체를 한 번에 채점 (AI 분석 없이 휴리스틱 점수만)
+    if request.variations:
+        predictions = services.ctr_predictor.predict_batch(
+            [v.model_dump(exclude_unset=True) for v in request.variations],
+            competitor_titles=request.competitor_titles,
+            thumbnail_description=request.thumbnail_description,
+            top_k=request.top_k,
+            category=category,
+        )
+        return {"predictions": predictions, "total": len(request.variations)}
+    if not request.title:
+        raise HTTPException(status_code=400, detail="title 또는 variations가 필요합니다.")
+
     collected = _extract_collected_data(result)
     top_insights = collected.get("top_insights", [])
     try:
@@ -304,12 +369,14 @@ async def predict_ctr(request: CTRPredictRequest):
             title=request.title,
             thumbnail_description=request.thumbnail_description,
             competitor_titles=request.competitor_titles,
+            category=category,
         )
 
     basic = services.ctr_predictor.predict_ctr(
         title=request.title,
         thumbnail_description=request.thumbnail_description,
         competitor_titles=request.competitor_titles,
+        category=category,
     )
     ai_prediction.update(
         {
@@ -320,6 +387,8 @@ async def predict_ctr(request: CTRPredictRequest):
             "ctr_range": basic.get("ctr_range", ""),
         }
     )
+    if "nearest_competitors" in basic:
+        ai_prediction["nearest_competitors"] = basic["nearest_competitors"]
     return {"prediction": ai_prediction}
 
 
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
+from config.dependencies import get_services
 from config.products import get_product_by_name, get_product_names
 
 router = APIRouter()
@@ -10,6 +11,14 @@ async def list_products():
     return {"products": get_product_names()}
 
 
+@router.get("/{product_name}/price-trend")
+async def get_product_price_trend(
+    product_name: str, days: int = Query(default=30, ge=1, le=365)
+):
+    """저장된 경쟁 상품 가격 시계열 기반 추이"""
+    return get_services().naver_service.get_price_trend(product_name, days)
+
+
 @router.get("/{product_name}")
 async def get_product_detail(product_name: str):
     product = get_product_by_name(product_name)
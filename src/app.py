@@ -1,6 +1,7 @@
 # src/app.py - Refactored for Modular Architecture
+import asyncio
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -9,8 +10,11 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from api.v1.api import api_router
+from config.dependencies import get_services
 from config.settings import get_settings
+from core.prompts.accounting import set_default_json_budget
 from infrastructure.database.connection import init_db
+from utils.cache import configure_api_cache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -22,10 +26,31 @@ async def lifespan(app: FastAPI):
     # Startup
     settings = get_settings()
     settings.setup_environment()
+    set_default_json_budget(settings.app.prompt_json_budget_chars)
+    configure_api_cache(
+        max_entries=settings.app.api_cache_max_entries,
+        max_bytes=settings.app.api_cache_max_bytes,
+    )
     await init_db()
+    # CTR 보정 모델 스냅샷을 미리 읽어 첫 예측 요청 지연을 없앰
+    calibrator = get_services().ctr_calibrator
+    logger.info(f"CTR calibration loaded ({calibrator.sample_count} samples).")
+    warm_task = None
+    if settings.app.cache_warm_enabled:
+        # 예약 실행 직전에 수집 데이터를 캐시에 미리 적재
+        warm_task = asyncio.create_task(
+            get_services().cache_warmer.run_forever(
+                settings.app.cache_warm_interval_seconds
+            )
+        )
     logger.info("Application startup completed.")
     yield
     # Shutdown
+    if warm_task is not None:
+        warm_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await warm_task
+    await get_services().aclose()
     logger.info("Application shutdown.")
 
 
@@ -93,6 +93,18 @@ DEFAULT_YOUTUBE_COUNT: Final[int] = 3
 DEFAULT_NAVER_COUNT: Final[int] = 10
 MAX_YOUTUBE_COUNT: Final[int] = 10
 MAX_NAVER_COUNT: Final[int] = 30
+# YouTube 검색/자막/댓글 동시 요청 상한
+YOUTUBE_FETCH_CONCURRENCY: Final[int] = 8
+# 증분 댓글 수집 시 영상당 최대 페이지 수 (commentThreads 1페이지 = 최대 100개, 1 unit)
+YOUTUBE_COMMENT_PAGE_LIMIT: Final[int] = 20
+# videos.list 1회 요청당 최대 id 수 (API 상한)
+YOUTUBE_VIDEOS_BATCH_SIZE: Final[int] = 50
+
+# 텍스트 모델 동시 호출 상한 (댓글 Hydration/심층 분석이 공유)
+GEMINI_TEXT_MAX_CONCURRENCY: Final[int] = 5
+# 댓글 심층 분석: 프롬프트 1회당 댓글 수, map 단계 최대 청크 수 (비용 상한)
+DEEP_ANALYSIS_CHUNK_SIZE: Final[int] = 70
+DEEP_ANALYSIS_MAX_CHUNKS: Final[int] = 12
 
 # 카메라 모션 (비디오 생성용)
 CAMERA_MOTIONS: Final[list[str]] = [
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 from contextlib import contextmanager
+from datetime import timedelta
 from functools import cached_property
 from typing import TYPE_CHECKING, ClassVar
 
@@ -27,14 +28,22 @@ from core.interfaces.services import (
     IYouTubeService,
 )
 from core.interfaces.storage import IStorageService
+from infrastructure.clients.async_naver_client import AsyncNaverClient
 from infrastructure.clients.discovery_engine_client import DiscoveryEngineClient
 from infrastructure.clients.gemini_client import GeminiClient
 from infrastructure.clients.naver_client import NaverClient
 from infrastructure.clients.veo_client import VeoClient
 from infrastructure.clients.youtube_client import YouTubeClient
+from infrastructure.database.connection import AsyncSessionFactory
+from infrastructure.storage.collection_snapshot_store import CollectionSnapshotStore
+from infrastructure.storage.comment_archive import CommentArchive
+from infrastructure.storage.competitor_title_index import CompetitorTitleStore
 from infrastructure.storage.gcs_storage import GCSStorage
+from infrastructure.storage.price_history_store import PriceHistoryStore
 from services.auth_service import AuthService
+from services.cache_warmer import CacheWarmer
 from services.chatbot_service import ChatbotService
+from services.ctr_calibration import CTRCalibrator
 from services.data_collection_service import DataCollectionService
 from services.history_service import HistoryService
 from services.market_trend_service import MarketTrendService
@@ -52,6 +61,7 @@ from services.rag_ingestion_service import RagIngestionService
 from services.thumbnail_service import ThumbnailService
 from services.video_service import VideoService
 from services.youtube_service import YouTubeService
+from utils.file_store import ensure_output_dir
 
 if TYPE_CHECKING:
     from services.comment_analysis_service import CommentAnalysisService
@@ -86,6 +96,7 @@ class ServiceContainer:
         for name in (
             "youtube_client",
             "naver_client",
+            "async_naver_client",
             "gemini_client",
             "veo_client",
             "storage_service",
@@ -107,9 +118,19 @@ class ServiceContainer:
             "rag_ingestion_service",
             "insight_external_service",
             "insight_report_service",
+            "cache_warmer",
+            "collection_snapshot_store",
+            "competitor_title_store",
+            "ctr_calibrator",
         ):
             self.__dict__.pop(name, None)
 
+    async def aclose(self) -> None:
+        """생성된 비동기 커넥션 풀 종료 (앱 종료 시)"""
+        client = self.__dict__.get("async_naver_client")
+        if client is not None:
+            await client.aclose()
+
     def _get_override(self, key: str, protocol=None):
         value = self._overrides.get(key)
         if value is None:
@@ -126,7 +147,12 @@ class ServiceContainer:
         override = self._get_override("youtube_client", IYouTubeClient)
         if override is not None:
             return override
-        return YouTubeClient(api_key=self._settings.google_api_key)
+        archive = None
+        if self._settings.app.youtube_incremental_comments:
+            archive = CommentArchive(ensure_output_dir() / "youtube_comments")
+        return YouTubeClient(
+            api_key=self._settings.google_api_key, comment_archive=archive
+        )
 
     @cached_property
     def naver_client(self) -> INaverClient:
@@ -138,6 +164,13 @@ class ServiceContainer:
             client_secret=self._settings.naver.client_secret.get_secret_value(),
         )
 
+    @cached_property
+    def async_naver_client(self) -> AsyncNaverClient:
+        return AsyncNaverClient(
+            client_id=self._settings.naver.client_id.get_secret_value(),
+            client_secret=self._settings.naver.client_secret.get_secret_value(),
+        )
+
     @cached_property
     def gemini_client(self) -> IMarketingAIService:
         override = self._get_override("gemini_client", IMarketingAIService)
@@ -146,6 +179,7 @@ class ServiceContainer:
         return GeminiClient(
             project_id=self._settings.gcp.project_id,
             location=self._settings.gcp.location,
+            image_max_concurrency=self._settings.models.gemini_image_max_concurrency,
         )
 
     @cached_property
@@ -194,7 +228,11 @@ class ServiceContainer:
         override = self._get_override("naver_service", INaverService)
         if override is not None:
             return override
-        return NaverService(client=self.naver_client)
+        return NaverService(
+            client=self.naver_client,
+            async_client=self.async_naver_client,
+            price_history=PriceHistoryStore(ensure_output_dir() / "price_history"),
+        )
 
     @cached_property
     def marketing_service(self) -> MarketingService:
@@ -212,7 +250,10 @@ class ServiceContainer:
         override = self._get_override("thumbnail_service", IThumbnailService)
         if override is not None:
             return override
-        return ThumbnailService(client=self.gemini_client)
+        return ThumbnailService(
+            client=self.gemini_client,
+            max_concurrency=self._settings.models.gemini_image_max_concurrency,
+        )
 
     @cached_property
     def video_service(self) -> VideoService:
@@ -228,7 +269,10 @@ class ServiceContainer:
             return override
         from services.hook_service import HookService
 
-        return HookService(gemini_client=self.gemini_client)
+        return HookService(
+            gemini_client=self.gemini_client,
+            competitor_index=self.competitor_title_store,
+        )
 
     @cached_property
     def comment_analysis_service(self) -> CommentAnalysisService:
@@ -239,7 +283,11 @@ class ServiceContainer:
             return override
         from services.comment_analysis_service import CommentAnalysisService
 
-        return CommentAnalysisService(gemini_client=self.gemini_client)
+        return CommentAnalysisService(
+            gemini_client=self.gemini_client,
+            deep_analysis_mode=self._settings.app.comment_deep_analysis_mode,
+            max_chunks=self._settings.app.comment_deep_analysis_max_chunks,
+        )
 
     @cached_property
     def ctr_predictor(self) -> CTRPredictor:
@@ -248,7 +296,11 @@ class ServiceContainer:
             return override
         from services.ctr_predictor import CTRPredictor
 
-        return CTRPredictor(gemini_client=self.gemini_client)
+        return CTRPredictor(
+            gemini_client=self.gemini_client,
+            competitor_index=self.competitor_title_store,
+            calibrator=self.ctr_calibrator,
+        )
 
     @cached_property
     def export_service(self) -> ExportService:
@@ -290,6 +342,7 @@ class ServiceContainer:
             naver_service=self.naver_service,
             pipeline_orchestrator=self.pipeline_orchestrator,
             market_trend_service=self.market_trend_service,
+            competitor_index=self.competitor_title_store,
         )
 
     @cached_property
@@ -306,8 +359,25 @@ class ServiceContainer:
             history_service=self.history_service,
             social_media_service=self.social_media_service,
             rag_ingestion_service=self.rag_ingestion_service,
+            upload_concurrency=self._settings.gcp.gcs_upload_concurrency,
+            snapshot_store=self.collection_snapshot_store,
+        )
+
+    @cached_property
+    def collection_snapshot_store(self) -> CollectionSnapshotStore:
+        return CollectionSnapshotStore(
+            ensure_output_dir() / "collection_snapshots",
+            ttl_seconds=self._settings.app.collection_snapshot_ttl_minutes * 60,
         )
 
+    @cached_property
+    def competitor_title_store(self) -> CompetitorTitleStore:
+        return CompetitorTitleStore(ensure_output_dir() / "competitor_titles")
+
+    @cached_property
+    def ctr_calibrator(self) -> CTRCalibrator:
+        return CTRCalibrator(ensure_output_dir() / "ctr_calibration.json")
+
     @cached_property
     def auth_service(self) -> AuthService:
         override = self._get_override("auth_service")
@@ -347,6 +417,18 @@ class ServiceContainer:
             rag_ingestion=self.rag_ingestion_service,
         )
 
+    @cached_property
+    def cache_warmer(self) -> CacheWarmer:
+        app_settings = self._settings.app
+        return CacheWarmer(
+            youtube_service=self.youtube_service,
+            naver_service=self.naver_service,
+            market_trend_service=self.market_trend_service,
+            session_factory=AsyncSessionFactory,
+            lead_time=timedelta(minutes=app_settings.cache_warm_lead_minutes),
+            youtube_daily_units=app_settings.cache_warm_youtube_daily_units,
+        )
+
 
 def get_services() -> ServiceContainer:
     """서비스 컨테이너 반환"""
@@ -7,6 +7,7 @@ Note: YouTube/Gemini는 Vertex AI를 사용하므로 GCP 서비스 계정으로
 
 import json
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import AliasChoices, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -49,6 +50,9 @@ class GCPSettings(BaseSettings):
     gcs_bucket_name: str | None = Field(
         default=None, validation_alias="GCS_BUCKET_NAME"
     )
+    gcs_upload_concurrency: int = Field(
+        default=4, validation_alias="GCS_UPLOAD_CONCURRENCY"
+    )
     credentials_path: str | None = Field(
         default=None, validation_alias="GOOGLE_APPLICATION_CREDENTIALS"
     )
@@ -85,6 +89,9 @@ class AIModelSettings(BaseSettings):
     veo_model_id: str = Field(
         default="veo-3.1-fast-generate-001", validation_alias="VEO_MODEL_ID"
     )
+    gemini_image_max_concurrency: int = Field(
+        default=4, validation_alias="GEMINI_IMAGE_MAX_CONCURRENCY"
+    )
 
 
 class NotionSettings(BaseSettings):
@@ -165,6 +172,50 @@ class AppSettings(BaseSettings):
         default=0.1,
         validation_alias="RAG_INGESTION_JITTER_SECONDS",
     )
+    prompt_json_budget_chars: int = Field(
+        default=0,
+        validation_alias="PROMPT_JSON_BUDGET_CHARS",
+    )
+    api_cache_max_entries: int = Field(
+        default=10_000,
+        validation_alias="API_CACHE_MAX_ENTRIES",
+    )
+    api_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        validation_alias="API_CACHE_MAX_BYTES",
+    )
+    cache_warm_enabled: bool = Field(
+        default=False,
+        validation_alias="CACHE_WARM_ENABLED",
+    )
+    cache_warm_lead_minutes: int = Field(
+        default=5,
+        validation_alias="CACHE_WARM_LEAD_MINUTES",
+    )
+    cache_warm_interval_seconds: int = Field(
+        default=60,
+        validation_alias="CACHE_WARM_INTERVAL_SECONDS",
+    )
+    cache_warm_youtube_daily_units: int = Field(
+        default=2000,
+        validation_alias="CACHE_WARM_YOUTUBE_DAILY_UNITS",
+    )
+    collection_snapshot_ttl_minutes: int = Field(
+        default=30,
+        validation_alias="COLLECTION_SNAPSHOT_TTL_MINUTES",
+    )
+    youtube_incremental_comments: bool = Field(
+        default=False,
+        validation_alias="YOUTUBE_INCREMENTAL_COMMENTS",
+    )
+    comment_deep_analysis_mode: Literal["sample", "map_reduce"] = Field(
+        default="map_reduce",
+        validation_alias="COMMENT_DEEP_ANALYSIS_MODE",
+    )
+    comment_deep_analysis_max_chunks: int = Field(
+        default=12,
+        validation_alias="COMMENT_DEEP_ANALYSIS_MAX_CHUNKS",
+    )
 
 
 class Settings:
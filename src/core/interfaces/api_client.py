@@ -2,6 +2,7 @@
 API 클라이언트 인터페이스 정의
 """
 from abc import abstractmethod
+from collections.abc import Iterable
 from typing import Generic, Protocol, TypeVar, runtime_checkable
 
 T = TypeVar("T")
@@ -41,6 +42,11 @@ class IYouTubeClient(ISearchClient, Protocol):
         """비디오 상세 정보 조회"""
         ...
 
+    @abstractmethod
+    def get_videos_details(self, video_ids: Iterable[str]) -> dict[str, dict]:
+        """비디오 상세 정보 일괄 조회 ({video_id: 상세 정보})"""
+        ...
+
     @abstractmethod
     def get_video_comments(self, video_id: str, max_results: int = 100) -> list[dict]:
         """비디오 댓글 조회"""
@@ -1,7 +1,8 @@
 """
 챗봇 및 RAG 인터페이스 정의
 """
-from typing import Protocol, runtime_checkable
+from collections.abc import Iterator
+from typing import Any, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -34,3 +35,11 @@ class IChatbotService(Protocol):
         data_store_id: str | None = None,
     ) -> dict:
         ...
+
+    def stream_reply(
+        self,
+        message: str,
+        session_id: str | None = None,
+        data_store_id: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        ...
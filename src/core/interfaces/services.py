@@ -2,10 +2,17 @@
 서비스 인터페이스 정의
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from datetime import date
 from typing import Any, Protocol, runtime_checkable
 
-from core.models import CollectedData, PipelineConfig, PipelineProgress, PipelineResult
+from core.models import (
+    CollectedData,
+    PipelineConfig,
+    PipelineProgress,
+    PipelineResult,
+    VideoArtifact,
+)
 
 
 @runtime_checkable
@@ -39,6 +46,14 @@ class INaverService(Protocol):
     ) -> dict:
         ...
 
+    async def collect_product_data_async(
+        self,
+        product: dict,
+        max_results: int = 10,
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> dict:
+        ...
+
     def analyze_competitors(self, products: list[dict]) -> dict:
         ...
 
@@ -124,7 +139,7 @@ class IVideoService(Protocol):
         duration_seconds: int = 8,
         resolution: str = "720p",
         progress_callback: Callable[[str, int], None] | None = None,
-    ) -> bytes | str:
+    ) -> VideoArtifact | bytes | str:
         ...
 
     def generate_marketing_video(
@@ -133,7 +148,16 @@ class IVideoService(Protocol):
         strategy: dict,
         duration_seconds: int = 8,
         progress_callback: Callable[[str, int], None] | None = None,
-    ) -> bytes | str:
+    ) -> VideoArtifact | bytes | str:
+        ...
+
+    async def generate_marketing_video_async(
+        self,
+        product: dict,
+        strategy: dict,
+        duration_seconds: int = 8,
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> VideoArtifact | bytes | str:
         ...
 
     def get_available_motions(self) -> list[str]:
@@ -224,6 +248,16 @@ class ICTRPredictor(Protocol):
     def compare_variations(self, variations: list[dict]) -> list[dict]:
         ...
 
+    def predict_batch(
+        self,
+        candidates: Sequence[str | dict],
+        competitor_titles: list[str] | None = None,
+        thumbnail_description: str = "",
+        top_k: int | None = None,
+        category: str = "general",
+    ) -> list[dict]:
+        ...
+
     async def predict_with_ai(
         self,
         title: str,
@@ -247,6 +281,17 @@ class IHistoryService(Protocol):
     def get_history_list(self) -> list[dict[str, Any]]:
         ...
 
+    def query_history(
+        self,
+        product: str | None = None,
+        success: bool | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        ...
+
     def load_history(self, history_id: str) -> PipelineResult | None:
         ...
 
@@ -10,8 +10,8 @@ class IStorageService(Protocol):
     """스토리지 서비스 프로토콜"""
 
     @abstractmethod
-    def ensure_bucket(self) -> None:
-        """버킷 존재 확인 및 필요 시 생성"""
+    def ensure_bucket(self, force: bool = False) -> None:
+        """버킷 존재 확인 및 필요 시 생성 (확인 결과 캐시)"""
         ...
 
     @abstractmethod
@@ -29,6 +29,7 @@ from .pipeline import (
     PipelineResult,
     PipelineStep,
     UploadStatus,
+    VideoArtifact,
 )
 from .product import (
     Product,
@@ -74,6 +75,7 @@ __all__ = [
     # Marketing
     "TargetPersona",
     "UploadStatus",
+    "VideoArtifact",
     "YouTubeComment",
     "YouTubeSearchResult",
     # YouTube
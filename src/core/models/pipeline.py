@@ -3,7 +3,7 @@
 """
 from datetime import datetime
 from enum import Enum
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
@@ -69,6 +69,12 @@ class PipelineConfig(BaseModel):
     # 저장 설정
     upload_to_gcs: bool = Field(default=True, description="GCS 업로드 여부")
 
+    # 수집 스냅샷 재사용: off(항상 수집) / fresh(신선한 스냅샷이면 Step 1 생략)
+    # / delta(신선하면 생략, 오래됐으면 재수집하되 새 댓글만 X-Algorithm 분석)
+    reuse_collection: Literal["off", "fresh", "delta"] = Field(
+        default="off", description="수집 스냅샷 재사용 모드"
+    )
+
 
 class PipelineProgress(BaseModel):
     """파이프라인 실행 진행 상황"""
@@ -195,6 +201,23 @@ class CollectedData(BaseModel):
     market_trends: dict[str, Any] | None = Field(
         default=None, description="시장 트렌드 데이터"
     )
+    source_errors: dict[str, str] = Field(
+        default_factory=dict, description="수집 실패 소스별 오류 (youtube/naver/market_trend)"
+    )
+    analyzed_comment_keys: list[str] = Field(
+        default_factory=list,
+        exclude=True,
+        description="X-Algorithm 분석을 거친 댓글 키 (수집 스냅샷 증분 기준, 응답 제외)",
+    )
+
+
+class VideoArtifact(BaseModel):
+    """생성된 비디오 파일 참조 (영상 바이트를 메모리에 들고 다니지 않음)"""
+
+    gcs_uri: str | None = Field(default=None, description="Veo 출력 GCS URI")
+    local_path: str | None = Field(default=None, description="로컬 저장 경로")
+    size_bytes: int | None = Field(default=None, description="파일 크기")
+    md5_hash: str | None = Field(default=None, description="base64 MD5 (GCS 형식)")
 
 
 class GeneratedContent(BaseModel):
@@ -205,8 +228,8 @@ class GeneratedContent(BaseModel):
     thumbnail_data: bytes | None = Field(default=None, description="썸네일 이미지 바이트")
     thumbnail_url: str | None = Field(default=None, description="썸네일 URL")
     multi_thumbnails: list[dict[str, Any]] = Field(default_factory=list, description="다중 썸네일")
-    video_bytes: bytes | None = Field(default=None, description="비디오 바이트")
-    video_path: str | None = Field(default=None, description="비디오 경로")
+    video_path: str | None = Field(default=None, description="비디오 로컬 경로")
+    video_gcs_uri: str | None = Field(default=None, description="비디오 원본 GCS URI")
     video_url: str | None = Field(default=None, description="비디오 URL")
 
 
@@ -233,6 +256,10 @@ class PipelineResult(BaseModel):
         default_factory=list,
         description="Upload failure details",
     )
+    upload_timings: dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-artifact upload time (ms)",
+    )
     executed_at: datetime = Field(default_factory=datetime.now, description="실행 시간")
     duration_seconds: float = Field(default=0.0, ge=0, description="실행 시간(초)")
 
@@ -1,15 +1,85 @@
 """프롬프트 템플릿/레지스트리"""
 from __future__ import annotations
 
+from string import Formatter
+from typing import Any
+
+from core.prompts.accounting import (
+    compact_json,
+    estimate_tokens,
+    get_default_json_budget,
+    global_prompt_usage,
+    record_render,
+    track_prompt_usage,
+)
+
 
 class PromptTemplate:
-    def __init__(self, name: str, template: str, version: str = "v1") -> None:
+    """
+    프롬프트 템플릿
+
+    생성 시 한 번 파싱해 정적 문자열 조각과 치환 필드를 분리해 둔다.
+    render는 조각을 이어붙이기만 하므로 대형 템플릿도 format_map 재파싱 비용이 없다.
+    dict/list 값은 compact_json으로 직렬화되며 json_budgets로 필드별 크기 예산을 둘 수 있다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        template: str,
+        version: str = "v1",
+        json_budgets: dict[str, int] | None = None,
+    ) -> None:
         self.name = name
         self.template = template
         self.version = version
+        self.json_budgets = dict(json_budgets or {})
+        self._literals, self._fields = self._compile(template)
+
+    @staticmethod
+    def _compile(template: str) -> tuple[list[str], list[str] | None]:
+        """정적 조각/필드 분리 ({{ }}는 컴파일 시 해제). 복잡한 필드는 None (format_map 사용)"""
+        literals = [""]
+        fields: list[str] = []
+        for literal, field, spec, conversion in Formatter().parse(template):
+            literals[-1] += literal
+            if field is None:
+                continue
+            if not field or spec or conversion or "." in field or "[" in field:
+                return [], None
+            fields.append(field)
+            literals.append("")
+        return literals, fields
+
+    @property
+    def fields(self) -> list[str]:
+        return list(self._fields or [])
+
+    @property
+    def static_chars(self) -> int:
+        """치환 전 정적 부분 길이"""
+        return sum(len(part) for part in self._literals)
+
+    def _format_value(self, field: str, value: Any) -> str:
+        if isinstance(value, str):
+            return value
+        if isinstance(value, (dict, list, tuple)):
+            budget = self.json_budgets.get(field) or get_default_json_budget()
+            return compact_json(value, max_chars=budget)
+        return format(value)
 
     def render(self, **kwargs) -> str:
-        return self.template.format_map(kwargs)
+        if self._fields is None:
+            text = self.template.format_map(kwargs)
+        else:
+            literals = self._literals
+            parts = [literals[0]]
+            for idx, field in enumerate(self._fields, start=1):
+                parts.append(self._format_value(field, kwargs[field]))
+                parts.append(literals[idx])
+            text = "".join(parts)
+        record_render(self.name, text)
+        return text
 
 
 class PromptRegistry:
@@ -24,7 +94,34 @@ class PromptRegistry:
             raise KeyError(f"등록되지 않은 프롬프트: {name}")
         return self._templates[name]
 
+    def set_json_budget(self, name: str, field: str, max_chars: int | None) -> None:
+        """템플릿 필드별 JSON 크기 예산 설정 (None = 해제)"""
+        template = self.get(name)
+        if max_chars:
+            template.json_budgets[field] = max_chars
+        else:
+            template.json_budgets.pop(field, None)
+
+    def usage_report(self) -> dict[str, dict[str, Any]]:
+        """프로세스 누적 템플릿별 렌더링 통계"""
+        usage = global_prompt_usage()
+        return {
+            name: {
+                "version": template.version,
+                "static_chars": template.static_chars,
+                **usage.get(name, {"renders": 0, "chars": 0, "est_tokens": 0}),
+            }
+            for name, template in self._templates.items()
+        }
+
 
 prompt_registry = PromptRegistry()
 
-__all__ = ["PromptRegistry", "PromptTemplate", "prompt_registry"]
+__all__ = [
+    "PromptRegistry",
+    "PromptTemplate",
+    "compact_json",
+    "estimate_tokens",
+    "prompt_registry",
+    "track_prompt_usage",
+]
@@ -0,0 +1,186 @@
+"""프롬프트 크기/토큰 집계 및 JSON 임베딩 압축"""
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any
+
+# Gemini 토크나이저 근사치: 영문/숫자/기호 약 4자당 1토큰, 한글 등 비 ASCII 약 1.6자당 1토큰
+_ASCII_CHARS_PER_TOKEN = 4.0
+_NON_ASCII_CHARS_PER_TOKEN = 1.6
+
+_TRUNCATED_MARK = "…"
+
+
+def estimate_tokens(text: str) -> int:
+    """로컬 토큰 수 추정 (API 호출 없이 O(n) C 레벨 연산만 사용)"""
+    if not text:
+        return 0
+    length = len(text)
+    if text.isascii():
+        return math.ceil(length / _ASCII_CHARS_PER_TOKEN)
+    # 비 ASCII 문자는 대부분 UTF-8 3바이트 (한글) → 바이트 수 차이로 개수 추정
+    non_ascii = min(length, (len(text.encode("utf-8")) - length) // 2)
+    ascii_chars = length - non_ascii
+    return math.ceil(
+        ascii_chars / _ASCII_CHARS_PER_TOKEN + non_ascii / _NON_ASCII_CHARS_PER_TOKEN
+    )
+
+
+def _trim(value: Any, max_items: int | None, max_str: int | None) -> Any:
+    if isinstance(value, dict):
+        return {k: _trim(v, max_items, max_str) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = list(value)
+        if max_items is not None and len(items) > max_items:
+            items = items[:max_items]
+        return [_trim(v, max_items, max_str) for v in items]
+    if isinstance(value, str) and max_str is not None and len(value) > max_str:
+        return value[:max_str] + _TRUNCATED_MARK
+    return value
+
+
+def _longest_list(value: Any) -> int:
+    if isinstance(value, dict):
+        return max((_longest_list(v) for v in value.values()), default=0)
+    if isinstance(value, (list, tuple)):
+        inner = max((_longest_list(v) for v in value), default=0)
+        return max(len(value), inner)
+    return 0
+
+
+def compact_json(
+    data: Any,
+    max_chars: int | None = None,
+    max_list_items: int | None = None,
+) -> str:
+    """
+    프롬프트 임베딩용 JSON 직렬화
+
+    들여쓰기/공백을 제거하고, max_chars를 넘으면 리스트 길이 → 긴 문자열 순으로
+    절반씩 줄여 예산 안에 맞춘다. 그래도 넘치면 마지막에 잘라낸다.
+    """
+
+    def dump(value: Any) -> str:
+        return json.dumps(
+            value, ensure_ascii=False, separators=(",", ":"), default=str
+        )
+
+    if max_list_items is not None:
+        data = _trim(data, max_list_items, None)
+    text = dump(data)
+    if not max_chars or len(text) <= max_chars:
+        return text
+
+    list_limit = _longest_list(data)
+    while list_limit > 1 and len(text) > max_chars:
+        list_limit //= 2
+        text = dump(_trim(data, list_limit, None))
+
+    str_limit = 400
+    while str_limit >= 50 and len(text) > max_chars:
+        text = dump(_trim(data, list_limit or None, str_limit))
+        str_limit //= 2
+
+    if len(text) > max_chars:
+        text = text[: max(0, max_chars - 1)] + _TRUNCATED_MARK
+    return text
+
+
+_default_json_budget: int | None = None
+
+
+def set_default_json_budget(max_chars: int | None) -> None:
+    """템플릿별 예산이 없는 JSON 필드에 적용할 기본 문자 수 예산 (None/0 = 무제한)"""
+    global _default_json_budget
+    _default_json_budget = max_chars or None
+
+
+def get_default_json_budget() -> int | None:
+    return _default_json_budget
+
+
+class PromptUsageRecorder:
+    """템플릿별 렌더링 횟수/크기/추정 토큰 집계"""
+
+    def __init__(self) -> None:
+        self._usage: dict[str, dict[str, int]] = {}
+        self._lock = Lock()
+
+    def record(self, name: str, chars: int, tokens: int) -> None:
+        with self._lock:
+            entry = self._usage.get(name)
+            if entry is None:
+                entry = {"renders": 0, "chars": 0, "est_tokens": 0, "max_chars": 0}
+                self._usage[name] = entry
+            entry["renders"] += 1
+            entry["chars"] += chars
+            entry["est_tokens"] += tokens
+            entry["max_chars"] = max(entry["max_chars"], chars)
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._usage.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._usage.clear()
+
+
+# 프로세스 전체 누적 집계 + 실행(파이프라인 run) 단위 집계
+_global_usage = PromptUsageRecorder()
+_current_usage: ContextVar[PromptUsageRecorder | None] = ContextVar(
+    "prompt_usage", default=None
+)
+
+
+def record_render(name: str, text: str) -> None:
+    chars = len(text)
+    tokens = estimate_tokens(text)
+    _global_usage.record(name, chars, tokens)
+    recorder = _current_usage.get()
+    if recorder is not None:
+        recorder.record(name, chars, tokens)
+
+
+@contextmanager
+def track_prompt_usage() -> Iterator[PromptUsageRecorder]:
+    """
+    컨텍스트 내 렌더링을 별도 집계 (asyncio 태스크/to_thread로 전파됨)
+
+    Example:
+        with track_prompt_usage() as usage:
+            await pipeline.execute(...)
+        usage.snapshot()
+    """
+    recorder = PromptUsageRecorder()
+    token = _current_usage.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current_usage.reset(token)
+
+
+def current_prompt_usage() -> PromptUsageRecorder | None:
+    return _current_usage.get()
+
+
+def global_prompt_usage() -> dict[str, dict[str, int]]:
+    return _global_usage.snapshot()
+
+
+__all__ = [
+    "PromptUsageRecorder",
+    "compact_json",
+    "current_prompt_usage",
+    "estimate_tokens",
+    "get_default_json_budget",
+    "global_prompt_usage",
+    "record_render",
+    "set_default_json_budget",
+    "track_prompt_usage",
+]
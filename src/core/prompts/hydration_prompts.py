@@ -119,7 +119,84 @@ Output ONLY the following JSON structure. Ensure all text is in Korean (한국
 """.strip(),
 )
 
+COMMENT_ANALYSIS_MAP_PROMPT = PromptTemplate(
+    name="comment.analysis.map",
+    template="""
+### 🤖 Role: Voice-of-Customer (VoC) Analyst — Chunk Summarizer
+You are summarizing ONE group of YouTube comments. Other analysts summarize the other groups,
+and a lead analyst will merge all group summaries into a single executive VoC report.
+
+### 🎯 Objective
+Capture every distinct pain point, purchase driver, question and quotable customer phrase in this group.
+Keep customer wording where possible. Do not speculate beyond the comments.
+
+---
+
+## 📦 Input Data
+
+### Group: {stratum} ({comment_count} comments)
+{combined_text}
+
+---
+
+### 📤 Response Format (Strict JSON)
+Output ONLY the following JSON structure. All text in Korean (한국어).
+{{
+    "dominant_emotion": "이 그룹의 지배적인 감정",
+    "pain_points": ["문제점/불편함 (직접 인용 권장)"],
+    "buying_factors": ["구매 결정 요소"],
+    "hook_phrases": ["광고 카피로 쓸 만한 고객 표현"],
+    "questions": ["자주 묻는 질문/오해"],
+    "summary": "이 그룹 요약 1~2문장"
+}}
+""".strip(),
+)
+
+COMMENT_ANALYSIS_REDUCE_PROMPT = PromptTemplate(
+    name="comment.analysis.reduce",
+    template="""
+### 🤖 Role: Lead Voice-of-Customer (VoC) Analyst
+You are merging group summaries prepared by your analysts into one executive VoC report.
+Together the groups cover {comments_seen} of {comments_total} YouTube comments.
+
+### 📋 Merge Rules
+1. **Weight by volume:** Themes appearing in many or large groups outrank one-off remarks.
+2. **Deduplicate:** Merge paraphrases of the same pain point or hook into one strong statement.
+3. **Keep customer language:** Prefer phrasing quoted from the groups for marketing hooks.
+
+---
+
+## 📦 Input Data
+
+### Group Summaries (JSON: group, comment_count, summary)
+{chunk_summaries}
+
+---
+
+### 📤 Response Format (Strict JSON)
+Output ONLY the following JSON structure. Ensure all text is in Korean (한국어) and written for an executive briefing.
+{{
+    "customer_sentiment": {{
+        "dominant_emotion": "지배적인 감정",
+        "sentiment_reason": "위 감정이 나타나는 핵심 이유"
+    }},
+    "deep_pain_points": ["문제점/불편함 1", "문제점/불편함 2", "문제점/불편함 3"],
+    "buying_factors": ["구매 결정 요소 1", "구매 결정 요소 2"],
+    "marketing_hooks": ["광고 카피 1", "광고 카피 2", "광고 카피 3"],
+    "faq_candidates": ["자주 묻는 질문/오해 1", "자주 묻는 질문/오해 2"],
+    "executive_summary": "전체 VoC 분석 결과를 3문장 내외로 요약. 핵심 인사이트, 전략적 시사점, 권장 조치 포함."
+}}
+""".strip(),
+)
+
 prompt_registry.register(HYDRATION_FEATURE_PROMPT)
 prompt_registry.register(COMMENT_ANALYSIS_PROMPT)
-
-__all__ = ["COMMENT_ANALYSIS_PROMPT", "HYDRATION_FEATURE_PROMPT"]
+prompt_registry.register(COMMENT_ANALYSIS_MAP_PROMPT)
+prompt_registry.register(COMMENT_ANALYSIS_REDUCE_PROMPT)
+
+__all__ = [
+    "COMMENT_ANALYSIS_MAP_PROMPT",
+    "COMMENT_ANALYSIS_PROMPT",
+    "COMMENT_ANALYSIS_REDUCE_PROMPT",
+    "HYDRATION_FEATURE_PROMPT",
+]
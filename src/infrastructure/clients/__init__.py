@@ -1,12 +1,14 @@
 """
 인프라스트럭처 클라이언트 패키지
 """
+from .async_naver_client import AsyncNaverClient
 from .gemini_client import GeminiClient
 from .naver_client import NaverClient
 from .veo_client import VeoClient
 from .youtube_client import YouTubeClient
 
 __all__ = [
+    "AsyncNaverClient",
     "GeminiClient",
     "NaverClient",
     "VeoClient",
@@ -0,0 +1,190 @@
+"""
+네이버 검색 API 비동기 클라이언트
+httpx 커넥션 풀(h2 설치 시 HTTP/2)로 쇼핑/블로그/뉴스를 동시에 조회
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterable
+
+import httpx
+
+from core.exceptions import NaverAPIError
+from infrastructure.clients.naver_client import (
+    NAVER_MAX_DISPLAY,
+    NAVER_MAX_START,
+    NaverClient,
+    parse_blog_item,
+    parse_news_item,
+    parse_shopping_item,
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - h2 미설치 시 HTTP/1.1 keep-alive
+    HTTP2_AVAILABLE = False
+
+# vertical 이름 -> (엔드포인트, 결과 키, 항목 파서)
+VERTICALS: dict[str, tuple[str, str, Callable[[dict], dict]]] = {
+    "shop": (NaverClient.SHOPPING_API_URL, "products", parse_shopping_item),
+    "blog": (NaverClient.BLOG_API_URL, "blogs", parse_blog_item),
+    "news": (NaverClient.NEWS_API_URL, "news", parse_news_item),
+}
+
+
+class AsyncNaverClient:
+    """
+    네이버 검색 비동기 클라이언트
+
+    httpx.AsyncClient는 생성된 이벤트 루프에 묶이므로 루프별로 하나씩 만들어
+    같은 루프 안의 요청은 모두 하나의 커넥션 풀을 공유한다.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        max_connections: int = 10,
+        timeout: float = 10.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._limits = httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_connections
+        )
+        self._timeout = timeout
+        self._transport = transport
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+
+    def is_configured(self) -> bool:
+        """API 키가 설정되었는지 확인"""
+        return bool(self._client_id and self._client_secret)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE and self._transport is None,
+                limits=self._limits,
+                timeout=self._timeout,
+                transport=self._transport,
+                headers={
+                    "X-Naver-Client-Id": self._client_id,
+                    "X-Naver-Client-Secret": self._client_secret,
+                },
+            )
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """현재 루프의 커넥션 풀 종료"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def search(
+        self, vertical: str, query: str, display: int = 10, start: int = 1
+    ) -> list[dict]:
+        """단일 vertical 검색 (shop/blog/news)"""
+        url, _, parse = VERTICALS[vertical]
+        data = await self._request(url, query, min(display, NAVER_MAX_DISPLAY), start)
+        return [parse(item) for item in data.get("items", [])]
+
+    async def search_all(
+        self,
+        query: str,
+        display: int = 10,
+        verticals: Iterable[str] = ("shop", "blog", "news"),
+        raise_on_error: bool = True,
+    ) -> dict[str, list[dict]]:
+        """
+        여러 vertical 동시 검색
+
+        Args:
+            raise_on_error: False면 실패한 vertical은 빈 목록으로 두고 계속 진행
+
+        Returns:
+            {"products": [...], "blogs": [...], "news": [...]} (요청한 vertical만)
+
+        Raises:
+            NaverAPIError: raise_on_error이고 하나라도 실패한 경우 (나머지 요청은 끝까지 수행)
+        """
+        names = list(dict.fromkeys(verticals))
+        gathered = await asyncio.gather(
+            *(self.collect(name, query, display) for name in names),
+            return_exceptions=True,
+        )
+        results: list[list[dict]] = []
+        for name, result in zip(names, gathered, strict=True):
+            if isinstance(result, BaseException):
+                if raise_on_error or not isinstance(result, Exception):
+                    raise result
+                logger.warning(f"네이버 {name} 검색 실패: {result}")
+                result = []
+            results.append(result)
+        logger.info(
+            f"네이버 통합 검색 완료: '{query}' -> "
+            + ", ".join(f"{n} {len(r)}개" for n, r in zip(names, results, strict=True))
+        )
+        return {VERTICALS[n][1]: r for n, r in zip(names, results, strict=True)}
+
+    async def collect(self, vertical: str, query: str, limit: int) -> list[dict]:
+        """limit개까지 페이지를 이어 받아 목록으로 반환"""
+        return [item async for item in self.iter_results(vertical, query, limit)]
+
+    async def iter_results(
+        self, vertical: str, query: str, limit: int = NAVER_MAX_START
+    ) -> AsyncIterator[dict]:
+        """
+        start 오프셋으로 페이지를 넘기며 결과 스트리밍
+
+        API 제약상 start는 최대 1000이므로 최대 1000 + display - 1개까지 받을 수 있다.
+        """
+        url, _, parse = VERTICALS[vertical]
+        start, remaining = 1, limit
+        while remaining > 0 and start <= NAVER_MAX_START:
+            display = min(remaining, NAVER_MAX_DISPLAY)
+            data = await self._request(url, query, display, start)
+            items = data.get("items", [])
+            for item in items:
+                yield parse(item)
+            total = int(data.get("total", 0) or 0)
+            start += len(items)
+            remaining -= len(items)
+            if len(items) < display or (total and start > total):
+                return
+
+    async def _request(self, url: str, query: str, display: int, start: int) -> dict:
+        if not self.is_configured():
+            logger.warning("네이버 API 자격증명이 설정되지 않았습니다.")
+            return {"items": []}
+
+        params: dict[str, str | int] = {"query": query, "display": display}
+        if start > 1:
+            params["start"] = start
+        try:
+            response = await self._get_client().get(url, params=params)
+        except httpx.HTTPError as e:
+            logger.error(f"네이버 검색 실패: {e}")
+            raise NaverAPIError(f"네이버 검색 실패: {e}", {"query": query}) from e
+
+        if response.status_code != 200:
+            raise NaverAPIError(
+                f"네이버 API 오류: {response.status_code}",
+                {"status_code": response.status_code, "query": query, "start": start},
+            )
+        return response.json()
+
+
+__all__ = ["HTTP2_AVAILABLE", "VERTICALS", "AsyncNaverClient"]
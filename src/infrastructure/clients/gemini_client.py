@@ -4,10 +4,8 @@ Vertex AI 기반 텍스트/이미지 생성
 """
 
 import asyncio
-import json
-import re
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Any
 
 from config.constants import HOOK_TEMPLATES, HOOK_TYPES
@@ -17,6 +15,8 @@ from core.prompts import (
     prompt_registry,
 )
 from utils.cache import cached
+from utils.concurrency import map_bounded, shared_limiter
+from utils.json_parser import parse_llm_json
 from utils.logger import get_logger, log_llm_fail, log_llm_request, log_llm_response
 from utils.retry import retry_on_error
 
@@ -32,11 +32,17 @@ class GeminiClient:
         location: str,
         text_model: str = "gemini-3-pro-preview",
         image_model: str = "gemini-3-pro-image-preview",
+        image_max_concurrency: int = 4,
     ) -> None:
         self._project_id = project_id
         self._location = location
         self._text_model = text_model
         self._image_model = image_model
+        self._image_max_concurrency = max(1, image_max_concurrency)
+        # 이미지 모델 호출 상한은 모델별로 프로세스 전체가 공유
+        self._image_limiter = shared_limiter(
+            f"gemini-image:{image_model}", self._image_max_concurrency
+        )
         self._client = None
         self._async_client = None
         self._async_client_loop = None
@@ -75,6 +81,8 @@ class GeminiClient:
             location=self._location,
         )
 
+    # 같은 프롬프트의 동시 호출은 한 번만 실행 (실패 시 ""는 캐시하지 않음)
+    @cached(ttl=3600, cache_key_prefix="gemini", negative_ttl=0)
     async def generate_content_async(
         self,
         prompt: str,
@@ -166,6 +174,55 @@ class GeminiClient:
             log_llm_fail("텍스트 생성", str(e), model=self._text_model)
             raise GeminiAPIError(f"텍스트 생성 실패: {e}") from e
 
+    def generate_text_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        use_grounding: bool = False,
+    ) -> Iterator[str]:
+        """텍스트 스트리밍 생성 (모델 청크를 도착 즉시 반환, 캐시/재시도 미적용)"""
+        start_time = time.time()
+
+        log_llm_request(
+            "텍스트 스트리밍",
+            details=f"temperature={temperature}, grounding={use_grounding}",
+            model=self._text_model,
+            prompt_preview=prompt,
+        )
+        try:
+            from google.genai import types
+
+            client = self._get_client()
+            config = types.GenerateContentConfig(temperature=temperature)
+            if use_grounding:
+                config.tools = [types.Tool(google_search=types.GoogleSearch())]
+
+            stream = client.models.generate_content_stream(
+                model=self._text_model,
+                contents=prompt,
+                config=config,
+            )
+
+            total_chars = 0
+            first_chunk_ms: float | None = None
+            for chunk in stream:
+                text = getattr(chunk, "text", None)
+                if not text:
+                    continue
+                if first_chunk_ms is None:
+                    first_chunk_ms = (time.time() - start_time) * 1000
+                total_chars += len(text)
+                yield text
+        except Exception as e:
+            log_llm_fail("텍스트 스트리밍", str(e), model=self._text_model)
+            raise GeminiAPIError(f"텍스트 스트리밍 실패: {e}") from e
+
+        log_llm_response(
+            "텍스트 스트리밍",
+            details=f"응답 {total_chars}자, 첫 청크 {first_chunk_ms or 0:.0f}ms",
+            duration_ms=(time.time() - start_time) * 1000,
+        )
+
     @retry_on_error(max_attempts=3, base_delay=1.0, max_delay=8.0)
     def generate_image(
         self,
@@ -191,14 +248,16 @@ class GeminiClient:
             client = self._get_client()
 
             # [AI Product Pattern] Retry Mechanism
+            # 리미터는 실제 호출 동안만 점유 (백오프 대기 중에는 반환)
             def _api_call():
-                return client.models.generate_content(
-                    model=self._image_model,
-                    contents=prompt,
-                    config=GenerateContentConfig(
-                        response_modalities=[Modality.TEXT, Modality.IMAGE],
-                    ),
-                )
+                with self._image_limiter:
+                    return client.models.generate_content(
+                        model=self._image_model,
+                        contents=prompt,
+                        config=GenerateContentConfig(
+                            response_modalities=[Modality.TEXT, Modality.IMAGE],
+                        ),
+                    )
 
             response = self.retry_with_backoff(_api_call)
             elapsed_ms = (_time.time() - start_time) * 1000
@@ -249,28 +308,13 @@ class GeminiClient:
             if progress_callback:
                 progress_callback("마케팅 데이터 분석 중...", 20)
 
+            # dict/list는 템플릿에서 compact JSON으로 직렬화 (필드별 크기 예산 적용)
             analysis_prompt = prompt_registry.get("marketing.analysis").render(
                 product_name=product_name,
-                top_insights_json=(
-                    json.dumps(top_insights, ensure_ascii=False, indent=2)
-                    if top_insights
-                    else "데이터 없음"
-                ),
-                market_trends_json=(
-                    json.dumps(market_trends, ensure_ascii=False, indent=2)
-                    if market_trends
-                    else "데이터 없음"
-                ),
-                youtube_data_json=(
-                    json.dumps(youtube_data, ensure_ascii=False, indent=2)
-                    if youtube_data
-                    else "데이터 없음"
-                ),
-                naver_data_json=(
-                    json.dumps(naver_data, ensure_ascii=False, indent=2)
-                    if naver_data
-                    else "데이터 없음"
-                ),
+                top_insights_json=top_insights or "데이터 없음",
+                market_trends_json=market_trends or "데이터 없음",
+                youtube_data_json=youtube_data or "데이터 없음",
+                naver_data_json=naver_data or "데이터 없음",
             )
 
             log_llm_request(
@@ -493,27 +537,32 @@ Your mission: Create a thumbnail that stops the scroll and drives immediate purc
         if styles is None:
             styles = ["네오브루탈리즘", "비비드", "누아르"]
 
-        results = []
         total = len(hook_texts)
+        jobs = [(hook_text, styles[i % len(styles)]) for i, hook_text in enumerate(hook_texts)]
 
-        for i, hook_text in enumerate(hook_texts):
-            style = styles[i % len(styles)]
+        if progress_callback and total:
+            progress_callback(f"썸네일 {total}개 동시 생성 중...", 0)
 
+        def on_complete(index: int, done: int, total_jobs: int) -> None:
             if progress_callback:
-                progress = int((i / total) * 100)
-                progress_callback(f"썸네일 {i + 1}/{total} 생성 중...", progress)
-
-            image = self.generate_thumbnail(product, hook_text, style)
-
-            if image:
-                results.append(
-                    {
-                        "image": image,
-                        "hook_text": hook_text,
-                        "style": style,
-                    }
+                progress_callback(
+                    f"썸네일 {done}/{total_jobs} 생성 완료",
+                    int((done / total_jobs) * 100),
                 )
 
+        images = map_bounded(
+            lambda job: self.generate_thumbnail(product, job[0], job[1]),
+            jobs,
+            max_workers=self._image_max_concurrency,
+            on_complete=on_complete,
+        )
+
+        results = [
+            {"image": image, "hook_text": hook_text, "style": style}
+            for (hook_text, style), image in zip(jobs, images, strict=True)
+            if isinstance(image, bytes) and image
+        ]
+
         log_llm_response("다중 썸네일 생성", f"{len(results)}/{total}개 완료")
 
         if progress_callback:
@@ -562,27 +611,6 @@ Your mission: Create a thumbnail that stops the scroll and drives immediate purc
 
         return unique_hooks
 
-    def _extract_first_json_object(self, text: str) -> str | None:
-        """첫 번째 완전한 { ... } 블록만 추출 (중첩 괄호 대응)."""
-        start = text.find("{")
-        if start == -1:
-            return None
-        depth = 0
-        for i in range(start, len(text)):
-            if text[i] == "{":
-                depth += 1
-            elif text[i] == "}":
-                depth -= 1
-                if depth == 0:
-                    return text[start : i + 1]
-        return None
-
-    def _fix_common_json_issues(self, raw: str) -> str:
-        """LLM이 자주 내는 JSON 오류 보정 (끝 쉼표 등)."""
-        raw = re.sub(r",\s*}", "}", raw)
-        raw = re.sub(r",\s*]", "]", raw)
-        return raw
-
     def _validate_json_output(
         self,
         text: str,
@@ -590,29 +618,7 @@ Your mission: Create a thumbnail that stops the scroll and drives immediate purc
     ) -> dict:
         """LLM 출력 JSON 검증 및 정화"""
         # [AI Product Pattern] Output Sanitization
-        text = re.sub(r"```json\s*", "", text)
-        text = re.sub(r"```\s*", "", text)
-        text = text.strip()
-
-        try:
-            result = json.loads(text)
-        except json.JSONDecodeError:
-            json_str = self._extract_first_json_object(text)
-            if json_str:
-                fixed = self._fix_common_json_issues(json_str)
-                try:
-                    result = json.loads(fixed)
-                except json.JSONDecodeError:
-                    return {"error": "JSON 파싱 실패", "raw_text": text[:500]}
-            else:
-                return {"error": "JSON을 찾을 수 없음", "raw_text": text[:500]}
-
-        if required_fields:
-            missing = [f for f in required_fields if f not in result]
-            if missing:
-                result["_validation_warning"] = f"누락된 필드: {missing}"
-
-        return result
+        return parse_llm_json(text, required_fields=required_fields)
 
     def retry_with_backoff(
         self,
@@ -3,14 +3,20 @@ Veo 비디오 생성 클라이언트
 Vertex AI Veo 3.1 기반 마케팅 비디오 생성
 """
 
+import asyncio
 import re
 import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 
 from config.constants import CAMERA_MOTIONS
 from core.exceptions import VeoAPIError
+from core.models import VideoArtifact
+from infrastructure.clients.veo_jobs import VeoJobManager
+from utils.file_store import ensure_output_dir
+from utils.gcs_store import DEFAULT_CHUNK_SIZE, parse_gcs_uri, stream_blob_to_file
 from utils.logger import (
     get_logger,
     log_api_end,
@@ -426,6 +432,8 @@ class VeoClient:
         self._model_id = model_id
         self._vision_model_id = vision_model_id
         self._client = None
+        self._job_manager: VeoJobManager | None = None
+        self._storage_client = None
 
     def _get_client(self):
         """Vertex AI GenAI 클라이언트 반환 (지연 초기화)"""
@@ -460,20 +468,169 @@ class VeoClient:
         if re.search(pattern, prompt, flags=re.IGNORECASE):
             raise VeoAPIError("Unsafe prompt content detected. Please revise.")
 
-    def generate_video(
+    def _get_job_manager(self) -> VeoJobManager:
+        """오퍼레이션 폴링 관리자 (클라이언트당 하나, 지연 초기화)"""
+        if self._job_manager is None:
+            self._job_manager = VeoJobManager(
+                poll=lambda operation: self._get_client().operations.get(operation)
+            )
+        return self._job_manager
+
+    @staticmethod
+    def _max_wait(duration_seconds: int) -> int:
+        return 180 if duration_seconds > 8 else 120
+
+    def _start_text_video(
         self,
         prompt: str,
-        duration_seconds: int = 8,
-        resolution: str = "1080p",  # 품질 개선: 720p → 1080p
-        progress_callback: Callable[[str, int], None] | None = None,
-    ) -> bytes | str:
-        """텍스트 프롬프트로 비디오 생성"""
+        duration_seconds: int,
+        resolution: str,
+        progress_callback: Callable[[str, int], None] | None,
+    ) -> tuple[object, str]:
+        """텍스트 → 비디오 오퍼레이션 제출"""
+        self._pre_flight_safety_check(prompt)
+        from google.genai.types import GenerateVideosConfig
+
+        client = self._get_client()
+
+        date_str = datetime.now().strftime("%Y%m%d")
+        output_gcs_uri = f"gs://{self._gcs_bucket_name}/videos/{date_str}/"
+
+        if progress_callback:
+            progress_callback(
+                f"Veo API 요청 전송 중... ({duration_seconds}초, {resolution})", 10
+            )
+
+        operation = client.models.generate_videos(
+            model=self._model_id,
+            prompt=prompt,
+            config=GenerateVideosConfig(  # type: ignore[call-arg]
+                aspect_ratio="9:16",
+                output_gcs_uri=output_gcs_uri,
+                duration_seconds=duration_seconds,
+                generate_audio=True,
+                number_of_videos=1,
+                resolution=resolution,
+                negative_prompt="text, watermark, typography, subtitles, logos, blurry, low quality, distorted, morphing, flickering, jittery, shaky, nsfw, violence, deformed, ugly, bad anatomy, unnatural motion, symbols, letters, numbers, static text",
+                person_generation="allow_adult",
+            ),
+        )
+        return operation, output_gcs_uri
+
+    def _start_image_video(
+        self,
+        image_bytes: bytes,
+        prompt: str,
+        duration_seconds: int,
+        progress_callback: Callable[[str, int], None] | None,
+    ) -> tuple[object, str]:
+        """이미지 → 비디오 오퍼레이션 제출"""
+        self._pre_flight_safety_check(prompt)
+        from google.genai.types import GenerateVideosConfig
+
+        client = self._get_client()
+
+        # 이미지 파트 생성
+        try:
+            import io
+
+            from PIL import Image
+
+            image = Image.open(io.BytesIO(image_bytes))
+        except Exception as img_err:
+            log_error(f"이미지 처리 오류: {img_err}")
+            raise VeoAPIError("유효하지 않은 이미지 데이터입니다.") from img_err
+
+        date_str = datetime.now().strftime("%Y%m%d")
+        output_gcs_uri = f"gs://{self._gcs_bucket_name}/videos_i2v/{date_str}/"
+
+        if progress_callback:
+            progress_callback("Veo Image-to-Video API 요청 중...", 10)
+
+        enhanced_prompt = f"""
+            {prompt}
+
+            TRANSITION: Start from the provided image and naturally animate the scene.
+            CAMERA: Smooth cinematic motion.
+            QUALITY: 4k photorealistic, high fidelity.
+            RESTRICTION: ZERO text, no watermarks, no typography on screen.
+            NEGATIVE PROMPT: morphing, structural distortion, blurry, text artifacts, subtitles, logos.
+            """.strip()
+
+        operation = client.models.generate_videos(
+            model=self._model_id,
+            prompt=enhanced_prompt,
+            config=GenerateVideosConfig(
+                input_images=[image],  # type: ignore[call-arg]
+                aspect_ratio="9:16",
+                output_gcs_uri=output_gcs_uri,
+                duration_seconds=duration_seconds,
+                generate_audio=True,
+                number_of_videos=1,
+                negative_prompt="watermarks, text, subtitles, low quality",
+                person_generation="allow_adult",
+            ),
+        )
+        return operation, output_gcs_uri
+
+    def _start_extension(
+        self,
+        video_uri: str,
+        prompt: str,
+        duration_seconds: int,
+        progress_callback: Callable[[str, int], None] | None,
+    ) -> tuple[object, str]:
+        """비디오 연장 오퍼레이션 제출"""
+        self._pre_flight_safety_check(prompt)
+        from google.genai.types import GenerateVideosConfig, Video
+
+        client = self._get_client()
+
+        date_str = datetime.now().strftime("%Y%m%d")
+        output_gcs_uri = f"gs://{self._gcs_bucket_name}/videos_ext/{date_str}/"
+
+        if progress_callback:
+            progress_callback("Veo Video Extension 요청 중...", 10)
+
+        # GCS URI를 Video 객체로 변환하여 입력 비디오로 사용
+        # google.genai.types.Video 객체 생성 (uri 필수)
+        input_video = Video(uri=video_uri)
+
+        operation = client.models.generate_videos(
+            model=self._model_id,
+            prompt=prompt,
+            video=input_video,  # Video 객체 전달
+            config=GenerateVideosConfig(
+                aspect_ratio="9:16",
+                output_gcs_uri=output_gcs_uri,
+                duration_seconds=duration_seconds,
+                generate_audio=True,
+                number_of_videos=1,
+                negative_prompt="watermarks, text, subtitles, low quality, morphing",
+                person_generation="allow_adult",
+            ),
+        )
+        return operation, output_gcs_uri
+
+    @staticmethod
+    def _clamp_duration(duration_seconds: int) -> int:
         # Veo 3.1 제한사항: 최대 8초 (4, 6, 8초 지원)
         if duration_seconds > 8:
             logger.warning(
                 f"요청된 길이({duration_seconds}초)가 Veo 최대 길이(8초)를 초과하여 8초로 조정됩니다."
             )
-            duration_seconds = 8
+            return 8
+        return duration_seconds
+
+    def generate_video(
+        self,
+        prompt: str,
+        duration_seconds: int = 8,
+        resolution: str = "1080p",  # 품질 개선: 720p → 1080p
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> VideoArtifact | str:
+        """텍스트 프롬프트로 비디오 생성"""
+        duration_seconds = self._clamp_duration(duration_seconds)
 
         log_api_start(
             "Veo Video Generation",
@@ -482,35 +639,46 @@ class VeoClient:
         start_time = time.time()
 
         try:
-            self._pre_flight_safety_check(prompt)
-            from google.genai.types import GenerateVideosConfig
+            operation, output_gcs_uri = self._start_text_video(
+                prompt, duration_seconds, resolution, progress_callback
+            )
+            result = self._handle_operation(
+                operation, duration_seconds, progress_callback, output_gcs_uri
+            )
 
-            client = self._get_client()
+            elapsed = time.time() - start_time
+            log_api_end("Veo Video Generation", duration=elapsed)
+            return result
 
-            date_str = datetime.now().strftime("%Y%m%d")
-            output_gcs_uri = f"gs://{self._gcs_bucket_name}/videos/{date_str}/"
+        except Exception as e:
+            log_error(f"비디오 생성 실패: {e}")
+            raise VeoAPIError(f"비디오 생성 실패: {e}") from e
 
-            if progress_callback:
-                progress_callback(
-                    f"Veo API 요청 전송 중... ({duration_seconds}초, {resolution})", 10
-                )
+    async def generate_video_async(
+        self,
+        prompt: str,
+        duration_seconds: int = 8,
+        resolution: str = "1080p",
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> VideoArtifact | str:
+        """텍스트 프롬프트로 비디오 생성 (대기 중 스레드를 점유하지 않음)"""
+        duration_seconds = self._clamp_duration(duration_seconds)
 
-            operation = client.models.generate_videos(
-                model=self._model_id,
-                prompt=prompt,
-                config=GenerateVideosConfig(  # type: ignore[call-arg]
-                    aspect_ratio="9:16",
-                    output_gcs_uri=output_gcs_uri,
-                    duration_seconds=duration_seconds,
-                    generate_audio=True,
-                    number_of_videos=1,
-                    resolution=resolution,
-                    negative_prompt="text, watermark, typography, subtitles, logos, blurry, low quality, distorted, morphing, flickering, jittery, shaky, nsfw, violence, deformed, ugly, bad anatomy, unnatural motion, symbols, letters, numbers, static text",
-                    person_generation="allow_adult",
-                ),
-            )
+        log_api_start(
+            "Veo Video Generation",
+            f"Duration: {duration_seconds}s, Resolution: {resolution}",
+        )
+        start_time = time.time()
 
-            result = self._handle_operation(
+        try:
+            operation, output_gcs_uri = await asyncio.to_thread(
+                self._start_text_video,
+                prompt,
+                duration_seconds,
+                resolution,
+                progress_callback,
+            )
+            result = await self._handle_operation_async(
                 operation, duration_seconds, progress_callback, output_gcs_uri
             )
 
@@ -528,60 +696,47 @@ class VeoClient:
         prompt: str,
         duration_seconds: int = 8,
         progress_callback: Callable[[str, int], None] | None = None,
-    ) -> bytes | None:
+    ) -> VideoArtifact | str | None:
         """이미지 기반 비디오 생성 (Image-to-Video)"""
         log_api_start("Veo I2V Generation", f"Duration: {duration_seconds}s")
         start_time = time.time()
 
         try:
-            self._pre_flight_safety_check(prompt)
-            from google.genai.types import GenerateVideosConfig
-
-            client = self._get_client()
-
-            # 이미지 파트 생성
-            try:
-                import io
-
-                from PIL import Image
-
-                image = Image.open(io.BytesIO(image_bytes))
-            except Exception as img_err:
-                log_error(f"이미지 처리 오류: {img_err}")
-                raise VeoAPIError("유효하지 않은 이미지 데이터입니다.") from img_err
-
-            date_str = datetime.now().strftime("%Y%m%d")
-            output_gcs_uri = f"gs://{self._gcs_bucket_name}/videos_i2v/{date_str}/"
+            operation, output_gcs_uri = self._start_image_video(
+                image_bytes, prompt, duration_seconds, progress_callback
+            )
+            result = self._handle_operation(
+                operation, duration_seconds, progress_callback, output_gcs_uri
+            )
 
-            if progress_callback:
-                progress_callback("Veo Image-to-Video API 요청 중...", 10)
+            elapsed = time.time() - start_time
+            log_api_end("Veo I2V Generation", duration=elapsed)
+            return result
 
-            enhanced_prompt = f"""
-            {prompt}
+        except Exception as e:
+            log_error(f"이미지 기반 비디오 생성 실패: {e}")
+            raise VeoAPIError(f"이미지 기반 비디오 생성 실패: {e}") from e
 
-            TRANSITION: Start from the provided image and naturally animate the scene.
-            CAMERA: Smooth cinematic motion.
-            QUALITY: 4k photorealistic, high fidelity.
-            RESTRICTION: ZERO text, no watermarks, no typography on screen.
-            NEGATIVE PROMPT: morphing, structural distortion, blurry, text artifacts, subtitles, logos.
-            """.strip()
+    async def generate_video_from_image_async(
+        self,
+        image_bytes: bytes,
+        prompt: str,
+        duration_seconds: int = 8,
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> VideoArtifact | str | None:
+        """이미지 기반 비디오 생성 (비동기)"""
+        log_api_start("Veo I2V Generation", f"Duration: {duration_seconds}s")
+        start_time = time.time()
 
-            operation = client.models.generate_videos(
-                model=self._model_id,
-                prompt=enhanced_prompt,
-                config=GenerateVideosConfig(
-                    input_images=[image],  # type: ignore[call-arg]
-                    aspect_ratio="9:16",
-                    output_gcs_uri=output_gcs_uri,
-                    duration_seconds=duration_seconds,
-                    generate_audio=True,
-                    number_of_videos=1,
-                    negative_prompt="watermarks, text, subtitles, low quality",
-                    person_generation="allow_adult",
-                ),
+        try:
+            operation, output_gcs_uri = await asyncio.to_thread(
+                self._start_image_video,
+                image_bytes,
+                prompt,
+                duration_seconds,
+                progress_callback,
             )
-
-            result = self._handle_operation(
+            result = await self._handle_operation_async(
                 operation, duration_seconds, progress_callback, output_gcs_uri
             )
 
@@ -593,45 +748,112 @@ class VeoClient:
             log_error(f"이미지 기반 비디오 생성 실패: {e}")
             raise VeoAPIError(f"이미지 기반 비디오 생성 실패: {e}") from e
 
+    def generate_video_with_fallback(
+        self,
+        phase1_prompt: str,
+        phase2_prompt: str,
+        duration_seconds: int = 8,
+        resolution: str = "1080p",
+        progress_callback: Callable[[str, int], None] | None = None,
+        phase2_image_bytes: bytes | None = None,
+    ) -> VideoArtifact | str:
+        """
+        듀얼 페이즈 생성 (Phase 2 실패 시 Phase 1 결과로 대체)
+
+        두 오퍼레이션을 먼저 모두 제출하고 작업 관리자에서 함께 대기한다.
+        """
+        duration_seconds = self._clamp_duration(duration_seconds)
         self._pre_flight_safety_check(phase1_prompt)
         self._pre_flight_safety_check(phase2_prompt)
 
-        phase1_result = self.generate_video(
-            prompt=phase1_prompt,
-            duration_seconds=duration_seconds,
-            resolution=resolution,
-            progress_callback=progress_callback,
+        max_wait = self._max_wait(duration_seconds)
+        manager = self._get_job_manager()
+
+        phase1_op, phase1_uri = self._start_text_video(
+            phase1_prompt, duration_seconds, resolution, progress_callback
         )
+        phase1_future = manager.submit(phase1_op, max_wait, progress_callback)
 
+        phase2_future = None
+        phase2_uri = ""
         try:
-            phase2_result: bytes | str | None
             if phase2_image_bytes is not None:
-                phase2_result = self.generate_video_from_image(
-                    image_bytes=phase2_image_bytes,
-                    prompt=phase2_prompt,
-                    duration_seconds=duration_seconds,
-                    progress_callback=progress_callback,
+                phase2_op, phase2_uri = self._start_image_video(
+                    phase2_image_bytes, phase2_prompt, duration_seconds, None
                 )
             else:
-                phase2_result = self.generate_video(
-                    prompt=phase2_prompt,
-                    duration_seconds=duration_seconds,
-                    resolution=resolution,
-                    progress_callback=progress_callback,
+                phase2_op, phase2_uri = self._start_text_video(
+                    phase2_prompt, duration_seconds, resolution, None
                 )
+            phase2_future = manager.submit(phase2_op, max_wait)
+        except Exception as e:
+            log_error(f"Phase 2 submission failed, falling back to phase 1: {e}")
+
+        phase1_result = self._collect_result(
+            phase1_future.result(), progress_callback, phase1_uri
+        )
+        if phase2_future is None:
+            return phase1_result
 
+        try:
+            phase2_result = self._collect_result(
+                phase2_future.result(), None, phase2_uri
+            )
             return phase2_result or phase1_result
         except Exception as e:
             log_error(f"Phase 2 generation failed, falling back to phase 1: {e}")
             return phase1_result
 
+    async def generate_video_with_fallback_async(
+        self,
+        phase1_prompt: str,
+        phase2_prompt: str,
+        duration_seconds: int = 8,
+        resolution: str = "1080p",
+        progress_callback: Callable[[str, int], None] | None = None,
+        phase2_image_bytes: bytes | None = None,
+    ) -> VideoArtifact | str:
+        """듀얼 페이즈 생성 (비동기, 두 페이즈 동시 진행)"""
+        duration_seconds = self._clamp_duration(duration_seconds)
+        self._pre_flight_safety_check(phase1_prompt)
+        self._pre_flight_safety_check(phase2_prompt)
+
+        if phase2_image_bytes is not None:
+            phase2 = self.generate_video_from_image_async(
+                phase2_image_bytes, phase2_prompt, duration_seconds
+            )
+        else:
+            phase2 = self.generate_video_async(
+                prompt=phase2_prompt,
+                duration_seconds=duration_seconds,
+                resolution=resolution,
+            )
+        phase1_result, phase2_result = await asyncio.gather(
+            self.generate_video_async(
+                prompt=phase1_prompt,
+                duration_seconds=duration_seconds,
+                resolution=resolution,
+                progress_callback=progress_callback,
+            ),
+            phase2,
+            return_exceptions=True,
+        )
+        if isinstance(phase1_result, BaseException):
+            raise phase1_result
+        if isinstance(phase2_result, BaseException):
+            log_error(
+                f"Phase 2 generation failed, falling back to phase 1: {phase2_result}"
+            )
+            return phase1_result
+        return phase2_result or phase1_result
+
     def extend_video(
         self,
         video_uri: str,
         prompt: str,
         duration_seconds: int = 8,
         progress_callback: Callable[[str, int], None] | None = None,
-    ) -> bytes | str:
+    ) -> VideoArtifact | str:
         """
         기존 비디오 연장 (Veo Video Extension)
 
@@ -647,37 +869,44 @@ class VeoClient:
         start_time = time.time()
 
         try:
-            self._pre_flight_safety_check(prompt)
-            from google.genai.types import GenerateVideosConfig, Video
+            operation, output_gcs_uri = self._start_extension(
+                video_uri, prompt, duration_seconds, progress_callback
+            )
+            result = self._handle_operation(
+                operation, duration_seconds, progress_callback, output_gcs_uri
+            )
 
-            client = self._get_client()
+            elapsed = time.time() - start_time
+            log_api_end("Veo Video Extension", duration=elapsed)
+            return result
 
-            date_str = datetime.now().strftime("%Y%m%d")
-            output_gcs_uri = f"gs://{self._gcs_bucket_name}/videos_ext/{date_str}/"
+        except Exception as e:
+            log_error(f"비디오 연장 실패: {e}")
+            raise VeoAPIError(f"비디오 연장 실패: {e}") from e
 
-            if progress_callback:
-                progress_callback("Veo Video Extension 요청 중...", 10)
-
-            # GCS URI를 Video 객체로 변환하여 입력 비디오로 사용
-            # google.genai.types.Video 객체 생성 (uri 필수)
-            input_video = Video(uri=video_uri)
-
-            operation = client.models.generate_videos(
-                model=self._model_id,
-                prompt=prompt,
-                video=input_video,  # Video 객체 전달
-                config=GenerateVideosConfig(
-                    aspect_ratio="9:16",
-                    output_gcs_uri=output_gcs_uri,
-                    duration_seconds=duration_seconds,
-                    generate_audio=True,
-                    number_of_videos=1,
-                    negative_prompt="watermarks, text, subtitles, low quality, morphing",
-                    person_generation="allow_adult",
-                ),
-            )
+    async def extend_video_async(
+        self,
+        video_uri: str,
+        prompt: str,
+        duration_seconds: int = 8,
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> VideoArtifact | str:
+        """기존 비디오 연장 (비동기)"""
+        log_api_start(
+            "Veo Video Extension",
+            f"Source: {video_uri}, Ext Duration: {duration_seconds}s",
+        )
+        start_time = time.time()
 
-            result = self._handle_operation(
+        try:
+            operation, output_gcs_uri = await asyncio.to_thread(
+                self._start_extension,
+                video_uri,
+                prompt,
+                duration_seconds,
+                progress_callback,
+            )
+            result = await self._handle_operation_async(
                 operation, duration_seconds, progress_callback, output_gcs_uri
             )
 
@@ -737,33 +966,27 @@ class VeoClient:
     def _handle_operation(
         self, operation, duration_seconds, progress_callback, output_gcs_uri
     ):
-        """비디오 생성 오퍼레이션 공통 처리"""
-        if progress_callback:
-            progress_callback("작업 시작됨", 20)
-
-        client = self._get_client()
-        max_wait = 180 if duration_seconds > 8 else 120
-        waited = 0
-
+        """비디오 생성 오퍼레이션 공통 처리 (동기 호출 측)"""
+        max_wait = self._max_wait(duration_seconds)
         log_process("Veo Generating", 0, max_wait)
+        operation = self._get_job_manager().wait_sync(
+            operation, max_wait, progress_callback
+        )
+        return self._collect_result(operation, progress_callback, output_gcs_uri)
 
-        while not operation.done and waited < max_wait:
-            time.sleep(10)
-            waited += 10
-            # 백그라운드 체크 중 에러 발생 시 처리
-            try:
-                operation = client.operations.get(operation)
-            except Exception as op_err:
-                log_error(f"Operation 상태 확인 중 오류: {op_err}")
-                # 상태 확인 실패해도 계속 대기해볼 수 있음 (일시적 오류일 수 있으므로)
-                continue
-
-            log_process("Veo Generating", waited, max_wait)
-
-            if progress_callback:
-                progress = min(20 + int((waited / max_wait) * 60), 80)
-                progress_callback(f"생성 중... ({waited}초)", progress)
+    async def _handle_operation_async(
+        self, operation, duration_seconds, progress_callback, output_gcs_uri
+    ):
+        """비디오 생성 오퍼레이션 공통 처리 (비동기 호출 측)"""
+        max_wait = self._max_wait(duration_seconds)
+        log_process("Veo Generating", 0, max_wait)
+        operation = await self._get_job_manager().wait(
+            operation, max_wait, progress_callback
+        )
+        return self._collect_result(operation, progress_callback, output_gcs_uri)
 
+    def _collect_result(self, operation, progress_callback, output_gcs_uri):
+        """완료된 오퍼레이션에서 결과 비디오 위치 회수"""
         if operation.done and operation.result:
             generated_videos = getattr(operation.result, "generated_videos", None)
 
@@ -779,46 +1002,50 @@ class VeoClient:
 
             logger.info(f"비디오 생성 완료: {video_uri}")
 
+            # 바이트를 내려받지 않고 GCS 위치만 반환한다.
+            # 업로드는 서버 측 복사, 로컬 보관은 download_video()로 스트리밍 저장
+            logger.info(f"비디오가 GCS에 보존되었습니다: {video_uri}")
             if progress_callback:
-                progress_callback("비디오 다운로드 중...", 85)
-
-            # GCS에서 다운로드
-            try:
-                from google.cloud import storage as gcs_storage
+                progress_callback("비디오 생성 완료!", 100)
+            return VideoArtifact(gcs_uri=video_uri)
 
-                download_start = time.time()
-                gcs_client = gcs_storage.Client()
-                path_parts = video_uri.replace("gs://", "").split("/", 1)
-                bucket_name = path_parts[0]
-                blob_path = path_parts[1] if len(path_parts) > 1 else ""
-
-                bucket = gcs_client.bucket(bucket_name)
-                blob = bucket.blob(blob_path)
-                video_content = blob.download_as_bytes()
+        return f"영상 생성 진행 중 (백그라운드)\nGCS에서 확인: {output_gcs_uri}"
 
-                # 임시 파일 삭제 (Clean up) - 사용자 요청으로 비활성화 (버킷 보존)
-                # try:
-                #     blob.delete()
-                #     logger.info(f"임시 비디오 파일 삭제 완료: {video_uri}")
-                # except Exception as del_err:
-                #     logger.warning(f"임시 비디오 파일 삭제 실패 (무시됨): {del_err}")
+    def _get_storage_client(self):
+        """GCS 클라이언트 반환 (지연 초기화, 다운로드마다 재생성하지 않음)"""
+        if self._storage_client is None:
+            from google.cloud import storage as gcs_storage
 
-                logger.info(f"비디오가 GCS에 보존되었습니다: {video_uri}")
+            self._storage_client = gcs_storage.Client(project=self._project_id)
+        return self._storage_client
 
-                log_timing("Video Download", (time.time() - download_start) * 1000)
+    def download_video(
+        self,
+        artifact: VideoArtifact,
+        dest_dir: Path | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> VideoArtifact:
+        """
+        생성된 비디오를 로컬 파일로 스트리밍 다운로드 (MD5 검증)
 
-                if progress_callback:
-                    progress_callback("비디오 생성 완료!", 100)
+        메모리에는 청크 하나만 올라가며, 기본 저장 위치는 출력 디렉터리의 videos/
+        """
+        if artifact.local_path or not artifact.gcs_uri:
+            return artifact
 
-                return video_content
+        download_start = time.time()
+        bucket_name, blob_path = parse_gcs_uri(artifact.gcs_uri)
+        out_dir = (dest_dir or ensure_output_dir()) / "videos"
+        name = datetime.now().strftime("video_%Y%m%d_%H%M%S_") + Path(blob_path).name
+        dest = out_dir / name
 
-            except Exception as download_error:
-                log_error(f"비디오 다운로드 오류: {download_error}")
-                return (
-                    f"영상 생성됨 (GCS): {video_uri}\n다운로드 오류: {download_error}"
-                )
+        blob = self._get_storage_client().bucket(bucket_name).blob(blob_path)
+        size, md5_hash = stream_blob_to_file(blob, dest, chunk_size=chunk_size)
 
-        return f"영상 생성 진행 중 (백그라운드)\nGCS에서 확인: {output_gcs_uri}"
+        log_timing("Video Download", (time.time() - download_start) * 1000)
+        return artifact.model_copy(
+            update={"local_path": str(dest), "size_bytes": size, "md5_hash": md5_hash}
+        )
 
     # === 상업용 프롬프트 템플릿 (Veo 3.1 최적화) ===
     PRODUCT_SHOT_TEMPLATE = """
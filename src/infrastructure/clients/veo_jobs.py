@@ -0,0 +1,230 @@
+"""
+Veo 작업(Long-running Operation) 관리자
+여러 비디오 생성 작업을 하나의 이벤트 루프 태스크에서 적응형 간격으로 폴링
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+from utils.logger import get_logger, log_error, log_process
+
+logger = get_logger(__name__)
+
+# 초반에는 짧게 확인하고 점점 간격을 늘린다 (2s → 3s → 4.5s … 최대 8s)
+DEFAULT_INITIAL_INTERVAL = 2.0
+DEFAULT_MAX_INTERVAL = 8.0
+DEFAULT_BACKOFF = 1.5
+
+
+@dataclass
+class VeoJob:
+    """폴링 중인 단일 Veo 오퍼레이션"""
+
+    operation: Any
+    timeout: float
+    future: Future
+    progress_callback: Callable[[str, int], None] | None = None
+    started_at: float = field(default_factory=time.monotonic)
+    next_poll_at: float = 0.0
+    interval: float = DEFAULT_INITIAL_INTERVAL
+    polls: int = 0
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+
+class VeoJobManager:
+    """
+    Veo 오퍼레이션 폴링 관리자
+
+    전용 스레드의 이벤트 루프 하나가 등록된 모든 작업을 폴링한다.
+    작업별로 다음 확인 시각을 두고 가장 이른 시각까지만 대기하므로
+    동시 생성 수가 늘어도 대기 스레드는 늘지 않는다.
+
+    - submit(): 스레드 안전, concurrent.futures.Future 반환 (콜백 등록 가능)
+    - wait(): asyncio 호출 측용 awaitable
+    - wait_sync(): 동기 호출 측용
+
+    타임아웃 시에는 예외 대신 마지막으로 조회한(미완료) 오퍼레이션으로 완료된다.
+    """
+
+    def __init__(
+        self,
+        poll: Callable[[Any], Any],
+        initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff: float = DEFAULT_BACKOFF,
+    ) -> None:
+        self._poll = poll
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._jobs: list[VeoJob] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    def submit(
+        self,
+        operation: Any,
+        timeout: float,
+        progress_callback: Callable[[str, int], None] | None = None,
+        on_done: Callable[[Any], None] | None = None,
+    ) -> Future:
+        """오퍼레이션 등록 (완료 또는 타임아웃 시 Future가 오퍼레이션으로 완료)"""
+        future: Future = Future()
+        if on_done:
+            future.add_done_callback(lambda f: on_done(f.result()))
+
+        if getattr(operation, "done", False):
+            future.set_result(operation)
+            return future
+
+        if progress_callback:
+            progress_callback("작업 시작됨", 20)
+
+        job = VeoJob(
+            operation=operation,
+            timeout=timeout,
+            future=future,
+            progress_callback=progress_callback,
+            interval=self._initial_interval,
+        )
+        job.next_poll_at = time.monotonic() + job.interval
+        loop = self._ensure_loop()
+        loop.call_soon_threadsafe(self._add_job, job)
+        return future
+
+    async def wait(
+        self,
+        operation: Any,
+        timeout: float,
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> Any:
+        """비동기 대기 (호출 측 이벤트 루프를 막지 않음)"""
+        return await asyncio.wrap_future(
+            self.submit(operation, timeout, progress_callback)
+        )
+
+    def wait_sync(
+        self,
+        operation: Any,
+        timeout: float,
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> Any:
+        """동기 대기"""
+        return self.submit(operation, timeout, progress_callback).result()
+
+    @property
+    def pending(self) -> int:
+        return len(self._jobs)
+
+    def shutdown(self) -> None:
+        """폴링 루프 종료 (남은 작업은 현재 오퍼레이션으로 완료 처리)"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        for job in self._jobs:
+            if not job.future.done():
+                job.future.set_result(job.operation)
+        self._jobs.clear()
+
+    # ------------------------------------------------------------------
+    # 폴링 루프
+    # ------------------------------------------------------------------
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None:
+                return self._loop
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run() -> None:
+                asyncio.set_event_loop(loop)
+                self._wakeup = asyncio.Event()
+                task = loop.create_task(self._poll_loop())
+                ready.set()
+                loop.run_forever()
+                task.cancel()
+                loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+                loop.close()
+
+            thread = threading.Thread(target=run, name="veo-job-manager", daemon=True)
+            thread.start()
+            ready.wait()
+            self._loop, self._thread = loop, thread
+            return loop
+
+    def _add_job(self, job: VeoJob) -> None:
+        self._jobs.append(job)
+        assert self._wakeup is not None
+        self._wakeup.set()
+
+    async def _poll_loop(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            if not self._jobs:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            delay = min(job.next_poll_at for job in self._jobs) - time.monotonic()
+            if delay > 0:
+                try:
+                    # 새 작업이 들어오면 더 이른 확인 시각을 반영하기 위해 깨어남
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    self._wakeup.clear()
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+
+            now = time.monotonic()
+            due = [job for job in self._jobs if job.next_poll_at <= now]
+            await asyncio.gather(*(self._poll_job(job) for job in due))
+            self._jobs = [job for job in self._jobs if not job.future.done()]
+
+    async def _poll_job(self, job: VeoJob) -> None:
+        job.polls += 1
+        try:
+            job.operation = await asyncio.to_thread(self._poll, job.operation)
+        except Exception as op_err:
+            # 일시적 오류일 수 있으므로 타임아웃 전까지는 계속 대기
+            log_error(f"Operation 상태 확인 중 오류: {op_err}")
+
+        elapsed = job.elapsed
+        if getattr(job.operation, "done", False) or elapsed >= job.timeout:
+            if not job.future.done():
+                job.future.set_result(job.operation)
+            return
+
+        log_process("Veo Generating", int(elapsed), int(job.timeout))
+        if job.progress_callback:
+            progress = min(20 + int((elapsed / job.timeout) * 60), 80)
+            try:
+                job.progress_callback(f"생성 중... ({int(elapsed)}초)", progress)
+            except Exception as cb_err:
+                logger.warning(f"Veo 진행 콜백 오류: {cb_err}")
+
+        job.interval = min(job.interval * self._backoff, self._max_interval)
+        remaining = job.timeout - elapsed
+        job.next_poll_at = time.monotonic() + min(job.interval, max(remaining, 0.0))
+
+
+__all__ = ["VeoJob", "VeoJobManager"]
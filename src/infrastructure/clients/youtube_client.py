@@ -3,30 +3,78 @@ YouTube API 클라이언트
 YouTube Data API v3를 사용한 비디오 검색 및 댓글 수집
 """
 
+import json
+import threading
+from collections.abc import Iterable, Iterator
+from typing import Any
 
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from youtube_transcript_api import YouTubeTranscriptApi
 
-from config.constants import YOUTUBE_LANGUAGES
+from config.constants import (
+    YOUTUBE_COMMENT_PAGE_LIMIT,
+    YOUTUBE_FETCH_CONCURRENCY,
+    YOUTUBE_LANGUAGES,
+    YOUTUBE_VIDEOS_BATCH_SIZE,
+)
 from core.exceptions import YouTubeAPIError
+from infrastructure.storage.comment_archive import CommentArchive
 from utils.cache import cached
+from utils.concurrency import map_bounded
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_discovery_doc: dict[str, Any] | None = None
+_discovery_lock = threading.Lock()
+
+
+def _youtube_discovery_doc() -> dict[str, Any]:
+    """
+    googleapiclient에 포함된 youtube v3 정적 디스커버리 문서 (프로세스당 1회 파싱)
+
+    build()는 스레드별 클라이언트를 만들 때마다 문서 파일을 읽고 JSON을 다시 파싱하므로
+    파싱 결과를 공유하여 콜드 스타트와 워커 스레드 초기화 비용을 줄인다.
+    """
+    global _discovery_doc
+    if _discovery_doc is None:
+        with _discovery_lock:
+            if _discovery_doc is None:
+                content = get_static_doc("youtube", "v3")
+                if content is None:
+                    raise YouTubeAPIError("YouTube 정적 디스커버리 문서를 찾을 수 없음")
+                _discovery_doc = json.loads(content)
+    return _discovery_doc
+
 
 class YouTubeClient:
     """YouTube API 클라이언트"""
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        max_workers: int = YOUTUBE_FETCH_CONCURRENCY,
+        comment_archive: CommentArchive | None = None,
+        comment_page_limit: int = YOUTUBE_COMMENT_PAGE_LIMIT,
+    ) -> None:
         self._api_key = api_key
-        self._youtube = None
+        self._max_workers = max(1, max_workers)
+        # 설정 시 collect_video_data가 워터마크 기반 증분 댓글 수집을 사용
+        self._comment_archive = comment_archive
+        self._comment_page_limit = comment_page_limit
+        # googleapiclient 리소스(httplib2)는 스레드 안전하지 않으므로 스레드별로 생성
+        self._local = threading.local()
 
     def _get_client(self):
-        """YouTube API 클라이언트 인스턴스 반환 (지연 초기화)"""
-        if self._youtube is None:
-            self._youtube = build("youtube", "v3", developerKey=self._api_key)
-        return self._youtube
+        """YouTube API 클라이언트 인스턴스 반환 (스레드별 지연 초기화)"""
+        youtube = getattr(self._local, "youtube", None)
+        if youtube is None:
+            youtube = build_from_document(
+                _youtube_discovery_doc(), developerKey=self._api_key
+            )
+            self._local.youtube = youtube
+        return youtube
 
     def is_configured(self) -> bool:
         """API 키가 설정되었는지 확인"""
@@ -42,7 +90,7 @@ class YouTubeClient:
         except Exception:
             return False
 
-    @cached(ttl=300, cache_key_prefix="youtube")
+    @cached(ttl=900, cache_key_prefix="youtube", stale_ttl=300)
     def search(self, query: str, max_results: int = 3) -> list[dict]:
         """YouTube 비디오 검색"""
         try:
@@ -81,30 +129,51 @@ class YouTubeClient:
     @cached(ttl=600, cache_key_prefix="youtube")
     def get_video_details(self, video_id: str) -> dict | None:
         """비디오 상세 정보 조회"""
-        try:
-            youtube = self._get_client()
-            request = youtube.videos().list(part="snippet,statistics", id=video_id)
-            response = request.execute()
+        return self.get_videos_details([video_id]).get(video_id)
+
+    def get_videos_details(self, video_ids: Iterable[str]) -> dict[str, dict]:
+        """
+        비디오 상세 정보 일괄 조회
+
+        videos.list는 id를 쉼표로 묶어 한 번에 최대 50개까지 받으므로
+        영상 N개를 ceil(N/50)회 요청(요청당 1 unit)으로 조회한다.
+
+        Returns:
+            {video_id: 상세 정보} (조회 실패/삭제된 영상은 제외)
+        """
+        unique_ids = list(dict.fromkeys(vid for vid in video_ids if vid))
+        details: dict[str, dict] = {}
+        youtube = self._get_client() if unique_ids else None
+        for start in range(0, len(unique_ids), YOUTUBE_VIDEOS_BATCH_SIZE):
+            chunk = unique_ids[start : start + YOUTUBE_VIDEOS_BATCH_SIZE]
+            try:
+                response = youtube.videos().list(
+                    part="snippet,statistics",
+                    id=",".join(chunk),
+                    maxResults=len(chunk),
+                ).execute()
+            except Exception as e:
+                logger.error(f"비디오 상세 정보 조회 실패 ({len(chunk)}개): {e}")
+                continue
+            for item in response.get("items", []):
+                details[item["id"]] = self._parse_video(item)
+        return details
 
-            if not response.get("items"):
-                return None
-
-            item = response["items"][0]
-            return {
-                "id": video_id,
-                "title": item["snippet"]["title"],
-                "description": item["snippet"]["description"],
-                "channel": item["snippet"]["channelTitle"],
-                "published_at": item["snippet"]["publishedAt"],
-                "view_count": int(item["statistics"].get("viewCount", 0)),
-                "like_count": int(item["statistics"].get("likeCount", 0)),
-                "comment_count": int(item["statistics"].get("commentCount", 0)),
-            }
-        except Exception as e:
-            logger.error(f"비디오 상세 정보 조회 실패: {e}")
-            return None
+    @staticmethod
+    def _parse_video(item: dict) -> dict:
+        snippet, statistics = item["snippet"], item.get("statistics", {})
+        return {
+            "id": item["id"],
+            "title": snippet["title"],
+            "description": snippet["description"],
+            "channel": snippet["channelTitle"],
+            "published_at": snippet["publishedAt"],
+            "view_count": int(statistics.get("viewCount", 0)),
+            "like_count": int(statistics.get("likeCount", 0)),
+            "comment_count": int(statistics.get("commentCount", 0)),
+        }
 
-    @cached(ttl=120, cache_key_prefix="youtube")
+    @cached(ttl=900, cache_key_prefix="youtube")
     def get_video_comments(self, video_id: str, max_results: int = 20) -> list[dict]:
         """비디오 댓글 수집"""
         try:
@@ -118,17 +187,7 @@ class YouTubeClient:
             )
             response = request.execute()
 
-            comments = []
-            for item in response.get("items", []):
-                comment = item["snippet"]["topLevelComment"]["snippet"]
-                comments.append(
-                    {
-                        "text": comment["textDisplay"],
-                        "likes": comment.get("likeCount", 0),
-                        "author": comment.get("authorDisplayName", ""),
-                        "published_at": comment.get("publishedAt", ""),
-                    }
-                )
+            comments = [self._parse_comment(item) for item in response.get("items", [])]
 
             # 좋아요 순 정렬
             return sorted(comments, key=lambda x: x["likes"], reverse=True)
@@ -137,6 +196,105 @@ class YouTubeClient:
             # 댓글 비활성화 등의 경우 빈 리스트 반환
             return []
 
+    @staticmethod
+    def _parse_comment(item: dict) -> dict:
+        comment = item["snippet"]["topLevelComment"]["snippet"]
+        return {
+            "id": item.get("id", ""),
+            "text": comment["textDisplay"],
+            "likes": comment.get("likeCount", 0),
+            "author": comment.get("authorDisplayName", ""),
+            "published_at": comment.get("publishedAt", ""),
+        }
+
+    def iter_comment_pages(
+        self,
+        video_id: str,
+        order: str = "time",
+        page_size: int = 100,
+        max_pages: int | None = None,
+    ) -> Iterator[list[dict]]:
+        """
+        댓글 페이지 스트리밍 (nextPageToken 순회)
+
+        order="time"이면 최신순이므로 호출 측에서 워터마크에 닿는 즉시 중단할 수 있다.
+        """
+        youtube = self._get_client()
+        page_token: str | None = None
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            params = {
+                "part": "snippet",
+                "videoId": video_id,
+                "maxResults": min(page_size, 100),
+                "order": order,
+                "textFormat": "plainText",
+            }
+            if page_token:
+                params["pageToken"] = page_token
+            response = youtube.commentThreads().list(**params).execute()
+            pages += 1
+            yield [self._parse_comment(item) for item in response.get("items", [])]
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return
+
+    def fetch_new_comments(
+        self, video_id: str, max_pages: int | None = None
+    ) -> list[dict]:
+        """
+        워터마크 이후 새 댓글만 수집하여 아카이브에 반영
+
+        최신순으로 페이지를 받다가 워터마크 댓글(같은 id 또는 더 이른 publishedAt)을
+        만나면 즉시 중단한다. 아카이브가 없으면 워터마크 없이 max_pages까지 수집한다.
+        페이지 상한에 걸려 워터마크에 닿지 못하면 받은 댓글만 합치고 워터마크는 그대로
+        두어, 다음 수집에서 빠진 구간을 다시 받는다.
+
+        Returns:
+            이번에 새로 받은 댓글 (최신순)
+        """
+        archive = self._comment_archive
+        watermark = archive.watermark(video_id) if archive else None
+        page_limit = max_pages or self._comment_page_limit
+        new_comments: list[dict] = []
+        pages = 0
+        reached = False
+        for page in self.iter_comment_pages(video_id, order="time", max_pages=page_limit):
+            pages += 1
+            for comment in page:
+                if watermark and (
+                    comment["id"] == watermark["id"]
+                    or comment["published_at"] < watermark["published_at"]
+                ):
+                    reached = True
+                    break
+                new_comments.append(comment)
+            if reached:
+                break
+
+        if archive:
+            # 상한보다 적은 페이지에서 끝났으면 마지막 페이지까지 받은 것
+            # (상한과 같으면 다음 페이지 유무를 모르므로 중간이 빈 것으로 본다)
+            exhausted = page_limit is None or pages < page_limit
+            archive.merge(
+                video_id,
+                new_comments,
+                advance_watermark=watermark is None or reached or exhausted,
+            )
+        logger.info(f"YouTube 증분 댓글 수집: {video_id} -> 새 댓글 {len(new_comments)}개")
+        return new_comments
+
+    def get_archived_comments(self, video_id: str, max_results: int = 30) -> list[dict]:
+        """증분 수집 후 아카이브 전체에서 좋아요 상위 댓글 반환"""
+        try:
+            self.fetch_new_comments(video_id)
+        except Exception as e:
+            # 댓글 비활성화/쿼터 초과 시 기존 아카이브만 사용
+            logger.warning(f"YouTube 증분 댓글 수집 실패 ({video_id}): {e}")
+        comments = self._comment_archive.load(video_id) if self._comment_archive else []
+        return sorted(comments, key=lambda x: x.get("likes", 0), reverse=True)[:max_results]
+
+    @cached(ttl=86400, cache_key_prefix="youtube_transcript")
     def get_transcript(self, video_id: str) -> str | None:
         """비디오 자막 추출"""
         try:
@@ -152,6 +310,7 @@ class YouTubeClient:
         product: dict,
         max_results: int = 5,
         include_comments: bool = True,
+        comments_per_video: int = 30,
     ) -> dict:
         """제품 기반 YouTube 데이터 수집"""
         # 검색 키워드 생성
@@ -165,39 +324,62 @@ class YouTubeClient:
         all_comments = []
         seen_video_ids: set[str] = set()
         video_limit = max(1, int(max_results))
+        search_keywords = keywords[:2]  # 상위 2개 키워드
 
-        for keyword in keywords[:2]:  # 상위 2개 키워드
-            try:
-                videos = self.search(keyword, video_limit)
-                if len(videos) > video_limit:
-                    videos = videos[:video_limit]
-                for v in videos:
-                    if v["id"] in seen_video_ids:
-                        continue
-                    seen_video_ids.add(v["id"])
-                    transcript = self.get_transcript(v["id"])
-
-                    comments = []
-                    if include_comments:
-                        comments = self.get_video_comments(v["id"], max_results=30)
-                        all_comments.extend(comments)
-
-                    collected_videos.append(
-                        {
-                            "keyword": keyword,
-                            "video_id": v["id"],
-                            "title": v["title"],
-                            "description": v["description"],
-                            "transcript": transcript[:2000]
-                            if transcript
-                            else v["description"][:500],
-                            "thumbnail": v.get("thumbnail", ""),
-                            "channel": v.get("channel", ""),
-                            "comments_count": len(comments),
-                        }
-                    )
-            except YouTubeAPIError:
+        # 1) 키워드 검색 병렬 실행 (결과는 키워드 순서 유지)
+        search_results = map_bounded(
+            lambda keyword: self.search(keyword, video_limit),
+            search_keywords,
+            self._max_workers,
+        )
+
+        # 2) 키워드/검색 순서대로 video id 중복 제거
+        targets: list[tuple[str, dict]] = []
+        for keyword, videos in zip(search_keywords, search_results, strict=True):
+            if isinstance(videos, YouTubeAPIError):
                 continue
+            if isinstance(videos, Exception):
+                raise videos
+            for v in videos[:video_limit]:
+                if v["id"] in seen_video_ids:
+                    continue
+                seen_video_ids.add(v["id"])
+                targets.append((keyword, v))
+
+        # 3) 영상별 자막/댓글을 하나의 제한된 풀에서 동시 조회
+        jobs = [(v["id"], "transcript") for _, v in targets]
+        if include_comments:
+            jobs += [(v["id"], "comments") for _, v in targets]
+        fetched = dict(
+            zip(
+                jobs,
+                map_bounded(
+                    lambda job: self._fetch_video_part(job, comments_per_video),
+                    jobs,
+                    self._max_workers,
+                ),
+                strict=True,
+            )
+        )
+
+        for keyword, v in targets:
+            transcript = fetched[(v["id"], "transcript")]
+            comments = fetched.get((v["id"], "comments"), [])
+            all_comments.extend(comments)
+            collected_videos.append(
+                {
+                    "keyword": keyword,
+                    "video_id": v["id"],
+                    "title": v["title"],
+                    "description": v["description"],
+                    "transcript": transcript[:2000]
+                    if transcript
+                    else v["description"][:500],
+                    "thumbnail": v.get("thumbnail", ""),
+                    "channel": v.get("channel", ""),
+                    "comments_count": len(comments),
+                }
+            )
 
         # 페인/게인 포인트 분석
         pain_points = (
@@ -216,6 +398,19 @@ class YouTubeClient:
             "top_comments": all_comments[:20] if all_comments else [],
         }
 
+    def _fetch_video_part(self, job: tuple[str, str], comments_per_video: int = 30):
+        """collect_video_data 팬아웃 작업 1개 (자막 또는 댓글, 실패 시 빈 값)"""
+        video_id, part = job
+        try:
+            if part == "transcript":
+                return self.get_transcript(video_id)
+            if self._comment_archive is not None:
+                return self.get_archived_comments(video_id, max_results=comments_per_video)
+            return self.get_video_comments(video_id, max_results=comments_per_video)
+        except Exception as e:
+            logger.warning(f"YouTube {part} 조회 실패 ({video_id}): {e}")
+            return None if part == "transcript" else []
+
     def extract_pain_points(self, comments: list[dict]) -> list[dict]:
         """댓글에서 페인포인트 추출"""
         pain_keywords = [
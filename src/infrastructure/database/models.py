@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -154,10 +154,10 @@ class CTRFeedback(Base):
     __tablename__ = "ctr_feedback"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    video_id: Mapped[str] = mapped_column(String(200), nullable=False)
-    predicted_ctr: Mapped[str] = mapped_column(String(20), nullable=False)
-    actual_ctr: Mapped[str | None] = mapped_column(String(20), nullable=True)
-    error: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    video_id: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    predicted_ctr: Mapped[float] = mapped_column(Float, nullable=False)
+    actual_ctr: Mapped[float | None] = mapped_column(Float, nullable=True)
+    error: Mapped[float | None] = mapped_column(Float, nullable=True)
     model_version: Mapped[str] = mapped_column(String(50), default="v1", nullable=False)
     metadata_json: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -0,0 +1,148 @@
+"""
+제품별 데이터 수집 스냅샷 로컬 저장소
+같은 제품 + 같은 수집 설정의 CollectedData(분석된 인사이트 포함)를 디스크에 보관하여 재사용
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from core.models import CollectedData, PipelineConfig
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 수집 결과에 영향을 주는 설정만 지문에 포함 (생성/업로드 설정은 제외)
+COLLECTION_CONFIG_FIELDS: tuple[str, ...] = (
+    "youtube_count",
+    "naver_count",
+    "include_comments",
+    "include_transcript",
+    "max_comment_samples",
+)
+
+
+@dataclass
+class CollectionSnapshot:
+    """저장된 수집 결과 1건"""
+
+    collected: CollectedData
+    fingerprint: str
+    created_at: float
+    fresh: bool
+
+    @property
+    def age_seconds(self) -> float:
+        return max(time.time() - self.created_at, 0.0)
+
+
+class CollectionSnapshotStore:
+    """
+    제품 + 설정 지문 단위 수집 스냅샷
+
+    {제품}/{지문}.json 하나에 최신 스냅샷만 유지한다.
+    ttl_seconds 이내면 fresh로 표시하고, 그보다 오래된 스냅샷도 증분(delta) 재사용을 위해
+    max_age_seconds까지는 돌려준다.
+    """
+
+    def __init__(
+        self,
+        base_dir: str | Path,
+        ttl_seconds: float = 1800,
+        max_age_seconds: float = 7 * 86400,
+    ) -> None:
+        self._base_dir = Path(base_dir)
+        self._ttl = ttl_seconds
+        self._max_age = max_age_seconds
+        self._lock = threading.Lock()
+        self._stats = {"fresh_hits": 0, "stale_hits": 0, "misses": 0, "saves": 0}
+
+    @staticmethod
+    def fingerprint(product: dict, config: PipelineConfig) -> str:
+        """제품명 + 수집 관련 설정의 정규화 지문"""
+        payload = {
+            "product": (product.get("name") or "").strip().lower(),
+            **{field: getattr(config, field) for field in COLLECTION_CONFIG_FIELDS},
+        }
+        raw = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+    def load(self, product: dict, config: PipelineConfig) -> CollectionSnapshot | None:
+        """스냅샷 조회 (없거나 max_age를 넘으면 None)"""
+        fingerprint = self.fingerprint(product, config)
+        path = self._path(product, fingerprint)
+        data = self._read(path)
+        if data is None:
+            self._count("misses")
+            return None
+
+        created_at = float(data.get("created_at", 0))
+        age = time.time() - created_at
+        if age > self._max_age:
+            self._count("misses")
+            return None
+        try:
+            collected = CollectedData.model_validate(data["collected"])
+        except Exception as e:
+            logger.warning(f"수집 스냅샷 형식 오류 ({path.name}): {e}")
+            self._count("misses")
+            return None
+        collected.analyzed_comment_keys = list(data.get("analyzed_comment_keys", []))
+
+        fresh = age <= self._ttl
+        self._count("fresh_hits" if fresh else "stale_hits")
+        return CollectionSnapshot(collected, fingerprint, created_at, fresh)
+
+    def save(self, product: dict, config: PipelineConfig, collected: CollectedData) -> None:
+        fingerprint = self.fingerprint(product, config)
+        payload = {
+            "fingerprint": fingerprint,
+            "product_name": product.get("name", ""),
+            "created_at": time.time(),
+            "collected": collected.model_dump(mode="json"),
+            # model_dump에서 제외되는 필드라 별도 저장 (증분 분석 기준)
+            "analyzed_comment_keys": collected.analyzed_comment_keys,
+        }
+        path = self._path(product, fingerprint)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+        self._count("saves")
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+        lookups = stats["fresh_hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["fresh_hits"] / lookups, 4) if lookups else 0.0
+        stats["ttl_seconds"] = self._ttl
+        return stats
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def _path(self, product: dict, fingerprint: str) -> Path:
+        safe = re.sub(r"[^\w-]", "_", product.get("name") or "unknown")
+        return self._base_dir / safe / f"{fingerprint}.json"
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, Any] | None:
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"수집 스냅샷 읽기 실패 ({path}): {e}")
+            return None
+
+
+__all__ = ["COLLECTION_CONFIG_FIELDS", "CollectionSnapshot", "CollectionSnapshotStore"]
@@ -0,0 +1,109 @@
+"""
+YouTube 댓글 로컬 아카이브
+영상별 수집 댓글과 워터마크(가장 최근 댓글의 publishedAt/id)를 JSON 파일로 보관
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_COMMENTS_PER_VIDEO = 5000
+
+
+class CommentArchive:
+    """
+    영상별 댓글 아카이브
+
+    파일 하나({video_id}.json)에 최신순 댓글 목록과 워터마크를 저장한다.
+    증분 수집 시 워터마크 이후 댓글만 받아 merge()로 합친다.
+    """
+
+    def __init__(
+        self,
+        base_dir: str | Path,
+        max_comments_per_video: int = DEFAULT_MAX_COMMENTS_PER_VIDEO,
+    ) -> None:
+        self._base_dir = Path(base_dir)
+        self._max_comments = max_comments_per_video
+        self._lock = threading.Lock()
+
+    def watermark(self, video_id: str) -> dict[str, str] | None:
+        """마지막으로 수집한 최신 댓글 {"id", "published_at"}"""
+        return self._read(video_id).get("watermark")
+
+    def load(self, video_id: str) -> list[dict[str, Any]]:
+        """아카이브된 댓글 (최신순)"""
+        return self._read(video_id).get("comments", [])
+
+    def merge(
+        self,
+        video_id: str,
+        new_comments: list[dict[str, Any]],
+        advance_watermark: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        새 댓글을 아카이브 앞쪽에 합치고 워터마크 갱신
+
+        Args:
+            advance_watermark: False면 기존 워터마크 유지 (이전 워터마크까지 다 받지 못해
+                중간 댓글이 비어 있을 때, 다음 수집에서 그 구간을 다시 받도록)
+
+        Returns:
+            합쳐진 전체 댓글 (최신순, 상한까지)
+        """
+        with self._lock:
+            data = self._read(video_id)
+            existing = data.get("comments", [])
+            if not new_comments:
+                return existing
+
+            seen = {c.get("id") for c in new_comments if c.get("id")}
+            merged = list(new_comments) + [
+                c for c in existing if not c.get("id") or c.get("id") not in seen
+            ]
+            merged.sort(key=lambda c: c.get("published_at", ""), reverse=True)
+            merged = merged[: self._max_comments]
+
+            watermark = data.get("watermark")
+            if advance_watermark or not watermark:
+                latest = merged[0]
+                watermark = {
+                    "id": latest.get("id", ""),
+                    "published_at": latest.get("published_at", ""),
+                }
+            data = {"watermark": watermark, "comments": merged}
+            self._write(video_id, data)
+            return merged
+
+    def _path(self, video_id: str) -> Path:
+        safe = re.sub(r"[^0-9A-Za-z_-]", "_", video_id)
+        return self._base_dir / f"{safe}.json"
+
+    def _read(self, video_id: str) -> dict[str, Any]:
+        path = self._path(video_id)
+        if not path.exists():
+            return {}
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"댓글 아카이브 읽기 실패 ({video_id}): {e}")
+            return {}
+
+    def _write(self, video_id: str, data: dict[str, Any]) -> None:
+        path = self._path(video_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+__all__ = ["CommentArchive"]
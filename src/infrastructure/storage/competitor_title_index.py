@@ -0,0 +1,264 @@
+"""
+카테고리별 경쟁 제목 색인 (문자 n-gram MinHash + LSH)
+수집한 YouTube 영상 제목/네이버 상품명을 누적 저장하고 가장 비슷한 경쟁 제목을 빠르게 조회
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections.abc import Iterable, Sequence
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from utils.logger import get_logger
+from utils.minhash import (
+    DEFAULT_BANDS,
+    DEFAULT_NGRAM,
+    DEFAULT_NUM_PERM,
+    MinHasher,
+    MinHashLSH,
+    normalize_title,
+    stack_signatures,
+    top_k_similar,
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_CATEGORY = "general"
+# 차별화 점수에 반영할 최근접 경쟁 제목 수
+DEFAULT_NEIGHBORS = 5
+
+
+def category_key(category: Any) -> str:
+    """ProductCategory/문자열/None -> 저장용 카테고리 이름"""
+    if isinstance(category, Enum):
+        category = category.value
+    return str(category or DEFAULT_CATEGORY).strip() or DEFAULT_CATEGORY
+
+
+class CompetitorTitleIndex:
+    """
+    카테고리 1개의 경쟁 제목 색인
+
+    제목별 MinHash 서명 행렬과 LSH 버킷을 함께 유지한다.
+    정규화 후 같은 제목은 한 번만 저장한다.
+    """
+
+    def __init__(self, hasher: MinHasher, bands: int = DEFAULT_BANDS) -> None:
+        self._hasher = hasher
+        self._lsh = MinHashLSH(hasher.num_perm, bands)
+        self.titles: list[str] = []
+        self.sources: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._signatures = stack_signatures([], hasher.num_perm)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def add(
+        self,
+        titles: Iterable[str],
+        source: str | Sequence[str],
+        signatures: np.ndarray | None = None,
+    ) -> int:
+        """
+        새 제목 추가 (중복/빈 제목 제외), 추가된 개수 반환
+
+        source는 전체 공통 출처 또는 제목별 출처 목록.
+        signatures를 주면 (저장본 로드 시) 서명을 다시 계산하지 않는다.
+        """
+        titles = list(titles)
+        sources = [source] * len(titles) if isinstance(source, str) else list(source)
+        new_rows: list[int] = []
+        new_signatures: list[np.ndarray] = []
+        for row, title in enumerate(titles):
+            key = normalize_title(title)
+            if not key or key in self._ids:
+                continue
+            signature = (
+                signatures[row] if signatures is not None else self._hasher.signature(key)
+            )
+            if signature is None:
+                continue
+            self._ids[key] = len(self.titles) + len(new_rows)
+            new_rows.append(row)
+            new_signatures.append(signature)
+
+        if not new_rows:
+            return 0
+        start = len(self.titles)
+        block = stack_signatures(new_signatures, self._hasher.num_perm)
+        self._signatures = np.vstack([self._signatures, block])
+        self.titles.extend(titles[row].strip() for row in new_rows)
+        self.sources.extend(sources[row] for row in new_rows)
+        # 버킷은 마지막에 등록 (동시 조회가 아직 없는 행을 후보로 받지 않도록)
+        self._lsh.add_many(start, block)
+        return len(new_rows)
+
+    def nearest(self, title: str, k: int = DEFAULT_NEIGHBORS) -> list[dict[str, Any]]:
+        """가장 비슷한 경쟁 제목 최대 k개 [{title, source, similarity}]"""
+        signature = self._hasher.signature(title)
+        if signature is None:
+            return []
+        return [
+            {
+                "title": self.titles[idx],
+                "source": self.sources[idx],
+                "similarity": round(similarity, 4),
+            }
+            for idx, similarity in self._nearest(signature, k)
+        ]
+
+    def _nearest(self, signature: np.ndarray, k: int) -> list[tuple[int, float]]:
+        if not self.titles:
+            return []
+        return top_k_similar(
+            signature, self._signatures, self._lsh.candidates(signature), k
+        )
+
+    def differentiation(
+        self, titles: Sequence[str], k: int = DEFAULT_NEIGHBORS
+    ) -> np.ndarray:
+        """
+        제목별 차별화 점수 (0-100)
+
+        최근접 k개(색인이 더 작으면 전체) 평균 유사도 기준. LSH 후보에 들지 못한
+        자리는 유사도 0으로 본다. 점수 규칙은 CTRPredictor._score_differentiation과 같다
+        ((1 - 평균 유사도) * 100, 50~100으로 제한, 비교 대상이 없으면 75).
+        """
+        slots = min(k, len(self.titles))
+        scores = np.full(len(titles), 75.0)
+        if slots == 0:
+            return scores
+        for row, title in enumerate(titles):
+            signature = self._hasher.signature(title)
+            if signature is None:
+                continue
+            average = sum(sim for _, sim in self._nearest(signature, slots)) / slots
+            scores[row] = max(50.0, min(100.0, (1 - average) * 100))
+        return scores
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        return {
+            "titles": np.array(self.titles, dtype=str),
+            "sources": np.array(self.sources, dtype=str),
+            "signatures": self._signatures,
+            "params": np.array(
+                [
+                    self._hasher.num_perm,
+                    self._hasher.ngram,
+                    self._hasher.seed,
+                    self._lsh.bands,
+                ],
+                dtype=np.int64,
+            ),
+        }
+
+
+class CompetitorTitleStore:
+    """
+    카테고리별 경쟁 제목 색인 저장소
+
+    카테고리마다 {category}.npz 파일 하나(제목/출처/서명 배열)를 두고,
+    처음 조회할 때 읽어 LSH 버킷을 메모리에 만든 뒤 계속 재사용한다.
+    add_titles는 메모리 색인에 증분 추가 후 파일을 원자적으로 교체한다.
+    """
+
+    def __init__(
+        self,
+        base_dir: str | Path,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        ngram: int = DEFAULT_NGRAM,
+    ) -> None:
+        self._base_dir = Path(base_dir)
+        self._hasher = MinHasher(num_perm=num_perm, ngram=ngram)
+        self._bands = bands
+        self._indexes: dict[str, CompetitorTitleIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, category: Any) -> CompetitorTitleIndex:
+        key = category_key(category)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = self._load(key)
+                self._indexes[key] = index
+            return index
+
+    def add_titles(self, category: Any, titles: Iterable[str], source: str) -> int:
+        """제목 증분 추가 + 저장, 새로 추가된 개수 반환"""
+        key = category_key(category)
+        index = self.get(key)
+        with self._lock:
+            added = index.add(titles, source)
+            if added:
+                self._write(key, index)
+        if added:
+            logger.info(f"경쟁 제목 색인 [{key}] +{added}개 (총 {len(index)}개, {source})")
+        return added
+
+    def nearest(
+        self, category: Any, title: str, k: int = DEFAULT_NEIGHBORS
+    ) -> list[dict[str, Any]]:
+        return self.get(category).nearest(title, k)
+
+    def differentiation(
+        self, category: Any, titles: Sequence[str], k: int = DEFAULT_NEIGHBORS
+    ) -> np.ndarray | None:
+        """색인이 비어 있으면 None (호출 측 기본 규칙 사용)"""
+        index = self.get(category)
+        if not len(index):
+            return None
+        return index.differentiation(titles, k)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {key: len(index) for key, index in self._indexes.items()}
+
+    def _path(self, key: str) -> Path:
+        safe = re.sub(r"[^\w-]", "_", key)
+        return self._base_dir / f"{safe}.npz"
+
+    def _load(self, key: str) -> CompetitorTitleIndex:
+        index = CompetitorTitleIndex(self._hasher, self._bands)
+        path = self._path(key)
+        if not path.exists():
+            return index
+        try:
+            with np.load(path) as data:
+                titles = data["titles"].tolist()
+                sources = data["sources"].tolist()
+                signatures = data["signatures"]
+                params = data["params"].tolist()
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"경쟁 제목 색인 읽기 실패 ({key}): {e}")
+            return index
+
+        hasher = self._hasher
+        expected = [hasher.num_perm, hasher.ngram, hasher.seed, self._bands]
+        # 해시 설정이 바뀌었으면 저장된 서명을 버리고 제목으로 다시 계산
+        reuse = params == expected and len(signatures) == len(titles)
+        index.add(titles, sources, signatures=signatures if reuse else None)
+        return index
+
+    def _write(self, key: str, index: CompetitorTitleIndex) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.stem + ".tmp.npz")
+        np.savez_compressed(tmp, **index.to_arrays())
+        os.replace(tmp, path)
+
+
+__all__ = [
+    "DEFAULT_CATEGORY",
+    "DEFAULT_NEIGHBORS",
+    "CompetitorTitleIndex",
+    "CompetitorTitleStore",
+    "category_key",
+]
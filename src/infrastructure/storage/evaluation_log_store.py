@@ -0,0 +1,329 @@
+"""
+모델 평가 로그 저장소 (모델/일 단위 파티션 + 집계 색인)
+보고서/모델 비교가 전체 로그가 아니라 조회한 파티션 수에 비례한 시간에 끝나도록 함
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, fields
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 출력/정답 dict에서 수치 지표로 읽을 키 (앞쪽 우선)
+DEFAULT_METRIC_KEYS = ("predicted_ctr", "actual_ctr", "score", "value")
+
+_INDEX_FILE = "_index.json"
+_DAY_FORMAT = "%Y%m%d"
+_PARTITION = re.compile(r"^(\d{8})\.jsonl$")
+# 예전 평면 구조 파일: {model}_{YYYYMMDD}.jsonl
+_LEGACY_FILE = re.compile(r"^(.+)_(\d{8})\.jsonl$")
+
+
+def _safe_name(model: str) -> str:
+    return re.sub(r"[^\w-]", "_", model) or "_"
+
+
+def _day_key(day: date | str) -> str:
+    return day if isinstance(day, str) else day.strftime(_DAY_FORMAT)
+
+
+@dataclass
+class PartitionStats:
+    """
+    파티션(또는 여러 파티션 합) 누적 집계
+
+    bytes는 집계에 반영된 파티션 파일 앞부분 길이로, 색인 이후 추가된 줄만
+    다시 읽으면 되도록 해 준다 (여러 파티션 합에서는 전체 크기 합).
+    """
+
+    count: int = 0
+    value_count: int = 0
+    value_sum: float = 0.0
+    value_sq_sum: float = 0.0
+    error_count: int = 0
+    error_sum: float = 0.0
+    abs_error_sum: float = 0.0
+    sq_error_sum: float = 0.0
+    bytes: int = 0
+
+    def add(self, value: float | None, truth: float | None) -> None:
+        self.count += 1
+        if value is None:
+            return
+        self.value_count += 1
+        self.value_sum += value
+        self.value_sq_sum += value * value
+        if truth is None:
+            return
+        error = truth - value
+        self.error_count += 1
+        self.error_sum += error
+        self.abs_error_sum += abs(error)
+        self.sq_error_sum += error * error
+
+    def merge(self, other: PartitionStats) -> None:
+        for field in fields(self):
+            setattr(self, field.name, getattr(self, field.name) + getattr(other, field.name))
+
+    @property
+    def mean(self) -> float | None:
+        return self.value_sum / self.value_count if self.value_count else None
+
+    @property
+    def mean_error(self) -> float | None:
+        return self.error_sum / self.error_count if self.error_count else None
+
+    @property
+    def mae(self) -> float | None:
+        return self.abs_error_sum / self.error_count if self.error_count else None
+
+    @property
+    def rmse(self) -> float | None:
+        return math.sqrt(self.sq_error_sum / self.error_count) if self.error_count else None
+
+    def summary(self) -> dict[str, Any]:
+        def rounded(value: float | None) -> float | None:
+            return None if value is None else round(value, 4)
+
+        return {
+            "count": self.count,
+            "scored": self.value_count,
+            "mean": rounded(self.mean),
+            "labeled": self.error_count,
+            "mean_error": rounded(self.mean_error),
+            "mae": rounded(self.mae),
+            "rmse": rounded(self.rmse),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PartitionStats:
+        names = {field.name for field in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+
+class EvaluationLogStore:
+    """
+    {base_dir}/{model}/{YYYYMMDD}.jsonl 파티션에 예측 로그를 append-only로 쌓고
+    {model}/_index.json에 파티션별 누적 집계(건수, 평균, 오차 합)를 둔다.
+
+    append는 파일 끝에 줄만 추가하고, 집계는 조회 시점에 색인 이후 늘어난 부분만
+    읽어 따라잡은 뒤 색인을 원자적으로 교체한다. 그래서 여러 인스턴스/프로세스가
+    같은 파티션에 써도 색인이 틀어지지 않는다.
+    """
+
+    def __init__(
+        self,
+        base_dir: str | Path,
+        metric_keys: tuple[str, ...] = DEFAULT_METRIC_KEYS,
+    ) -> None:
+        self._base_dir = Path(base_dir)
+        self._base_dir.mkdir(parents=True, exist_ok=True)
+        self._metric_keys = metric_keys
+        self._lock = threading.Lock()
+
+    def append(
+        self,
+        model: str,
+        records: Iterable[dict[str, Any]],
+        day: date | None = None,
+    ) -> int:
+        """레코드 여러 건을 해당 일자 파티션 끝에 기록, 기록한 건수 반환"""
+        lines = [
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for record in records
+        ]
+        if not lines:
+            return 0
+        path = self._partition_path(model, day or datetime.now().date())
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 한 번의 write로 기록해 동시 append 시 줄이 섞이지 않게 함
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write("".join(lines))
+        return len(lines)
+
+    def models(self) -> list[str]:
+        return sorted(p.name for p in self._base_dir.iterdir() if p.is_dir())
+
+    def days(
+        self,
+        model: str,
+        start: date | str | None = None,
+        end: date | str | None = None,
+    ) -> list[str]:
+        """start~end(포함) 범위의 파티션 일자 (YYYYMMDD, 오름차순)"""
+        directory = self._base_dir / _safe_name(model)
+        if not directory.is_dir():
+            return []
+        low = _day_key(start) if start is not None else None
+        high = _day_key(end) if end is not None else None
+        days = []
+        for entry in os.scandir(directory):
+            match = _PARTITION.match(entry.name)
+            if not match:
+                continue
+            day = match.group(1)
+            if (low is None or day >= low) and (high is None or day <= high):
+                days.append(day)
+        return sorted(days)
+
+    def partition_stats(
+        self,
+        model: str,
+        start: date | str | None = None,
+        end: date | str | None = None,
+    ) -> dict[str, PartitionStats]:
+        """일자별 집계 (색인 + 색인 이후 추가분만 읽어 갱신)"""
+        days = self.days(model, start, end)
+        if not days:
+            return {}
+        with self._lock:
+            index = self._read_index(model)
+            changed = False
+            stats: dict[str, PartitionStats] = {}
+            for day in days:
+                current = PartitionStats.from_dict(index.get(day, {}))
+                updated = self._catch_up(self._partition_path(model, day), current)
+                if updated is not None:
+                    current = updated
+                    index[day] = current.to_dict()
+                    changed = True
+                stats[day] = current
+            if changed:
+                self._write_index(model, index)
+        return stats
+
+    def aggregate(
+        self,
+        model: str,
+        start: date | str | None = None,
+        end: date | str | None = None,
+    ) -> PartitionStats:
+        total = PartitionStats()
+        for stats in self.partition_stats(model, start, end).values():
+            total.merge(stats)
+        return total
+
+    def iter_records(
+        self,
+        model: str,
+        start: date | str | None = None,
+        end: date | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """조회 범위 레코드를 파티션 순서대로 스트리밍"""
+        for day in self.days(model, start, end):
+            with self._partition_path(model, day).open(encoding="utf-8") as handle:
+                for line in handle:
+                    record = self._parse(line)
+                    if record is not None:
+                        yield record
+
+    def migrate_legacy(self) -> int:
+        """
+        예전 평면 파일({model}_{YYYYMMDD}.jsonl)을 파티션 구조로 옮김, 옮긴 파일 수 반환
+
+        파일을 먼저 임시 이름으로 바꿔 선점하므로 여러 인스턴스가 동시에 불러도 한 번만 옮긴다.
+        """
+        moved = 0
+        for entry in os.scandir(self._base_dir):
+            match = _LEGACY_FILE.match(entry.name)
+            if not match or not entry.is_file():
+                continue
+            claimed = Path(entry.path + ".migrating")
+            try:
+                os.replace(entry.path, claimed)
+            except FileNotFoundError:
+                continue
+            model, day = match.groups()
+            target = self._partition_path(model, day)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with claimed.open(encoding="utf-8") as source, target.open(
+                "a", encoding="utf-8"
+            ) as handle:
+                for line in source:
+                    if line.endswith("\n"):
+                        handle.write(line)
+            claimed.unlink()
+            moved += 1
+        if moved:
+            logger.info(f"평가 로그 {moved}개 파일을 모델/일 파티션으로 이전")
+        return moved
+
+    def _partition_path(self, model: str, day: date | str) -> Path:
+        return self._base_dir / _safe_name(model) / f"{_day_key(day)}.jsonl"
+
+    def _catch_up(self, path: Path, stats: PartitionStats) -> PartitionStats | None:
+        """stats.bytes 이후 완결된 줄만 읽어 반영한 집계 (변경 없으면 None)"""
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return None
+        if size < stats.bytes:
+            # 파일이 교체/절단됨 -> 처음부터 다시 집계
+            stats = PartitionStats()
+        if size == stats.bytes:
+            return None
+        with path.open("rb") as handle:
+            handle.seek(stats.bytes)
+            for raw in handle:
+                if not raw.endswith(b"\n"):
+                    break  # 아직 쓰는 중인 마지막 줄은 다음 조회 때 반영
+                stats.bytes += len(raw)
+                record = self._parse(raw)
+                if record is None:
+                    continue
+                stats.add(
+                    self._metric(record.get("output")),
+                    self._metric(record.get("ground_truth")),
+                )
+        return stats
+
+    def _metric(self, data: Any) -> float | None:
+        if not isinstance(data, dict):
+            return None
+        for key in self._metric_keys:
+            value = data.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return float(value)
+        return None
+
+    @staticmethod
+    def _parse(line: str | bytes) -> dict[str, Any] | None:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return None
+        return record if isinstance(record, dict) else None
+
+    def _read_index(self, model: str) -> dict[str, dict[str, Any]]:
+        path = self._base_dir / _safe_name(model) / _INDEX_FILE
+        if not path.exists():
+            return {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"평가 로그 색인 읽기 실패 ({model}): {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write_index(self, model: str, index: dict[str, dict[str, Any]]) -> None:
+        path = self._base_dir / _safe_name(model) / _INDEX_FILE
+        tmp = path.with_name(f"{_INDEX_FILE}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+__all__ = ["DEFAULT_METRIC_KEYS", "EvaluationLogStore", "PartitionStats"]
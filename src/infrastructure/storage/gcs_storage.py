@@ -4,14 +4,22 @@ Google Cloud Storage 서비스
 
 import json
 import re
+import threading
 import uuid
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from google.api_core.exceptions import Forbidden, NotFound
 from google.cloud import storage
 
 from core.exceptions import GCSDownloadError, GCSUploadError
+from utils.gcs_store import (
+    DEFAULT_CHUNK_SIZE,
+    RESUMABLE_THRESHOLD,
+    encode_json_gzip,
+    stream_blob_to_file,
+)
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -30,6 +38,9 @@ class GCSStorage:
         self._project_id = project_id
         self._location = location
         self._client = None
+        # 버킷 확인은 프로세스당 한 번 (업로드마다 buckets.get을 호출하지 않음)
+        self._bucket_ready = False
+        self._bucket_lock = threading.Lock()
 
     def _get_client(self) -> storage.Client:
         """Storage 클라이언트 인스턴스 반환 (지연 초기화)"""
@@ -48,8 +59,17 @@ class GCSStorage:
         name = f"{slug}-nexloop-korea-{suffix}"
         return name[:63].strip("-")
 
-    def ensure_bucket(self) -> None:
-        """버킷 존재 확인 및 필요 시 생성"""
+    def ensure_bucket(self, force: bool = False) -> None:
+        """버킷 존재 확인 및 필요 시 생성 (확인 결과 캐시, force=True면 재확인)"""
+        if self._bucket_ready and not force:
+            return
+        with self._bucket_lock:
+            if self._bucket_ready and not force:
+                return
+            self._check_bucket()
+            self._bucket_ready = True
+
+    def _check_bucket(self) -> None:
         client = self._get_client()
 
         if not self._bucket_name:
@@ -77,9 +97,10 @@ class GCSStorage:
     def health_check(self) -> bool:
         """연결 상태 확인"""
         try:
-            self.ensure_bucket()
+            self.ensure_bucket(force=True)
             return True
         except Exception:
+            self._bucket_ready = False
             return False
 
     @property
@@ -98,11 +119,17 @@ class GCSStorage:
             if not path or not isinstance(path, str):
                 raise ValueError("업로드 경로가 유효하지 않습니다.")
             bucket = self._get_bucket()
-            blob = bucket.blob(path)
+            # 큰 바이트(미디어)는 청크 단위 resumable 업로드 (실패 시 청크부터 재시도)
+            chunk_size = (
+                DEFAULT_CHUNK_SIZE
+                if isinstance(data, bytes) and len(data) >= RESUMABLE_THRESHOLD
+                else None
+            )
+            blob = bucket.blob(path, chunk_size=chunk_size)
 
             if content_type == "application/json" and isinstance(data, dict):
                 blob.upload_from_string(
-                    json.dumps(data, ensure_ascii=False, indent=2),
+                    json.dumps(data, ensure_ascii=False, separators=(",", ":")),
                     content_type=content_type,
                 )
             elif isinstance(data, (str, bytes)):
@@ -115,7 +142,70 @@ class GCSStorage:
 
         except Exception as e:
             logger.error(f"GCS 업로드 실패: {e}")
-            raise GCSUploadError(f"GCS 업로드 실패: {e}", path=path) from e
+            raise GCSUploadError(f"GCS 업로드 실패: {e}", details={"path": path}) from e
+
+    def upload_json(self, data: dict | list, path: str) -> bool:
+        """
+        JSON 업로드 (gzip 압축 + Content-Encoding: gzip)
+
+        GCS가 Accept-Encoding에 따라 압축 해제해 내려주므로(decompressive transcoding)
+        download_json 등 기존 읽기 경로는 그대로 동작한다.
+        """
+        try:
+            self.ensure_bucket()
+            blob = self._get_bucket().blob(path)
+            blob.content_encoding = "gzip"
+            blob.upload_from_string(
+                encode_json_gzip(data), content_type="application/json"
+            )
+            logger.info(f"GCS JSON 업로드 완료: gs://{self._bucket_name}/{path}")
+            return True
+        except Exception as e:
+            logger.error(f"GCS JSON 업로드 실패: {e}")
+            raise GCSUploadError(f"GCS 업로드 실패: {e}", details={"path": path}) from e
+
+    def upload_file(
+        self,
+        local_path: str | Path,
+        path: str,
+        content_type: str = "application/octet-stream",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> bool:
+        """로컬 파일 업로드 (청크 단위 resumable 업로드, 파일 전체를 메모리에 올리지 않음)"""
+        try:
+            self.ensure_bucket()
+            blob = self._get_bucket().blob(path, chunk_size=chunk_size)
+            blob.upload_from_filename(str(local_path), content_type=content_type)
+            logger.info(f"GCS 파일 업로드 완료: gs://{self._bucket_name}/{path}")
+            return True
+        except Exception as e:
+            logger.error(f"GCS 파일 업로드 실패: {e}")
+            raise GCSUploadError(f"GCS 업로드 실패: {e}", details={"path": path}) from e
+
+    def download_to_file(
+        self,
+        path: str,
+        dest: str | Path,
+        bucket_name: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> dict[str, Any]:
+        """
+        객체를 청크 단위로 로컬 파일에 스트리밍 다운로드 (MD5 검증)
+
+        Returns:
+            {"path", "size", "md5_hash"}
+        """
+        try:
+            bucket = self._get_client().bucket(bucket_name or self._bucket_name)
+            size, md5_hash = stream_blob_to_file(
+                bucket.blob(path), Path(dest), chunk_size=chunk_size
+            )
+            return {"path": str(dest), "size": size, "md5_hash": md5_hash}
+        except GCSDownloadError:
+            raise
+        except Exception as e:
+            logger.error(f"GCS 스트리밍 다운로드 실패: {e}")
+            raise GCSDownloadError(f"GCS 다운로드 실패: {e}", details={"path": path}) from e
 
     def download(self, path: str) -> bytes | None:
         """바이너리 데이터 다운로드"""
@@ -125,7 +215,7 @@ class GCSStorage:
             return blob.download_as_bytes()
         except Exception as e:
             logger.error(f"GCS 다운로드 실패: {e}")
-            raise GCSDownloadError(f"GCS 다운로드 실패: {e}", path=path) from e
+            raise GCSDownloadError(f"GCS 다운로드 실패: {e}", details={"path": path}) from e
 
     def download_text(self, path: str) -> str | None:
         """텍스트 데이터 다운로드"""
@@ -232,12 +322,22 @@ class GCSStorage:
         except Exception:
             return False
 
-    def copy(self, source_path: str, dest_path: str) -> bool:
-        """파일 복사"""
+    def copy(
+        self,
+        source_path: str,
+        dest_path: str,
+        source_bucket: str | None = None,
+    ) -> bool:
+        """파일 복사 (서버 측 복사, 데이터가 이 프로세스를 거치지 않음)"""
         try:
             bucket = self._get_bucket()
-            source_blob = bucket.blob(source_path)
-            bucket.copy_blob(source_blob, bucket, dest_path)
+            src_bucket = (
+                self._get_client().bucket(source_bucket)
+                if source_bucket and source_bucket != self._bucket_name
+                else bucket
+            )
+            source_blob = src_bucket.blob(source_path)
+            src_bucket.copy_blob(source_blob, bucket, dest_path)
             logger.info(f"GCS 파일 복사: {source_path} -> {dest_path}")
             return True
         except Exception as e:
@@ -0,0 +1,244 @@
+"""
+파이프라인 실행 히스토리 목록 색인 (SQLite)
+메타데이터 JSON 전체를 읽지 않고 목록/필터/페이지 조회
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable
+from contextlib import closing
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id TEXT PRIMARY KEY,
+    file_path TEXT NOT NULL,
+    product_name TEXT NOT NULL,
+    executed_at TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    top_insight_count INTEGER NOT NULL,
+    has_video INTEGER NOT NULL,
+    mtime REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_history_mtime ON history (mtime DESC, id DESC);
+CREATE INDEX IF NOT EXISTS ix_history_product ON history (product_name, mtime DESC);
+CREATE INDEX IF NOT EXISTS ix_history_executed_at ON history (executed_at);
+CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+_COLUMNS = (
+    "id",
+    "file_path",
+    "product_name",
+    "executed_at",
+    "success",
+    "top_insight_count",
+    "has_video",
+    "mtime",
+)
+
+
+def summarize_history(history_id: str, path: Path, data: dict[str, Any]) -> dict[str, Any]:
+    """메타데이터 dict -> 목록 항목 (get_history_list 응답 필드 + mtime)"""
+    collected = data.get("collected_data") or {}
+    generated = data.get("generated_content") or {}
+    return {
+        "id": history_id,
+        "file_path": str(path),
+        "product_name": data.get("product_name", "N/A"),
+        "executed_at": data.get("executed_at", ""),
+        "success": data.get("success", False),
+        "top_insight_count": len(collected.get("top_insights", [])),
+        "has_video": bool(generated.get("video_url") or generated.get("video_path")),
+        "mtime": path.stat().st_mtime,
+    }
+
+
+def encode_cursor(mtime: float, history_id: str) -> str:
+    raw = json.dumps([mtime, history_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[float, str]:
+    """잘못된 커서는 ValueError"""
+    try:
+        mtime, history_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return float(mtime), str(history_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"invalid history cursor: {cursor!r}") from e
+
+
+class HistoryIndex:
+    """
+    히스토리 목록 SQLite 색인
+
+    행 하나 = 메타데이터 파일 하나. 정렬은 파일 수정 시각(mtime) 최신순이고
+    (mtime, id) keyset 커서로 페이지를 넘기므로 페이지 위치와 무관하게 조회 비용이 같다.
+    처음 열 때 한 번만 기존 meta_*.json을 읽어 채운다 (backfill).
+    """
+
+    def __init__(self, db_path: str | Path, meta_dir: str | Path) -> None:
+        self._db_path = Path(db_path)
+        self._meta_dir = Path(meta_dir)
+        self._lock = threading.Lock()
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def ensure_ready(self) -> None:
+        """스키마 생성 + 최초 1회 기존 파일 backfill"""
+        if self._ready:
+            return
+        with self._lock:
+            if self._ready:
+                return
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(self._connect()) as conn, conn:
+                conn.executescript(_SCHEMA)
+                done = conn.execute(
+                    "SELECT value FROM index_meta WHERE key = 'backfilled'"
+                ).fetchone()
+            if done is None:
+                count = self._insert(self._scan(self._meta_dir))
+                with closing(self._connect()) as conn, conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO index_meta (key, value) VALUES ('backfilled', '1')"
+                    )
+                logger.info(f"히스토리 색인 backfill 완료: {count}건")
+            self._ready = True
+
+    @staticmethod
+    def _scan(meta_dir: Path) -> Iterable[dict[str, Any]]:
+        for path in meta_dir.glob("meta_*.json"):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                yield summarize_history(path.stem, path, data)
+            except Exception as e:
+                logger.error(f"히스토리 파일 로드 실패 ({path.name}): {e}")
+
+    def upsert(self, entry: dict[str, Any]) -> None:
+        self.ensure_ready()
+        self._insert([entry])
+
+    def _insert(self, entries: Iterable[dict[str, Any]]) -> int:
+        rows = [
+            (
+                entry["id"],
+                entry["file_path"],
+                str(entry["product_name"]),
+                str(entry["executed_at"] or ""),
+                int(bool(entry["success"])),
+                int(entry["top_insight_count"]),
+                int(bool(entry["has_video"])),
+                float(entry["mtime"]),
+            )
+            for entry in entries
+        ]
+        if not rows:
+            return 0
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO history ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+                rows,
+            )
+        return len(rows)
+
+    def delete(self, history_id: str) -> None:
+        self.ensure_ready()
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM history WHERE id = ?", (history_id,))
+
+    def query(
+        self,
+        product: str | None = None,
+        success: bool | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        최신순 목록 조회
+
+        Args:
+            product: 제품명 일치
+            success: 성공/실패 여부
+            date_from, date_to: executed_at 날짜 범위 (양 끝 포함)
+            cursor: 이전 응답의 next_cursor
+            limit: 페이지 크기 (None이면 전체)
+
+        Returns:
+            (항목 리스트, 다음 페이지 커서 또는 None)
+        """
+        self.ensure_ready()
+        clauses: list[str] = []
+        params: list[Any] = []
+        if product is not None:
+            clauses.append("product_name = ?")
+            params.append(product)
+        if success is not None:
+            clauses.append("success = ?")
+            params.append(int(success))
+        # ISO 문자열 비교 (날짜 접두어 기준)
+        if date_from is not None:
+            clauses.append("executed_at >= ?")
+            params.append(date_from.isoformat())
+        if date_to is not None:
+            clauses.append("executed_at < ?")
+            params.append((date_to + timedelta(days=1)).isoformat())
+        if cursor is not None:
+            mtime, history_id = decode_cursor(cursor)
+            clauses.append("(mtime < ? OR (mtime = ? AND id < ?))")
+            params.extend([mtime, mtime, history_id])
+
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM history"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY mtime DESC, id DESC"
+        if limit is not None:
+            # 다음 페이지 존재 여부 확인용 1건 추가 조회
+            sql += " LIMIT ?"
+            params.append(limit + 1)
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["mtime"], rows[-1]["id"])
+        items = [
+            {
+                "id": row["id"],
+                "file_path": row["file_path"],
+                "product_name": row["product_name"],
+                "executed_at": row["executed_at"],
+                "success": bool(row["success"]),
+                "top_insight_count": row["top_insight_count"],
+                "has_video": bool(row["has_video"]),
+            }
+            for row in rows
+        ]
+        return items, next_cursor
+
+
+__all__ = [
+    "HistoryIndex",
+    "decode_cursor",
+    "encode_cursor",
+    "summarize_history",
+]
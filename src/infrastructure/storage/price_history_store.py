@@ -0,0 +1,141 @@
+"""
+제품별 가격 통계 시계열 로컬 저장소
+수집 시점마다 가격 집계값 한 행을 열 단위(.npz) 배열로 보관하여 네이버 재조회 없이 추세 조회
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 행 하나 = 수집 1회. 시각은 epoch 초, 나머지는 원 단위 가격/개수
+COLUMNS: tuple[str, ...] = (
+    "ts",
+    "count",
+    "min",
+    "max",
+    "mean",
+    "p10",
+    "p25",
+    "p50",
+    "p75",
+    "p90",
+)
+DEFAULT_MAX_ROWS = 10000
+
+
+class PriceHistoryStore:
+    """
+    제품별 가격 집계 시계열
+
+    제품 하나당 파일 하나({product}.npz)에 컬럼별 배열을 압축 저장한다.
+    행 수가 적고(하루 수 회) 추세 조회는 특정 컬럼만 읽으므로 열 단위 배열이 적합하다.
+    """
+
+    def __init__(self, base_dir: str | Path, max_rows: int = DEFAULT_MAX_ROWS) -> None:
+        self._base_dir = Path(base_dir)
+        self._max_rows = max_rows
+        self._lock = threading.Lock()
+
+    def append(
+        self, product_name: str, summary: dict[str, Any], at: datetime | None = None
+    ) -> None:
+        """summarize_prices 결과 한 행 추가 (유효 가격이 없으면 무시)"""
+        if not summary.get("max_price"):
+            return
+        percentiles = summary.get("percentiles", {})
+        row = {
+            "ts": (at.timestamp() if at else time.time()),
+            "count": summary.get("total_products", 0),
+            "min": summary["min_price"],
+            "max": summary["max_price"],
+            "mean": summary.get("avg_price", 0),
+            **{q: percentiles.get(q, 0.0) for q in ("p10", "p25", "p50", "p75", "p90")},
+        }
+        with self._lock:
+            columns = self._read(product_name)
+            for name in COLUMNS:
+                columns[name] = np.append(columns[name], np.float64(row[name]))[
+                    -self._max_rows :
+                ]
+            self._write(product_name, columns)
+
+    def load(
+        self, product_name: str, since: datetime | None = None
+    ) -> dict[str, np.ndarray]:
+        """컬럼별 배열 (시간순, since 이후만)"""
+        columns = self._read(product_name)
+        if since is not None and columns["ts"].size:
+            mask = columns["ts"] >= since.timestamp()
+            columns = {name: values[mask] for name, values in columns.items()}
+        return columns
+
+    def drift(self, product_name: str, days: int = 30) -> dict[str, Any]:
+        """
+        최근 days일 가격 추이 요약
+
+        Returns:
+            samples, first/last 시각, 중앙가·평균가·최저가 변화량과 변화율,
+            중앙가 일 단위 선형 추세(원/일)
+        """
+        since = datetime.now().astimezone() - timedelta(days=days)
+        columns = self.load(product_name, since=since)
+        ts = columns["ts"]
+        result: dict[str, Any] = {
+            "product_name": product_name,
+            "days": days,
+            "samples": int(ts.size),
+        }
+        if ts.size == 0:
+            return result
+
+        result["first_at"] = datetime.fromtimestamp(ts[0]).astimezone().isoformat()
+        result["last_at"] = datetime.fromtimestamp(ts[-1]).astimezone().isoformat()
+        for name in ("p50", "mean", "min"):
+            values = columns[name]
+            change = float(values[-1] - values[0])
+            result[f"{name}_change"] = round(change, 2)
+            result[f"{name}_change_pct"] = (
+                round(change / values[0] * 100, 2) if values[0] else 0.0
+            )
+        if ts.size >= 2 and np.ptp(ts) > 0:
+            slope = np.polyfit((ts - ts[0]) / 86400.0, columns["p50"], 1)[0]
+            result["p50_slope_per_day"] = round(float(slope), 2)
+        return result
+
+    def _path(self, product_name: str) -> Path:
+        safe = re.sub(r"[^\w-]", "_", product_name)
+        return self._base_dir / f"{safe}.npz"
+
+    def _read(self, product_name: str) -> dict[str, np.ndarray]:
+        path = self._path(product_name)
+        empty = {name: np.empty(0, dtype=np.float64) for name in COLUMNS}
+        if not path.exists():
+            return empty
+        try:
+            with np.load(path) as data:
+                return {name: data[name] if name in data else empty[name] for name in COLUMNS}
+        except (OSError, ValueError) as e:
+            logger.warning(f"가격 시계열 읽기 실패 ({product_name}): {e}")
+            return empty
+
+    def _write(self, product_name: str, columns: dict[str, np.ndarray]) -> None:
+        path = self._path(product_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.stem + ".tmp.npz")
+        np.savez_compressed(tmp, **columns)
+        os.replace(tmp, path)
+
+
+__all__ = ["COLUMNS", "PriceHistoryStore"]
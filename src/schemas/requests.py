@@ -18,6 +18,9 @@ class PipelineRequest(BaseModel):
     thumbnail_styles: list[str] | None = Field(
         default=None, description="썸네일 스타일 목록"
     )
+    reuse_collection: Literal["off", "fresh", "delta"] = Field(
+        default="off", description="수집 스냅샷 재사용 모드"
+    )
 
 
 class RefreshUrlRequest(BaseModel):
@@ -80,11 +83,25 @@ class AnalysisTaskRequest(BaseModel):
     task_id: str
 
 
+class CTRVariation(BaseModel):
+    title: str
+    thumbnail_description: str = ""
+
+
 class CTRPredictRequest(BaseModel):
     task_id: str
-    title: str
+    title: str = ""
     thumbnail_description: str = ""
     competitor_titles: list[str] = Field(default_factory=list)
+    variations: list[CTRVariation] = Field(
+        default_factory=list,
+        max_length=1000,
+        description="일괄 채점할 제목 후보 (있으면 title 대신 배치 예측)",
+    )
+    top_k: int | None = Field(default=None, ge=1, description="배치 예측 상위 k개만 반환")
+    category: str | None = Field(
+        default=None, description="경쟁 제목 색인 카테고리 (비면 작업 제품 카테고리)"
+    )
 
 
 class NotionExportRequest(BaseModel):
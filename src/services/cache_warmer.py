@@ -0,0 +1,235 @@
+"""
+예약 실행 캐시 워머
+다가오는 파이프라인 스케줄의 수집 데이터를 실행 전에 미리 캐시에 적재
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import select
+
+from config.products import get_product_by_name
+from infrastructure.database.models import PipelineSchedule
+from services.market_trend_service import MarketTrendService
+from services.naver_service import NaverService
+from services.youtube_service import YouTubeService
+from utils.cron import KST, next_cron_time, resolve_timezone
+from utils.logger import get_logger, log_error, log_info, log_warning
+
+logger = get_logger(__name__)
+
+# YouTube Data API 단가 (search.list=100, commentThreads.list=1)
+YOUTUBE_SEARCH_UNITS = 100
+YOUTUBE_COMMENT_UNITS = 1
+# collect_video_data가 검색하는 키워드 수
+YOUTUBE_SEARCH_KEYWORDS = 2
+
+
+@dataclass(frozen=True)
+class WarmTarget:
+    """예열 대상 (같은 수집 인자를 쓰는 스케줄은 하나로 합침)"""
+
+    product_name: str
+    youtube_count: int = 3
+    naver_count: int = 10
+    include_comments: bool = True
+
+    @property
+    def youtube_units(self) -> int:
+        """예상 YouTube 쿼터 사용량 (캐시 미스 가정, 상한 추정)"""
+        units = YOUTUBE_SEARCH_KEYWORDS * YOUTUBE_SEARCH_UNITS
+        if self.include_comments:
+            units += YOUTUBE_SEARCH_KEYWORDS * self.youtube_count * YOUTUBE_COMMENT_UNITS
+        return units
+
+
+class QuotaBudget:
+    """일일 쿼터 예산 (KST 자정 기준 초기화)"""
+
+    def __init__(self, daily_units: int) -> None:
+        self._daily_units = daily_units
+        self._used = 0
+        self._day: date | None = None
+        self._lock = threading.Lock()
+
+    def try_consume(self, units: int, today: date | None = None) -> bool:
+        today = today or datetime.now(KST).date()
+        with self._lock:
+            if self._day != today:
+                self._day, self._used = today, 0
+            if self._used + units > self._daily_units:
+                return False
+            self._used += units
+            return True
+
+    @property
+    def remaining(self) -> int:
+        return max(self._daily_units - self._used, 0)
+
+
+class CacheWarmer:
+    """
+    다가오는 스케줄 기준 캐시 예열
+
+    lead_time 안에 실행될 스케줄을 찾아 예약 실행과 같은 인자로 수집 계층
+    (YouTube 검색/자막/댓글, 네이버 쇼핑/블로그/뉴스, 시장 동향)을 호출한다.
+    각 호출은 @cached가 적용되어 있으므로 실제 실행은 캐시 적중으로 시작한다.
+    예열은 순차 실행하고 YouTube 쿼터 예산을 넘기면 건너뛴다.
+    """
+
+    def __init__(
+        self,
+        youtube_service: YouTubeService,
+        naver_service: NaverService,
+        market_trend_service: MarketTrendService | None,
+        session_factory: Callable[[], Any],
+        lead_time: timedelta = timedelta(minutes=5),
+        youtube_daily_units: int = 2000,
+        product_resolver: Callable[[str], Any] = get_product_by_name,
+    ) -> None:
+        self._youtube = youtube_service
+        self._naver = naver_service
+        self._market_trend = market_trend_service
+        self._session_factory = session_factory
+        self._lead_time = lead_time
+        self._quota = QuotaBudget(youtube_daily_units)
+        self._resolve_product = product_resolver
+        # 같은 실행 시각을 여러 주기에서 반복 예열하지 않도록 기록
+        self._warmed: dict[WarmTarget, datetime] = {}
+
+    async def warm_upcoming(self, now: datetime | None = None) -> list[dict[str, Any]]:
+        """lead_time 안의 스케줄 예열 (1회 주기)"""
+        now = now or datetime.now(KST)
+        schedules = await self._load_schedules()
+
+        due: dict[WarmTarget, tuple[datetime, list[int]]] = {}
+        for schedule in schedules:
+            try:
+                run_at = next_cron_time(
+                    schedule.cron_expression, now, resolve_timezone(schedule.timezone)
+                )
+            except ValueError as e:
+                log_warning(f"스케줄 {schedule.id} 크론 해석 실패: {e}")
+                continue
+            if run_at - now > self._lead_time:
+                continue
+            target = self._target_for(schedule)
+            first_run, ids = due.setdefault(target, (run_at, []))
+            ids.append(schedule.id)
+            due[target] = (min(first_run, run_at), ids)
+
+        report: list[dict[str, Any]] = []
+        for target, (run_at, schedule_ids) in due.items():
+            entry = {
+                "schedule_ids": schedule_ids,
+                "product_name": target.product_name,
+                "run_at": run_at.isoformat(),
+            }
+            if self._warmed.get(target) == run_at:
+                entry["status"] = "already_warmed"
+            else:
+                entry["status"] = await self._warm(target)
+                if entry["status"] == "warmed":
+                    self._warmed[target] = run_at
+            report.append(entry)
+
+        self._prune_warmed(now)
+        return report
+
+    async def run_forever(self, interval_seconds: float = 60.0) -> None:
+        """주기적 예열 루프 (앱 lifespan에서 백그라운드 태스크로 실행)"""
+        log_info(
+            f"캐시 워머 시작 (선행 {int(self._lead_time.total_seconds() // 60)}분, "
+            f"주기 {interval_seconds:.0f}초)"
+        )
+        while True:
+            try:
+                report = await self.warm_upcoming()
+                warmed = [r["product_name"] for r in report if r["status"] == "warmed"]
+                if warmed:
+                    log_info(f"캐시 예열 완료: {', '.join(warmed)}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log_error(f"캐시 예열 주기 실패: {e}")
+            await asyncio.sleep(interval_seconds)
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+    async def _load_schedules(self) -> list[PipelineSchedule]:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(PipelineSchedule).where(
+                    PipelineSchedule.enabled.is_(True),
+                    PipelineSchedule.deleted_at.is_(None),
+                )
+            )
+            return list(result.scalars().all())
+
+    @staticmethod
+    def _target_for(schedule: PipelineSchedule) -> WarmTarget:
+        try:
+            config = json.loads(schedule.config_json or "{}")
+        except json.JSONDecodeError:
+            config = {}
+        return WarmTarget(
+            product_name=schedule.product_name,
+            youtube_count=int(config.get("youtube_count", 3)),
+            naver_count=int(config.get("naver_count", 10)),
+            include_comments=bool(config.get("include_comments", True)),
+        )
+
+    async def _warm(self, target: WarmTarget) -> str:
+        product = self._resolve_product(target.product_name)
+        if product is None:
+            log_warning(f"캐시 예열 대상 제품 없음: {target.product_name}")
+            return "unknown_product"
+        product_dict = product.model_dump() if hasattr(product, "model_dump") else dict(product)
+
+        if not self._quota.try_consume(target.youtube_units):
+            log_warning(
+                f"YouTube 쿼터 예산 부족으로 예열 생략: {target.product_name} "
+                f"(필요 {target.youtube_units}, 남음 {self._quota.remaining})"
+            )
+            return "skipped_quota"
+
+        try:
+            await self._prefetch(product_dict, target)
+            return "warmed"
+        except Exception as e:
+            log_error(f"캐시 예열 실패 ({target.product_name}): {e}")
+            return "failed"
+
+    async def _prefetch(self, product: dict, target: WarmTarget) -> None:
+        # 예약 실행(DataCollectionService.collect_all_data_async)과 같은 메서드/인자로
+        # 호출해야 캐시 키가 일치 (네이버는 search_all 캐시 경로)
+        jobs = [
+            asyncio.to_thread(
+                self._youtube.collect_product_data,
+                product=product,
+                max_results=target.youtube_count,
+                include_comments=target.include_comments,
+            ),
+            self._naver.collect_product_data_async(
+                product=product, max_results=target.naver_count
+            ),
+        ]
+        if self._market_trend:
+            jobs.append(asyncio.to_thread(self._market_trend.get_market_trends, product))
+        await asyncio.gather(*jobs)
+
+    def _prune_warmed(self, now: datetime) -> None:
+        self._warmed = {
+            target: run_at for target, run_at in self._warmed.items() if run_at >= now
+        }
+
+
+__all__ = ["CacheWarmer", "QuotaBudget", "WarmTarget"]
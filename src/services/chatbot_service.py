@@ -3,8 +3,7 @@
 """
 from __future__ import annotations
 
-import json
-import re
+from collections.abc import Iterator
 from threading import Lock
 from typing import Any
 from uuid import uuid4
@@ -17,10 +16,12 @@ from core.prompts import (
     chatbot_prompts,  # noqa: F401
     prompt_registry,
 )
+from utils.json_parser import StreamingFieldDecoder, extract_json
 from utils.logger import get_logger, log_llm_fail, log_llm_request, log_llm_response
 
 logger = get_logger(__name__)
 
+_FALLBACK_REPLY = "죄송합니다. 현재 응답을 생성할 수 없습니다."
 
 class ChatbotService:
     """챗봇 비즈니스 로직"""
@@ -39,30 +40,13 @@ class ChatbotService:
     ) -> dict:
         text = message.strip()
         if not text:
-            return {
-                "session_id": session_id or "",
-                "message": "메시지를 입력해 주세요.",
-                "card": None,
-                "sources": [],
-            }
+            return self._empty_reply(session_id)
 
         session = self._get_or_create_session(session_id)
         session.add_message("user", text)
 
-        product = self._detect_product(text)
-        rag_results = self._rag_client.search(
-            text,
-            max_results=5,
-            data_store_id=data_store_id,
-        )
-        use_grounding = not rag_results
-
-        prompt = self._build_prompt(
-            message=text,
-            session=session,
-            product=product,
-            rag_results=rag_results,
-        )
+        rag_results = self._search_sources(text, data_store_id)
+        prompt, use_grounding = self._prepare_prompt(text, session, rag_results)
         log_llm_request("챗봇 응답", f"메시지 {len(text)}자, grounding={use_grounding}")
 
         try:
@@ -75,16 +59,9 @@ class ChatbotService:
         except Exception as e:
             log_llm_fail("챗봇 응답", str(e))
             logger.error(f"챗봇 응답 생성 실패: {e}")
-            raw_response = "죄송합니다. 현재 응답을 생성할 수 없습니다."
-
-        parsed = self._parse_json_output(raw_response)
-        answer = parsed.get("answer")
-        if not isinstance(answer, str) or not answer.strip():
-            answer = raw_response.strip()
-
-        card = parsed.get("card") if isinstance(parsed, dict) else None
-        card = None if not isinstance(card, dict) else self._sanitize_card(card)
+            raw_response = _FALLBACK_REPLY
 
+        answer, card = self._finalize_reply(raw_response)
         session.add_message("ai", answer)
 
         return {
@@ -94,6 +71,137 @@ class ChatbotService:
             "sources": rag_results,
         }
 
+    def stream_reply(
+        self,
+        message: str,
+        session_id: str | None = None,
+        data_store_id: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        스트리밍 응답 이벤트 생성
+
+        이벤트 순서: session → sources → token* → done
+        - session: 세션 ID (RAG 검색 전 즉시 전송)
+        - sources: RAG 검색 결과 (검색 완료 즉시 전송)
+        - token: answer 필드의 증분 텍스트
+        - done: generate_reply와 동일한 최종 응답 (card 포함)
+        """
+        text = message.strip()
+        if not text:
+            yield {"event": "done", "data": self._empty_reply(session_id)}
+            return
+
+        session = self._get_or_create_session(session_id)
+        session.add_message("user", text)
+        yield {"event": "session", "data": {"session_id": session.session_id}}
+
+        rag_results = self._search_sources(text, data_store_id)
+        yield {"event": "sources", "data": {"sources": rag_results}}
+
+        prompt, use_grounding = self._prepare_prompt(text, session, rag_results)
+        log_llm_request(
+            "챗봇 응답(스트리밍)", f"메시지 {len(text)}자, grounding={use_grounding}"
+        )
+
+        parser = StreamingFieldDecoder("answer")
+        chunks: list[str] = []
+        recorded = False
+        try:
+            try:
+                for chunk in self._iter_model_chunks(prompt, use_grounding):
+                    chunks.append(chunk)
+                    delta = parser.feed(chunk)
+                    if delta:
+                        yield {"event": "token", "data": {"text": delta}}
+            except Exception as e:
+                log_llm_fail("챗봇 응답(스트리밍)", str(e))
+                logger.error(f"챗봇 스트리밍 응답 실패: {e}")
+
+            raw_response = "".join(chunks)
+            if not raw_response.strip():
+                raw_response = parser.text or _FALLBACK_REPLY
+            log_llm_response("챗봇 응답(스트리밍)", f"응답 {len(raw_response)}자")
+
+            answer, card = self._finalize_reply(
+                raw_response, fallback_answer=parser.text.strip()
+            )
+            session.add_message("ai", answer)
+            recorded = True
+            yield {
+                "event": "done",
+                "data": {
+                    "session_id": session.session_id,
+                    "message": answer,
+                    "card": card,
+                    "sources": rag_results,
+                },
+            }
+        finally:
+            # 클라이언트가 중간에 연결을 끊어도 전송된 부분까지는 세션에 기록
+            if not recorded and parser.text.strip():
+                session.add_message("ai", parser.text.strip())
+
+    def _iter_model_chunks(self, prompt: str, use_grounding: bool) -> Iterator[str]:
+        stream_fn = getattr(self._gemini_client, "generate_text_stream", None)
+        if stream_fn is None:
+            yield self._gemini_client.generate_text(
+                prompt=prompt,
+                temperature=0.4,
+                use_grounding=use_grounding,
+            )
+            return
+        yield from stream_fn(
+            prompt=prompt,
+            temperature=0.4,
+            use_grounding=use_grounding,
+        )
+
+    def _empty_reply(self, session_id: str | None) -> dict:
+        return {
+            "session_id": session_id or "",
+            "message": "메시지를 입력해 주세요.",
+            "card": None,
+            "sources": [],
+        }
+
+    def _search_sources(
+        self, text: str, data_store_id: str | None
+    ) -> list[dict[str, Any]]:
+        return self._rag_client.search(
+            text,
+            max_results=5,
+            data_store_id=data_store_id,
+        )
+
+    def _prepare_prompt(
+        self,
+        text: str,
+        session: ChatSession,
+        rag_results: list[dict[str, Any]],
+    ) -> tuple[str, bool]:
+        product = self._detect_product(text)
+        prompt = self._build_prompt(
+            message=text,
+            session=session,
+            product=product,
+            rag_results=rag_results,
+        )
+        return prompt, not rag_results
+
+    def _finalize_reply(
+        self,
+        raw_response: str,
+        fallback_answer: str = "",
+    ) -> tuple[str, dict[str, Any] | None]:
+        parsed = self._parse_json_output(raw_response)
+        answer = parsed.get("answer")
+        if not isinstance(answer, str) or not answer.strip():
+            answer = fallback_answer or raw_response.strip()
+
+        card = parsed.get("card") if isinstance(parsed, dict) else None
+        card = None if not isinstance(card, dict) else self._sanitize_card(card)
+        return answer, card
+
     def _get_or_create_session(self, session_id: str | None) -> ChatSession:
         with self._lock:
             if session_id and session_id in self._sessions:
@@ -131,31 +239,17 @@ class ChatbotService:
             )
 
         rag_block = "\n".join(rag_lines) if rag_lines else "검색 결과 없음"
-        product_block = json.dumps(product, ensure_ascii=False, indent=2) if product else "없음"
-
         return prompt_registry.get("chatbot.reply").render(
             message=message,
             history_lines=history_lines,
-            product_names_json=json.dumps(product_names, ensure_ascii=False),
-            product_block=product_block,
+            product_names_json=product_names,
+            product_block=product or "없음",
             rag_block=rag_block,
         )
 
     def _parse_json_output(self, text: str) -> dict[str, Any]:
-        cleaned = re.sub(r"```json\s*", "", text)
-        cleaned = re.sub(r"```\s*$", "", cleaned)
-        cleaned = cleaned.strip()
-
-        try:
-            return json.loads(cleaned)
-        except json.JSONDecodeError:
-            match = re.search(r"\{[\s\S]*\}", cleaned)
-            if match:
-                try:
-                    return json.loads(match.group())
-                except json.JSONDecodeError:
-                    return {}
-        return {}
+        parsed = extract_json(text)
+        return parsed if isinstance(parsed, dict) else {}
 
     def _sanitize_card(self, card: dict[str, Any]) -> dict[str, Any] | None:
         title = card.get("title")
@@ -3,14 +3,25 @@
 YouTube 댓글에서 마케팅 인사이트 추출
 """
 
+import asyncio
 import re
-from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Literal
 
 from api import validate_json_output
+from config.constants import (
+    DEEP_ANALYSIS_CHUNK_SIZE,
+    DEEP_ANALYSIS_MAX_CHUNKS,
+    GEMINI_TEXT_MAX_CONCURRENCY,
+)
 from core.prompts import (
     hydration_prompts,  # noqa: F401
     prompt_registry,
 )
+from core.prompts.accounting import compact_json, estimate_tokens
+from utils.comment_analytics import KeywordMatcher, StreamingCommentAnalyzer
+from utils.concurrency import run_coroutine_sync, shared_async_limiter
 from utils.logger import (
     get_logger,
     log_llm_fail,
@@ -103,16 +114,128 @@ QUESTION_PATTERNS = [
     r"\?$",  # 물음표로 끝나는 문장
 ]
 
+# 스트리밍 분석 시 한 번에 처리할 댓글 수
+COMMENT_CHUNK_SIZE = 5000
+
+# 심층 분석 층화 기준 (앞 그룹 우선 배정)
+DEEP_ANALYSIS_STRATA: tuple[tuple[str, str], ...] = (
+    ("question", "질문"),
+    ("negative", "부정"),
+    ("pain", "페인포인트"),
+    ("positive", "긍정"),
+    ("other", "기타"),
+)
+
+_STRATUM_MATCHER = KeywordMatcher(
+    {"positive": POSITIVE_KEYWORDS, "negative": NEGATIVE_KEYWORDS, "pain": PAIN_KEYWORDS}
+)
+_QUESTION_RE = re.compile("|".join(f"(?:{p})" for p in QUESTION_PATTERNS))
+
+
+@dataclass
+class CommentChunk:
+    """map 단계 프롬프트 1회분 댓글 묶음"""
+
+    strata: list[str]
+    texts: list[str]
+
+    @property
+    def label(self) -> str:
+        return "·".join(self.strata)
+
+
+def _stratum_of(text: str) -> str:
+    if _QUESTION_RE.search(text):
+        return "question"
+    found = _STRATUM_MATCHER.match(text.lower())
+    for key, _ in DEEP_ANALYSIS_STRATA[1:-1]:
+        if key in found:
+            return key
+    return "other"
+
+
+def plan_deep_analysis_chunks(
+    comments: list[dict],
+    chunk_size: int = DEEP_ANALYSIS_CHUNK_SIZE,
+    max_chunks: int = DEEP_ANALYSIS_MAX_CHUNKS,
+) -> tuple[list[CommentChunk], int]:
+    """
+    심층 분석 map 단계 청크 구성
+
+    중복/3자 이하를 제외한 전체 댓글을 질문/부정/페인포인트/긍정/기타로 층화하고,
+    chunk_size * max_chunks 예산을 층 크기에 비례해 나눈 뒤 층마다 좋아요 순으로 뽑는다.
+    같은 층 댓글이 한 청크에 모이도록 층 순서대로 이어 붙여 chunk_size씩 자른다.
+
+    Returns:
+        (청크 목록, 분석 대상 댓글 수)
+    """
+    groups: dict[str, list[dict]] = {key: [] for key, _ in DEEP_ANALYSIS_STRATA}
+    seen: set[str] = set()
+    for comment in comments:
+        text = comment.get("text", "")
+        key = text.strip().lower()
+        if len(text) <= 3 or key in seen:
+            continue
+        seen.add(key)
+        groups[_stratum_of(text)].append(comment)
+
+    total = len(seen)
+    if total == 0:
+        return [], 0
+    budget = min(total, chunk_size * max(1, max_chunks))
+
+    # 층 크기 비례 배분 (비어 있지 않은 층은 최소 1개), 반올림 오차는 앞 층부터 보정
+    quotas = {
+        key: min(len(group), max(1, budget * len(group) // total))
+        for key, group in groups.items()
+        if group
+    }
+    while sum(quotas.values()) > budget:
+        largest = max(quotas, key=quotas.__getitem__)
+        quotas[largest] -= 1
+    leftover = budget - sum(quotas.values())
+    for key in quotas:
+        extra = min(leftover, len(groups[key]) - quotas[key])
+        quotas[key] += extra
+        leftover -= extra
+
+    selected: list[tuple[str, str]] = []
+    for key, label in DEEP_ANALYSIS_STRATA:
+        if not quotas.get(key):
+            continue
+        ranked = sorted(groups[key], key=lambda c: int(c.get("likes") or 0), reverse=True)
+        selected.extend((label, c.get("text", "")) for c in ranked[: quotas[key]])
+
+    chunks = []
+    for start in range(0, len(selected), chunk_size):
+        part = selected[start : start + chunk_size]
+        strata = list(dict.fromkeys(label for label, _ in part))
+        chunks.append(CommentChunk(strata=strata, texts=[text for _, text in part]))
+    return chunks, total
+
 
 class CommentAnalysisService:
     """YouTube 댓글 분석 서비스 (Hybrid: Rule-based + AI)"""
 
-    def __init__(self, gemini_client=None) -> None:
+    def __init__(
+        self,
+        gemini_client=None,
+        deep_analysis_mode: Literal["sample", "map_reduce"] = "map_reduce",
+        chunk_size: int = DEEP_ANALYSIS_CHUNK_SIZE,
+        max_chunks: int = DEEP_ANALYSIS_MAX_CHUNKS,
+    ) -> None:
         """
         Args:
             gemini_client: AI 기반 심층 분석 시 사용 (필수)
+            deep_analysis_mode: "sample"은 앞 chunk_size개 댓글만 1회 분석,
+                "map_reduce"는 전체 댓글을 층화해 청크별 요약 후 통합
+            chunk_size: 프롬프트 1회당 댓글 수
+            max_chunks: map 단계 최대 청크 수 (비용 상한)
         """
         self._gemini = gemini_client
+        self._deep_analysis_mode = deep_analysis_mode
+        self._chunk_size = max(1, chunk_size)
+        self._max_chunks = max(1, max_chunks)
         self.pipeline: PipelineOrchestrator | None = None
 
         # X-Algorithm Pipeline 초기화
@@ -145,36 +268,58 @@ class CommentAnalysisService:
         if not comments:
             return self._empty_result()
 
-        # 댓글 텍스트 추출
-        texts = [c.get("text", "") for c in comments if c.get("text")]
-
-        # 각 분석 수행
-        sentiment = self._analyze_sentiment(texts)
-        pain_points = self._extract_pain_points(texts)
-        gain_points = self._extract_gain_points(texts)
-        questions = self._extract_questions(texts)
-        keywords = self._extract_keywords(texts)
-
-        result = {
-            "total_comments": len(comments),
-            "sentiment": sentiment,
-            "pain_points": pain_points,
-            "gain_points": gain_points,
-            "questions": questions,
-            "top_keywords": keywords,
-            "summary": self._generate_summary(sentiment, pain_points, gain_points),
-            "ai_analysis": None,  # AI 분석 결과 공간 확보
-        }
+        return self.analyze_comment_stream(comments)
+
+    def analyze_comment_stream(
+        self,
+        comments: Iterable[dict],
+        chunk_size: int = COMMENT_CHUNK_SIZE,
+        top_k: int = 10,
+    ) -> dict:
+        """
+        댓글 스트리밍 분석 (수백만 건 규모)
+
+        댓글을 chunk_size 단위로 한 번씩만 훑으며 감정/페인포인트/질문/1~3-gram을 집계한다.
+        n-gram 빈도는 Space-Saving 요약이라 메모리가 댓글 수와 무관하게 일정하다.
+        """
+        analyzer = self.create_stream_analyzer()
+        analyzer.feed_stream((c.get("text", "") for c in comments), chunk_size)
+        if analyzer.comments == 0:
+            return self._empty_result()
+
+        result = analyzer.result(top_k)
+        sentiment = result["sentiment"]
+        result["summary"] = self._generate_summary(
+            sentiment, result["pain_points"], result["gain_points"]
+        )
+        result["ai_analysis"] = None  # AI 분석 결과 공간 확보
 
         log_success(
             f"댓글 기본 분석 완료: 긍정 {sentiment['positive']}%, 부정 {sentiment['negative']}%"
         )
         return result
 
+    def create_stream_analyzer(self, **kwargs) -> StreamingCommentAnalyzer:
+        """서비스 사전(감정/페인/질문)으로 구성한 스트리밍 집계기 (kwargs는 토크나이저/용량 등)"""
+        return StreamingCommentAnalyzer(
+            positive=POSITIVE_KEYWORDS,
+            negative=NEGATIVE_KEYWORDS,
+            pain=PAIN_KEYWORDS,
+            question_patterns=QUESTION_PATTERNS,
+            **kwargs,
+        )
+
     def analyze_with_ai(self, comments: list[dict]) -> dict:
+        """
+        AI를 활용한 심층 댓글 분석 (동기 호출용, analyze_with_ai_async 래퍼)
+        """
+        return run_coroutine_sync(self.analyze_with_ai_async(comments))
+
+    async def analyze_with_ai_async(self, comments: list[dict]) -> dict:
         """
         AI를 활용한 심층 댓글 분석 (Deep Analysis)
         - Rule-based 분석 결과에 AI 인사이트를 통합합니다.
+        - X-Algorithm Pipeline과 Gemini 심층 분석을 호출 측 이벤트 루프에서 동시에 실행합니다.
         """
         # 1. 기본 분석 먼저 수행
         base_result = self.analyze_comments(comments)
@@ -182,97 +327,175 @@ class CommentAnalysisService:
         if not self._gemini or not comments:
             return base_result
 
-        # [NEW] X-Algorithm Pipeline 실행
-        if self.pipeline:
-            try:
-                import asyncio
-
-                # 이미 실행 중인 이벤트 루프가 있는지 확인
-                try:
-                    loop = asyncio.get_running_loop()
-                except RuntimeError:
-                    loop = None
-
-                if loop and loop.is_running():
-                    # 이미 루프가 있으면 (예: Streamlit이 비동기로 도는 경우) create_task 등을 써야 하는데,
-                    # 동기 함수 내라서 await를 못 씀.
-                    # 이 경우엔 nest_asyncio 같은 게 필요한데, 일단 간단히 run_pipeline이 async이므로
-                    # 동기 래퍼가 필요함.
-                    # 여기서는 안전하게 별도 스레드나 nest_asyncio를 가정하지 않고,
-                    # 만약 루프가 없다면 run()을, 있다면... 복잡함.
-                    # 간단하게: Streamlit은 보통 메인 스레드에서 돌고 루프가 없는 경우가 많음.
-                    pipeline_result = self._run_async(self.pipeline.run_pipeline(comments))
-                else:
-                    pipeline_result = self._run_async(self.pipeline.run_pipeline(comments))
-
-                if pipeline_result and "insights" in pipeline_result:
-                    base_result["x_algorithm_insights"] = pipeline_result["insights"]
-                    base_result["x_algorithm_stats"] = pipeline_result["stats"]
-                    log_success(
-                        f"X-Algorithm Pipeline 완료: {len(pipeline_result['insights'])}개 인사이트 도출"
-                    )
-
-            except Exception as e:
-                logger.error(f"X-Algorithm Pipeline Error: {e}")
-
-        log_step("AI 심층 분석", "Gemini Pro", "고객 니즈/페인포인트 추출 중...")
-
-        # 2. 분석용 텍스트 준비 (상위 50~100개 댓글 w/ filtering)
-        # 너무 짧은 댓글(3글자 미만) 제외
-        valid_comments = [
-            c.get("text", "") for c in comments if len(c.get("text", "")) > 3
-        ]
-        sample_texts = valid_comments[:70]  # 비용 최적화를 위해 상위 70개만 분석
-        combined_text = "\n- ".join(sample_texts)
-        log_llm_request("댓글 심층 분석", f"댓글 {len(sample_texts)}개 요약, 프롬프트 {len(combined_text)}자")
-
-        # 3. 프롬프트 엔지니어링 (Insight Extraction)
-        prompt = prompt_registry.get("comment.analysis").render(
-            combined_text=combined_text
+        await asyncio.gather(
+            self._run_x_algorithm(comments, base_result),
+            self._run_deep_analysis(comments, base_result),
         )
+        return base_result
 
+    async def _run_x_algorithm(self, comments: list[dict], base_result: dict) -> None:
+        """X-Algorithm Pipeline 실행 결과를 base_result에 병합"""
+        if not self.pipeline:
+            return
         try:
-            # 4. Gemini 호출 (Retry Logic 포함)
-            response_text = self._gemini.generate_text(prompt, temperature=0.4)
+            pipeline_result = await self.pipeline.run_pipeline(comments)
+            if pipeline_result and "insights" in pipeline_result:
+                base_result["x_algorithm_insights"] = pipeline_result["insights"]
+                base_result["x_algorithm_stats"] = pipeline_result["stats"]
+                log_success(
+                    f"X-Algorithm Pipeline 완료: {len(pipeline_result['insights'])}개 인사이트 도출"
+                )
+        except Exception as e:
+            logger.error(f"X-Algorithm Pipeline Error: {e}")
 
-            # 5. 결과 검증 및 정화
-            ai_data = validate_json_output(
-                response_text, required_fields=["deep_pain_points", "marketing_hooks"]
-            )
+    async def _run_deep_analysis(self, comments: list[dict], base_result: dict) -> None:
+        """Gemini 심층 분석 결과와 커버리지/비용을 base_result에 병합 (실패 시 오류만 기록)"""
+        log_step("AI 심층 분석", "Gemini Pro", "고객 니즈/페인포인트 추출 중...")
 
-            # 6. 결과 통합
+        try:
+            chunks: list[CommentChunk] = []
+            total = 0
+            if self._deep_analysis_mode == "map_reduce":
+                chunks, total = plan_deep_analysis_chunks(
+                    comments, self._chunk_size, self._max_chunks
+                )
+
+            if len(chunks) > 1:
+                ai_data, coverage = await self._deep_analysis_map_reduce(chunks, total)
+            else:
+                ai_data, coverage = await self._deep_analysis_single(comments)
+
+            # 결과 통합
             base_result["ai_analysis"] = ai_data
+            base_result["ai_coverage"] = coverage
 
             # AI 요약이 있다면 최상위 요약 덮어쓰기 (더 정확하므로)
             if "executive_summary" in ai_data:
                 base_result["summary"] = f"[AI] {ai_data['executive_summary']}"
 
-            log_llm_response("댓글 심층 분석", f"응답 {len(response_text)}자, 인사이트 추출 완료")
-            log_success("AI 심층 분석 완료")
-            return base_result
+            log_success(
+                f"AI 심층 분석 완료: 댓글 {coverage['comments_seen']}/{coverage['comments_total']}개 반영, "
+                f"LLM {coverage['llm_calls']}회"
+            )
 
         except Exception as e:
             log_llm_fail("댓글 심층 분석", str(e))
             logger.error(f"AI 댓글 분석 실패: {e}")
             # 실패 시 기본 결과 반환 (서비스 중단 방지)
             base_result["ai_analysis"] = {"error": str(e)}
-            return base_result
 
-    def _run_async(self, coro):
-        import asyncio
-        from concurrent.futures import ThreadPoolExecutor
+    async def _deep_analysis_single(self, comments: list[dict]) -> tuple[dict, dict]:
+        """앞 chunk_size개 댓글을 프롬프트 1회로 분석"""
+        # 너무 짧은 댓글(3글자 이하) 제외
+        valid_comments = [
+            c.get("text", "") for c in comments if len(c.get("text", "")) > 3
+        ]
+        sample_texts = valid_comments[: self._chunk_size]
+        combined_text = "\n- ".join(sample_texts)
+        log_llm_request("댓글 심층 분석", f"댓글 {len(sample_texts)}개 요약, 프롬프트 {len(combined_text)}자")
 
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
+        prompt = prompt_registry.get("comment.analysis").render(
+            combined_text=combined_text
+        )
+        response_text = await self._generate(prompt, temperature=0.4)
+        ai_data = validate_json_output(
+            response_text, required_fields=["deep_pain_points", "marketing_hooks"]
+        )
+        log_llm_response("댓글 심층 분석", f"응답 {len(response_text)}자, 인사이트 추출 완료")
 
-        if loop and loop.is_running():
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(asyncio.run, coro)
-                return future.result()
+        coverage = self._coverage(
+            "sample", len(valid_comments), len(sample_texts), 1, estimate_tokens(prompt)
+        )
+        return ai_data, coverage
+
+    async def _deep_analysis_map_reduce(
+        self, chunks: list[CommentChunk], total: int
+    ) -> tuple[dict, dict]:
+        """청크별 요약(map)을 병렬 실행한 뒤 하나의 VoC 리포트로 통합(reduce)"""
+        log_llm_request(
+            "댓글 심층 분석(map)",
+            f"댓글 {sum(len(c.texts) for c in chunks)}/{total}개, 청크 {len(chunks)}개",
+        )
+        mapped = await asyncio.gather(*(self._map_chunk(chunk) for chunk in chunks))
+
+        summaries = []
+        comments_seen = 0
+        prompt_tokens = 0
+        for chunk, (summary, tokens) in zip(chunks, mapped, strict=True):
+            prompt_tokens += tokens
+            if summary is None:
+                continue
+            comments_seen += len(chunk.texts)
+            summaries.append(
+                {"group": chunk.label, "comment_count": len(chunk.texts), "summary": summary}
+            )
+        if not summaries:
+            raise ValueError("모든 청크 요약이 실패했습니다.")
 
-        return asyncio.run(coro)
+        prompt = prompt_registry.get("comment.analysis.reduce").render(
+            comments_seen=comments_seen,
+            comments_total=total,
+            chunk_summaries=compact_json(summaries),
+        )
+        response_text = await self._generate(prompt, temperature=0.4)
+        ai_data = validate_json_output(
+            response_text, required_fields=["deep_pain_points", "marketing_hooks"]
+        )
+        log_llm_response("댓글 심층 분석(reduce)", f"응답 {len(response_text)}자, 청크 {len(summaries)}개 통합")
+
+        coverage = self._coverage(
+            "map_reduce",
+            total,
+            comments_seen,
+            len(chunks) + 1,
+            prompt_tokens + estimate_tokens(prompt),
+        )
+        coverage["chunks"] = len(chunks)
+        coverage["failed_chunks"] = len(chunks) - len(summaries)
+        return ai_data, coverage
+
+    async def _map_chunk(self, chunk: CommentChunk) -> tuple[dict | None, int]:
+        """청크 1개 요약 (실패 시 None, reduce는 성공한 청크만 사용)"""
+        prompt = prompt_registry.get("comment.analysis.map").render(
+            stratum=chunk.label,
+            comment_count=len(chunk.texts),
+            combined_text="\n- ".join(chunk.texts),
+        )
+        tokens = estimate_tokens(prompt)
+        try:
+            response_text = await self._generate(prompt, temperature=0.3)
+            summary = validate_json_output(response_text, required_fields=["pain_points"])
+        except Exception as e:
+            logger.warning(f"댓글 청크 요약 실패 ({chunk.label}): {e}")
+            return None, tokens
+        if "error" in summary:
+            logger.warning(f"댓글 청크 요약 파싱 실패 ({chunk.label}): {summary['error']}")
+            return None, tokens
+        return summary, tokens
+
+    async def _generate(self, prompt: str, temperature: float) -> str:
+        """Gemini 호출 (비동기 클라이언트가 있으면 루프에서 직접, 없으면 스레드)"""
+        async with shared_async_limiter("gemini-text", GEMINI_TEXT_MAX_CONCURRENCY):
+            generate_async = getattr(self._gemini, "generate_text_async", None)
+            if generate_async is not None:
+                return await generate_async(prompt, temperature=temperature)
+            return await asyncio.to_thread(
+                self._gemini.generate_text, prompt, temperature=temperature
+            )
+
+    @staticmethod
+    def _coverage(
+        mode: str, total: int, seen: int, llm_calls: int, prompt_tokens: int
+    ) -> dict:
+        """커버리지(반영 댓글 수)와 비용(LLM 호출 수/추정 프롬프트 토큰) 리포트"""
+        return {
+            "mode": mode,
+            "comments_total": total,
+            "comments_seen": seen,
+            "coverage": round(seen / total, 4) if total else 0.0,
+            "llm_calls": llm_calls,
+            "prompt_tokens": prompt_tokens,
+        }
 
     def _empty_result(self) -> dict:
         """빈 결과 반환"""
@@ -283,107 +506,12 @@ class CommentAnalysisService:
             "gain_points": [],
             "questions": [],
             "top_keywords": [],
+            "top_bigrams": [],
+            "top_trigrams": [],
             "summary": "분석할 댓글이 없습니다.",
             "ai_analysis": None,
         }
 
-    def _analyze_sentiment(self, texts: list[str]) -> dict:
-        """감정 분석 (긍정/부정/중립 비율)"""
-        positive_count = 0
-        negative_count = 0
-
-        for text in texts:
-            text_lower = text.lower()
-
-            has_positive = any(kw in text_lower for kw in POSITIVE_KEYWORDS)
-            has_negative = any(kw in text_lower for kw in NEGATIVE_KEYWORDS)
-
-            if has_positive and not has_negative:
-                positive_count += 1
-            elif has_negative and not has_positive:
-                negative_count += 1
-
-        total = len(texts) if texts else 1
-        neutral_count = total - positive_count - negative_count
-
-        return {
-            "positive": round(positive_count / total * 100, 1),
-            "negative": round(negative_count / total * 100, 1),
-            "neutral": round(neutral_count / total * 100, 1),
-            "positive_count": positive_count,
-            "negative_count": negative_count,
-            "neutral_count": neutral_count,
-        }
-
-    def _extract_pain_points(self, texts: list[str], max_count: int = 5) -> list[str]:
-        """페인포인트 추출"""
-        pain_comments = []
-
-        for text in texts:
-            # 페인 키워드가 포함되고 너무 짧지 않은 댓글 수집
-            if any(kw in text for kw in PAIN_KEYWORDS) and len(text) > 10:
-                pain_comments.append(text[:100])  # 100자로 제한
-
-        # 중복 제거 및 상위 N개 반환
-        unique_pains = list(set(pain_comments))
-        return unique_pains[:max_count]
-
-    def _extract_gain_points(self, texts: list[str], max_count: int = 5) -> list[str]:
-        """긍정적 피드백(Gain Points) 추출"""
-        gain_comments = []
-
-        for text in texts:
-            # 긍정 키워드가 포함되고 너무 짧지 않은 댓글 수집
-            if any(kw in text.lower() for kw in POSITIVE_KEYWORDS) and len(text) > 10:
-                gain_comments.append(text[:100])
-
-        unique_gains = list(set(gain_comments))
-        return unique_gains[:max_count]
-
-    def _extract_questions(self, texts: list[str], max_count: int = 5) -> list[str]:
-        """자주 묻는 질문 추출"""
-        questions = []
-
-        for text in texts:
-            # 질문 패턴 매칭
-            for pattern in QUESTION_PATTERNS:
-                if re.search(pattern, text):
-                    if len(text) > 5 and len(text) < 200:
-                        questions.append(text)
-                    break
-
-        unique_questions = list(set(questions))
-        return unique_questions[:max_count]
-
-    def _extract_keywords(self, texts: list[str], max_count: int = 10) -> list[dict]:
-        """핵심 키워드 추출"""
-        # 모든 텍스트 합치기
-        all_text = " ".join(texts)
-
-        # 간단한 단어 빈도 분석 (2글자 이상)
-        words = re.findall(r"[가-힣a-zA-Z]{2,}", all_text)
-
-        # 불용어 제거
-        stopwords = {
-            "그리고",
-            "하지만",
-            "그래서",
-            "근데",
-            "이거",
-            "저거",
-            "the",
-            "and",
-            "is",
-            "it",
-        }
-        filtered_words = [w for w in words if w.lower() not in stopwords]
-
-        # 빈도 계산
-        word_counts = Counter(filtered_words)
-        top_words = word_counts.most_common(max_count)
-
-        return [{"word": word, "count": count} for word, count in top_words]
-
     def _generate_summary(
         self,
         sentiment: dict,
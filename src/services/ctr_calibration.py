@@ -0,0 +1,151 @@
+"""
+CTR 예측 보정 모델 (온라인 선형 회귀)
+실제 CTR 피드백이 들어올 때마다 충분통계량만 갱신하고, 예측 시에는 계수 2개로 바로 보정
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 표본이 이 정도 쌓여야 보정식과 원래 예측의 비중이 반반이 됨 (적은 표본 과적합 방지)
+DEFAULT_PRIOR_SAMPLES = 20.0
+# 예측값 분산이 이보다 작으면 기울기를 추정하지 않고 평균 편향만 보정
+_MIN_VARIANCE = 1e-6
+
+
+class CTRCalibrator:
+    """
+    예측 CTR -> 실제 CTR 온라인 선형 보정
+
+    (예측, 실제) 쌍의 충분통계량 n, Σx, Σy, Σx², Σxy만 들고 있어 기록 건수와 무관하게
+    갱신/저장 비용이 일정하다. 보정값은 최소제곱 직선 a + b·x를 표본 수에 따라
+    원래 예측과 섞은 값이다 (w = n / (n + prior_samples)).
+    기울기는 0 이상으로 제한해 예측 순서가 뒤집히지 않게 한다.
+
+    apply는 미리 계산해 둔 계수 튜플만 읽으므로 잠금 없이 마이크로초 단위로 동작한다.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        prior_samples: float = DEFAULT_PRIOR_SAMPLES,
+    ) -> None:
+        self._path = Path(path) if path is not None else None
+        self._prior = prior_samples
+        self._lock = threading.Lock()
+        self._stats = [0.0, 0.0, 0.0, 0.0, 0.0]  # n, Σx, Σy, Σx², Σxy
+        # (절편, 기울기) - 원래 예측과 섞은 최종 계수
+        self._coef: tuple[float, float] = (0.0, 1.0)
+        if self._path is not None:
+            self._load()
+
+    @property
+    def sample_count(self) -> int:
+        return int(self._stats[0])
+
+    @property
+    def coefficients(self) -> tuple[float, float]:
+        return self._coef
+
+    def apply(self, predicted_ctr: float) -> float:
+        intercept, slope = self._coef
+        return min(100.0, max(0.0, intercept + slope * predicted_ctr))
+
+    def apply_many(self, predicted_ctr: np.ndarray) -> np.ndarray:
+        intercept, slope = self._coef
+        return np.clip(intercept + slope * predicted_ctr, 0.0, 100.0)
+
+    def update(self, predicted_ctr: float, actual_ctr: float, save: bool = True) -> None:
+        """피드백 1건 반영 (save=True면 스냅샷 파일도 갱신)"""
+        self.update_many([(predicted_ctr, actual_ctr)], save=save)
+
+    def update_many(
+        self, pairs: Iterable[tuple[float, float]], save: bool = True
+    ) -> int:
+        """(예측, 실제) 쌍 여러 건 반영, 반영된 건수 반환"""
+        data = np.array(list(pairs), dtype=np.float64).reshape(-1, 2)
+        data = data[np.isfinite(data).all(axis=1)]
+        if not len(data):
+            return 0
+        x, y = data[:, 0], data[:, 1]
+        with self._lock:
+            for i, value in enumerate(
+                (len(data), x.sum(), y.sum(), (x * x).sum(), (x * y).sum())
+            ):
+                self._stats[i] += float(value)
+            self._coef = self._fit()
+            if save:
+                self._write()
+        return len(data)
+
+    def snapshot(self) -> dict[str, float | int]:
+        n, sx, sy, sxx, sxy = self._stats
+        intercept, slope = self._coef
+        return {
+            "n": int(n),
+            "sum_x": sx,
+            "sum_y": sy,
+            "sum_xx": sxx,
+            "sum_xy": sxy,
+            "prior_samples": self._prior,
+            "intercept": round(intercept, 6),
+            "slope": round(slope, 6),
+        }
+
+    def save(self) -> None:
+        with self._lock:
+            self._write()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = [0.0, 0.0, 0.0, 0.0, 0.0]
+            self._coef = (0.0, 1.0)
+
+    def _fit(self) -> tuple[float, float]:
+        n, sx, sy, sxx, sxy = self._stats
+        if n <= 0:
+            return (0.0, 1.0)
+        mean_x, mean_y = sx / n, sy / n
+        var_x = sxx / n - mean_x * mean_x
+        if var_x > _MIN_VARIANCE:
+            slope = max(0.0, (sxy / n - mean_x * mean_y) / var_x)
+        else:
+            slope = 1.0
+        intercept = mean_y - slope * mean_x
+        weight = n / (n + self._prior)
+        return (weight * intercept, weight * slope + (1 - weight))
+
+    def _load(self) -> None:
+        if self._path is None or not self._path.exists():
+            return
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+            stats = [
+                float(data[key]) for key in ("n", "sum_x", "sum_y", "sum_xx", "sum_xy")
+            ]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"CTR 보정 모델 읽기 실패 ({self._path}): {e}")
+            return
+        self._stats = stats
+        self._coef = self._fit()
+
+    def _write(self) -> None:
+        if self._path is None:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        tmp.write_text(json.dumps(self.snapshot()), encoding="utf-8")
+        os.replace(tmp, self._path)
+
+
+__all__ = ["DEFAULT_PRIOR_SAMPLES", "CTRCalibrator"]
@@ -5,19 +5,27 @@ from __future__ import annotations
 import json
 from typing import Any
 
+from services.ctr_calibration import CTRCalibrator
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 백필 시 한 번에 읽는 피드백 행 수
+BACKFILL_BATCH_SIZE = 1000
+
 
 class CTRFeedbackLoop:
     """
     CTR 예측/실제 기록 및 오차 분석.
     가중치 자동 튜닝을 위한 데이터 수집.
+
+    calibrator가 있으면 실제 CTR이 기록될 때마다 보정 모델을 갱신한다.
+    predicted_ctr에는 보정 전 예측값(raw_predicted_ctr가 있으면 그 값)을 기록해야 한다.
     """
 
-    def __init__(self, db_session: Any = None):
+    def __init__(self, db_session: Any = None, calibrator: CTRCalibrator | None = None):
         self._db = db_session
+        self._calibrator = calibrator
         # In-memory 저장소 (DB 없을 때)
         self._records: list[dict[str, Any]] = []
 
@@ -49,19 +57,78 @@ class CTRFeedbackLoop:
         self, video_id: str, actual_ctr: float
     ) -> dict[str, Any] | None:
         """실제 CTR 기록 및 오차 계산"""
+        updated = None
         if self._db is not None:
             try:
-                return await self._update_actual_in_db(video_id, actual_ctr)
+                updated = await self._update_actual_in_db(video_id, actual_ctr)
             except Exception as e:
                 logger.warning(f"CTR 실제 DB 업데이트 실패: {e}")
+            else:
+                self._update_calibrator(updated)
+                return updated
 
         # In-memory fallback
         for record in reversed(self._records):
             if record["video_id"] == video_id and "actual_ctr" not in record:
                 record["actual_ctr"] = actual_ctr
                 record["error"] = actual_ctr - record["predicted_ctr"]
-                return record
-        return None
+                updated = record
+                break
+        self._update_calibrator(updated)
+        return updated
+
+    def _update_calibrator(self, record: dict[str, Any] | None) -> None:
+        if self._calibrator is None or record is None:
+            return
+        try:
+            self._calibrator.update(record["predicted_ctr"], record["actual_ctr"])
+        except OSError as e:
+            logger.warning(f"CTR 보정 모델 저장 실패: {e}")
+
+    async def backfill_calibration(
+        self, batch_size: int = BACKFILL_BATCH_SIZE, reset: bool = True
+    ) -> int:
+        """
+        ctr_feedback 테이블의 (예측, 실제) 쌍으로 보정 모델 재학습
+
+        id 기준 keyset 페이지네이션으로 batch_size행씩 읽어 누적하므로
+        테이블 크기와 무관하게 메모리 사용량이 일정하다. 스냅샷은 마지막에 한 번 저장.
+
+        Returns:
+            학습에 반영된 피드백 건수
+        """
+        if self._db is None or self._calibrator is None:
+            return 0
+        from sqlalchemy import select
+
+        from infrastructure.database.models import CTRFeedback
+
+        if reset:
+            self._calibrator.reset()
+        last_id = 0
+        total = 0
+        while True:
+            stmt = (
+                select(CTRFeedback.id, CTRFeedback.predicted_ctr, CTRFeedback.actual_ctr)
+                .where(CTRFeedback.id > last_id)
+                .where(CTRFeedback.actual_ctr.is_not(None))
+                .order_by(CTRFeedback.id)
+                .limit(batch_size)
+            )
+            rows = (await self._db.execute(stmt)).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            # 문자열 컬럼 시절 행도 읽히도록 float 변환
+            total += self._calibrator.update_many(
+                ((float(r.predicted_ctr), float(r.actual_ctr)) for r in rows),
+                save=False,
+            )
+        self._calibrator.save()
+        logger.info(
+            f"CTR 보정 모델 백필 완료: {total}건, 계수 {self._calibrator.coefficients}"
+        )
+        return total
 
     def compute_adjustment_weights(
         self, records: list[dict[str, Any]] | None = None
@@ -91,7 +158,7 @@ class CTRFeedbackLoop:
 
         row = CTRFeedback(
             video_id=record["video_id"],
-            predicted_ctr=str(record["predicted_ctr"]),
+            predicted_ctr=float(record["predicted_ctr"]),
             model_version=record["model_version"],
             metadata_json=json.dumps(record.get("metadata") or {}),
         )
@@ -120,8 +187,8 @@ class CTRFeedbackLoop:
 
         predicted = float(row.predicted_ctr)
         error = actual_ctr - predicted
-        row.actual_ctr = str(actual_ctr)
-        row.error = str(round(error, 4))
+        row.actual_ctr = actual_ctr
+        row.error = round(error, 4)
         await self._db.commit()
 
         return {
@@ -130,3 +197,22 @@ class CTRFeedbackLoop:
             "actual_ctr": actual_ctr,
             "error": error,
         }
+
+
+async def _run_backfill(batch_size: int) -> None:
+    from config.dependencies import get_services
+    from infrastructure.database.connection import AsyncSessionFactory
+
+    calibrator = get_services().ctr_calibrator
+    async with AsyncSessionFactory() as session:
+        await CTRFeedbackLoop(session, calibrator).backfill_calibration(batch_size)
+
+
+if __name__ == "__main__":
+    # 실행: PYTHONPATH=src python -m services.ctr_feedback_loop [--batch-size 1000]
+    import argparse
+    import asyncio
+
+    parser = argparse.ArgumentParser(description="CTR 보정 모델 백필")
+    parser.add_argument("--batch-size", type=int, default=BACKFILL_BATCH_SIZE)
+    asyncio.run(_run_backfill(parser.parse_args().batch_size))
@@ -3,11 +3,18 @@ CTR 예측 서비스
 썸네일 + 제목 조합 분석 및 클릭률 예측
 """
 
+import re
+from collections.abc import Sequence
+
+import numpy as np
 
 from core.prompts import (
+    compact_json,
     ctr_prediction_prompts,  # noqa: F401
     prompt_registry,
 )
+from infrastructure.storage.competitor_title_index import CompetitorTitleStore
+from services.ctr_calibration import CTRCalibrator
 from services.model_evaluator import ModelEvaluator
 from utils.logger import (
     get_logger,
@@ -20,16 +27,113 @@ from utils.logger import (
 
 logger = get_logger(__name__)
 
+# 이모지 패턴
+EMOJI_PATTERN = re.compile(
+    "["
+    "\U0001f600-\U0001f64f"  # emoticons
+    "\U0001f300-\U0001f5ff"  # symbols & pictographs
+    "\U0001f680-\U0001f6ff"  # transport & map
+    "\U0001f1e0-\U0001f1ff"  # flags
+    "\U00002702-\U000027b0"
+    "\U000024c2-\U0001f251"
+    "]+",
+    flags=re.UNICODE,
+)
+
+# 후킹 키워드별 가산점 (강 20 / 중 10 / 약 5)
+STRONG_HOOKS = ["비밀", "충격", "반전", "꿀팁", "필수", "주의", "경고", "긴급"]
+MEDIUM_HOOKS = ["방법", "이유", "진실", "사실", "효과", "결과", "비교"]
+WEAK_HOOKS = ["추천", "소개", "리뷰", "후기"]
+HOOK_WEIGHTS: dict[str, float] = {
+    **dict.fromkeys(STRONG_HOOKS, 20.0),
+    **dict.fromkeys(MEDIUM_HOOKS, 10.0),
+    **dict.fromkeys(WEAK_HOOKS, 5.0),
+}
+# 모든 시작 위치에서 매칭해 키워드별 포함 여부를 한 번에 확인
+_HOOK_PATTERN = re.compile(
+    "(?=({}))".format("|".join(sorted(HOOK_WEIGHTS, key=len, reverse=True)))
+)
+
+# 차별화 점수 비교 대상 경쟁 제목 수
+MAX_COMPETITOR_TITLES = 5
+
+# 세부 점수 가중치 (합계 1.0)
+SCORE_WEIGHTS: dict[str, float] = {
+    "title_length": 0.15,
+    "emoji_usage": 0.10,
+    "hook_strength": 0.25,
+    "thumbnail": 0.30,
+    "differentiation": 0.20,
+}
+
+
+class CompetitorIndex:
+    """
+    경쟁 제목 단어 색인 (배치 예측에서 한 번만 생성)
+
+    경쟁 제목 단어 집합을 (제목 수 x 어휘) 0/1 행렬로 들고 있다가
+    후보 제목 전체와의 Jaccard 유사도를 행렬곱 한 번으로 계산한다.
+    """
+
+    def __init__(self, competitor_titles: Sequence[str]) -> None:
+        word_sets = [
+            set(title.lower().split())
+            for title in competitor_titles[:MAX_COMPETITOR_TITLES]
+        ]
+        self._vocab: dict[str, int] = {}
+        for words in word_sets:
+            for word in words:
+                self._vocab.setdefault(word, len(self._vocab))
+        self._matrix = np.zeros((len(word_sets), len(self._vocab)), dtype=np.int32)
+        for row, words in enumerate(word_sets):
+            self._matrix[row, [self._vocab[w] for w in words]] = 1
+        self._sizes = self._matrix.sum(axis=1)
+
+    def __len__(self) -> int:
+        return self._matrix.shape[0]
+
+    def differentiation(self, titles: Sequence[str]) -> np.ndarray:
+        """제목별 차별화 점수 (_score_differentiation과 같은 규칙)"""
+        if len(self) == 0:
+            return np.full(len(titles), 75.0)
+
+        members = np.zeros((len(titles), len(self._vocab)), dtype=np.int32)
+        title_sizes = np.zeros(len(titles), dtype=np.int64)
+        for row, title in enumerate(titles):
+            words = set(title.lower().split())
+            title_sizes[row] = len(words)
+            cols = [self._vocab[w] for w in words if w in self._vocab]
+            if cols:
+                members[row, cols] = 1
+
+        inter = members @ self._matrix.T
+        union = title_sizes[:, None] + self._sizes[None, :] - inter
+        valid = (title_sizes[:, None] > 0) & (self._sizes[None, :] > 0)
+        similarity = np.where(valid, inter / np.maximum(union, 1), 0.0)
+        counts = valid.sum(axis=1)
+        average = similarity.sum(axis=1) / np.maximum(counts, 1)
+        scores = np.clip((1 - average) * 100, 50.0, 100.0)
+        return np.where(counts > 0, scores, 75.0)
+
 
 class CTRPredictor:
     """AI 기반 CTR 예측 서비스"""
 
-    def __init__(self, gemini_client=None) -> None:
+    def __init__(
+        self,
+        gemini_client=None,
+        competitor_index: CompetitorTitleStore | None = None,
+        calibrator: CTRCalibrator | None = None,
+    ) -> None:
         """
         Args:
             gemini_client: AI 기반 심층 분석 시 사용 (선택)
+            competitor_index: 카테고리별 경쟁 제목 색인 (competitor_titles 미지정 시 차별화 기준)
+            calibrator: 실제 CTR 피드백으로 학습한 보정 모델 (표본이 있을 때만 적용)
         """
         self._gemini = gemini_client
+        self._competitor_index = competitor_index
+        self._calibrator = calibrator
         self._evaluator = ModelEvaluator()
 
     def predict_ctr(
@@ -67,22 +171,31 @@ class CTRPredictor:
         # 4. 썸네일 요소 점수 (설명 기반 추정)
         scores["thumbnail"] = self._score_thumbnail(thumbnail_description)
 
-        # 5. 경쟁사 대비 차별화 점수
-        scores["differentiation"] = self._score_differentiation(
-            title, competitor_titles or []
-        )
+        # 5. 경쟁사 대비 차별화 점수 (지정 경쟁 제목 우선, 없으면 카테고리 색인)
+        nearest = None
+        if not competitor_titles and self._competitor_index is not None:
+            indexed = self._competitor_index.differentiation(category, [title])
+            if indexed is not None:
+                scores["differentiation"] = float(indexed[0])
+                nearest = self._competitor_index.nearest(category, title, k=3)
+        if "differentiation" not in scores:
+            scores["differentiation"] = self._score_differentiation(
+                title, competitor_titles or []
+            )
 
         # 가중 평균 계산
         total_score = (
-            scores["title_length"] * 0.15
-            + scores["emoji_usage"] * 0.10
-            + scores["hook_strength"] * 0.25
-            + scores["thumbnail"] * 0.30
-            + scores["differentiation"] * 0.20
+            scores["title_length"] * SCORE_WEIGHTS["title_length"]
+            + scores["emoji_usage"] * SCORE_WEIGHTS["emoji_usage"]
+            + scores["hook_strength"] * SCORE_WEIGHTS["hook_strength"]
+            + scores["thumbnail"] * SCORE_WEIGHTS["thumbnail"]
+            + scores["differentiation"] * SCORE_WEIGHTS["differentiation"]
         )
 
         # CTR 범위로 변환 (2% ~ 15%)
-        predicted_ctr = 2 + (total_score / 100) * 13
+        raw_ctr = 2 + (total_score / 100) * 13
+        calibrated = self._calibrating()
+        predicted_ctr = self._calibrator.apply(raw_ctr) if calibrated else raw_ctr
 
         result = {
             "predicted_ctr": round(predicted_ctr, 2),
@@ -92,6 +205,11 @@ class CTRPredictor:
             "recommendations": self._generate_recommendations(scores),
             "grade": self._get_grade(total_score),
         }
+        if calibrated:
+            # 피드백 기록(CTRFeedbackLoop)에는 보정 전 값을 넘겨야 함
+            result["raw_predicted_ctr"] = round(raw_ctr, 2)
+        if nearest is not None:
+            result["nearest_competitors"] = nearest
 
         log_success(f"CTR 예측 완료: {result['predicted_ctr']}% ({result['grade']})")
         self._evaluator.log_prediction(
@@ -101,6 +219,154 @@ class CTRPredictor:
         )
         return result
 
+    def predict_batch(
+        self,
+        candidates: Sequence[str | dict],
+        competitor_titles: list[str] | None = None,
+        thumbnail_description: str = "",
+        top_k: int | None = None,
+        category: str = "general",
+    ) -> list[dict]:
+        """
+        후보 제목 일괄 CTR 예측 (predict_ctr와 같은 점수 규칙)
+
+        휴리스틱 피처를 후보 전체에 대해 배열로 한 번에 계산하고,
+        경쟁 제목 단어 색인은 배치당 한 번만 만든다.
+
+        Args:
+            candidates: 제목 문자열 또는 {title, thumbnail_description} 리스트
+            competitor_titles: 모든 후보가 공유하는 경쟁 영상 제목들
+            thumbnail_description: 후보의 썸네일 설명이 없거나 비어 있을 때 쓰는 기본값
+            top_k: 상위 k개만 반환 (None이면 전체)
+            category: competitor_titles가 없을 때 차별화 기준으로 쓸 색인 카테고리
+
+        Returns:
+            predicted_ctr 내림차순 결과 리스트 (variation_id는 입력 순서 1부터, rank 포함)
+        """
+        if not candidates:
+            return []
+        items = [c if isinstance(c, dict) else {"title": c} for c in candidates]
+        titles = [item.get("title", "") or "" for item in items]
+        descriptions = [
+            item.get("thumbnail_description") or thumbnail_description or ""
+            for item in items
+        ]
+        log_step("CTR 배치 예측", "시작", f"후보 {len(titles)}개")
+
+        features = self._batch_features(
+            titles, descriptions, competitor_titles or [], category
+        )
+        total = sum(features[name] * weight for name, weight in SCORE_WEIGHTS.items())
+        raw = 2 + (total / 100) * 13
+        calibrated = self._calibrating()
+        predicted = self._calibrator.apply_many(raw) if calibrated else raw
+
+        # 반올림된 CTR 내림차순, 동률은 입력 순서 (compare_variations와 동일)
+        rounded = [round(ctr, 2) for ctr in predicted.tolist()]
+        order = sorted(range(len(titles)), key=lambda i: -rounded[i])
+        if top_k is not None:
+            order = order[:top_k]
+
+        results = []
+        for rank, idx in enumerate(order, start=1):
+            breakdown = {name: float(values[idx]) for name, values in features.items()}
+            ctr = float(predicted[idx])
+            score = float(total[idx])
+            results.append(
+                {
+                    "variation_id": idx + 1,
+                    "title": titles[idx],
+                    "predicted_ctr": rounded[idx],
+                    "ctr_range": self._get_ctr_range(ctr),
+                    "total_score": round(score, 1),
+                    "breakdown": breakdown,
+                    "recommendations": self._generate_recommendations(breakdown),
+                    "grade": self._get_grade(score),
+                    "rank": rank,
+                }
+            )
+            if calibrated:
+                results[-1]["raw_predicted_ctr"] = round(float(raw[idx]), 2)
+
+        log_success(
+            f"CTR 배치 예측 완료: 후보 {len(titles)}개, 최고 {results[0]['predicted_ctr']}%"
+        )
+        self._evaluator.log_predictions(
+            model_name="ctr_hybrid",
+            records=[
+                (
+                    {
+                        "title": r["title"],
+                        "thumbnail_description": descriptions[r["variation_id"] - 1],
+                    },
+                    r,
+                )
+                for r in results
+            ],
+        )
+        return results
+
+    def _calibrating(self) -> bool:
+        return self._calibrator is not None and self._calibrator.sample_count > 0
+
+    def _batch_features(
+        self,
+        titles: list[str],
+        descriptions: list[str],
+        competitor_titles: list[str],
+        category: str = "general",
+    ) -> dict[str, np.ndarray]:
+        """후보별 세부 점수 배열 (키 순서는 breakdown과 동일)"""
+        lengths = np.fromiter(
+            (len(t) for t in titles), dtype=np.float64, count=len(titles)
+        )
+        title_length = np.where(
+            lengths < 30,
+            np.maximum(0, 100 - (30 - lengths) * 3),
+            np.where(lengths > 60, np.maximum(0, 100 - (lengths - 60) * 2), 100.0),
+        )
+
+        emoji_counts = np.fromiter(
+            (len(EMOJI_PATTERN.findall(t)) for t in titles),
+            dtype=np.int64,
+            count=len(titles),
+        )
+        emoji_usage = np.select(
+            [emoji_counts == 0, emoji_counts <= 3, emoji_counts <= 5],
+            [60.0, 100.0, 80.0],
+            default=50.0,
+        )
+
+        hook_bonus = np.fromiter(
+            (
+                sum(HOOK_WEIGHTS[h] for h in set(_HOOK_PATTERN.findall(t.lower())))
+                + (10 if any(c.isdigit() for c in t) else 0)
+                + (5 if "?" in t else 0)
+                for t in titles
+            ),
+            dtype=np.float64,
+            count=len(titles),
+        )
+        hook_strength = np.minimum(100.0, 50.0 + hook_bonus)
+
+        # 썸네일 설명은 보통 몇 종류뿐이라 고유값만 채점
+        thumbnail_scores = {d: self._score_thumbnail(d) for d in set(descriptions)}
+        thumbnail = np.array([thumbnail_scores[d] for d in descriptions], dtype=np.float64)
+
+        differentiation = None
+        if not competitor_titles and self._competitor_index is not None:
+            differentiation = self._competitor_index.differentiation(category, titles)
+        if differentiation is None:
+            differentiation = CompetitorIndex(competitor_titles).differentiation(titles)
+
+        return {
+            "title_length": title_length,
+            "emoji_usage": emoji_usage,
+            "hook_strength": hook_strength,
+            "thumbnail": thumbnail,
+            "differentiation": differentiation,
+        }
+
     def _score_title_length(self, title: str) -> float:
         """제목 길이 점수 (0-100)"""
         length = len(title)
@@ -115,22 +381,7 @@ class CTRPredictor:
 
     def _score_emoji_usage(self, title: str) -> float:
         """이모지 사용 점수 (0-100)"""
-        import re
-
-        # 이모지 패턴
-        emoji_pattern = re.compile(
-            "["
-            "\U0001f600-\U0001f64f"  # emoticons
-            "\U0001f300-\U0001f5ff"  # symbols & pictographs
-            "\U0001f680-\U0001f6ff"  # transport & map
-            "\U0001f1e0-\U0001f1ff"  # flags
-            "\U00002702-\U000027b0"
-            "\U000024c2-\U0001f251"
-            "]+",
-            flags=re.UNICODE,
-        )
-
-        emojis = emoji_pattern.findall(title)
+        emojis = EMOJI_PATTERN.findall(title)
         count = len(emojis)
 
         if count == 0:
@@ -144,16 +395,12 @@ class CTRPredictor:
 
     def _score_hook_strength(self, title: str) -> float:
         """후킹 강도 점수 (0-100)"""
-        strong_hooks = ["비밀", "충격", "반전", "꿀팁", "필수", "주의", "경고", "긴급"]
-        medium_hooks = ["방법", "이유", "진실", "사실", "효과", "결과", "비교"]
-        weak_hooks = ["추천", "소개", "리뷰", "후기"]
-
         title_lower = title.lower()
 
         # 강한 후킹 키워드 체크
-        strong_count = sum(1 for h in strong_hooks if h in title_lower)
-        medium_count = sum(1 for h in medium_hooks if h in title_lower)
-        weak_count = sum(1 for h in weak_hooks if h in title_lower)
+        strong_count = sum(1 for h in STRONG_HOOKS if h in title_lower)
+        medium_count = sum(1 for h in MEDIUM_HOOKS if h in title_lower)
+        weak_count = sum(1 for h in WEAK_HOOKS if h in title_lower)
 
         score = 50.0  # 기본
         score += strong_count * 20
@@ -201,7 +448,7 @@ class CTRPredictor:
         title_words = set(title.lower().split())
 
         similarity_scores = []
-        for comp_title in competitor_titles[:5]:
+        for comp_title in competitor_titles[:MAX_COMPETITOR_TITLES]:
             comp_words = set(comp_title.lower().split())
             if title_words and comp_words:
                 overlap = len(title_words & comp_words) / len(title_words | comp_words)
@@ -327,25 +574,7 @@ class CTRPredictor:
         Returns:
             예측 결과 + 순위 리스트
         """
-        results = []
-
-        for i, var in enumerate(variations):
-            prediction = self.predict_ctr(
-                title=var.get("title", ""),
-                thumbnail_description=var.get("thumbnail_description", ""),
-            )
-            prediction["variation_id"] = i + 1
-            prediction["title"] = var.get("title", "")
-            results.append(prediction)
-
-        # CTR 순으로 정렬
-        results.sort(key=lambda x: x["predicted_ctr"], reverse=True)
-
-        # 순위 추가
-        for rank, result in enumerate(results, 1):
-            result["rank"] = rank
-
-        return results
+        return self.predict_batch(variations)
 
     async def predict_with_ai(
         self,
@@ -374,8 +603,7 @@ class CTRPredictor:
 
         insights_text = ""
         if top_insights:
-            import json
-            insights_text = f"\n## X-Algorithm 핵심 인사이트 (참고용)\n{json.dumps(top_insights, ensure_ascii=False, indent=2)}\n"
+            insights_text = f"\n## X-Algorithm 핵심 인사이트 (참고용)\n{compact_json(top_insights)}\n"
 
         prompt = prompt_registry.get("ctr.prediction").render(
             insights_text=insights_text,
@@ -4,20 +4,70 @@ YouTube + Naver + X-Algorithm 인사이트 수집
 """
 
 import asyncio
-import threading
+import hashlib
 from collections.abc import Callable
+from typing import ClassVar
 
-from core.models import CollectedData, PipelineConfig, PipelineStep
+from core.exceptions import DataCollectionError
+from core.models import CollectedData, PipelineConfig, PipelineProgress, PipelineStep
+from infrastructure.storage.competitor_title_index import CompetitorTitleStore
 from services.data_validator import validate_comments
 from services.market_trend_service import MarketTrendService
 from services.naver_service import NaverService
 from services.pipeline.orchestrator import PipelineOrchestrator
 from services.youtube_service import YouTubeService
+from utils.concurrency import run_coroutine_sync
 from utils.logger import get_logger, log_error, log_info, log_step
 
 logger = get_logger(__name__)
 
 
+def comment_key(text: str) -> str:
+    """댓글 식별 키 (정규화 텍스트 해시)"""
+    return hashlib.sha1(text.strip().encode("utf-8")).hexdigest()[:16]
+
+
+def merge_insights(
+    previous: list[dict], new: list[dict], top_k: int | None = None
+) -> list[dict]:
+    """이전/신규 인사이트를 점수순으로 합치고 순위 재부여 (같은 내용은 한 번만)"""
+    top_k = top_k or max(len(previous), len(new))
+    seen: set[str] = set()
+    merged = []
+    for insight in sorted(previous + new, key=lambda x: x.get("score", 0), reverse=True):
+        content = insight.get("content", "")
+        if content in seen:
+            continue
+        seen.add(content)
+        merged.append({**insight, "rank": len(merged) + 1})
+        if len(merged) >= top_k:
+            break
+    return merged
+
+
+class _MonotonicProgress:
+    """
+    동시 수집용 진행 보고
+
+    소스가 완료되는 순서가 매번 다르므로, 이미 보고한 단계보다 앞선 단계가 와도
+    진행률이 되돌아가지 않도록 단계는 지금까지의 최대값을 유지하고 메시지만 갱신한다.
+    """
+
+    _ORDER: ClassVar[dict[PipelineStep, int]] = {
+        step: i for i, step in enumerate(PipelineProgress.STEP_ORDER)
+    }
+
+    def __init__(self, callback: Callable[[PipelineStep, str], None] | None) -> None:
+        self._callback = callback
+        self._reached: PipelineStep | None = None
+
+    def report(self, step: PipelineStep, message: str) -> None:
+        if self._reached is None or self._ORDER[step] > self._ORDER[self._reached]:
+            self._reached = step
+        if self._callback:
+            self._callback(self._reached, message)
+
+
 class DataCollectionService:
     """데이터 수집 통합 서비스"""
 
@@ -27,57 +77,138 @@ class DataCollectionService:
         naver_service: NaverService,
         pipeline_orchestrator: PipelineOrchestrator,
         market_trend_service: MarketTrendService | None = None,
+        competitor_index: CompetitorTitleStore | None = None,
     ) -> None:
         self._youtube = youtube_service
         self._naver = naver_service
         self._orchestrator = pipeline_orchestrator
         self._market_trend = market_trend_service
+        self._competitor_index = competitor_index
 
     def collect_all_data(
         self,
         product: dict,
         config: PipelineConfig,
         progress_callback: Callable[[PipelineStep, str], None] | None = None,
+        previous: CollectedData | None = None,
+    ) -> CollectedData:
+        """전체 데이터 수집 (동기 호출용, collect_all_data_async 래퍼)"""
+        return run_coroutine_sync(
+            self.collect_all_data_async(product, config, progress_callback, previous)
+        )
+
+    async def collect_all_data_async(
+        self,
+        product: dict,
+        config: PipelineConfig,
+        progress_callback: Callable[[PipelineStep, str], None] | None = None,
+        previous: CollectedData | None = None,
     ) -> CollectedData:
-        """전체 데이터 수집"""
+        """
+        전체 데이터 수집
+
+        YouTube / 네이버 / 시장 동향을 동시에 수집하고, YouTube 결과가 오는 즉시
+        X-Algorithm 댓글 분석을 시작한다 (네이버·시장 동향을 기다리지 않음).
+        소스 하나가 실패해도 나머지로 계속 진행하며 실패 내역은 source_errors에 남긴다.
+        previous(이전 수집 스냅샷)가 있으면 그때 분석하지 않은 댓글만 분석하고
+        인사이트를 합친다.
+
+        Raises:
+            DataCollectionError: YouTube와 네이버가 모두 실패한 경우
+        """
         p_name = product.get("name", "N/A")
         log_step("데이터 수집", "시작", f"제품: {p_name}")
 
         collected_data = CollectedData()
+        progress = _MonotonicProgress(progress_callback)
+        progress.report(PipelineStep.DATA_COLLECTION, "YouTube/네이버/시장 동향 동시 수집 중...")
 
-        if progress_callback:
-            progress_callback(PipelineStep.YOUTUBE_COLLECTION, "YouTube 데이터 수집 중...")
+        async def youtube_then_analysis() -> None:
+            youtube_data = await asyncio.to_thread(
+                self._youtube.collect_product_data,
+                product=product,
+                max_results=config.youtube_count,
+                include_comments=config.include_comments,
+            )
+            collected_data.youtube_data = youtube_data
+            collected_data.pain_points = youtube_data.get("pain_points", [])
+            collected_data.gain_points = youtube_data.get("gain_points", [])
+            # YouTube 비디오 목록 저장
+            if youtube_data and "videos" in youtube_data:
+                collected_data.youtube_videos = youtube_data["videos"]
+            progress.report(
+                PipelineStep.YOUTUBE_COLLECTION,
+                f"YouTube 데이터 수집 완료 ({len(collected_data.youtube_videos)}개 영상)",
+            )
 
-        youtube_data = self._youtube.collect_product_data(
-            product=product,
-            max_results=config.youtube_count,
-            include_comments=config.include_comments,
-        )
-        collected_data.youtube_data = youtube_data
-        collected_data.pain_points = youtube_data.get("pain_points", [])
-        collected_data.gain_points = youtube_data.get("gain_points", [])
+            progress.report(PipelineStep.COMMENT_ANALYSIS, "X-Algorithm 인사이트 분석 중...")
+            await self._analyze_comments(youtube_data, config, collected_data, previous)
 
-        if progress_callback:
-            progress_callback(PipelineStep.NAVER_COLLECTION, "네이버 쇼핑 데이터 수집 중...")
+        async def naver() -> None:
+            collected_data.naver_data = await self._naver.collect_product_data_async(
+                product=product,
+                max_results=config.naver_count,
+            )
+            progress.report(PipelineStep.NAVER_COLLECTION, "네이버 쇼핑 데이터 수집 완료")
 
-        naver_data = self._naver.collect_product_data(
-            product=product,
-            max_results=config.naver_count,
-        )
-        collected_data.naver_data = naver_data
+        async def market_trends() -> None:
+            collected_data.market_trends = await asyncio.to_thread(
+                self._market_trend.get_market_trends, product
+            )
+            progress.report(PipelineStep.DATA_COLLECTION, "시장 동향 수집 완료")
 
+        sources = {"youtube": youtube_then_analysis(), "naver": naver()}
         if self._market_trend:
-            if progress_callback:
-                progress_callback(PipelineStep.DATA_COLLECTION, "시장 동향 수집 중...")
-            collected_data.market_trends = self._market_trend.get_market_trends(product)
+            sources["market_trend"] = market_trends()
+
+        results = await asyncio.gather(*sources.values(), return_exceptions=True)
+        for source, result in zip(sources, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                collected_data.source_errors[source] = str(result)
+                log_error(f"{source} 수집 실패 (나머지 소스로 계속 진행): {result}")
 
-        # YouTube 비디오 목록 저장
-        if youtube_data and "videos" in youtube_data:
-            collected_data.youtube_videos = youtube_data["videos"]
+        if {"youtube", "naver"} <= collected_data.source_errors.keys():
+            raise DataCollectionError(
+                "YouTube와 네이버 데이터 수집이 모두 실패했습니다.",
+                details={"errors": collected_data.source_errors},
+            )
 
-        if progress_callback:
-            progress_callback(PipelineStep.COMMENT_ANALYSIS, "X-Algorithm 인사이트 분석 중...")
+        if self._competitor_index is not None:
+            await asyncio.to_thread(self._index_competitor_titles, product, collected_data)
+
+        progress.report(PipelineStep.DATA_COLLECTION, "데이터 수집 완료")
+        return collected_data
+
+    def _index_competitor_titles(self, product: dict, collected_data: CollectedData) -> None:
+        """수집한 영상 제목/상품명을 카테고리 경쟁 제목 색인에 누적 (실패해도 수집은 계속)"""
+        category = product.get("category")
+        try:
+            self._competitor_index.add_titles(
+                category,
+                (v.get("title", "") for v in collected_data.youtube_videos),
+                source="youtube",
+            )
+            self._competitor_index.add_titles(
+                category,
+                (
+                    p.get("title", "")
+                    for p in (collected_data.naver_data or {}).get("products", [])
+                ),
+                source="naver",
+            )
+        except Exception as e:
+            log_error(f"경쟁 제목 색인 갱신 실패: {e}")
 
+    async def _analyze_comments(
+        self,
+        youtube_data: dict,
+        config: PipelineConfig,
+        collected_data: CollectedData,
+        previous: CollectedData | None = None,
+    ) -> None:
+        """YouTube 댓글 X-Algorithm 분석 (실패해도 수집은 계속)"""
         try:
             comments = []
             if youtube_data and "videos" in youtube_data:
@@ -111,6 +242,20 @@ class DataCollectionService:
                 unique_comments.append(c)
 
             unique_comments.sort(key=lambda x: x.get("likes", 0), reverse=True)
+            known_keys: list[str] = []
+            if previous is not None:
+                # 증분: 이전 스냅샷에서 이미 분석한 댓글은 제외
+                known_keys = previous.analyzed_comment_keys
+                known = set(known_keys)
+                unique_comments = [
+                    c for c in unique_comments if comment_key(c["text"]) not in known
+                ]
+                if not unique_comments:
+                    log_info("X-Algorithm 증분 분석: 새 댓글 없음 (이전 인사이트 재사용)")
+                    collected_data.top_insights = previous.top_insights
+                    collected_data.quality_report = previous.quality_report
+                    collected_data.analyzed_comment_keys = known_keys
+                    return
             limited_comments = unique_comments[: config.max_comment_samples]
 
             log_info(
@@ -125,54 +270,17 @@ class DataCollectionService:
             )
 
             validated_payload = [item.model_dump() for item in validated]
-            analysis_result = self._run_async(
-                self._orchestrator.run_pipeline(validated_payload)
-            )
+            analysis_result = await self._orchestrator.run_pipeline(validated_payload)
             collected_data.top_insights = analysis_result.get("insights", [])
+            collected_data.analyzed_comment_keys = known_keys + [
+                comment_key(c["text"]) for c in limited_comments
+            ]
+            if previous is not None:
+                collected_data.top_insights = merge_insights(
+                    previous.top_insights, collected_data.top_insights
+                )
+                log_info(f"X-Algorithm 증분 분석: 새 댓글 {len(limited_comments)}개")
             log_info(f"X-Algorithm 분석 완료: {len(collected_data.top_insights)}개 인사이트 도출")
         except Exception as e:
             logger.error(f"X-Algorithm 분석 실패: {e}")
             log_error(f"X-Algorithm 분석 중 오류 발생: {e}")
-
-        if progress_callback:
-            progress_callback(PipelineStep.DATA_COLLECTION, "데이터 수집 완료")
-
-        return collected_data
-
-    @staticmethod
-    def _run_async(coro):
-        """새 이벤트 루프에서 비동기 작업 실행"""
-        try:
-            running_loop = asyncio.get_running_loop()
-        except RuntimeError:
-            running_loop = None
-
-        if running_loop is None:
-            loop = asyncio.new_event_loop()
-            try:
-                asyncio.set_event_loop(loop)
-                return loop.run_until_complete(coro)
-            finally:
-                loop.close()
-
-        result_container: dict[str, object] = {}
-        error_container: dict[str, BaseException] = {}
-
-        def runner():
-            loop = asyncio.new_event_loop()
-            try:
-                asyncio.set_event_loop(loop)
-                result_container["result"] = loop.run_until_complete(coro)
-            except BaseException as exc:
-                error_container["error"] = exc
-            finally:
-                loop.close()
-
-        thread = threading.Thread(target=runner, daemon=True)
-        thread.start()
-        thread.join()
-
-        if "error" in error_container:
-            raise error_container["error"]
-
-        return result_container.get("result")
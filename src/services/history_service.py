@@ -4,61 +4,79 @@
 """
 
 import json
-import os
-from datetime import datetime
+import sqlite3
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
 from core.models.pipeline import (
     PipelineResult,
 )
+from infrastructure.storage.history_index import HistoryIndex, summarize_history
 from utils.file_store import ensure_output_dir, safe_unlink
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+HISTORY_INDEX_FILE = "history_index.sqlite3"
+
 
 class HistoryService:
     """분석 히스토리 관리 서비스"""
 
     def __init__(self, base_dir: Path | None = None):
         self._base_dir = base_dir
+        self._index: HistoryIndex | None = None
+
+    def _meta_dir(self) -> Path:
+        return ensure_output_dir(self._base_dir) / "metadata"
+
+    def _history_index(self) -> HistoryIndex:
+        """목록 색인 (처음 사용할 때 기존 메타데이터 파일로 1회 backfill)"""
+        if self._index is None:
+            meta_dir = self._meta_dir()
+            self._index = HistoryIndex(meta_dir / HISTORY_INDEX_FILE, meta_dir)
+        return self._index
 
     def get_history_list(self) -> list[dict[str, Any]]:
         """저장된 히스토리 목록 반환 (최신순)"""
+        items, _ = self.query_history()
+        return items
+
+    def query_history(
+        self,
+        product: str | None = None,
+        success: bool | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        히스토리 목록 필터/커서 페이지 조회 (최신순, 메타데이터 파일은 읽지 않음)
+
+        잘못된 cursor는 ValueError.
+
+        Returns:
+            (항목 리스트, 다음 페이지 커서 또는 None)
+        """
         try:
-            meta_dir = ensure_output_dir(self._base_dir) / "metadata"
-            if not meta_dir.exists():
-                return []
-
-            files = sorted(meta_dir.glob("meta_*.json"), key=os.path.getmtime, reverse=True)
-
-            history = []
-            for f in files:
-                try:
-                    data = json.loads(f.read_text(encoding="utf-8"))
-                    history.append({
-                        "id": f.stem,
-                        "file_path": str(f),
-                        "product_name": data.get("product_name", "N/A"),
-                        "executed_at": data.get("executed_at", ""),
-                        "success": data.get("success", False),
-                        "top_insight_count": len(data.get("collected_data", {}).get("top_insights", [])),
-                        "has_video": bool(data.get("generated_content", {}).get("video_url") or data.get("generated_content", {}).get("video_path")),
-                    })
-                except Exception as e:
-                    logger.error(f"히스토리 파일 로드 실패 ({f.name}): {e}")
-
-            return history
-        except Exception as e:
+            return self._history_index().query(
+                product=product,
+                success=success,
+                date_from=date_from,
+                date_to=date_to,
+                cursor=cursor,
+                limit=limit,
+            )
+        except sqlite3.Error as e:
             logger.error(f"히스토리 목록 조회 실패: {e}")
-            return []
+            return [], None
 
     def load_history(self, history_id: str) -> PipelineResult | None:
         """특정 히스토리 로드 및 PipelineResult 객체로 복원"""
         try:
-            meta_dir = ensure_output_dir(self._base_dir) / "metadata"
-            file_path = meta_dir / f"{history_id}.json"
+            file_path = self._meta_dir() / f"{history_id}.json"
 
             if not file_path.exists():
                 logger.warning(f"히스토리 파일을 찾을 수 없음: {file_path}")
@@ -97,12 +115,11 @@ class HistoryService:
     def delete_history(self, history_id: str) -> bool:
         """히스토리 삭제 (메타데이터 파일만 삭제)"""
         try:
-            meta_dir = ensure_output_dir(self._base_dir) / "metadata"
-            file_path = meta_dir / f"{history_id}.json"
+            file_path = self._meta_dir() / f"{history_id}.json"
 
-            if file_path.exists():
-                return safe_unlink(file_path)
-            return False
+            deleted = file_path.exists() and safe_unlink(file_path)
+            self._history_index().delete(history_id)
+            return deleted
         except Exception as e:
             logger.error(f"히스토리 삭제 실패 ({history_id}): {e}")
             return False
@@ -116,7 +133,6 @@ class HistoryService:
             # 대용량 바이트 데이터는 저장 시 제외 (이미 별도 파일로 저장됨)
             if data.get("generated_content"):
                 data["generated_content"].pop("thumbnail_data", None)
-                data["generated_content"].pop("video_bytes", None)
 
                 # multi_thumbnails에서도 image 바이트 제거
                 if "multi_thumbnails" in data["generated_content"]:
@@ -129,7 +145,13 @@ class HistoryService:
                 data["executed_at"] = data["executed_at"].isoformat()
 
             from utils.file_store import save_metadata
-            return save_metadata(data, self._base_dir)
+            saved = save_metadata(data, self._base_dir)
+            path = Path(saved)
+            try:
+                self._history_index().upsert(summarize_history(path.stem, path, data))
+            except sqlite3.Error as e:
+                logger.error(f"히스토리 색인 갱신 실패 ({path.name}): {e}")
+            return saved
         except Exception as e:
             logger.error(f"결과 저장 실패: {e}")
             return ""
@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import Any
 
+from infrastructure.storage.competitor_title_index import CompetitorTitleStore
+from utils.json_parser import extract_json
 from utils.logger import (
     get_logger,
     log_llm_fail,
@@ -218,12 +220,18 @@ HOOK_STYLES = {
 class HookService:
     """AI 기반 후킹 문구 생성 서비스"""
 
-    def __init__(self, gemini_client=None) -> None:
+    def __init__(
+        self,
+        gemini_client=None,
+        competitor_index: CompetitorTitleStore | None = None,
+    ) -> None:
         """
         Args:
             gemini_client: AI 기반 맞춤 후킹 생성 시 사용 (선택)
+            competitor_index: 카테고리별 경쟁 제목 색인 (훅 차별화 점검용, 선택)
         """
         self._gemini = gemini_client
+        self._competitor_index = competitor_index
 
     def get_available_styles(self) -> list[dict]:
         """사용 가능한 후킹 스타일 목록 반환 (9종, UI 표기용 label)"""
@@ -558,8 +566,40 @@ Each hook should apply a DIFFERENT psychological strategy to maximize A/B testin
                     }
                 )
 
+        # 경쟁 제목 색인이 있으면 훅별 차별화 점수/가장 비슷한 경쟁 제목 첨부
+        checks = self.check_differentiation(
+            [r["hook"] for r in results], product.get("category")
+        )
+        for result, check in zip(results, checks, strict=False):
+            result["differentiation"] = check["differentiation"]
+            result["nearest_competitor"] = check["nearest_competitor"]
+
         return results
 
+    def check_differentiation(self, hooks: list[str], category: Any) -> list[dict]:
+        """
+        훅 문구를 카테고리 경쟁 제목 전체(색인)와 비교
+
+        Returns:
+            [{hook, differentiation(0-100), nearest_competitor}] (색인이 없거나 비어 있으면 [])
+        """
+        if self._competitor_index is None or not hooks:
+            return []
+        scores = self._competitor_index.differentiation(category, hooks)
+        if scores is None:
+            return []
+        checks = []
+        for hook, score in zip(hooks, scores.tolist(), strict=True):
+            nearest = self._competitor_index.nearest(category, hook, k=1)
+            checks.append(
+                {
+                    "hook": hook,
+                    "differentiation": round(score, 1),
+                    "nearest_competitor": nearest[0] if nearest else None,
+                }
+            )
+        return checks
+
     async def generate_psychological_ab_test(
         self,
         product: dict,
@@ -613,14 +653,9 @@ Output ONLY a JSON list of objects:
 """
         try:
             response = await self._gemini.generate_text_async(prompt)
-            # JSON 파싱
-            import json
-            import re
-
-            text = response.strip()
-            text = re.sub(r"^```(?:json)?\s*", "", text)
-            text = re.sub(r"\s*```\s*$", "", text)
-            return json.loads(text)
+            # JSON 파싱 (잘린 응답은 완결된 항목까지 복구)
+            data = extract_json(response or "", opener="[", allow_partial=True)
+            return data if isinstance(data, list) else []
         except Exception as e:
             logger.error(f"Psychological A/B test generation failed: {e}")
             return []
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from services.naver_service import NaverService
@@ -37,8 +38,6 @@ class InsightExternalService:
         if not safe_query:
             return {"ingested": 0, "items": 0, "products": 0, "blogs": 0, "news": 0}
 
-        meta = meta or {}
-        items: list[dict[str, Any]] = []
         products: list[dict[str, Any]] = []
         blogs: list[dict[str, Any]] = []
         news: list[dict[str, Any]] = []
@@ -61,6 +60,63 @@ class InsightExternalService:
             except Exception as exc:
                 logger.warning(f"Naver news search failed: {exc}")
 
+        return self._ingest_naver_results(safe_query, products, blogs, news, meta, user)
+
+    async def ingest_naver_async(
+        self,
+        query: str,
+        max_results: int = 10,
+        include_products: bool = True,
+        include_blogs: bool = True,
+        include_news: bool = True,
+        meta: dict[str, str | None] | None = None,
+        user: Any | None = None,
+    ) -> dict[str, int]:
+        """ingest_naver와 동일하되 쇼핑/블로그/뉴스를 동시에 검색"""
+        safe_query = (query or "").strip()
+        if not safe_query:
+            return {"ingested": 0, "items": 0, "products": 0, "blogs": 0, "news": 0}
+
+        verticals = tuple(
+            vertical
+            for vertical, enabled in (
+                ("shop", include_products),
+                ("blog", include_blogs),
+                ("news", include_news),
+            )
+            if enabled
+        )
+        found: dict[str, list[dict[str, Any]]] = {}
+        if verticals:
+            try:
+                found = await self._naver.search_all(
+                    safe_query, max_results, verticals, raise_on_error=False
+                )
+            except Exception as exc:
+                logger.warning(f"Naver search failed: {exc}")
+
+        return await asyncio.to_thread(
+            self._ingest_naver_results,
+            safe_query,
+            found.get("products", []),
+            found.get("blogs", []),
+            found.get("news", []),
+            meta,
+            user,
+        )
+
+    def _ingest_naver_results(
+        self,
+        safe_query: str,
+        products: list[dict[str, Any]],
+        blogs: list[dict[str, Any]],
+        news: list[dict[str, Any]],
+        meta: dict[str, str | None] | None,
+        user: Any | None,
+    ) -> dict[str, int]:
+        meta = meta or {}
+        items: list[dict[str, Any]] = []
+
         for item in products:
             title = item.get("title") or safe_query
             content = "\n".join(
@@ -6,6 +6,7 @@ Discovery Engine 검색 결과를 요약
 from typing import Any
 
 from core.interfaces.chatbot import IRAGClient
+from utils.cache import cached
 from utils.logger import log_info, log_warning
 
 
@@ -15,6 +16,7 @@ class MarketTrendService:
     def __init__(self, rag_client: IRAGClient) -> None:
         self._rag_client = rag_client
 
+    @cached(ttl=1800, cache_key_prefix="market_trend")
     def get_market_trends(self, product: dict, max_results: int = 5) -> dict[str, Any]:
         product_name = product.get("name", "")
         product_category = product.get("category", "")
@@ -2,17 +2,24 @@
 모델 평가 및 로깅
 """
 
-import json
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 
+from infrastructure.storage.evaluation_log_store import EvaluationLogStore
+
 
 class ModelEvaluator:
-    """모델 성능 평가 및 추적"""
+    """
+    모델 성능 평가 및 추적
+
+    로그는 모델/일 단위 파티션에 쌓이고, 보고서와 모델 비교는 파티션별
+    누적 집계 색인만 읽는다 (EvaluationLogStore).
+    """
 
     def __init__(self, output_dir: str = "outputs/evaluations") -> None:
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._store = EvaluationLogStore(output_dir)
+        self._store.migrate_legacy()
 
     def log_prediction(
         self,
@@ -23,29 +30,76 @@ class ModelEvaluator:
     ) -> None:
         record = {
             "timestamp": datetime.now().isoformat(),
-            "model": model_name,
             "input": input_data,
             "output": output,
             "ground_truth": ground_truth,
         }
-        log_file = self.output_dir / f"{model_name}_{datetime.now().strftime('%Y%m%d')}.jsonl"
-        with log_file.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._store.append(model_name, [record])
 
-    def compare_models(self, model_a: str, model_b: str) -> dict:
+    def log_predictions(
+        self,
+        model_name: str,
+        records: list[tuple[dict, dict]],
+    ) -> None:
+        """[(input, output)] 여러 건을 파일 한 번 열어 기록 (배치 예측용)"""
+        timestamp = datetime.now().isoformat()
+        self._store.append(
+            model_name,
+            (
+                {
+                    "timestamp": timestamp,
+                    "input": input_data,
+                    "output": output,
+                    "ground_truth": None,
+                }
+                for input_data, output in records
+            ),
+        )
+
+    def compare_models(
+        self,
+        model_a: str,
+        model_b: str,
+        start: date | str | None = None,
+        end: date | str | None = None,
+    ) -> dict:
+        """두 모델의 기간(start~end, YYYYMMDD 또는 date) 집계 비교"""
+        summary_a = self._store.aggregate(model_a, start, end).summary()
+        summary_b = self._store.aggregate(model_b, start, end).summary()
+        difference = {
+            key: round(summary_a[key] - summary_b[key], 4)
+            for key in ("mean", "mean_error", "mae", "rmse")
+            if summary_a[key] is not None and summary_b[key] is not None
+        }
+        better = None
+        if "mae" in difference and difference["mae"] != 0:
+            better = model_a if difference["mae"] < 0 else model_b
         return {
             "model_a": model_a,
             "model_b": model_b,
-            "comparison": "구현 예정",
+            "summary_a": summary_a,
+            "summary_b": summary_b,
+            "difference": difference,
+            "better_by_mae": better,
         }
 
-    def generate_report(self) -> str:
+    def generate_report(
+        self,
+        start: date | str | None = None,
+        end: date | str | None = None,
+    ) -> str:
         report_lines = [
             "# 모델 평가 보고서",
             f"생성 시각: {datetime.now().isoformat()}",
             "",
         ]
-        for log_file in self.output_dir.glob("*.jsonl"):
-            count = sum(1 for _ in log_file.open(encoding="utf-8"))
-            report_lines.append(f"- {log_file.stem}: {count}건")
+        for model in self._store.models():
+            for day, stats in self._store.partition_stats(model, start, end).items():
+                line = f"- {model}_{day}: {stats.count}건"
+                if stats.mean is not None:
+                    line += f" (평균 {stats.mean:.4f}"
+                    if stats.mae is not None:
+                        line += f", MAE {stats.mae:.4f}"
+                    line += ")"
+                report_lines.append(line)
         return "\n".join(report_lines)
@@ -3,10 +3,13 @@
 네이버 쇼핑 데이터 수집 비즈니스 로직
 """
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Iterable
 
 from core.exceptions import DataCollectionError
 from core.interfaces.api_client import INaverClient
+from infrastructure.clients.async_naver_client import VERTICALS, AsyncNaverClient
+from infrastructure.storage.price_history_store import PriceHistoryStore
 from utils.cache import cached
 from utils.logger import (
     log_api_end,
@@ -22,10 +25,17 @@ from utils.retry import retry_on_error
 class NaverService:
     """네이버 쇼핑 데이터 수집 서비스"""
 
-    def __init__(self, client: INaverClient) -> None:
+    def __init__(
+        self,
+        client: INaverClient,
+        async_client: AsyncNaverClient | None = None,
+        price_history: PriceHistoryStore | None = None,
+    ) -> None:
         self._client = client
+        self._async_client = async_client
+        self._price_history = price_history
 
-    @cached(ttl=600, cache_key_prefix="naver")  # 10분 캐시
+    @cached(ttl=600, cache_key_prefix="naver", stale_ttl=600)  # 10분 캐시
     @retry_on_error(max_attempts=3, base_delay=1.0, max_delay=8.0)
     def search_products(self, query: str, max_results: int = 10) -> list[dict]:
         """상품 검색 (캐시 적용: 동일 검색어는 10분간 재사용)"""
@@ -46,7 +56,7 @@ class NaverService:
         """경쟁사 분석"""
         return self._client.analyze_competitors(products)
 
-    @cached(ttl=600, cache_key_prefix="naver_blog")
+    @cached(ttl=600, cache_key_prefix="naver_blog", stale_ttl=600)
     @retry_on_error(max_attempts=3, base_delay=1.0, max_delay=8.0)
     def search_blog(self, query: str, max_results: int = 10) -> list[dict]:
         """네이버 블로그 검색"""
@@ -59,7 +69,7 @@ class NaverService:
             log_error(f"네이버 블로그 검색 실패: {e}")
             raise DataCollectionError("네이버 블로그 검색 실패", original_error=e) from e
 
-    @cached(ttl=600, cache_key_prefix="naver_news")
+    @cached(ttl=600, cache_key_prefix="naver_news", stale_ttl=600)
     @retry_on_error(max_attempts=3, base_delay=1.0, max_delay=8.0)
     def search_news(self, query: str, max_results: int = 10) -> list[dict]:
         """네이버 뉴스 검색"""
@@ -72,6 +82,67 @@ class NaverService:
             log_error(f"네이버 뉴스 검색 실패: {e}")
             raise DataCollectionError("네이버 뉴스 검색 실패", original_error=e) from e
 
+    @cached(ttl=600, cache_key_prefix="naver_all", stale_ttl=600)
+    async def search_all(
+        self,
+        query: str,
+        max_results: int = 10,
+        verticals: Iterable[str] = ("shop", "blog", "news"),
+        raise_on_error: bool = True,
+    ) -> dict[str, list[dict]]:
+        """
+        쇼핑/블로그/뉴스 동시 검색
+
+        비동기 클라이언트가 있으면 하나의 커넥션 풀로 동시 요청하고
+        (max_results가 100을 넘으면 start 오프셋으로 페이지를 이어 받음),
+        없으면 동기 검색 메서드를 스레드로 병렬 실행한다.
+
+        Returns:
+            {"products": [...], "blogs": [...], "news": [...]} (요청한 vertical만)
+        """
+        verticals = tuple(dict.fromkeys(verticals))
+        log_api_start("Naver Search All", f"Query: {query}, Max: {max_results}, {verticals}")
+        try:
+            if self._async_client is not None:
+                results = await self._async_client.search_all(
+                    query, max_results, verticals, raise_on_error=raise_on_error
+                )
+            else:
+                results = await self._search_all_threaded(
+                    query, max_results, verticals, raise_on_error
+                )
+        except Exception as e:
+            log_error(f"네이버 통합 검색 실패: {e}")
+            raise DataCollectionError("네이버 통합 검색 실패", original_error=e) from e
+        log_api_end("Naver Search All", items=sum(len(r) for r in results.values()))
+        return results
+
+    async def _search_all_threaded(
+        self,
+        query: str,
+        max_results: int,
+        verticals: tuple[str, ...],
+        raise_on_error: bool,
+    ) -> dict[str, list[dict]]:
+        methods = {
+            "shop": self.search_products,
+            "blog": self.search_blog,
+            "news": self.search_news,
+        }
+        gathered = await asyncio.gather(
+            *(asyncio.to_thread(methods[v], query, max_results) for v in verticals),
+            return_exceptions=True,
+        )
+        results: dict[str, list[dict]] = {}
+        for vertical, result in zip(verticals, gathered, strict=True):
+            if isinstance(result, BaseException):
+                if raise_on_error or not isinstance(result, Exception):
+                    raise result
+                log_error(f"네이버 {vertical} 검색 실패: {result}")
+                result = []
+            results[VERTICALS[vertical][1]] = result
+        return results
+
     @retry_on_error(max_attempts=3, base_delay=1.0, max_delay=8.0)
     def collect_product_data(
         self,
@@ -99,23 +170,55 @@ class NaverService:
             if progress_callback:
                 progress_callback("경쟁사 분석 중...", 50)
 
-            # 경쟁사 분석
-            competitor_stats = self.analyze_competitors(products)
+            result = self._build_product_data(product, products, blog_posts, news_posts)
 
             if progress_callback:
                 progress_callback("네이버 데이터 수집 완료", 100)
+            return result
+
+        except Exception as e:
+            log_error(f"네이버 쇼핑 데이터 수집 실패: {e}")
+            raise DataCollectionError(
+                f"네이버 쇼핑 데이터 수집 실패: {e}",
+                original_error=e,
+            ) from e
 
-            result = {
-                "product": product,
-                "products": products,
-                "competitor_stats": competitor_stats,
-                "blogs": blog_posts,
-                "news": news_posts,
-                "total_count": len(products),
-            }
-
-            log_success(f"네이버 쇼핑 데이터 수집 완료 ({len(products)}개 상품)")
-            log_data("Products", len(products), "Naver")
+    @retry_on_error(max_attempts=3, base_delay=1.0, max_delay=8.0)
+    async def collect_product_data_async(
+        self,
+        product: dict,
+        max_results: int = 10,
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> dict:
+        """
+        제품 기반 네이버 데이터 수집 (쇼핑/블로그/뉴스 동시 검색)
+
+        search_all(커넥션 풀 비동기 클라이언트, 캐시 적용)로 세 vertical을 한 번에 받고
+        경쟁사 분석/가격 시계열 기록은 collect_product_data와 같다.
+        """
+        p_name = product.get("name", "N/A")
+        log_step("네이버 데이터 수집", "시작", f"제품: {p_name}")
+
+        try:
+            if progress_callback:
+                progress_callback("네이버 쇼핑/블로그/뉴스 동시 검색 중...", 10)
+
+            found = await self.search_all(product["name"], max_results)
+
+            if progress_callback:
+                progress_callback("경쟁사 분석 중...", 50)
+
+            # 가격 시계열 파일 기록이 이벤트 루프를 막지 않도록 스레드에서 실행
+            result = await asyncio.to_thread(
+                self._build_product_data,
+                product,
+                found.get("products", []),
+                found.get("blogs", []),
+                found.get("news", []),
+            )
+
+            if progress_callback:
+                progress_callback("네이버 데이터 수집 완료", 100)
             return result
 
         except Exception as e:
@@ -125,6 +228,43 @@ class NaverService:
                 original_error=e,
             ) from e
 
+    def _build_product_data(
+        self,
+        product: dict,
+        products: list[dict],
+        blog_posts: list[dict],
+        news_posts: list[dict],
+    ) -> dict:
+        """경쟁사 분석 + 가격 시계열 기록 후 수집 결과 dict 구성"""
+        competitor_stats = self.analyze_competitors(products)
+        self._record_price_history(product["name"], competitor_stats)
+
+        log_success(f"네이버 쇼핑 데이터 수집 완료 ({len(products)}개 상품)")
+        log_data("Products", len(products), "Naver")
+        return {
+            "product": product,
+            "products": products,
+            "competitor_stats": competitor_stats,
+            "blogs": blog_posts,
+            "news": news_posts,
+            "total_count": len(products),
+        }
+
+    def get_price_trend(self, product_name: str, days: int = 30) -> dict:
+        """저장된 가격 시계열 기반 추이 (네이버 재조회 없음)"""
+        if self._price_history is None:
+            return {"product_name": product_name, "days": days, "samples": 0}
+        return self._price_history.drift(product_name, days)
+
+    def _record_price_history(self, product_name: str, stats: dict) -> None:
+        if self._price_history is None:
+            return
+        try:
+            self._price_history.append(product_name, stats)
+        except Exception as e:
+            # 시계열 기록 실패가 수집 자체를 실패시키지 않도록 함
+            log_error(f"가격 시계열 기록 실패 ({product_name}): {e}")
+
     def get_price_summary(self, products: list[dict]) -> str:
         """가격 요약 문자열 생성"""
         if not products:
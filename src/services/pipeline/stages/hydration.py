@@ -1,7 +1,7 @@
 import asyncio
 import hashlib
 
-from api import validate_json_output
+from config.constants import GEMINI_TEXT_MAX_CONCURRENCY
 from core.interfaces.ai_service import IMarketingAIService
 from core.prompts import (
     hydration_prompts,  # noqa: F401
@@ -9,11 +9,13 @@ from core.prompts import (
 )
 from services.pipeline.types import Candidate, CandidateFeatures
 from utils.cache import TTLCache
+from utils.concurrency import shared_async_limiter
+from utils.json_parser import parse_llm_json
 from utils.logger import get_logger, log_llm_fail
 
 logger = get_logger(__name__)
 
-MAX_CONCURRENT_REQUESTS = 5
+MAX_CONCURRENT_REQUESTS = GEMINI_TEXT_MAX_CONCURRENCY
 _feature_cache = TTLCache(default_ttl=86400)
 
 
@@ -51,8 +53,8 @@ class FeatureHydrator:
             for i in range(0, len(to_hydrate), batch_size)
         ]
 
-        # 동시 배치 요청 제한
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # 동시 배치 요청 제한 (같은 루프의 댓글 심층 분석 호출과 상한 공유)
+        semaphore = shared_async_limiter("gemini-text", MAX_CONCURRENT_REQUESTS)
 
         async def process_batch(batch_items: list[tuple[int, Candidate]]):
             async with semaphore:
@@ -82,7 +84,10 @@ class FeatureHydrator:
             if not response_text:
                 raise ValueError("빈 응답을 수신했습니다.")
 
-            data = validate_json_output(response_text, required_fields=["results"])
+            # 출력이 잘려도 완결된 results 항목까지는 살린다
+            data = parse_llm_json(
+                response_text, required_fields=["results"], allow_partial=True
+            )
             if "error" in data:
                 raise ValueError(data.get("error"))
 
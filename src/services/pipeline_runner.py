@@ -60,7 +60,7 @@ def sanitize_result(result_obj: Any) -> Any:
     if hasattr(result_obj, "model_dump"):
         raw = result_obj.model_dump(
             exclude={
-                "generated_content": {"thumbnail_data", "video_bytes"},
+                "generated_content": {"thumbnail_data"},
             }
         )
     else:
@@ -109,6 +109,7 @@ async def execute_pipeline_task(request: PipelineRequest, task_id: str) -> None:
             thumbnail_styles=request.thumbnail_styles,
             video_dual_phase_beta=False,
             upload_to_gcs=True,
+            reuse_collection=request.reuse_collection,
         )
 
         def progress_callback(progress: Any) -> None:
@@ -8,6 +8,7 @@ import random
 import time
 from collections.abc import Callable
 from datetime import datetime
+from typing import Any
 
 from core.exceptions import PipelineError
 from core.interfaces import IStorageService
@@ -19,25 +20,26 @@ from core.models import (
     PipelineResult,
     PipelineStep,
     UploadStatus,
+    VideoArtifact,
 )
 from core.prompts import (  # noqa: F401
     marketing_prompts,
     prompt_registry,
     social_media_prompts,
+    track_prompt_usage,
 )
+from core.prompts.accounting import PromptUsageRecorder
+from infrastructure.storage.collection_snapshot_store import CollectionSnapshotStore
 from services.data_collection_service import DataCollectionService
 from services.history_service import HistoryService
 from services.marketing_service import MarketingService
 from services.rag_ingestion_service import RagIngestionService
 from services.social_service import SocialMediaService
 from services.thumbnail_service import THUMBNAIL_STYLES, ThumbnailService
+from services.upload_manager import DEFAULT_UPLOAD_CONCURRENCY, UploadManager
 from services.video_service import VideoService
-from utils.gcs_store import (
-    build_gcs_prefix,
-    detect_image_ext,
-    detect_video_ext,
-    gcs_url_for,
-)
+from utils.file_store import save_video_bytes
+from utils.gcs_store import build_gcs_prefix
 from utils.logger import (
     get_logger,
     log_error,
@@ -73,6 +75,8 @@ class PipelineService:
         history_service: HistoryService,
         social_media_service: SocialMediaService,
         rag_ingestion_service: RagIngestionService | None = None,
+        upload_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        snapshot_store: CollectionSnapshotStore | None = None,
     ) -> None:
         self._collector = data_collection_service
         self._marketing = marketing_service
@@ -82,6 +86,8 @@ class PipelineService:
         self._history = history_service
         self._social = social_media_service
         self._rag_ingestion = rag_ingestion_service
+        self._upload_concurrency = upload_concurrency
+        self._snapshots = snapshot_store
 
     async def execute(
         self,
@@ -89,7 +95,17 @@ class PipelineService:
         config: PipelineConfig,
         progress_callback: Callable[[PipelineProgress], None] | None = None,
     ) -> PipelineResult:
-        """파이프라인 실행"""
+        """파이프라인 실행 (실행 단위 프롬프트 사용량 집계 포함)"""
+        with track_prompt_usage() as usage:
+            return await self._execute(product, config, progress_callback, usage)
+
+    async def _execute(
+        self,
+        product: dict,
+        config: PipelineConfig,
+        progress_callback: Callable[[PipelineProgress], None] | None,
+        usage: PromptUsageRecorder,
+    ) -> PipelineResult:
         # ===== 🚀 파이프라인 시작 - 입력 데이터 로깅 =====
         log_separator("double")
         log_stage_start("파이프라인 실행", f"제품: {product.get('name', 'N/A')}")
@@ -109,8 +125,10 @@ class PipelineService:
         strategy: dict = {}
         upload_status = UploadStatus.SKIPPED
         upload_errors: list[str] = []
+        upload_timings: dict[str, float] = {}
         upload_enabled = config.upload_to_gcs
-        prompt_log: dict[str, dict[str, str]] = {}
+        uploads: UploadManager | None = None
+        prompt_log: dict[str, dict[str, Any]] = {}
         audit_trail: list[dict[str, str]] = [
             {
                 "action": "created",
@@ -125,12 +143,28 @@ class PipelineService:
             upload_errors.append("GCS health check failed")
             upload_enabled = False
 
+        if upload_enabled:
+            # 산출물은 생성 단계가 끝나는 즉시 백그라운드 업로드 시작
+            uploads = UploadManager(
+                self._storage,
+                build_gcs_prefix(product, "pipeline"),
+                max_concurrency=self._upload_concurrency,
+            )
+
         def record_prompt(name: str) -> None:
             try:
                 template = prompt_registry.get(name)
             except KeyError:
                 return
-            prompt_log[name] = {"version": template.version}
+            prompt_log.setdefault(name, {})["version"] = template.version
+
+        def merge_prompt_usage() -> None:
+            # 이번 실행에서 렌더링된 템플릿별 횟수/크기/추정 토큰
+            for name, stats in usage.snapshot().items():
+                entry = prompt_log.setdefault(name, {})
+                entry.update(stats)
+                if "version" not in entry:
+                    record_prompt(name)
 
         def update_progress(step: PipelineStep, message: str = "") -> None:
             progress.update(step, message)
@@ -150,17 +184,17 @@ class PipelineService:
             log_input_data("카테고리", product.get("category"))
 
             update_progress(PipelineStep.DATA_COLLECTION, "데이터 수집 시작")
-            collected_data = await asyncio.to_thread(
-                self._collector.collect_all_data,
-                product=product,
-                config=config,
-                progress_callback=update_progress,
+            collected_data, snapshot_info = await self._collect(
+                product, config, update_progress
             )
+            prompt_log["collection_snapshot"] = snapshot_info
 
             # 수집 결과 로깅
             log_output_data("YouTube 동영상 수집", f"{len(collected_data.youtube_videos)}개")
             log_output_data("핵심 인사이트", f"{len(collected_data.top_insights or [])}개")
             log_stage_end("Step 1: 데이터 수집", f"총 {len(collected_data.youtube_videos)}개 데이터 수집")
+            if uploads and collected_data:
+                uploads.submit_json("collected_data.json", collected_data.model_dump())
 
             # ===== Step 2: 마케팅 전략 생성 =====
             log_stage_start("Step 2: 마케팅 전략 생성", "AI 기반 전략 분석")
@@ -204,6 +238,9 @@ class PipelineService:
                     except Exception as e:
                         log_error(f"    ❌ [SNS 포스팅] 생성 실패: {e}")
                         log_stage_fail("SNS 포스팅 생성", str(e))
+                # 전략 JSON에는 SNS 포스팅이 포함되므로 이 단계가 끝난 뒤 업로드
+                if uploads and strategy:
+                    uploads.submit_json("strategy.json", strategy)
 
             async def run_thumbnail():
                 if config.generate_thumbnail:
@@ -234,6 +271,17 @@ class PipelineService:
                             generated_content.thumbnail_data = thumbnails[0].get(
                                 "image"
                             )
+                        if uploads:
+                            for idx, item in enumerate(thumbnails or []):
+                                image_bytes = item.get("image") or item.get("image_bytes")
+                                if not image_bytes:
+                                    continue
+                                style_key = (item.get("style") or "thumb").replace(" ", "_")[:20]
+                                uploads.submit_image(
+                                    f"thumbnail_{idx + 1}_{style_key}",
+                                    image_bytes,
+                                    on_uploaded=lambda url, item=item: item.__setitem__("url", url),
+                                )
                         log_output_data("썸네일 - 생성 완료", f"{len(thumbnails or [])}개")
                     else:
                         hooks = strategy.get("hook_suggestions", [])
@@ -251,6 +299,14 @@ class PipelineService:
                         )
                         generated_content.thumbnail_data = thumbnail
                         log_output_data("썸네일 - 이미지 크기", f"{len(thumbnail or b'')} bytes")
+                        if uploads and thumbnail:
+                            uploads.submit_image(
+                                "thumbnail",
+                                thumbnail,
+                                on_uploaded=lambda url: setattr(
+                                    generated_content, "thumbnail_url", url
+                                ),
+                            )
                     log_info("    ✅ [썸네일] 생성 완료")
 
             async def run_video():
@@ -274,8 +330,8 @@ class PipelineService:
                         )
                         log_input_data("비디오 - Phase2 프롬프트", phase2_prompt[:50])
 
-                    video_result = await asyncio.to_thread(
-                        self._video.generate_marketing_video,
+                    # Veo 대기는 작업 관리자가 폴링하므로 워커 스레드를 점유하지 않는다
+                    video_result = await self._video.generate_marketing_video_async(
                         product=product,
                         strategy=strategy,
                         duration_seconds=config.video_duration,
@@ -284,12 +340,32 @@ class PipelineService:
                         enable_dual_phase_beta=enable_dual_phase_beta,
                     )
 
-                    if isinstance(video_result, bytes):
-                        generated_content.video_bytes = video_result
+                    if isinstance(video_result, VideoArtifact):
+                        generated_content.video_gcs_uri = video_result.gcs_uri
+                        if not upload_enabled:
+                            # 업로드하지 않는 실행은 결과를 로컬 출력 디렉터리에 스트리밍 저장
+                            video_result = await asyncio.to_thread(
+                                self._video.save_local, video_result
+                            )
+                        generated_content.video_path = video_result.local_path
+                        log_output_data("비디오 - GCS 원본", video_result.gcs_uri or "N/A")
+                    elif isinstance(video_result, bytes):
+                        generated_content.video_path = await asyncio.to_thread(
+                            save_video_bytes, video_result
+                        )
                         log_output_data("비디오 - 파일 크기", f"{len(video_result):,} bytes")
                     else:
                         generated_content.video_url = video_result
                         log_output_data("비디오 - GCS URL", video_result[:80] if video_result else "N/A")
+                    if uploads and (generated_content.video_gcs_uri or generated_content.video_path):
+                        uploads.submit_video(
+                            "video.mp4",
+                            gcs_uri=generated_content.video_gcs_uri,
+                            local_path=generated_content.video_path,
+                            on_uploaded=lambda url: setattr(
+                                generated_content, "video_url", url
+                            ),
+                        )
                     log_info("    ✅ [비디오] 생성 완료")
 
             # Run parallel tasks
@@ -297,17 +373,19 @@ class PipelineService:
             log_stage_end("Step 3-5: 콘텐츠 병렬 생성", "모든 콘텐츠 생성 완료")
 
             # ===== Step 6: GCS 업로드 =====
-            if upload_enabled:
-                log_stage_start("Step 6: GCS 업로드", "생성된 콘텐츠를 클라우드에 저장")
+            if uploads:
+                log_stage_start("Step 6: GCS 업로드", "진행 중인 업로드 완료 대기 후 메타데이터 저장")
                 update_progress(PipelineStep.UPLOAD, "Uploading to GCS...")
-                upload_status, upload_errors = await asyncio.to_thread(
-                    self._upload_to_gcs,
-                    product=product,
-                    config=config,
-                    collected_data=collected_data,
-                    strategy=strategy,
-                    generated_content=generated_content,
+                report = await uploads.finish(
+                    metadata=lambda: self._build_upload_metadata(
+                        product, config, generated_content, time.time() - start_time
+                    )
                 )
+                uploads = None
+                upload_status = report.status
+                upload_errors = report.errors
+                upload_timings = report.timings
+                log_output_data("업로드 소요 시간(ms)", upload_timings)
                 log_output_data("업로드 상태", upload_status.value if hasattr(upload_status, 'value') else upload_status)
                 if upload_errors:
                     log_output_data("업로드 오류", upload_errors)
@@ -324,7 +402,7 @@ class PipelineService:
                 f"📊 수집된 데이터: YouTube {len(collected_data.youtube_videos or [])}개",
                 f"💡 생성된 훅 문구: {len(strategy.get('hook_suggestions', []))}개",
                 f"🖼️ 썸네일: {'생성됨' if generated_content.thumbnail_data else '건너뜀'}",
-                f"🎬 비디오: {'생성됨' if generated_content.video_bytes or generated_content.video_url else '건너뜀'}",
+                f"🎬 비디오: {'생성됨' if generated_content.video_gcs_uri or generated_content.video_path or generated_content.video_url else '건너뜀'}",
                 f"📱 SNS 포스팅: {len(strategy.get('social_posts', []))}개",
                 f"☁️ GCS 업로드: {upload_status}",
                 f"⏱️ 총 소요 시간: {duration:.2f}초",
@@ -335,6 +413,7 @@ class PipelineService:
             log_timing("Pipeline Execution", duration * 1000)
             log_separator("double")
 
+            merge_prompt_usage()
             result = PipelineResult(
                 success=True,
                 product_name=product.get("name", ""),
@@ -347,6 +426,7 @@ class PipelineService:
                 audit_trail=audit_trail,
                 upload_status=upload_status,
                 upload_errors=upload_errors,
+                upload_timings=upload_timings,
                 duration_seconds=duration,
             )
 
@@ -386,6 +466,14 @@ class PipelineService:
             log_summary_box("파이프라인 실패 요약", summary_items)
             log_separator("double")
 
+            if uploads:
+                # 이미 시작된 업로드는 끝까지 기다려 결과를 기록 (메타데이터 없음)
+                report = await uploads.finish()
+                upload_status = report.status
+                upload_errors = report.errors
+                upload_timings = report.timings
+
+            merge_prompt_usage()
             result = PipelineResult(
                 success=False,
                 product_name=product.get("name", ""),
@@ -398,6 +486,7 @@ class PipelineService:
                 audit_trail=audit_trail,
                 upload_status=upload_status,
                 upload_errors=upload_errors,
+                upload_timings=upload_timings,
                 error_message=str(e),
                 duration_seconds=duration,
             )
@@ -411,6 +500,57 @@ class PipelineService:
 
             return result
 
+    async def _collect(
+        self,
+        product: dict,
+        config: PipelineConfig,
+        update_progress: Callable[[PipelineStep, str], None],
+    ) -> tuple[CollectedData, dict[str, Any]]:
+        """
+        Step 1 수집 (스냅샷 재사용 포함)
+
+        Returns:
+            (수집 데이터, 스냅샷 사용 내역 {"mode", "status", "age_seconds"?})
+        """
+        mode = config.reuse_collection
+        info: dict[str, Any] = {"mode": mode, "status": "disabled"}
+        snapshot = None
+        if self._snapshots is not None and mode != "off":
+            snapshot = await asyncio.to_thread(self._snapshots.load, product, config)
+            info["status"] = "miss"
+
+        if snapshot is not None and snapshot.fresh:
+            info.update(status="hit", age_seconds=round(snapshot.age_seconds, 1))
+            log_info(f"    ♻️ 수집 스냅샷 재사용 ({snapshot.age_seconds:.0f}초 전 수집)")
+            update_progress(PipelineStep.DATA_COLLECTION, "수집 스냅샷 재사용 (Step 1 생략)")
+            return snapshot.collected, info
+
+        previous = None
+        if snapshot is not None and mode == "delta":
+            previous = snapshot.collected
+            info.update(status="delta", age_seconds=round(snapshot.age_seconds, 1))
+        elif snapshot is not None:
+            info["status"] = "stale"
+
+        collected_data = await self._collector.collect_all_data_async(
+            product=product,
+            config=config,
+            progress_callback=update_progress,
+            previous=previous,
+        )
+        if previous is not None:
+            info["new_comment_count"] = len(collected_data.analyzed_comment_keys) - len(
+                previous.analyzed_comment_keys
+            )
+
+        # 부분 실패한 수집은 다음 실행에서 재사용하지 않도록 저장하지 않음
+        if self._snapshots is not None and not collected_data.source_errors:
+            try:
+                await asyncio.to_thread(self._snapshots.save, product, config, collected_data)
+            except Exception as e:
+                log_warning(f"수집 스냅샷 저장 실패: {e}")
+        return collected_data, info
+
     def execute_data_collection_only(
         self,
         product: dict,
@@ -433,120 +573,20 @@ class PipelineService:
                 original_error=e,
             ) from e
 
-    def _upload_to_gcs(
-        self,
+    @staticmethod
+    def _build_upload_metadata(
         product: dict,
         config: PipelineConfig,
-        collected_data: CollectedData,
-        strategy: dict,
         generated_content: GeneratedContent,
-    ) -> tuple[UploadStatus, list[str]]:
-        """GCS upload (auto bucket creation)."""
-        prefix = build_gcs_prefix(product, "pipeline")
-        storage = self._storage
-        errors: list[str] = []
-        total_uploads = 0
-
-        if collected_data:
-            total_uploads += 1
-            try:
-                storage.upload(
-                    data=collected_data.model_dump(),
-                    path=f"{prefix}/collected_data.json",
-                    content_type="application/json",
-                )
-            except Exception as e:
-                log_error(f"GCS collected_data upload failed: {e}")
-                errors.append(f"collected_data.json: {e}")
-
-        if strategy:
-            total_uploads += 1
-            try:
-                storage.upload(
-                    data=strategy,
-                    path=f"{prefix}/strategy.json",
-                    content_type="application/json",
-                )
-            except Exception as e:
-                log_error(f"GCS strategy upload failed: {e}")
-                errors.append(f"strategy.json: {e}")
-
-        if generated_content.thumbnail_data and not generated_content.multi_thumbnails:
-            total_uploads += 1
-            try:
-                ext = detect_image_ext(generated_content.thumbnail_data)
-                thumb_path = f"{prefix}/thumbnail{ext}"
-                storage.upload(
-                    data=generated_content.thumbnail_data,
-                    path=thumb_path,
-                    content_type="image/png" if ext == ".png" else "image/jpeg",
-                )
-                generated_content.thumbnail_url = gcs_url_for(storage, thumb_path)
-            except Exception as e:
-                log_error(f"GCS thumbnail upload failed: {e}")
-                errors.append(f"thumbnail{ext}: {e}")
-
-        if generated_content.multi_thumbnails:
-            for idx, item in enumerate(generated_content.multi_thumbnails):
-                image_bytes = item.get("image") or item.get("image_bytes")
-                if not image_bytes:
-                    continue
-                total_uploads += 1
-                try:
-                    ext = detect_image_ext(image_bytes)
-                    style_key = (item.get("style") or "thumb").replace(" ", "_")[:20]
-                    multi_path = f"{prefix}/thumbnail_{idx + 1}_{style_key}{ext}"
-                    storage.upload(
-                        data=image_bytes,
-                        path=multi_path,
-                        content_type="image/png" if ext == ".png" else "image/jpeg",
-                    )
-                    item["url"] = gcs_url_for(storage, multi_path)
-                except Exception as e:
-                    log_error(f"GCS thumbnail #{idx + 1} upload failed: {e}")
-                    errors.append(f"thumbnail_{idx + 1}{ext}: {e}")
-
-        if generated_content.video_bytes:
-            total_uploads += 1
-            try:
-                ext = detect_video_ext(generated_content.video_bytes)
-                video_path = f"{prefix}/video{ext}"
-                storage.upload(
-                    data=generated_content.video_bytes,
-                    path=video_path,
-                    content_type="video/mp4"
-                    if ext == ".mp4"
-                    else "application/octet-stream",
-                )
-                generated_content.video_url = gcs_url_for(storage, video_path)
-            except Exception as e:
-                log_error(f"GCS video upload failed: {e}")
-                errors.append(f"video{ext}: {e}")
-
-        metadata = {
+        duration_seconds: float,
+    ) -> dict[str, Any]:
+        """metadata.json 내용 (다른 산출물 업로드 후 URL이 반영된 상태로 생성)"""
+        return {
             "product": product,
             "config": config.model_dump()
             if hasattr(config, "model_dump")
             else dict(config),
-            "duration_seconds": getattr(self, "_last_duration", None),
+            "duration_seconds": duration_seconds,
             "thumbnail_url": generated_content.thumbnail_url,
             "video_url": generated_content.video_url,
         }
-        total_uploads += 1
-        try:
-            storage.upload(
-                data=metadata,
-                path=f"{prefix}/metadata.json",
-                content_type="application/json",
-            )
-        except Exception as e:
-            log_error(f"GCS metadata upload failed: {e}")
-            errors.append(f"metadata.json: {e}")
-
-        if total_uploads == 0:
-            return UploadStatus.SKIPPED, []
-        if not errors:
-            return UploadStatus.SUCCESS, []
-        if len(errors) < total_uploads:
-            return UploadStatus.PARTIAL, errors
-        return UploadStatus.FAILED, errors
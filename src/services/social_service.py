@@ -40,17 +40,10 @@ class SocialMediaService:
         product_name = product.get("name", "제품")
         summary = strategy.get("summary", "")
 
-        import json
-        insights_text = (
-            json.dumps(top_insights, ensure_ascii=False, indent=2)
-            if top_insights
-            else "N/A"
-        )
-
         prompt = prompt_registry.get("social.media.posts").render(
             product_name=product_name,
             summary=summary,
-            insights_text=insights_text,
+            insights_text=top_insights or "N/A",
         )
         log_llm_request("SNS 포스팅 생성", f"제품: {product_name}, 플랫폼: {platforms}")
         try:
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
-from core.prompts import prompt_registry
+from core.prompts import (
+    prompt_registry,
+    studio_prompts,  # noqa: F401
+)
 from core.prompts.veo_prompt_engine import VeoPromptEngine
 from infrastructure.clients.gemini_client import GeminiClient
+from utils.json_parser import extract_json
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,13 @@ class StudioService:
     def __init__(self, gemini_client: GeminiClient):
         self._gemini = gemini_client
 
+    @staticmethod
+    def _parse_json_response(response: str) -> dict[str, Any]:
+        data = extract_json(response or "")
+        if not isinstance(data, dict):
+            raise ValueError("JSON 객체를 찾을 수 없음")
+        return data
+
     async def generate_draft_prompts(
         self,
         product_name: str,
@@ -49,11 +59,7 @@ class StudioService:
         try:
             response = await self._gemini.generate_text_async(prompt_text)
             # JSON 클렌징 및 로딩
-            import re
-
-            cleaned = re.sub(r"^```(?:json)?\s*", "", response.strip())
-            cleaned = re.sub(r"\s*```\s*$", "", cleaned)
-            return json.loads(cleaned)
+            return self._parse_json_response(response)
         except Exception as e:
             logger.error(f"Studio draft generation failed: {e}")
             return {
@@ -71,13 +77,13 @@ class StudioService:
         """
         사용자 피드백을 반영한 프롬프트 고도화 (Refinement)
         """
-        template = prompt_registry.get_template("studio.refine")
+        template = prompt_registry.get("studio.refine")
 
         brand_summary = "N/A"
         if brand_kit:
             brand_summary = f"{brand_kit.get('name')} (Color: {brand_kit.get('primary_color')}, Mood: {brand_kit.get('tone_and_voice')})"
 
-        prompt_text = template.format(
+        prompt_text = template.render(
             original_prompt=original_prompt,
             user_feedback=user_feedback,
             brand_kit_summary=brand_summary,
@@ -85,11 +91,7 @@ class StudioService:
 
         try:
             response = await self._gemini.generate_text_async(prompt_text)
-            import re
-
-            cleaned = re.sub(r"^```(?:json)?\s*", "", response.strip())
-            cleaned = re.sub(r"\s*```\s*$", "", cleaned)
-            return json.loads(cleaned)
+            return self._parse_json_response(response)
         except Exception as e:
             logger.error(f"Studio prompt refinement failed: {e}")
             return {
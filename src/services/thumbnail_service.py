@@ -1,10 +1,10 @@
-import json
-import re
 from collections.abc import Callable
 
 from config.products import get_product_by_name
 from core.exceptions import ThumbnailGenerationError
 from core.interfaces.ai_service import IMarketingAIService
+from utils.concurrency import map_bounded
+from utils.json_parser import extract_json
 from utils.logger import (
     get_logger,
     log_llm_fail,
@@ -96,8 +96,9 @@ STYLE_COPY_GUIDE = """
 class ThumbnailService:
     """썸네일 생성 서비스"""
 
-    def __init__(self, client: IMarketingAIService) -> None:
+    def __init__(self, client: IMarketingAIService, max_concurrency: int = 4) -> None:
         self._client = client
+        self._max_concurrency = max(1, max_concurrency)
 
     def get_available_styles(self) -> list[dict]:
         """사용 가능한 스타일 목록 반환"""
@@ -199,21 +200,17 @@ class ThumbnailService:
         if styles is None:
             styles = ["neobrutalism"] * len(hook_texts)
 
-        results = []
-        total = len(hook_texts) if hook_texts else 1
-
-        for i, hook_text in enumerate(hook_texts):
-            style_key = styles[i % len(styles)]
-            if progress_callback:
-                progress = int((i / total) * 100)
-                progress_callback(f"썸네일 {i + 1}/{total} 생성 중...", progress)
+        jobs = [(hook_text, styles[i % len(styles)]) for i, hook_text in enumerate(hook_texts)]
+        images = self._generate_concurrently(
+            product,
+            jobs,
+            include_text_overlay=True,
+            progress_label="썸네일",
+            progress_callback=progress_callback,
+        )
 
-            image = self.generate(
-                product=product,
-                hook_text=hook_text,
-                style=style_key,
-                include_text_overlay=True,
-            )
+        results = []
+        for (hook_text, style_key), image in zip(jobs, images, strict=True):
             if image:
                 results.append(
                     {
@@ -331,36 +328,79 @@ class ThumbnailService:
         if styles is None:
             styles = ["neobrutalism", "raw_authentic", "hand_grip"]
 
+        images = self._generate_concurrently(
+            product,
+            [(hook_text, style) for style in styles],
+            include_text_overlay=False,
+            progress_label="스타일",
+            progress_callback=progress_callback,
+        )
+
         results = []
-        for i, style in enumerate(styles):
+        for style, image in zip(styles, images, strict=True):
+            if image is None:
+                continue
+            results.append(
+                {
+                    "style": style,
+                    "style_name": THUMBNAIL_STYLES.get(style, {}).get("name", style),
+                    "image_bytes": image,
+                    "description": THUMBNAIL_STYLES.get(style, {}).get(
+                        "prompt_modifier", ""
+                    ),
+                }
+            )
+
+        return results
+
+    def _generate_concurrently(
+        self,
+        product: dict,
+        jobs: list[tuple[str, str]],
+        include_text_overlay: bool,
+        progress_label: str,
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> list[bytes | None]:
+        """
+        (훅 텍스트, 스타일) 목록을 동시성 상한 내에서 병렬 생성
+
+        결과는 입력 순서를 유지하며, 실패한 항목은 None으로 남긴다.
+        이미지 모델 호출 자체의 상한은 클라이언트의 공유 리미터가 건다.
+        """
+        total = len(jobs)
+        if not total:
+            return []
+
+        if progress_callback:
+            progress_callback(f"{progress_label} {total}개 동시 생성 중...", 0)
+
+        def on_complete(index: int, done: int, total_jobs: int) -> None:
             if progress_callback:
                 progress_callback(
-                    f"스타일 {i + 1}/{len(styles)} 생성 중...",
-                    int((i / len(styles)) * 100),
+                    f"{progress_label} {done}/{total_jobs} 생성 완료",
+                    int((done / total_jobs) * 100),
                 )
 
-            try:
-                image = self.generate(
-                    product=product,
-                    hook_text=hook_text,
-                    style=style,
-                )
-                results.append(
-                    {
-                        "style": style,
-                        "style_name": THUMBNAIL_STYLES.get(style, {}).get(
-                            "name", style
-                        ),
-                        "image_bytes": image,
-                        "description": THUMBNAIL_STYLES.get(style, {}).get(
-                            "prompt_modifier", ""
-                        ),
-                    }
-                )
-            except Exception as e:
-                logger.warning(f"스타일 {style} 생성 실패: {e}")
+        outcomes = map_bounded(
+            lambda job: self.generate(
+                product=product,
+                hook_text=job[0],
+                style=job[1],
+                include_text_overlay=include_text_overlay,
+            ),
+            jobs,
+            max_workers=self._max_concurrency,
+            on_complete=on_complete,
+        )
 
-        return results
+        images: list[bytes | None] = []
+        for (_, style), outcome in zip(jobs, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.warning(f"스타일 {style} 생성 실패: {outcome}")
+                images.append(None)
+            else:
+                images.append(outcome)
+        return images
 
     def generate_from_strategy(
         self,
@@ -459,10 +499,9 @@ Analyze the product description below and output a JSON object containing:
             log_llm_request("상품 설명 분석", f"설명 {len(raw_description)}자")
             try:
                 response = self._client.generate_text(prompt, temperature=0.3)
-                text = (response or "").strip()
-                text = re.sub(r"^```(?:json)?\s*", "", text)
-                text = re.sub(r"\s*```\s*$", "", text)
-                data = json.loads(text)
+                data = extract_json(response or "")
+                if not isinstance(data, dict):
+                    raise ValueError("JSON 객체를 찾을 수 없음")
                 # LLM은 3가지(visual_description, hook_text, recommended_style)만 반환; name/category는 기본값
                 visual_description = (
                     data.get("visual_description") or default_info["visual_description"]
@@ -484,7 +523,7 @@ Analyze the product description below and output a JSON object containing:
                     "hook_text": hook_text,
                     "recommended_style": recommended_style,
                 }
-            except (json.JSONDecodeError, AttributeError) as e:
+            except (ValueError, AttributeError) as e:
                 log_llm_fail("상품 설명 분석", str(e))
                 logger.warning(f"LLM 시각 정보 파싱 실패, 폴백 사용: {e}")
 
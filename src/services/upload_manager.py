@@ -0,0 +1,178 @@
+"""
+파이프라인 산출물 업로드 관리자
+산출물이 생성되는 즉시 업로드를 시작하고, 제한된 동시성으로 병렬 전송
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from core.interfaces import IStorageService
+from core.models import UploadStatus
+from utils.gcs_store import detect_image_ext, gcs_url_for, transfer_video
+from utils.logger import get_logger, log_error, log_timing
+
+logger = get_logger(__name__)
+
+DEFAULT_UPLOAD_CONCURRENCY = 4
+
+
+@dataclass
+class UploadReport:
+    """업로드 결과 (상태, 실패 목록, 산출물별 소요 시간 ms)"""
+
+    status: UploadStatus = UploadStatus.SKIPPED
+    errors: list[str] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+class UploadManager:
+    """
+    파이프라인 실행 1회의 업로드 관리자
+
+    submit_*()는 이벤트 루프에서 호출하며 업로드 태스크를 즉시 시작한다.
+    실제 전송은 워커 스레드에서 수행하고 세마포어로 동시 전송 수를 제한한다.
+    URL 반영 콜백(on_uploaded)은 업로드 성공 후 이벤트 루프에서 실행된다.
+    finish()는 모든 업로드를 기다린 뒤 메타데이터를 마지막으로 올린다.
+    """
+
+    def __init__(
+        self,
+        storage: IStorageService,
+        prefix: str,
+        max_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+    ) -> None:
+        self._storage = storage
+        self._prefix = prefix
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._tasks: list[asyncio.Task[None]] = []
+        self._report = UploadReport()
+        self._total = 0
+
+    @property
+    def prefix(self) -> str:
+        return self._prefix
+
+    # ------------------------------------------------------------------
+    # 산출물 등록
+    # ------------------------------------------------------------------
+    def submit_json(self, name: str, data: dict | list) -> None:
+        """JSON 산출물 업로드 (지원 시 gzip 압축)"""
+        path = self._path(name)
+
+        def upload() -> None:
+            upload_json = getattr(self._storage, "upload_json", None)
+            if upload_json is not None:
+                upload_json(data, path)
+            else:
+                self._storage.upload(data=data, path=path, content_type="application/json")
+
+        self._submit(name, upload)
+
+    def submit_image(
+        self,
+        stem: str,
+        data: bytes,
+        on_uploaded: Callable[[str], None] | None = None,
+    ) -> None:
+        """이미지 업로드 (확장자는 바이트 시그니처로 결정)"""
+        ext = detect_image_ext(data)
+        name = f"{stem}{ext}"
+        path = self._path(name)
+        content_type = "image/png" if ext == ".png" else "image/jpeg"
+
+        def upload() -> str:
+            self._storage.upload(data=data, path=path, content_type=content_type)
+            return gcs_url_for(self._storage, path)
+
+        self._submit(name, upload, on_uploaded)
+
+    def submit_video(
+        self,
+        name: str,
+        gcs_uri: str | None = None,
+        local_path: str | None = None,
+        on_uploaded: Callable[[str], None] | None = None,
+    ) -> None:
+        """비디오 전송 (GCS 원본은 서버 측 복사, 로컬 파일은 청크 업로드)"""
+        path = self._path(name)
+
+        def upload() -> str:
+            transfer_video(self._storage, path, gcs_uri=gcs_uri, local_path=local_path)
+            return gcs_url_for(self._storage, path)
+
+        self._submit(name, upload, on_uploaded)
+
+    async def finish(
+        self, metadata: Callable[[], dict[str, Any]] | None = None
+    ) -> UploadReport:
+        """
+        진행 중인 업로드를 모두 기다린 뒤 결과 반환
+
+        metadata는 다른 산출물의 URL이 반영된 후 생성해야 하므로
+        모든 업로드가 끝난 다음 호출해 metadata.json으로 올린다.
+        """
+        await self._drain()
+        if metadata is not None:
+            self.submit_json("metadata.json", metadata())
+            await self._drain()
+
+        report = self._report
+        if self._total == 0:
+            report.status = UploadStatus.SKIPPED
+        elif not report.errors:
+            report.status = UploadStatus.SUCCESS
+        elif len(report.errors) < self._total:
+            report.status = UploadStatus.PARTIAL
+        else:
+            report.status = UploadStatus.FAILED
+        return report
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+    def _path(self, name: str) -> str:
+        return f"{self._prefix}/{name}"
+
+    def _submit(
+        self,
+        name: str,
+        upload: Callable[[], Any],
+        on_uploaded: Callable[[str], None] | None = None,
+    ) -> None:
+        self._total += 1
+        self._tasks.append(asyncio.create_task(self._run(name, upload, on_uploaded)))
+
+    async def _run(
+        self,
+        name: str,
+        upload: Callable[[], Any],
+        on_uploaded: Callable[[str], None] | None,
+    ) -> None:
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                url = await asyncio.to_thread(upload)
+            except Exception as e:
+                log_error(f"GCS {name} upload failed: {e}")
+                self._report.errors.append(f"{name}: {e}")
+                return
+            finally:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                self._report.timings[name] = round(elapsed_ms, 2)
+                log_timing(f"GCS upload {name}", elapsed_ms)
+
+        if on_uploaded and url:
+            on_uploaded(url)
+
+    async def _drain(self) -> None:
+        while self._tasks:
+            tasks, self._tasks = self._tasks, []
+            await asyncio.gather(*tasks)
+
+
+__all__ = ["DEFAULT_UPLOAD_CONCURRENCY", "UploadManager", "UploadReport"]
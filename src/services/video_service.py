@@ -8,6 +8,7 @@ from collections.abc import Callable
 from typing import Any
 
 from core.exceptions import VideoGenerationError
+from core.models import VideoArtifact
 from core.prompts.veo_template import VeoTemplateManager
 from infrastructure.clients.veo_client import VeoClient
 from utils.logger import log_error, log_info, log_step, log_success
@@ -76,12 +77,18 @@ class VideoService:
     def validate_video_output(self, result: Any) -> bool:
         """
         [AI Product Pattern] 생성된 비디오 출력 유효성 검증
+        - VideoArtifact: GCS 위치 또는 로컬 파일이 있는지 확인
         - bytes: 비어있지 않은지 확인
         - str: 유효한 GCS URL 패턴인지 확인
         """
         if not result:
             return False
 
+        if isinstance(result, VideoArtifact):
+            if result.local_path:
+                return (result.size_bytes or 0) > 1024
+            return bool(result.gcs_uri)
+
         if isinstance(result, bytes):
             return len(result) > 1024  # 최소 1KB 이상이어야 유효
 
@@ -94,6 +101,38 @@ class VideoService:
 
         return False
 
+    def save_local(self, artifact: VideoArtifact) -> VideoArtifact:
+        """생성된 비디오를 출력 디렉터리에 스트리밍 저장 (이미 로컬이면 그대로 반환)"""
+        return self._client.download_video(artifact)
+
+    def _prepare_phase2(
+        self,
+        mode: str,
+        phase2_prompt: str | None,
+        enable_dual_phase_beta: bool,
+    ) -> str | None:
+        """듀얼 페이즈 요청 검증 후 정화된 Phase 2 프롬프트 반환 (single이면 None)"""
+        if mode != "dual":
+            return None
+        if not enable_dual_phase_beta:
+            raise VideoGenerationError("Dual phase generation requires beta flag.")
+        if not phase2_prompt:
+            raise VideoGenerationError("Dual phase generation requires phase2_prompt.")
+        safe_phase2 = self.sanitize_prompt_input(phase2_prompt)
+        self._validate_prompt_safety(safe_phase2)
+        return safe_phase2
+
+    def _check_generated(self, result: Any) -> VideoArtifact | str:
+        """[Defense] 출력 검증 및 로깅"""
+        if not self.validate_video_output(result):
+            raise VideoGenerationError("생성된 비디오 데이터가 유효하지 않습니다.")
+
+        if isinstance(result, VideoArtifact):
+            log_success(f"비디오 생성 완료 ({result.gcs_uri})")
+        else:
+            log_info(f"비디오 생성 상태: {result[:100]}")
+        return result
+
     def generate(
         self,
         prompt: str,
@@ -103,7 +142,7 @@ class VideoService:
         phase2_prompt: str | None = None,
         enable_dual_phase_beta: bool = False,
         progress_callback: Callable[[str, int], None] | None = None,
-    ) -> bytes | str:
+    ) -> VideoArtifact | str:
         """비디오 생성"""
         # [Defense] 입력값 정화
         safe_prompt = self.sanitize_prompt_input(prompt)
@@ -111,43 +150,17 @@ class VideoService:
         log_step("비디오 생성 요청", "시작", f"{duration_seconds}s, {resolution}")
 
         try:
-            if mode == "dual":
-                if not enable_dual_phase_beta:
-                    raise VideoGenerationError(
-                        "Dual phase generation requires beta flag."
-                    )
-                if not phase2_prompt:
-                    raise VideoGenerationError(
-                        "Dual phase generation requires phase2_prompt."
-                    )
-
-                safe_phase2 = self.sanitize_prompt_input(phase2_prompt)
-                self._validate_prompt_safety(safe_phase2)
-
-                if hasattr(self._client, "generate_video_with_fallback"):
-                    result = self._client.generate_video_with_fallback(
-                        phase1_prompt=safe_prompt,
-                        phase2_prompt=safe_phase2,
-                        duration_seconds=duration_seconds,
-                        resolution=resolution,
-                        progress_callback=progress_callback,
-                    )
-                else:
-                    phase1_result = self._client.generate_video(
-                        prompt=safe_prompt,
-                        duration_seconds=duration_seconds,
-                        resolution=resolution,
-                        progress_callback=progress_callback,
-                    )
-                    try:
-                        result = self._client.generate_video(
-                            prompt=safe_phase2,
-                            duration_seconds=duration_seconds,
-                            resolution=resolution,
-                            progress_callback=progress_callback,
-                        )
-                    except Exception:
-                        result = phase1_result
+            safe_phase2 = self._prepare_phase2(
+                mode, phase2_prompt, enable_dual_phase_beta
+            )
+            if safe_phase2 is not None:
+                result = self._client.generate_video_with_fallback(
+                    phase1_prompt=safe_prompt,
+                    phase2_prompt=safe_phase2,
+                    duration_seconds=duration_seconds,
+                    resolution=resolution,
+                    progress_callback=progress_callback,
+                )
             else:
                 result = self._client.generate_video(
                     prompt=safe_prompt,
@@ -155,17 +168,50 @@ class VideoService:
                     resolution=resolution,
                     progress_callback=progress_callback,
                 )
+            return self._check_generated(result)
 
-            # [Defense] 출력 검증
-            if not self.validate_video_output(result):
-                raise VideoGenerationError("생성된 비디오 데이터가 유효하지 않습니다.")
+        except Exception as e:
+            log_error(f"비디오 생성 서비스 실패: {e}")
+            raise VideoGenerationError(
+                f"비디오 생성 실패: {e}",
+                original_error=e,
+            ) from e
 
-            if isinstance(result, bytes):
-                log_success(f"비디오 생성 완료 ({len(result)} bytes)")
-            else:
-                log_info(f"비디오 생성 상태: {result[:100]}")
+    async def generate_async(
+        self,
+        prompt: str,
+        duration_seconds: int = 8,
+        resolution: str = "720p",
+        mode: str = "single",
+        phase2_prompt: str | None = None,
+        enable_dual_phase_beta: bool = False,
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> VideoArtifact | str:
+        """비디오 생성 (비동기, Veo 대기 중 워커 스레드를 점유하지 않음)"""
+        safe_prompt = self.sanitize_prompt_input(prompt)
+        self._validate_prompt_safety(safe_prompt)
+        log_step("비디오 생성 요청", "시작", f"{duration_seconds}s, {resolution}")
 
-            return result
+        try:
+            safe_phase2 = self._prepare_phase2(
+                mode, phase2_prompt, enable_dual_phase_beta
+            )
+            if safe_phase2 is not None:
+                result = await self._client.generate_video_with_fallback_async(
+                    phase1_prompt=safe_prompt,
+                    phase2_prompt=safe_phase2,
+                    duration_seconds=duration_seconds,
+                    resolution=resolution,
+                    progress_callback=progress_callback,
+                )
+            else:
+                result = await self._client.generate_video_async(
+                    prompt=safe_prompt,
+                    duration_seconds=duration_seconds,
+                    resolution=resolution,
+                    progress_callback=progress_callback,
+                )
+            return self._check_generated(result)
 
         except Exception as e:
             log_error(f"비디오 생성 서비스 실패: {e}")
@@ -180,7 +226,7 @@ class VideoService:
         prompt: str,
         duration_seconds: int = 8,
         progress_callback: Callable[[str, int], None] | None = None,
-    ) -> bytes | None:
+    ) -> VideoArtifact | str | None:
         """이미지 기반 비디오 생성 (Image-to-Video)"""
         # [Defense] 입력값 정화
         safe_prompt = self.sanitize_prompt_input(prompt)
@@ -203,8 +249,8 @@ class VideoService:
                 return None
 
             if result:
-                if isinstance(result, bytes):
-                    log_success(f"I2V 생성 완료 ({len(result)} bytes)")
+                if isinstance(result, VideoArtifact):
+                    log_success(f"I2V 생성 완료 ({result.gcs_uri})")
                 else:
                     log_info(f"I2V 생성 결과: {result[:100]}")
 
@@ -223,7 +269,7 @@ class VideoService:
         prompt: str,
         duration_seconds: int = 8,
         progress_callback: Callable[[str, int], None] | None = None,
-    ) -> bytes | str:
+    ) -> VideoArtifact | str:
         """기존 비디오 연장"""
         # [Defense] 입력값 정화
         safe_prompt = self.sanitize_prompt_input(prompt)
@@ -244,8 +290,47 @@ class VideoService:
             if not self.validate_video_output(result):
                 raise VideoGenerationError("연장된 비디오 데이터가 유효하지 않습니다.")
 
-            if isinstance(result, bytes):
-                log_success(f"비디오 연장 완료 ({len(result)} bytes)")
+            if isinstance(result, VideoArtifact):
+                log_success(f"비디오 연장 완료 ({result.gcs_uri})")
+            else:
+                log_info(f"비디오 연장 상태: {result[:100]}")
+
+            return result
+
+        except Exception as e:
+            log_error(f"비디오 연장 서비스 실패: {e}")
+            raise VideoGenerationError(
+                f"비디오 연장 실패: {e}",
+                original_error=e,
+            ) from e
+
+    async def extend_generated_video_async(
+        self,
+        video_uri: str,
+        prompt: str,
+        duration_seconds: int = 8,
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> VideoArtifact | str:
+        """기존 비디오 연장 (비동기)"""
+        safe_prompt = self.sanitize_prompt_input(prompt)
+        self._validate_prompt_safety(safe_prompt)
+        log_step(
+            "비디오 연장 요청", "시작", f"Source: {video_uri}, {duration_seconds}s"
+        )
+
+        try:
+            result = await self._client.extend_video_async(
+                video_uri=video_uri,
+                prompt=safe_prompt,
+                duration_seconds=duration_seconds,
+                progress_callback=progress_callback,
+            )
+
+            if not self.validate_video_output(result):
+                raise VideoGenerationError("연장된 비디오 데이터가 유효하지 않습니다.")
+
+            if isinstance(result, VideoArtifact):
+                log_success(f"비디오 연장 완료 ({result.gcs_uri})")
             else:
                 log_info(f"비디오 연장 상태: {result[:100]}")
 
@@ -318,17 +403,8 @@ class VideoService:
             hook_text=hook_text,
         )
 
-    def generate_marketing_video(
-        self,
-        product: dict,
-        strategy: dict,
-        duration_seconds: int = 8,
-        mode: str = "single",
-        phase2_prompt: str | None = None,
-        enable_dual_phase_beta: bool = False,
-        progress_callback: Callable[[str, int], None] | None = None,
-    ) -> bytes | str:
-        """마케팅 비디오 생성"""
+    def _build_marketing_video_prompt(self, product: dict, strategy: dict) -> str:
+        """전략의 첫 훅으로 마케팅 비디오 프롬프트 구성"""
         p_name = product.get("name", "N/A")
         log_step("마케팅 비디오 생성", "시작", f"제품: {p_name}")
 
@@ -344,7 +420,20 @@ class VideoService:
         }
 
         # 프롬프트 생성
-        prompt = self.create_marketing_prompt(product, insights, hook_text)
+        return self.create_marketing_prompt(product, insights, hook_text)
+
+    def generate_marketing_video(
+        self,
+        product: dict,
+        strategy: dict,
+        duration_seconds: int = 8,
+        mode: str = "single",
+        phase2_prompt: str | None = None,
+        enable_dual_phase_beta: bool = False,
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> VideoArtifact | str:
+        """마케팅 비디오 생성"""
+        prompt = self._build_marketing_video_prompt(product, strategy)
 
         # 비디오 생성
         return self.generate(
@@ -356,6 +445,27 @@ class VideoService:
             progress_callback=progress_callback,
         )
 
+    async def generate_marketing_video_async(
+        self,
+        product: dict,
+        strategy: dict,
+        duration_seconds: int = 8,
+        mode: str = "single",
+        phase2_prompt: str | None = None,
+        enable_dual_phase_beta: bool = False,
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> VideoArtifact | str:
+        """마케팅 비디오 생성 (비동기)"""
+        prompt = self._build_marketing_video_prompt(product, strategy)
+        return await self.generate_async(
+            prompt=prompt,
+            duration_seconds=duration_seconds,
+            mode=mode,
+            phase2_prompt=phase2_prompt,
+            enable_dual_phase_beta=enable_dual_phase_beta,
+            progress_callback=progress_callback,
+        )
+
     def get_available_motions(self) -> list[str]:
         """사용 가능한 카메라 모션 목록"""
         return self._client.get_available_motions()
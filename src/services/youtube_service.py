@@ -25,7 +25,7 @@ class YouTubeService:
     def __init__(self, client: IYouTubeClient) -> None:
         self._client = client
 
-    @cached(ttl=600, cache_key_prefix="youtube")  # 10분 캐시
+    @cached(ttl=600, cache_key_prefix="youtube", stale_ttl=600)  # 10분 캐시
     @retry_on_error(max_attempts=3, base_delay=1.0, max_delay=8.0)
     def search_videos(self, query: str, max_results: int = 3) -> list[dict]:
         """비디오 검색 (캐시 적용: 동일 검색어는 10분간 재사용)"""
@@ -46,6 +46,10 @@ class YouTubeService:
         """비디오 상세 정보"""
         return self._client.get_video_details(video_id)
 
+    def get_videos_details(self, video_ids: list[str]) -> dict[str, dict]:
+        """비디오 상세 정보 일괄 조회 (50개 단위 videos.list)"""
+        return self._client.get_videos_details(video_ids)
+
     def get_comments(self, video_id: str, max_results: int = 20) -> list[dict]:
         """비디오 댓글"""
         return self._client.get_video_comments(video_id, max_results)
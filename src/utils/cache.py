@@ -1,12 +1,28 @@
 """
 TTL 기반 캐시 유틸리티
 API 응답 캐싱으로 호출 횟수를 줄이고 응답 속도를 개선합니다.
+
+- 항목 수/바이트 상한을 넘으면 가장 오래 사용하지 않은 항목부터 O(1) 제거 (LRU)
+- 만료 시각은 최소 힙으로 관리하여 전체 스캔 없이 정리
+- 네임스페이스(cache_key_prefix)별 무효화 및 hit/miss/eviction 통계
+- @cached: 동기/비동기 함수 모두 지원, 동시 미스 단일 실행(single-flight),
+  만료 직후 이전 값 제공 + 백그라운드 갱신(stale-while-revalidate), 빈 결과 단기 캐시
 """
 
+import asyncio
+import contextvars
 import hashlib
+import heapq
+import inspect
+import itertools
 import json
+import sys
+import threading
 import time
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from functools import wraps
 from typing import Any
 
@@ -14,22 +30,113 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_NAMESPACE = "default"
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """값의 대략적인 메모리 크기 (바이트 상한 계산용, 중첩 4단계까지)"""
+    size = sys.getsizeof(value)
+    if _depth >= 4:
+        return size
+    if isinstance(value, dict):
+        size += sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+            for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(v, _depth + 1) for v in value)
+    elif not isinstance(value, type):
+        if hasattr(value, "__dict__"):
+            size += estimate_size(vars(value), _depth + 1)
+        # __slots__ 객체(slots dataclass 등)는 __dict__가 없으므로 슬롯 값을 직접 측정
+        for name in _slot_names(type(value)):
+            if hasattr(value, name):
+                size += estimate_size(getattr(value, name), _depth + 1)
+    return size
+
+
+def _slot_names(cls: type) -> list[str]:
+    names: list[str] = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(s for s in slots if s not in ("__dict__", "__weakref__"))
+    return names
+
+
+@dataclass
+class NamespaceStats:
+    """네임스페이스별 카운터"""
+
+    entries: int = 0
+    bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    stale_hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return round(self.hits / total, 4) if total else 0.0
+
+
+class _Entry:
+    __slots__ = ("expires_at", "namespace", "size", "value")
+
+    def __init__(self, value: Any, namespace: str, expires_at: float, size: int) -> None:
+        self.value = value
+        self.namespace = namespace
+        self.expires_at = expires_at
+        self.size = size
+
 
 class TTLCache:
     """
-    Time-To-Live 기반 메모리 캐시
+    Time-To-Live 기반 메모리 캐시 (크기 제한 LRU)
 
     특정 시간이 지나면 자동으로 만료되는 캐시입니다.
     API 응답 등 일정 시간 동안 유효한 데이터를 저장할 때 사용합니다.
+    모든 연산은 스레드 안전합니다.
     """
 
-    def __init__(self, default_ttl: int = 300):
+    def __init__(
+        self,
+        default_ttl: int = 300,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
         """
         Args:
             default_ttl: 기본 캐시 유효 시간 (초), 기본값 5분
+            max_entries: 최대 항목 수
+            max_bytes: 최대 추정 바이트 수
         """
-        self._cache: dict[str, dict[str, Any]] = {}
+        self._cache: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._expiry_heap: list[tuple[float, int, Hashable]] = []
+        self._seq = itertools.count()
+        self._namespaces: dict[str, set[Hashable]] = {}
+        self._stats: dict[str, NamespaceStats] = {}
+        self._bytes = 0
         self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lock = threading.RLock()
+
+    def configure(
+        self, max_entries: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        """상한 변경 (초과분은 즉시 제거)"""
+        with self._lock:
+            if max_entries is not None:
+                self._max_entries = max_entries
+            if max_bytes is not None:
+                self._max_bytes = max_bytes
+            self._enforce_limits()
 
     def _generate_key(self, *args, **kwargs) -> str:
         """인자들을 조합하여 고유 캐시 키 생성"""
@@ -38,118 +145,384 @@ class TTLCache:
         )
         return hashlib.md5(key_data.encode()).hexdigest()
 
-    def get(self, key: str) -> Any | None:
+    def get(self, key: Hashable, namespace: str = DEFAULT_NAMESPACE) -> Any | None:
         """캐시에서 값 조회 (만료 시 None 반환)"""
-        if key not in self._cache:
-            return None
-
-        entry = self._cache[key]
-
-        # TTL 체크
-        if time.time() > entry["expires_at"]:
-            del self._cache[key]
-            return None
-
-        return entry["value"]
-
-    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._ns_stats(namespace).misses += 1
+                return None
+
+            if time.monotonic() > entry.expires_at:
+                self._remove(key)
+                stats = self._ns_stats(entry.namespace)
+                stats.expirations += 1
+                stats.misses += 1
+                return None
+
+            self._cache.move_to_end(key)
+            self._ns_stats(entry.namespace).hits += 1
+            return entry.value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: int | None = None,
+        namespace: str = DEFAULT_NAMESPACE,
+    ) -> None:
         """캐시에 값 저장"""
         ttl = ttl or self._default_ttl
-        self._cache[key] = {
-            "value": value,
-            "expires_at": time.time() + ttl,
-            "created_at": time.time(),
-        }
-
-    def invalidate(self, key: str) -> bool:
+        size = estimate_size(value) + sys.getsizeof(key)
+        if size > self._max_bytes:
+            logger.debug(f"캐시 항목이 너무 커서 저장하지 않음: {key} ({size} bytes)")
+            return
+
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+            expires_at = time.monotonic() + ttl
+            self._cache[key] = _Entry(value, namespace, expires_at, size)
+            self._namespaces.setdefault(namespace, set()).add(key)
+            stats = self._ns_stats(namespace)
+            stats.entries += 1
+            stats.bytes += size
+            self._bytes += size
+            heapq.heappush(self._expiry_heap, (expires_at, next(self._seq), key))
+            self._enforce_limits()
+
+    def invalidate(self, key: Hashable) -> bool:
         """특정 키의 캐시 삭제"""
-        if key in self._cache:
-            del self._cache[key]
-            return True
-        return False
+        with self._lock:
+            return self._remove(key) is not None
+
+    def record_stale_hit(self, namespace: str = DEFAULT_NAMESPACE) -> None:
+        """만료된 값을 갱신 대기 중에 제공한 횟수 기록"""
+        with self._lock:
+            self._ns_stats(namespace).stale_hits += 1
+
+    def invalidate_namespace(self, namespace: str) -> int:
+        """네임스페이스에 속한 캐시만 삭제"""
+        with self._lock:
+            keys = list(self._namespaces.get(namespace, ()))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
 
     def clear(self) -> int:
         """모든 캐시 삭제"""
-        count = len(self._cache)
-        self._cache.clear()
-        return count
+        with self._lock:
+            count = len(self._cache)
+            self._cache.clear()
+            self._expiry_heap.clear()
+            self._namespaces.clear()
+            self._bytes = 0
+            for stats in self._stats.values():
+                stats.entries = 0
+                stats.bytes = 0
+            return count
 
     def cleanup_expired(self) -> int:
-        """만료된 캐시 정리"""
-        now = time.time()
-        expired_keys = [
-            key for key, entry in self._cache.items() if now > entry["expires_at"]
-        ]
-        for key in expired_keys:
-            del self._cache[key]
-
-        return len(expired_keys)
+        """만료된 캐시 정리 (힙 앞쪽의 만료 항목만 확인)"""
+        with self._lock:
+            return self._purge_expired()
 
     @property
     def stats(self) -> dict[str, Any]:
         """캐시 통계 정보"""
-        now = time.time()
-        active = sum(1 for e in self._cache.values() if now <= e["expires_at"])
-        return {
-            "total_entries": len(self._cache),
-            "active_entries": active,
-            "expired_entries": len(self._cache) - active,
-        }
+        with self._lock:
+            self._purge_expired()
+            namespaces = {
+                name: {**asdict(stats), "hit_rate": stats.hit_rate}
+                for name, stats in self._stats.items()
+            }
+            return {
+                "total_entries": len(self._cache),
+                "active_entries": len(self._cache),
+                "bytes": self._bytes,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+                "hits": sum(s.hits for s in self._stats.values()),
+                "misses": sum(s.misses for s in self._stats.values()),
+                "evictions": sum(s.evictions for s in self._stats.values()),
+                "namespaces": namespaces,
+            }
+
+    # ------------------------------------------------------------------
+    # 내부 (호출 측에서 lock 보유)
+    # ------------------------------------------------------------------
+    def _ns_stats(self, namespace: str) -> NamespaceStats:
+        stats = self._stats.get(namespace)
+        if stats is None:
+            stats = self._stats[namespace] = NamespaceStats()
+        return stats
+
+    def _remove(self, key: Hashable) -> _Entry | None:
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return None
+        self._bytes -= entry.size
+        stats = self._ns_stats(entry.namespace)
+        stats.entries -= 1
+        stats.bytes -= entry.size
+        keys = self._namespaces.get(entry.namespace)
+        if keys is not None:
+            keys.discard(key)
+        return entry
+
+    def _purge_expired(self) -> int:
+        now = time.monotonic()
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # 재설정된 키의 이전 힙 항목은 만료 시각이 달라 건너뜀
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                self._ns_stats(entry.namespace).expirations += 1
+                removed += 1
+        # 무효화/재설정으로 남은 힙 찌꺼기가 쌓이면 재구성
+        if len(heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [
+                (e.expires_at, next(self._seq), k) for k, e in self._cache.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+        return removed
+
+    def _enforce_limits(self) -> None:
+        if len(self._cache) <= self._max_entries and self._bytes <= self._max_bytes:
+            return
+        self._purge_expired()
+        while self._cache and (
+            len(self._cache) > self._max_entries or self._bytes > self._max_bytes
+        ):
+            key, entry = next(iter(self._cache.items()))
+            self._remove(key)
+            self._ns_stats(entry.namespace).evictions += 1
 
 
 # 전역 캐시 인스턴스 (서비스 간 공유)
 _api_cache = TTLCache(default_ttl=300)  # 5분 TTL
 
+# stale-while-revalidate 동기 갱신용 워커
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+# stale-while-revalidate 비동기 갱신 태스크 (이벤트 루프는 약한 참조만 들고 있어,
+# 완료 전에 GC되면 single-flight 키가 풀리지 않으므로 끝날 때까지 여기서 붙잡아 둠)
+_refresh_tasks: set[asyncio.Task] = set()
+
+DEFAULT_NEGATIVE_TTL = 60
+
 
-def cached(ttl: int = 300, cache_key_prefix: str = ""):
+@dataclass(slots=True)
+class _Stamped:
+    """캐시된 결과와 신선도 기한 (이후는 stale 구간)"""
+
+    value: Any
+    fresh_until: float
+
+
+class _SingleFlight:
+    """키별 진행 중 호출 추적 (동시 미스는 먼저 온 호출 결과를 공유)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+
+    def claim(self, key: Hashable) -> tuple[Future, bool]:
+        """(Future, 직접 실행해야 하는지)"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = self._calls[key] = Future()
+            return future, True
+
+    def resolve(
+        self,
+        key: Hashable,
+        future: Future,
+        result: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+_inflight = _SingleFlight()
+
+
+def _is_empty(result: Any) -> bool:
+    return result is None or (
+        isinstance(result, (list, dict, tuple, str, set)) and not result
+    )
+
+
+def cached(
+    ttl: int = 300,
+    cache_key_prefix: str = "",
+    stale_ttl: int = 0,
+    negative_ttl: int = DEFAULT_NEGATIVE_TTL,
+):
     """
-    API 응답 캐싱 데코레이터
+    API 응답 캐싱 데코레이터 (동기/비동기 함수 모두 지원)
 
     동일한 인자로 호출 시 캐시된 결과를 반환합니다.
+    cache_key_prefix가 네임스페이스가 되어 통계와 무효화 단위로 쓰입니다.
+    같은 키의 동시 미스는 한 번만 실행하고 나머지는 그 결과를 기다립니다.
 
     Args:
         ttl: 캐시 유효 시간 (초)
         cache_key_prefix: 캐시 키 접두사 (서비스별 구분용)
+        stale_ttl: 만료 후 이전 값을 제공하며 백그라운드로 갱신하는 구간 (초)
+        negative_ttl: None/빈 결과 캐시 시간 (초, 0이면 캐시하지 않음)
 
     Example:
-        @cached(ttl=600, cache_key_prefix="youtube")
-        def search_videos(query: str, max_results: int):
+        @cached(ttl=600, cache_key_prefix="youtube", stale_ttl=300)
+        def search_videos(self, query: str, max_results: int):
             # API 호출
             ...
     """
+    namespace = cache_key_prefix or DEFAULT_NAMESPACE
 
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # 캐시 키 생성 (접두사 + 함수명 + 인자)
-            key_base = f"{cache_key_prefix}:{func.__name__}"
-            cache_key = (
-                key_base + ":" + _api_cache._generate_key(*args[1:], **kwargs)
-            )  # self 제외
-
-            # 캐시 조회
-            cached_result = _api_cache.get(cache_key)
-            if cached_result is not None:
-                return cached_result
-
-            # 캐시 미스: 실제 함수 실행
-            result = func(*args, **kwargs)
-
-            # 결과 캐싱 (성공적인 결과만)
-            if result is not None:
-                _api_cache.set(cache_key, result, ttl)
-
-            return result
-
-        # 캐시 무효화 메서드 추가
-        wrapped: Any = wrapper
-        wrapped.invalidate_cache = lambda: _api_cache.clear()
+        params = list(inspect.signature(func).parameters)
+        skip_first = bool(params) and params[0] in ("self", "cls")
+        qualname = func.__qualname__
+
+        def make_key(args: tuple, kwargs: dict) -> Hashable:
+            # 해시 가능한 인자는 튜플 키 그대로 사용 (직렬화/MD5 생략)
+            call_args = args[1:] if skip_first else args
+            key = (cache_key_prefix, qualname, call_args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+                return key
+            except TypeError:
+                return (
+                    f"{cache_key_prefix}:{qualname}:"
+                    + _api_cache._generate_key(*call_args, **kwargs)
+                )
+
+        def lookup(key: Hashable) -> tuple[_Stamped | None, bool]:
+            """(캐시 항목, 신선한지)"""
+            stamped = _api_cache.get(key, namespace=namespace)
+            if stamped is None:
+                return None, False
+            return stamped, time.monotonic() < stamped.fresh_until
+
+        def store(key: Hashable, result: Any) -> None:
+            if _is_empty(result):
+                if negative_ttl <= 0:
+                    return
+                fresh, keep = negative_ttl, negative_ttl
+            else:
+                fresh, keep = ttl, ttl + stale_ttl
+            _api_cache.set(
+                key,
+                _Stamped(result, time.monotonic() + fresh),
+                keep,
+                namespace=namespace,
+            )
+
+        if inspect.iscoroutinefunction(func):
+
+            async def lead_async(key, future, args, kwargs):
+                try:
+                    result = await func(*args, **kwargs)
+                except BaseException as e:
+                    _inflight.resolve(key, future, error=e)
+                    raise
+                store(key, result)
+                _inflight.resolve(key, future, result)
+                return result
+
+            async def refresh_async(key, future, args, kwargs):
+                try:
+                    await lead_async(key, future, args, kwargs)
+                except Exception as e:
+                    logger.warning(f"캐시 백그라운드 갱신 실패 ({qualname}): {e}")
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                stamped, fresh = lookup(key)
+                if stamped is not None:
+                    if not fresh:
+                        _api_cache.record_stale_hit(namespace)
+                        future, leader = _inflight.claim(key)
+                        if leader:
+                            task = asyncio.get_running_loop().create_task(
+                                refresh_async(key, future, args, kwargs)
+                            )
+                            _refresh_tasks.add(task)
+                            task.add_done_callback(_refresh_tasks.discard)
+                    return stamped.value
+
+                future, leader = _inflight.claim(key)
+                if not leader:
+                    return await asyncio.wrap_future(future)
+                return await lead_async(key, future, args, kwargs)
+
+            wrapped: Any = async_wrapper
+        else:
+
+            def lead_sync(key, future, args, kwargs):
+                try:
+                    result = func(*args, **kwargs)
+                except BaseException as e:
+                    _inflight.resolve(key, future, error=e)
+                    raise
+                store(key, result)
+                _inflight.resolve(key, future, result)
+                return result
+
+            def refresh_sync(key, future, args, kwargs):
+                try:
+                    lead_sync(key, future, args, kwargs)
+                except Exception as e:
+                    logger.warning(f"캐시 백그라운드 갱신 실패 ({qualname}): {e}")
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                stamped, fresh = lookup(key)
+                if stamped is not None:
+                    if not fresh:
+                        _api_cache.record_stale_hit(namespace)
+                        future, leader = _inflight.claim(key)
+                        if leader:
+                            ctx = contextvars.copy_context()
+                            _refresh_executor.submit(
+                                ctx.run, refresh_sync, key, future, args, kwargs
+                            )
+                    return stamped.value
+
+                future, leader = _inflight.claim(key)
+                if not leader:
+                    return future.result()
+                return lead_sync(key, future, args, kwargs)
+
+            wrapped = wrapper
+
+        # 캐시 무효화 메서드 추가 (같은 네임스페이스만 삭제)
+        wrapped.invalidate_cache = lambda: _api_cache.invalidate_namespace(namespace)
 
         return wrapped
 
     return decorator
 
 
+def configure_api_cache(
+    max_entries: int | None = None, max_bytes: int | None = None
+) -> None:
+    """전역 캐시 상한 설정 (앱 시작 시 설정값 반영)"""
+    _api_cache.configure(max_entries=max_entries, max_bytes=max_bytes)
+
+
 def get_cache_stats() -> dict[str, Any]:
     """전역 캐시 통계 반환"""
     return _api_cache.stats
@@ -158,3 +531,8 @@ def get_cache_stats() -> dict[str, Any]:
 def clear_all_api_cache() -> int:
     """전역 API 캐시 모두 삭제"""
     return _api_cache.clear()
+
+
+def clear_api_cache_namespace(namespace: str) -> int:
+    """전역 API 캐시에서 네임스페이스 하나만 삭제"""
+    return _api_cache.invalidate_namespace(namespace)
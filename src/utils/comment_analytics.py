@@ -0,0 +1,336 @@
+"""
+대용량 댓글 스트리밍 분석
+청크 단위로 댓글을 한 번씩만 훑으며 감정/페인/질문 사전 매칭과 1~3-gram 상위 빈도 집계를 동시에 수행
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Any
+
+from utils.heavy_hitters import SpaceSaving
+
+# 명사 뒤에 붙는 대표 조사 (긴 것부터 매칭)
+KOREAN_JOSA: tuple[str, ...] = (
+    "에서는",
+    "에게서",
+    "으로는",
+    "으로도",
+    "이랑",
+    "에서",
+    "에게",
+    "한테",
+    "까지",
+    "부터",
+    "처럼",
+    "보다",
+    "으로",
+    "하고",
+    "은",
+    "는",
+    "이",
+    "가",
+    "을",
+    "를",
+    "에",
+    "의",
+    "도",
+    "로",
+    "와",
+    "과",
+    "만",
+    "랑",
+)
+
+DEFAULT_STOPWORDS: frozenset[str] = frozenset(
+    {
+        # 접속/지시/강조 표현
+        "그리고",
+        "하지만",
+        "그래서",
+        "근데",
+        "그런데",
+        "그냥",
+        "진짜",
+        "정말",
+        "너무",
+        "이거",
+        "저거",
+        "그거",
+        "이건",
+        "저건",
+        "그건",
+        "이런",
+        "저런",
+        "그런",
+        "여기",
+        "거기",
+        "우리",
+        "제가",
+        "저는",
+        "나는",
+        "있는",
+        "없는",
+        "하는",
+        "합니다",
+        "해요",
+        "있어요",
+        "같아요",
+        # 영어 기능어
+        "the",
+        "and",
+        "is",
+        "it",
+        "to",
+        "of",
+        "for",
+        "this",
+        "that",
+        "was",
+        "are",
+        "you",
+        "with",
+        "but",
+    }
+)
+
+_TOKEN_RE = re.compile(r"[가-힣]+|[a-z]+")
+
+
+class KoreanTokenizer:
+    """
+    한국어 인식 경량 토크나이저
+
+    한글/영문 연속 구간을 토큰으로 잘라 소문자화하고, 한글 토큰 끝의 조사를 떼어낸다
+    (조사를 뗀 어간이 min_stem 글자 미만이면 그대로 둠: "효과" -> "효과").
+    형태소 분석기 없이 "가격이"/"가격은"/"가격" 을 같은 키워드로 모으는 정도가 목적이다.
+    """
+
+    def __init__(
+        self,
+        stopwords: Iterable[str] | None = None,
+        min_length: int = 2,
+        suffixes: Sequence[str] = KOREAN_JOSA,
+        min_stem: int = 2,
+    ) -> None:
+        self.stopwords = frozenset(DEFAULT_STOPWORDS if stopwords is None else stopwords)
+        self.min_length = min_length
+        self._suffixes = tuple(sorted(suffixes, key=len, reverse=True))
+        self._min_stem = min_stem
+        self._stem_cache: dict[str, str] = {}
+
+    def stem(self, token: str) -> str:
+        cached = self._stem_cache.get(token)
+        if cached is not None:
+            return cached
+        stem = token
+        if "가" <= token[0] <= "힣":
+            for suffix in self._suffixes:
+                if token.endswith(suffix) and len(token) - len(suffix) >= self._min_stem:
+                    stem = token[: -len(suffix)]
+                    break
+        # 어휘 수가 많아도 메모리가 무한히 늘지 않도록 캐시 크기 제한
+        if len(self._stem_cache) < 200000:
+            self._stem_cache[token] = stem
+        return stem
+
+    def tokenize(self, text_lower: str) -> list[str]:
+        """소문자화된 텍스트 -> 불용어를 제외한 토큰 목록"""
+        stopwords = self.stopwords
+        min_length = self.min_length
+        tokens = []
+        for raw in _TOKEN_RE.findall(text_lower):
+            token = self.stem(raw)
+            if len(token) >= min_length and token not in stopwords and raw not in stopwords:
+                tokens.append(token)
+        return tokens
+
+
+class KeywordMatcher:
+    """
+    여러 키워드 사전을 정규식 하나로 합친 매처
+
+    텍스트를 한 번만 훑어 등장한 사전(카테고리) 집합을 돌려준다.
+    각 위치에서 가장 긴 키워드만 잡히므로, 다른 키워드를 부분 문자열로 포함하는
+    키워드("효과없" ⊃ "효과")는 포함된 키워드의 카테고리까지 미리 합쳐 두어
+    사전별 `any(kw in text)` 와 같은 결과를 낸다.
+    """
+
+    def __init__(self, dictionaries: dict[str, Iterable[str]]) -> None:
+        owners: dict[str, set[str]] = {}
+        for category, keywords in dictionaries.items():
+            for keyword in keywords:
+                owners.setdefault(keyword.lower(), set()).add(category)
+
+        self._categories: dict[str, frozenset[str]] = {}
+        for keyword in owners:
+            merged = set()
+            for other, categories in owners.items():
+                if other in keyword:
+                    merged |= categories
+            self._categories[keyword] = frozenset(merged)
+
+        alternation = "|".join(
+            re.escape(kw) for kw in sorted(owners, key=len, reverse=True)
+        )
+        # 전방 탐색으로 모든 시작 위치에서 매칭 (겹치는 키워드 누락 방지)
+        self._pattern = re.compile(f"(?=({alternation}))") if owners else None
+
+    def match(self, text_lower: str) -> set[str]:
+        if self._pattern is None:
+            return set()
+        found: set[str] = set()
+        categories = self._categories
+        for keyword in set(self._pattern.findall(text_lower)):
+            found |= categories[keyword]
+        return found
+
+
+class StreamingCommentAnalyzer:
+    """
+    댓글 스트리밍 집계기
+
+    feed()로 청크를 계속 넣고 result()로 현재까지의 집계를 얻는다.
+    - 댓글 하나당 사전 매칭 1회 + 질문 패턴 1회 + 토큰화 1회
+    - n-gram 빈도는 청크 안에서 Counter로 모은 뒤 Space-Saving 요약에 합쳐 메모리를 capacity로 제한
+    - 페인/게인/질문 예시는 처음 나온 고유 댓글을 sample_limit개까지만 보관
+    """
+
+    def __init__(
+        self,
+        positive: Iterable[str],
+        negative: Iterable[str],
+        pain: Iterable[str],
+        question_patterns: Iterable[str],
+        tokenizer: KoreanTokenizer | None = None,
+        ngram_sizes: Sequence[int] = (1, 2, 3),
+        capacity: int = 10000,
+        sample_limit: int = 5,
+    ) -> None:
+        self._matcher = KeywordMatcher(
+            {"positive": positive, "negative": negative, "pain": pain}
+        )
+        self._question = re.compile("|".join(f"(?:{p})" for p in question_patterns))
+        self.tokenizer = tokenizer or KoreanTokenizer()
+        self.ngram_sizes = tuple(ngram_sizes)
+        self._ngrams = {n: SpaceSaving[str](capacity) for n in self.ngram_sizes}
+        self._sample_limit = sample_limit
+        self._samples: dict[str, dict[str, None]] = {
+            "pain_points": {},
+            "gain_points": {},
+            "questions": {},
+        }
+        self.comments = 0
+        self.texts = 0
+        self.positive = 0
+        self.negative = 0
+
+    def feed(self, texts: Iterable[str]) -> None:
+        """댓글 텍스트 청크 1개 처리 (빈 문자열은 댓글 수에만 반영)"""
+        chunk_counts = {n: Counter() for n in self.ngram_sizes}
+        match = self._matcher.match
+        question = self._question.search
+        tokenize = self.tokenizer.tokenize
+        pains, gains, questions = (
+            self._samples["pain_points"],
+            self._samples["gain_points"],
+            self._samples["questions"],
+        )
+        limit = self._sample_limit
+
+        for text in texts:
+            self.comments += 1
+            if not text:
+                continue
+            self.texts += 1
+            text_lower = text.lower()
+
+            found = match(text_lower)
+            has_positive = "positive" in found
+            has_negative = "negative" in found
+            if has_positive != has_negative:
+                if has_positive:
+                    self.positive += 1
+                else:
+                    self.negative += 1
+
+            if len(text) > 10:
+                if "pain" in found and len(pains) < limit:
+                    pains.setdefault(text[:100])
+                if has_positive and len(gains) < limit:
+                    gains.setdefault(text[:100])
+            if 5 < len(text) < 200 and len(questions) < limit and question(text):
+                questions.setdefault(text)
+
+            tokens = tokenize(text_lower)
+            for n, counts in chunk_counts.items():
+                if n == 1:
+                    counts.update(tokens)
+                elif len(tokens) >= n:
+                    counts.update(
+                        map(
+                            " ".join,
+                            zip(*(tokens[i:] for i in range(n)), strict=False),
+                        )
+                    )
+
+        for n, counts in chunk_counts.items():
+            summary = self._ngrams[n]
+            for gram, count in counts.items():
+                summary.add(gram, count)
+
+    def feed_stream(self, texts: Iterable[str], chunk_size: int = 5000) -> None:
+        """임의 길이 텍스트 이터러블을 chunk_size 단위로 나눠 처리"""
+        for chunk in _chunked(texts, chunk_size):
+            self.feed(chunk)
+
+    def sentiment(self) -> dict[str, float | int]:
+        total = self.texts or 1
+        neutral = total - self.positive - self.negative
+        return {
+            "positive": round(self.positive / total * 100, 1),
+            "negative": round(self.negative / total * 100, 1),
+            "neutral": round(neutral / total * 100, 1),
+            "positive_count": self.positive,
+            "negative_count": self.negative,
+            "neutral_count": neutral,
+        }
+
+    def top_ngrams(self, n: int, top_k: int = 10) -> list[dict[str, Any]]:
+        return [
+            {"word": gram, "count": count}
+            for gram, count, _ in self._ngrams[n].top(top_k)
+        ]
+
+    def samples(self, kind: str) -> list[str]:
+        return list(self._samples[kind])
+
+    def result(self, top_k: int = 10) -> dict[str, Any]:
+        return {
+            "total_comments": self.comments,
+            "sentiment": self.sentiment(),
+            "pain_points": self.samples("pain_points"),
+            "gain_points": self.samples("gain_points"),
+            "questions": self.samples("questions"),
+            "top_keywords": self.top_ngrams(1, top_k) if 1 in self._ngrams else [],
+            "top_bigrams": self.top_ngrams(2, top_k) if 2 in self._ngrams else [],
+            "top_trigrams": self.top_ngrams(3, top_k) if 3 in self._ngrams else [],
+        }
+
+
+def _chunked(items: Iterable[str], size: int) -> Iterator[list[str]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+__all__ = [
+    "DEFAULT_STOPWORDS",
+    "KOREAN_JOSA",
+    "KeywordMatcher",
+    "KoreanTokenizer",
+    "StreamingCommentAnalyzer",
+]
@@ -0,0 +1,120 @@
+"""동시 실행 유틸리티 (동시성 상한 + 공유 리미터)"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import weakref
+from collections.abc import Callable, Coroutine, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_limiters: dict[str, threading.BoundedSemaphore] = {}
+_limiters_lock = threading.Lock()
+_async_limiters: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+
+
+def shared_limiter(name: str, max_concurrent: int) -> threading.BoundedSemaphore:
+    """
+    이름별 프로세스 공유 세마포어 반환
+
+    같은 모델을 호출하는 클라이언트/서비스가 여러 개여도 하나의 상한을 공유한다.
+    상한은 처음 생성될 때 값으로 고정된다.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = threading.BoundedSemaphore(max(1, max_concurrent))
+            _limiters[name] = limiter
+        return limiter
+
+
+def shared_async_limiter(name: str, max_concurrent: int) -> asyncio.Semaphore:
+    """
+    이름별 이벤트 루프 공유 asyncio 세마포어 반환
+
+    같은 루프 안의 코루틴들(예: Hydration 배치와 댓글 심층 분석)이 하나의 상한을 공유한다.
+    asyncio.Semaphore는 루프에 묶이므로 루프마다 따로 만들며, 루프가 사라지면 함께 정리된다.
+    """
+    loop = asyncio.get_running_loop()
+    with _limiters_lock:
+        per_loop = _async_limiters.setdefault(loop, {})
+        limiter = per_loop.get(name)
+        if limiter is None:
+            limiter = asyncio.Semaphore(max(1, max_concurrent))
+            per_loop[name] = limiter
+        return limiter
+
+
+def map_bounded(
+    func: Callable[[T], Any],
+    items: Iterable[T],
+    max_workers: int,
+    on_complete: Callable[[int, int, int], None] | None = None,
+) -> list[Any]:
+    """
+    항목별 func를 최대 max_workers개씩 병렬 실행
+
+    - 결과는 입력 순서대로 반환 (실패한 항목은 예외 객체가 그 자리에 들어감)
+    - on_complete(index, done, total)는 호출 스레드에서 완료 순서대로 호출
+    - 호출 측 contextvars(프롬프트 사용량 집계 등)를 워커로 전파
+    """
+    items = list(items)
+    total = len(items)
+    results: list[Any] = [None] * total
+    if not total:
+        return results
+
+    workers = max(1, min(max_workers, total))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(contextvars.copy_context().run, func, item): idx
+            for idx, item in enumerate(items)
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            idx = futures[future]
+            try:
+                results[idx] = future.result()
+            except Exception as exc:
+                results[idx] = exc
+            if on_complete:
+                on_complete(idx, done, total)
+    return results
+
+
+def run_coroutine_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    동기 코드에서 코루틴 실행 (동기 호출 경로 호환용)
+
+    실행 중인 루프가 없으면 asyncio.run으로 바로 실행하고, 루프 안에서 호출된 경우에만
+    전용 스레드의 새 루프에서 실행한다. 비동기 호출자는 이 함수 대신 직접 await 한다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    outcome: dict[str, Any] = {}
+
+    def runner() -> None:
+        try:
+            outcome["result"] = asyncio.run(coro)
+        except BaseException as exc:
+            outcome["error"] = exc
+
+    # 호출 측 컨텍스트(프롬프트 사용량 집계 등)를 워커 스레드로 전파
+    context = contextvars.copy_context()
+    thread = threading.Thread(target=context.run, args=(runner,), daemon=True)
+    thread.start()
+    thread.join()
+
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+__all__ = ["map_bounded", "run_coroutine_sync", "shared_async_limiter", "shared_limiter"]
@@ -0,0 +1,116 @@
+"""
+크론 표현식 헬퍼
+Cloud Scheduler용 5필드 크론(분 시 일 월 요일)의 다음 실행 시각 계산
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone, tzinfo
+
+# KST = UTC+9 (tzdata 없이 Windows에서도 동작)
+KST = timezone(timedelta(hours=9))
+
+_FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+# 다음 실행 시각 탐색 상한 (윤년 2월 29일 같은 드문 표현식 포함)
+_MAX_SEARCH_DAYS = 366 * 5
+
+
+def resolve_timezone(name: str | None) -> tzinfo:
+    """IANA 타임존 이름 → tzinfo (tzdata가 없으면 KST로 대체)"""
+    if not name:
+        return KST
+    try:
+        from zoneinfo import ZoneInfo
+
+        return ZoneInfo(name)
+    except Exception:
+        return KST
+
+
+def _parse_field(field: str, low: int, high: int) -> set[int]:
+    values: set[int] = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_str = part.split("/", 1)
+            step = int(step_str)
+        if part in ("*", ""):
+            start, end = low, high
+        elif "-" in part:
+            start_str, end_str = part.split("-", 1)
+            start, end = int(start_str), int(end_str)
+        else:
+            start = int(part)
+            end = high if step > 1 else start
+        if start < low or end > high or start > end or step < 1:
+            raise ValueError(f"크론 필드 범위 오류: {field}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+def parse_cron(expression: str) -> tuple[set[int], set[int], set[int], set[int], set[int], bool, bool]:
+    """
+    크론 표현식 파싱
+
+    Returns:
+        (분, 시, 일, 월, 요일(0=일), 일 제한 여부, 요일 제한 여부)
+    """
+    fields = expression.split()
+    if len(fields) != 5:
+        raise ValueError(f"5필드 크론 표현식이 아닙니다: {expression}")
+    minutes, hours, days, months, weekdays = (
+        _parse_field(field, low, high)
+        for field, (low, high) in zip(fields, _FIELD_RANGES, strict=True)
+    )
+    weekdays = {d % 7 for d in weekdays}  # 7도 일요일
+    return (
+        minutes,
+        hours,
+        days,
+        months,
+        weekdays,
+        fields[2] != "*",
+        fields[4] != "*",
+    )
+
+
+def next_cron_time(
+    expression: str,
+    after: datetime,
+    tz: tzinfo | None = None,
+) -> datetime:
+    """
+    after 이후(초과) 첫 실행 시각 계산
+
+    after가 naive이면 tz 기준 시각으로 간주한다. 결과는 tz-aware.
+    일/요일이 모두 제한된 경우 표준 크론처럼 둘 중 하나만 맞아도 실행한다.
+    """
+    tz = tz or KST
+    minutes, hours, days, months, weekdays, dom_restricted, dow_restricted = parse_cron(
+        expression
+    )
+    local = (after.replace(tzinfo=tz) if after.tzinfo is None else after.astimezone(tz))
+    start = local.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    sorted_hours = sorted(hours)
+    sorted_minutes = sorted(minutes)
+
+    day = start.date()
+    for _ in range(_MAX_SEARCH_DAYS):
+        if day.month in months:
+            dom_ok = day.day in days
+            dow_ok = (day.weekday() + 1) % 7 in weekdays
+            if dom_restricted and dow_restricted:
+                day_ok = dom_ok or dow_ok
+            else:
+                day_ok = dom_ok and dow_ok
+            if day_ok:
+                for hour in sorted_hours:
+                    for minute in sorted_minutes:
+                        candidate = datetime(
+                            day.year, day.month, day.day, hour, minute, tzinfo=tz
+                        )
+                        if candidate >= start:
+                            return candidate
+        day += timedelta(days=1)
+    raise ValueError(f"다음 실행 시각을 찾을 수 없습니다: {expression}")
@@ -4,12 +4,26 @@ GCS 업로드 헬퍼
 
 from __future__ import annotations
 
+import base64
+import gzip
+import hashlib
+import json
+import os
 import re
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from core.exceptions import GCSDownloadError
 
 # KST = UTC+9 (tzdata 없이 Windows에서도 동작)
 KST = timezone(timedelta(hours=9))
 
+# 스트리밍 다운로드 청크 크기 (GCS 권장: 256KB 배수)
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+# 이 크기 이상의 바이트 업로드는 청크 단위 resumable 업로드로 전송
+RESUMABLE_THRESHOLD = 8 * 1024 * 1024
+
 
 def build_gcs_prefix(product: dict, kind: str) -> str:
     name = product.get("name", "product")
@@ -45,3 +59,88 @@ def gcs_url_for(storage, path: str) -> str:
         return public
     bucket = getattr(storage, "bucket_name", "bucket")
     return f"gs://{bucket}/{path}"
+
+
+def encode_json_gzip(data: dict | list) -> bytes:
+    """JSON 산출물을 공백 없이 직렬화한 뒤 gzip 압축 (Content-Encoding: gzip 업로드용)"""
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+    return gzip.compress(text.encode("utf-8"), compresslevel=6)
+
+
+def parse_gcs_uri(uri: str) -> tuple[str, str]:
+    """gs://bucket/path → (bucket, path)"""
+    parts = uri.removeprefix("gs://").split("/", 1)
+    return parts[0], parts[1] if len(parts) > 1 else ""
+
+
+def stream_blob_to_file(
+    blob,
+    dest: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> tuple[int, str]:
+    """
+    Blob을 청크 단위로 파일에 스트리밍 저장 (메모리 사용량 = 청크 1개)
+
+    .part 임시 파일에 쓰면서 MD5를 계산하고, GCS 메타데이터의 md5_hash와
+    일치할 때만 최종 경로로 교체한다 (복합 객체처럼 md5가 없으면 검증 생략).
+
+    Returns:
+        (저장된 바이트 수, base64 MD5)
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(dest.name + ".part")
+    blob.reload()
+    expected_md5 = getattr(blob, "md5_hash", None)
+    digest = hashlib.md5()
+    size = 0
+    try:
+        with blob.open("rb", chunk_size=chunk_size) as reader, tmp.open("wb") as out:
+            while chunk := reader.read(chunk_size):
+                digest.update(chunk)
+                out.write(chunk)
+                size += len(chunk)
+        actual_md5 = base64.b64encode(digest.digest()).decode("ascii")
+        if expected_md5 and actual_md5 != expected_md5:
+            raise GCSDownloadError(
+                f"체크섬 불일치: expected={expected_md5}, actual={actual_md5}",
+                details={"path": getattr(blob, "name", str(dest))},
+            )
+        os.replace(tmp, dest)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return size, actual_md5
+
+
+def transfer_video(
+    storage,
+    dest_path: str,
+    gcs_uri: str | None = None,
+    local_path: str | None = None,
+    content_type: str = "video/mp4",
+) -> None:
+    """
+    생성된 비디오를 스토리지의 dest_path로 옮긴다
+
+    원본이 이미 GCS에 있으면 서버 측 복사로 끝내고(다운로드/재업로드 없음),
+    그 외에는 로컬 파일을 청크 단위로 업로드한다.
+    """
+    copy = getattr(storage, "copy", None)
+    if gcs_uri and copy is not None:
+        source_bucket, source_path = parse_gcs_uri(gcs_uri)
+        if copy(source_path, dest_path, source_bucket=source_bucket):
+            return
+        if not local_path:
+            raise GCSDownloadError(
+                f"서버 측 복사 실패: {gcs_uri}", details={"path": source_path}
+            )
+
+    if not local_path:
+        raise ValueError("업로드할 비디오 파일이 없습니다.")
+    upload_file = getattr(storage, "upload_file", None)
+    if upload_file is not None:
+        upload_file(local_path, dest_path, content_type=content_type)
+    else:
+        storage.upload(
+            data=Path(local_path).read_bytes(), path=dest_path, content_type=content_type
+        )
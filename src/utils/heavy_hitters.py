@@ -0,0 +1,90 @@
+"""
+고정 메모리 빈도 상위 항목 집계 (Space-Saving)
+항목 종류가 수백만 개여도 capacity개 카운터만 유지하며 상위 빈도 항목을 근사
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Hashable, Iterable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class SpaceSaving(Generic[K]):
+    """
+    Space-Saving 알고리즘 (Metwally et al.)
+
+    카운터가 가득 차면 최소 카운터 항목을 새 항목으로 교체하고 그 값을 이어받는다.
+    보고되는 count는 실제 빈도 이상이며, 과대 추정 폭은 error 이하다.
+    빈도가 총합/capacity를 넘는 항목은 반드시 포함된다.
+    """
+
+    def __init__(self, capacity: int = 10000) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self._capacity = capacity
+        self._counts: dict[K, int] = {}
+        self._errors: dict[K, int] = {}
+        # (count, seq, item) 최소 힙. 증가 시 새 항목을 넣고 오래된 항목은 꺼낼 때 건너뜀
+        self._heap: list[tuple[int, int, K]] = []
+        self._seq = 0
+        self.total = 0
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, item: K, count: int = 1) -> None:
+        self.total += count
+        current = self._counts.get(item)
+        if current is not None:
+            self._set(item, current + count)
+            return
+        if len(self._counts) < self._capacity:
+            self._errors[item] = 0
+            self._set(item, count)
+            return
+        victim, floor = self._pop_min()
+        del self._counts[victim]
+        del self._errors[victim]
+        self._errors[item] = floor
+        self._set(item, floor + count)
+
+    def update(self, items: Iterable[K]) -> None:
+        for item in items:
+            self.add(item)
+
+    def merge(self, other: SpaceSaving[K]) -> None:
+        """다른 요약을 합침 (청크 병렬 처리 후 결합용, 오차 상한은 두 요약의 합)"""
+        for item, count in other._counts.items():
+            self.add(item, count)
+            self._errors[item] = self._errors.get(item, 0) + other._errors.get(item, 0)
+        # add()가 total에 다시 더했으므로 실제 합계로 보정
+        self.total -= sum(other._counts.values()) - other.total
+
+    def top(self, n: int) -> list[tuple[K, int, int]]:
+        """[(항목, 추정 빈도, 최대 과대 추정치)] 빈도 내림차순"""
+        best = heapq.nlargest(n, self._counts.items(), key=lambda kv: kv[1])
+        return [(item, count, self._errors[item]) for item, count in best]
+
+    def _set(self, item: K, count: int) -> None:
+        self._counts[item] = count
+        self._seq += 1
+        heapq.heappush(self._heap, (count, self._seq, item))
+        if len(self._heap) > 4 * self._capacity:
+            self._compact()
+
+    def _pop_min(self) -> tuple[K, int]:
+        while True:
+            count, _, item = heapq.heappop(self._heap)
+            if self._counts.get(item) == count:
+                return item, count
+
+    def _compact(self) -> None:
+        self._heap = [(count, i, item) for i, (item, count) in enumerate(self._counts.items())]
+        heapq.heapify(self._heap)
+        self._seq = len(self._heap)
+
+
+__all__ = ["SpaceSaving"]
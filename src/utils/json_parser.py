@@ -0,0 +1,364 @@
+"""
+LLM 출력 JSON 파서
+코드 블록/설명문이 섞인 LLM 응답에서 JSON 페이로드를 한 번의 선형 스캔으로 추출합니다.
+
+- 문자열 내부의 괄호/쉼표는 구조 문자로 취급하지 않음
+- 끝 쉼표(trailing comma)는 스캔 중 위치를 기록해 한 번에 제거
+- 잘린 출력은 마지막으로 완결된 배열 원소까지 복구 (allow_partial)
+- orjson이 설치되어 있으면 파싱 백엔드로 사용
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 (pip install nexloop[fast])
+    orjson = None
+
+# 문자열 리터럴은 통째로, 그 외에는 구조 문자만 매칭 (일반 텍스트는 C 레벨에서 건너뜀)
+# 닫히지 않은 문자열(잘린 출력)은 단독 '"'로 매칭된다
+_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\],"]', re.DOTALL)
+_DECODER = json.JSONDecoder()
+_CLOSERS = {"{": "}", "[": "]"}
+_JSON_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+def loads(text: str | bytes) -> Any:
+    """JSON 파싱 (orjson 사용 가능 시 우선 사용)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError as e:
+            # orjson은 NaN/Infinity, 비표준 서로게이트 등을 거부하므로 표준 파서로 재시도
+            try:
+                return json.loads(text)
+            except json.JSONDecodeError:
+                raise e from None
+    return json.loads(text)
+
+
+def backend_name() -> str:
+    """현재 사용 중인 JSON 파싱 백엔드 이름"""
+    return "orjson" if orjson is not None else "json"
+
+
+def _raw_decode_repairing(text: str, start: int, max_repairs: int = 8) -> Any:
+    """
+    C 디코더로 start 위치부터 디코딩, 끝 쉼표 오류는 오류 위치에서 바로 제거 후 재시도
+
+    끝 쉼표 오류는 항상 닫는 괄호 위치에서 보고되므로 문자열 내부 쉼표는 건드리지 않는다.
+    """
+    for _ in range(max_repairs + 1):
+        try:
+            return _DECODER.raw_decode(text, start)[0]
+        except json.JSONDecodeError as e:
+            pos = e.pos
+            if pos >= len(text) or text[pos] not in "}]":
+                raise
+            comma = pos - 1
+            while comma > start and text[comma] in " \t\r\n":
+                comma -= 1
+            if text[comma] != ",":
+                raise
+            text = text[:comma] + text[comma + 1 :]
+    raise ValueError("끝 쉼표 보정 한도 초과")
+
+
+def _scan(text: str, start: int) -> tuple[int, list[int], int, list[str]]:
+    """
+    text[start]의 여는 괄호부터 짝이 맞는 닫는 괄호까지 스캔
+
+    Returns:
+        (end, trailing_commas, safe_end, safe_stack)
+        - end: 완결된 경우 닫는 괄호 다음 위치, 잘린 경우 -1
+        - trailing_commas: 제거해야 할 끝 쉼표 위치 목록
+        - safe_end/safe_stack: 잘린 경우 복구 가능한 마지막 지점과 그 시점의 열린 괄호
+    """
+    stack: list[str] = []
+    trailing_commas: list[int] = []
+    last_comma = -1
+    safe_end = -1
+    safe_stack: list[str] = []
+
+    for match in _TOKEN_RE.finditer(text, start):
+        token = match.group()
+        ch = token[0]
+
+        if ch == '"':
+            if len(token) == 1:
+                break  # 닫히지 않은 문자열 → 잘린 출력
+            if stack and stack[-1] == "[":
+                safe_end, safe_stack = match.end(), stack[:]
+        elif ch == ",":
+            last_comma = match.start()
+        elif ch in _CLOSERS:
+            stack.append(ch)
+        elif stack:
+            pos = match.start()
+            if last_comma != -1 and not text[last_comma + 1 : pos].strip():
+                trailing_commas.append(last_comma)
+            stack.pop()
+            if not stack:
+                return pos + 1, trailing_commas, pos + 1, []
+            safe_end, safe_stack = pos + 1, stack[:]
+
+    return -1, trailing_commas, safe_end, safe_stack
+
+
+def _drop_positions(text: str, positions: list[int], offset: int) -> str:
+    if not positions:
+        return text
+    parts = []
+    prev = 0
+    for pos in positions:
+        rel = pos - offset
+        if rel < prev or rel >= len(text):
+            continue
+        parts.append(text[prev:rel])
+        prev = rel + 1
+    parts.append(text[prev:])
+    return "".join(parts)
+
+
+def extract_json_text(
+    text: str,
+    opener: str = "{",
+    allow_partial: bool = False,
+) -> str | None:
+    """
+    첫 번째 JSON 객체/배열 텍스트 추출 (끝 쉼표 보정 포함)
+
+    Args:
+        text: LLM 원본 응답
+        opener: "{" (객체), "[" (배열), "" (먼저 나오는 쪽)
+        allow_partial: 잘린 출력일 때 마지막 완결 원소까지 복구
+    """
+    if opener:
+        start = text.find(opener)
+    else:
+        candidates = [i for i in (text.find("{"), text.find("[")) if i != -1]
+        start = min(candidates) if candidates else -1
+    if start == -1:
+        return None
+
+    end, trailing_commas, safe_end, safe_stack = _scan(text, start)
+    if end != -1:
+        return _drop_positions(text[start:end], trailing_commas, start)
+
+    if not allow_partial or safe_end == -1:
+        return None
+    commas = [c for c in trailing_commas if c < safe_end]
+    body = _drop_positions(text[start:safe_end], commas, start)
+    closers = "".join(_CLOSERS[ch] for ch in reversed(safe_stack))
+    return body.rstrip().rstrip(",") + closers
+
+
+def extract_json(
+    text: str,
+    opener: str = "{",
+    allow_partial: bool = False,
+) -> Any | None:
+    """
+    LLM 응답에서 JSON 값 추출 및 파싱 (실패 시 None)
+
+    전체가 유효한 JSON이면 바로 파싱하고, 그다음 첫 괄호부터 C 디코더로 시도합니다.
+    그래도 실패하면(잘린 출력 등) 한 번의 스캔으로 페이로드를 찾습니다.
+    """
+    if not text:
+        return None
+    stripped = text.strip()
+    if stripped[:1] in ("{", "[") and (not opener or stripped[0] == opener):
+        try:
+            return loads(stripped)
+        except ValueError:
+            pass
+
+    if opener:
+        start = text.find(opener)
+        if start != -1:
+            try:
+                return _raw_decode_repairing(text, start)
+            except ValueError:
+                pass
+
+    payload = extract_json_text(text, opener=opener, allow_partial=allow_partial)
+    if payload is None:
+        return None
+    try:
+        return loads(payload)
+    except ValueError:
+        return None
+
+
+def parse_llm_json(
+    text: str,
+    required_fields: list[str] | None = None,
+    allow_partial: bool = False,
+) -> dict[str, Any]:
+    """
+    LLM 출력 JSON 검증 및 정화
+
+    - Markdown 코드 블록/앞뒤 설명문 무시
+    - 첫 번째 JSON 객체만 추출 (문자열 내부 괄호 대응)
+    - 끝 쉼표 보정, 선택적으로 잘린 출력 복구
+    - 필수 필드 확인 (누락 시 _validation_warning)
+    """
+    text = text or ""
+    if "{" not in text:
+        return {"error": "JSON을 찾을 수 없음", "raw_text": text.strip()[:500]}
+
+    result = extract_json(text, opener="{", allow_partial=allow_partial)
+    if not isinstance(result, dict):
+        return {"error": "JSON 파싱 실패", "raw_text": text.strip()[:500]}
+
+    if required_fields:
+        missing = [f for f in required_fields if f not in result]
+        if missing:
+            result["_validation_warning"] = f"누락된 필드: {missing}"
+
+    return result
+
+
+class StreamingFieldDecoder:
+    """
+    스트리밍 중인 JSON 응답에서 특정 문자열 필드를 점진적으로 디코딩
+
+    나머지 필드가 아직 도착 중이어도 대상 필드 값은 청크 단위로 반환합니다.
+    응답이 JSON이 아니면 원문을 그대로 흘려보냅니다.
+    """
+
+    def __init__(self, field: str) -> None:
+        self._key = f'"{field}"'
+        self._buffer = ""
+        self._pos = 0
+        self._state = "detect"
+        self.text = ""
+
+    def feed(self, chunk: str) -> str:
+        """청크를 추가하고 새로 디코딩된 텍스트를 반환"""
+        self._buffer += chunk
+        start_len = len(self.text)
+        while self._step():
+            pass
+        return self.text[start_len:]
+
+    def _step(self) -> bool:
+        buf = self._buffer
+        if self._state == "detect":
+            stripped = buf[self._pos :].lstrip()
+            if not stripped:
+                return False
+            if stripped[0] == "{":
+                self._state = "key"
+                return True
+            if stripped[0] == "`":
+                brace = buf.find("{", self._pos)
+                if brace == -1:
+                    return False
+                self._pos = brace
+                self._state = "key"
+                return True
+            self._state = "raw"
+            return True
+
+        if self._state == "raw":
+            self.text += buf[self._pos :]
+            self._pos = len(buf)
+            return False
+
+        if self._state == "key":
+            idx = buf.find(self._key, self._pos)
+            if idx == -1:
+                return False
+            self._pos = idx + len(self._key)
+            self._state = "value"
+            return True
+
+        if self._state == "value":
+            while self._pos < len(buf) and buf[self._pos] in " \t\r\n:":
+                self._pos += 1
+            if self._pos >= len(buf):
+                return False
+            if buf[self._pos] != '"':
+                self._state = "done"
+                return False
+            self._pos += 1
+            self._state = "string"
+            return True
+
+        if self._state == "string":
+            self._decode_string()
+
+        return False
+
+    def _decode_string(self) -> None:
+        buf = self._buffer
+        out: list[str] = []
+        pos = self._pos
+        while pos < len(buf):
+            ch = buf[pos]
+            if ch == '"':
+                self._state = "done"
+                pos += 1
+                break
+            if ch != "\\":
+                out.append(ch)
+                pos += 1
+                continue
+            if pos + 1 >= len(buf):
+                break
+            esc = buf[pos + 1]
+            if esc != "u":
+                out.append(_JSON_ESCAPES.get(esc, esc))
+                pos += 2
+                continue
+            if pos + 6 > len(buf):
+                break
+            try:
+                code = int(buf[pos + 2 : pos + 6], 16)
+            except ValueError:
+                out.append(buf[pos : pos + 6])
+                pos += 6
+                continue
+            if 0xD800 <= code <= 0xDBFF:
+                if pos + 12 > len(buf):
+                    break
+                low = buf[pos + 6 : pos + 12]
+                if low.startswith("\\u"):
+                    try:
+                        low_code = int(low[2:], 16)
+                    except ValueError:
+                        low_code = 0
+                    if 0xDC00 <= low_code <= 0xDFFF:
+                        out.append(
+                            chr(0x10000 + ((code - 0xD800) << 10) + (low_code - 0xDC00))
+                        )
+                        pos += 12
+                        continue
+            out.append(chr(code))
+            pos += 6
+        self._pos = pos
+        self.text += "".join(out)
+
+
+__all__ = [
+    "StreamingFieldDecoder",
+    "backend_name",
+    "extract_json",
+    "extract_json_text",
+    "loads",
+    "parse_llm_json",
+]
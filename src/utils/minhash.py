@@ -0,0 +1,147 @@
+"""
+문자 n-gram MinHash + LSH 유사 문서 검색
+수천~수십만 개 제목 중 비슷한 제목 후보를 전수 비교 없이 버킷 조회로 찾음
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 32
+DEFAULT_NGRAM = 3
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_title(text: str) -> str:
+    """소문자화 + 연속 공백 1칸으로 정리"""
+    return _SPACES.sub(" ", text.lower()).strip()
+
+
+def char_shingles(text: str, n: int = DEFAULT_NGRAM) -> set[str]:
+    """정규화된 문자열의 문자 n-gram 집합 (n보다 짧으면 문자열 전체 1개)"""
+    text = normalize_title(text)
+    if not text:
+        return set()
+    if len(text) <= n:
+        return {text}
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+class MinHasher:
+    """
+    문자 n-gram 집합의 MinHash 서명 생성기
+
+    shingle을 crc32로 32비트 정수화한 뒤 multiply-shift 해시 num_perm개
+    ((a * x + b) mod 2^64) >> 32 의 최솟값을 서명으로 쓴다.
+    crc32와 고정 seed를 쓰므로 프로세스가 바뀌어도 서명이 같다 (디스크 저장 가능).
+    두 서명의 일치 비율은 n-gram Jaccard 유사도의 추정치다.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = DEFAULT_NUM_PERM,
+        ngram: int = DEFAULT_NGRAM,
+        seed: int = 1,
+    ) -> None:
+        self.num_perm = num_perm
+        self.ngram = ngram
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        # a는 홀수여야 multiply-shift 해시가 보편성을 가짐
+        self._a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray | None:
+        """(num_perm,) uint32 서명 (n-gram이 없으면 None)"""
+        shingles = char_shingles(text, self.ngram)
+        if not shingles:
+            return None
+        hashed = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        # uint64 곱셈/덧셈은 2^64에서 자연스럽게 wrap-around
+        mixed = self._a[:, None] * hashed[None, :] + self._b[:, None]
+        return (mixed >> np.uint64(32)).min(axis=1).astype(np.uint32)
+
+
+class MinHashLSH:
+    """
+    밴딩 LSH 색인
+
+    서명을 bands개 구간으로 나눠 구간별 버킷에 id를 넣는다. 질의는 같은 버킷에
+    한 번이라도 들어간 id만 후보로 보고, 후보에 대해서만 서명 일치율을 계산한다.
+    bands=32, rows=2(num_perm=64) 기준 유사도 약 0.18 이상부터 후보로 잡히기 시작한다.
+    """
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, bands: int = DEFAULT_BANDS) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: list[dict[bytes, list[int]]] = [{} for _ in range(bands)]
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        return [band.tobytes() for band in signature.reshape(self.bands, self.rows)]
+
+    def add(self, item_id: int, signature: np.ndarray) -> None:
+        for buckets, key in zip(self._buckets, self._band_keys(signature), strict=True):
+            buckets.setdefault(key, []).append(item_id)
+
+    def add_many(self, start_id: int, signatures: np.ndarray) -> None:
+        for offset, signature in enumerate(signatures):
+            self.add(start_id + offset, signature)
+
+    def candidates(self, signature: np.ndarray) -> set[int]:
+        found: set[int] = set()
+        for buckets, key in zip(self._buckets, self._band_keys(signature), strict=True):
+            ids = buckets.get(key)
+            if ids:
+                found.update(ids)
+        return found
+
+
+def top_k_similar(
+    signature: np.ndarray,
+    signatures: np.ndarray,
+    candidate_ids: Iterable[int],
+    k: int,
+) -> list[tuple[int, float]]:
+    """후보 id 중 서명 일치율 상위 k개 [(id, 추정 Jaccard)]"""
+    ids = np.fromiter(candidate_ids, dtype=np.int64)
+    if ids.size == 0 or k <= 0:
+        return []
+    similarity = (signatures[ids] == signature).mean(axis=1)
+    if ids.size > k:
+        keep = np.argpartition(-similarity, k - 1)[:k]
+        ids, similarity = ids[keep], similarity[keep]
+    # 유사도 내림차순, 동률은 먼저 들어간 id 우선
+    order = np.lexsort((ids, -similarity))
+    return [(int(ids[i]), float(similarity[i])) for i in order]
+
+
+def stack_signatures(signatures: Sequence[np.ndarray], num_perm: int) -> np.ndarray:
+    if not signatures:
+        return np.empty((0, num_perm), dtype=np.uint32)
+    return np.vstack(signatures).astype(np.uint32, copy=False)
+
+
+__all__ = [
+    "DEFAULT_BANDS",
+    "DEFAULT_NGRAM",
+    "DEFAULT_NUM_PERM",
+    "MinHashLSH",
+    "MinHasher",
+    "char_shingles",
+    "normalize_title",
+    "stack_signatures",
+    "top_k_similar",
+]
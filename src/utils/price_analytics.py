@@ -0,0 +1,131 @@
+"""
+경쟁 상품 가격 분석 (NumPy 벡터 연산)
+백분위수, 구간별 히스토그램, 브랜드/판매처 점유율을 상품 수와 무관하게 한 번에 계산
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+# 기존 price_distribution과 같은 구간 (원)
+DEFAULT_PRICE_BINS: tuple[float, ...] = (0, 10000, 30000, 50000, 100000, float("inf"))
+DEFAULT_PERCENTILES: tuple[int, ...] = (10, 25, 50, 75, 90)
+
+
+def price_array(products: Sequence[dict[str, Any]]) -> np.ndarray:
+    """유효 가격(>0)만 int64 배열로 추출"""
+    prices = np.fromiter(
+        (int(p.get("price", 0) or 0) for p in products),
+        dtype=np.int64,
+        count=len(products),
+    )
+    return prices[prices > 0]
+
+
+def bin_labels(bins: Sequence[float]) -> list[str]:
+    """구간 경계 -> "0-10000", ..., "100000+" 라벨"""
+    labels = []
+    for low, high in itertools.pairwise(bins):
+        if np.isinf(high):
+            labels.append(f"{int(low)}+")
+        else:
+            labels.append(f"{int(low)}-{int(high)}")
+    return labels
+
+
+def price_histogram(
+    prices: np.ndarray, bins: Sequence[float] = DEFAULT_PRICE_BINS
+) -> dict[str, int]:
+    """구간별 상품 수 (왼쪽 경계 포함, 오른쪽 경계 제외)"""
+    edges = np.asarray(bins, dtype=np.float64)
+    # searchsorted(side="right") - 1 -> low <= price < high 인 구간 인덱스
+    index = np.searchsorted(edges, prices, side="right") - 1
+    index = index[(index >= 0) & (index < len(edges) - 1)]
+    counts = np.bincount(index, minlength=len(edges) - 1)
+    return dict(zip(bin_labels(bins), counts.tolist(), strict=True))
+
+
+def price_percentiles(
+    prices: np.ndarray, percentiles: Sequence[int] = DEFAULT_PERCENTILES
+) -> dict[str, float]:
+    """{"p10": ..., "p50": ...}"""
+    if prices.size == 0:
+        return {f"p{q}": 0.0 for q in percentiles}
+    values = np.percentile(prices, percentiles)
+    return {f"p{q}": float(v) for q, v in zip(percentiles, values, strict=True)}
+
+
+def label_shares(labels: Sequence[str], top_n: int = 5) -> list[tuple[str, float]]:
+    """
+    빈 라벨을 제외한 점유율 상위 top_n [(라벨, 비율)]
+
+    동률은 먼저 등장한 라벨이 앞선다.
+    """
+    names = np.asarray([label for label in labels if label], dtype=object)
+    if names.size == 0:
+        return []
+    unique, first_index, counts = np.unique(names, return_index=True, return_counts=True)
+    # 개수 내림차순, 동률이면 첫 등장 순
+    order = np.lexsort((first_index, -counts))[:top_n]
+    total = counts.sum()
+    return [(str(unique[i]), float(counts[i] / total)) for i in order]
+
+
+def summarize_prices(
+    products: Sequence[dict[str, Any]],
+    bins: Sequence[float] = DEFAULT_PRICE_BINS,
+    percentiles: Sequence[int] = DEFAULT_PERCENTILES,
+    top_n: int = 5,
+) -> dict[str, Any]:
+    """
+    경쟁사 가격 통계 (analyze_competitors 결과 형식 + 백분위수/점유율)
+
+    Returns:
+        total_products, min/max/avg_price, top_brands, top_malls,
+        price_distribution, percentiles, brand_share, mall_share
+    """
+    prices = price_array(products)
+    if prices.size == 0:
+        return {
+            "total_products": len(products),
+            "min_price": 0,
+            "max_price": 0,
+            "avg_price": 0,
+            "top_brands": [],
+            "top_malls": [],
+            "price_distribution": {},
+            "percentiles": {},
+            "brand_share": {},
+            "mall_share": {},
+        }
+
+    brand_share = label_shares([p.get("brand", "") for p in products], top_n)
+    mall_share = label_shares([p.get("mall", "") for p in products], top_n)
+    return {
+        "total_products": len(products),
+        "min_price": int(prices.min()),
+        "max_price": int(prices.max()),
+        "avg_price": int(prices.sum() // prices.size),
+        "top_brands": [name for name, _ in brand_share],
+        "top_malls": [name for name, _ in mall_share],
+        "price_distribution": price_histogram(prices, bins),
+        "percentiles": price_percentiles(prices, percentiles),
+        "brand_share": {name: round(share, 4) for name, share in brand_share},
+        "mall_share": {name: round(share, 4) for name, share in mall_share},
+    }
+
+
+__all__ = [
+    "DEFAULT_PERCENTILES",
+    "DEFAULT_PRICE_BINS",
+    "bin_labels",
+    "label_shares",
+    "price_array",
+    "price_histogram",
+    "price_percentiles",
+    "summarize_prices",
+]
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 import time
 from collections.abc import Callable
+from functools import wraps
 from typing import TypeVar
 
 from core.exceptions import NexloopError, classify_error
@@ -18,6 +19,7 @@ def retry_on_error(
 ):
     def decorator(func: F) -> F:
         if asyncio.iscoroutinefunction(func):
+            @wraps(func)
             async def async_wrapper(*args, **kwargs):
                 attempt = 0
                 while True:
@@ -33,6 +35,7 @@ def retry_on_error(
 
             return async_wrapper  # type: ignore[return-value]
 
+        @wraps(func)
         def sync_wrapper(*args, **kwargs):
             attempt = 0
             while True:
@@ -58,6 +58,9 @@ class MockYouTubeClient:
     def get_video_details(self, video_id: str) -> dict | None:
         return {"id": video_id}
 
+    def get_videos_details(self, video_ids) -> dict[str, dict]:
+        return {vid: {"id": vid} for vid in video_ids}
+
     def get_video_comments(self, video_id: str, max_results: int = 20) -> list[dict]:
         return [{"text": "comment"}]
 
@@ -121,6 +124,9 @@ class MockVideoService:
     def generate_marketing_video(self, product: dict, strategy: dict, duration_seconds: int = 8, mode: str = "single", phase2_prompt: str | None = None, enable_dual_phase_beta: bool = False) -> bytes | str:
         return b"video"
 
+    async def generate_marketing_video_async(self, product: dict, strategy: dict, duration_seconds: int = 8, mode: str = "single", phase2_prompt: str | None = None, enable_dual_phase_beta: bool = False) -> bytes | str:
+        return b"video"
+
 
 class MockHistoryService:
     def save_result(self, result) -> str:
@@ -0,0 +1,265 @@
+import asyncio
+import gc
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.cache import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    TTLCache,
+    _api_cache,
+    _refresh_tasks,
+    cached,
+    clear_all_api_cache,
+    configure_api_cache,
+)
+
+
+def test_lru_eviction_by_entry_count():
+    cache = TTLCache(max_entries=3)
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+    assert cache.get("a") == "a"  # a를 최근 사용으로 갱신
+
+    cache.set("d", "d")
+
+    assert cache.get("b") is None
+    assert [cache.get(k) for k in ("a", "c", "d")] == ["a", "c", "d"]
+    assert cache.stats["namespaces"]["default"]["evictions"] == 1
+
+
+def test_eviction_by_byte_budget():
+    cache = TTLCache(max_entries=100, max_bytes=4000)
+    for i in range(10):
+        cache.set(f"k{i}", "x" * 1000)
+
+    stats = cache.stats
+    assert stats["bytes"] <= 4000
+    assert stats["total_entries"] < 10
+    assert cache.get("k9") == "x" * 1000
+
+
+def test_cached_entries_count_toward_byte_budget():
+    clear_all_api_cache()
+    configure_api_cache(max_entries=1000, max_bytes=10_000)
+    try:
+
+        class Client:
+            @cached(ttl=60, cache_key_prefix="test_bytes")
+            def fetch(self, i):
+                return {"items": ["x" * 1000 for _ in range(3)], "i": i}
+
+        client = Client()
+        for i in range(20):
+            client.fetch(i)
+
+        stats = _api_cache.stats
+        namespace = stats["namespaces"]["test_bytes"]
+        assert stats["bytes"] <= 10_000
+        # 항목당 3KB 이상으로 측정되어야 상한 안에 3개 이하만 남음
+        assert namespace["entries"] <= 3
+        assert namespace["evictions"] >= 17
+    finally:
+        configure_api_cache(max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES)
+        clear_all_api_cache()
+
+
+def test_expiry_is_purged_without_lookup(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = TTLCache()
+    cache.set("short", 1, ttl=5, namespace="a")
+    cache.set("long", 2, ttl=50, namespace="a")
+
+    now[0] += 10
+
+    assert cache.cleanup_expired() == 1
+    stats = cache.stats["namespaces"]["a"]
+    assert stats["entries"] == 1
+    assert stats["expirations"] == 1
+    assert cache.get("long", namespace="a") == 2
+
+
+def test_reset_key_keeps_latest_expiry(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = TTLCache()
+    cache.set("k", "old", ttl=5)
+    cache.set("k", "new", ttl=50)
+
+    now[0] += 10
+
+    assert cache.cleanup_expired() == 0
+    assert cache.get("k") == "new"
+
+
+def test_namespace_invalidation_and_counters():
+    cache = TTLCache()
+    cache.set("y1", 1, namespace="youtube")
+    cache.set("y2", 2, namespace="youtube")
+    cache.set("n1", 3, namespace="naver")
+    cache.get("y1", namespace="youtube")
+    cache.get("missing", namespace="naver")
+
+    assert cache.invalidate_namespace("youtube") == 2
+
+    stats = cache.stats["namespaces"]
+    assert stats["youtube"]["entries"] == 0
+    assert stats["youtube"]["hits"] == 1
+    assert stats["naver"]["entries"] == 1
+    assert stats["naver"]["misses"] == 1
+    assert cache.get("n1", namespace="naver") == 3
+
+
+def test_decorator_invalidate_only_clears_own_prefix():
+    clear_all_api_cache()
+    calls = {"a": 0, "b": 0}
+
+    class Client:
+        @cached(ttl=60, cache_key_prefix="test_a")
+        def fetch_a(self, q):
+            calls["a"] += 1
+            return {"q": q}
+
+        @cached(ttl=60, cache_key_prefix="test_b")
+        def fetch_b(self, q):
+            calls["b"] += 1
+            return {"q": q}
+
+    client = Client()
+    client.fetch_a("x")
+    client.fetch_b("x")
+    Client.fetch_a.invalidate_cache()
+    client.fetch_a("x")
+    client.fetch_b("x")
+
+    assert calls == {"a": 2, "b": 1}
+    assert _api_cache.stats["namespaces"]["test_b"]["hits"] == 1
+    clear_all_api_cache()
+
+
+def test_sync_single_flight_deduplicates_concurrent_misses():
+    clear_all_api_cache()
+    calls = []
+    gate = threading.Event()
+
+    class Client:
+        @cached(ttl=60, cache_key_prefix="test_sf")
+        def search(self, query):
+            calls.append(query)
+            gate.wait(1)
+            return [query]
+
+    client = Client()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(client.search, "q") for _ in range(8)]
+        time.sleep(0.05)
+        gate.set()
+        results = [f.result() for f in futures]
+
+    assert calls == ["q"]
+    assert results == [["q"]] * 8
+    clear_all_api_cache()
+
+
+def test_async_single_flight_and_shared_key_across_instances():
+    clear_all_api_cache()
+    calls = []
+
+    class Client:
+        @cached(ttl=60, cache_key_prefix="test_async")
+        async def generate(self, prompt):
+            calls.append(prompt)
+            await asyncio.sleep(0.05)
+            return prompt.upper()
+
+    async def run():
+        return await asyncio.gather(*(Client().generate("hi") for _ in range(5)))
+
+    assert asyncio.run(run()) == ["HI"] * 5
+    assert calls == ["hi"]
+    clear_all_api_cache()
+
+
+def test_stale_value_served_while_refreshing(monkeypatch):
+    clear_all_api_cache()
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    versions = iter(["v1", "v2"])
+    refreshed = threading.Event()
+
+    class Client:
+        @cached(ttl=10, cache_key_prefix="test_swr", stale_ttl=30)
+        def fetch(self):
+            value = next(versions)
+            if value == "v2":
+                refreshed.set()
+            return value
+
+    client = Client()
+    assert client.fetch() == "v1"
+    now[0] = 15.0
+    assert client.fetch() == "v1"
+    assert refreshed.wait(1)
+    time.sleep(0.05)
+    assert client.fetch() == "v2"
+    assert _api_cache.stats["namespaces"]["test_swr"]["stale_hits"] == 1
+    clear_all_api_cache()
+
+
+def test_async_stale_refresh_task_survives_gc(monkeypatch):
+    clear_all_api_cache()
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    versions = iter(["v1", "v2"])
+
+    class Client:
+        @cached(ttl=10, cache_key_prefix="test_swr_async", stale_ttl=30)
+        async def fetch(self):
+            await asyncio.sleep(0)
+            return next(versions)
+
+    async def run():
+        client = Client()
+        assert await client.fetch() == "v1"
+        now[0] = 15.0
+        assert await client.fetch() == "v1"
+        # 루프 밖에서 참조가 없어도 갱신 태스크가 끝까지 실행되어 키를 풀어야 함
+        assert len(_refresh_tasks) == 1
+        gc.collect()
+        await asyncio.gather(*_refresh_tasks)
+        assert not _refresh_tasks
+        return await asyncio.wait_for(client.fetch(), 1)
+
+    assert asyncio.run(run()) == "v2"
+    clear_all_api_cache()
+
+
+def test_empty_results_use_negative_ttl(monkeypatch):
+    clear_all_api_cache()
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    calls = []
+
+    class Client:
+        @cached(ttl=600, cache_key_prefix="test_neg", negative_ttl=5)
+        def search(self, query):
+            calls.append(query)
+            return []
+
+        @cached(ttl=600, cache_key_prefix="test_neg", negative_ttl=0)
+        def generate(self, prompt):
+            calls.append(prompt)
+            return ""
+
+    client = Client()
+    client.search("q")
+    client.search("q")
+    now[0] = 6.0
+    client.search("q")
+    client.generate("p")
+    client.generate("p")
+
+    assert calls == ["q", "q", "p", "p"]
+    clear_all_api_cache()
@@ -0,0 +1,79 @@
+from collections import Counter
+
+from utils.comment_analytics import (
+    KeywordMatcher,
+    KoreanTokenizer,
+    StreamingCommentAnalyzer,
+)
+from utils.heavy_hitters import SpaceSaving
+
+
+def test_tokenizer_strips_josa_and_stopwords():
+    tokenizer = KoreanTokenizer()
+    assert tokenizer.tokenize("가격이 너무 비싸요 가격은 그냥 효과 good and") == [
+        "가격",
+        "비싸요",
+        "가격",
+        "효과",
+        "good",
+    ]
+    assert KoreanTokenizer(stopwords={"가격"}).tokenize("가격이 좋다") == ["좋다"]
+
+
+def test_keyword_matcher_matches_contained_keywords():
+    matcher = KeywordMatcher({"positive": ["효과", "good"], "negative": ["효과없"]})
+    # "효과없" 안의 "효과"도 긍정 사전에 걸림 (사전별 any(kw in text)와 동일)
+    assert matcher.match("효과없어요") == {"positive", "negative"}
+    assert matcher.match("really good") == {"positive"}
+    assert matcher.match("그냥 그래요") == set()
+
+
+def test_space_saving_keeps_heavy_hitters_in_bounded_memory():
+    summary = SpaceSaving[str](capacity=10)
+    stream = ["a"] * 500 + ["b"] * 300 + [f"rare{i}" for i in range(2000)] + ["a"] * 100
+    summary.update(stream)
+
+    assert len(summary) == 10
+    assert summary.total == len(stream)
+    top = summary.top(2)
+    assert [item for item, _, _ in top] == ["a", "b"]
+    for item, count, error in top:
+        true_count = Counter(stream)[item]
+        assert count - error <= true_count <= count
+
+
+def test_space_saving_merge_adds_counts():
+    left, right = SpaceSaving[str](5), SpaceSaving[str](5)
+    left.update(["x", "x", "y"])
+    right.update(["x", "z"])
+    left.merge(right)
+    assert left.total == 5
+    assert left.top(1) == [("x", 3, 0)]
+
+
+def test_streaming_analyzer_matches_single_pass_across_chunks():
+    analyzer = StreamingCommentAnalyzer(
+        positive=["좋아요"],
+        negative=["별로"],
+        pain=["고민"],
+        question_patterns=[r"\?$"],
+        sample_limit=2,
+    )
+    texts = [
+        "배송이 빨라서 정말 좋아요 배송 최고",
+        "색상이 별로예요 배송 느림",
+        "",
+        "피부 고민이 많아요 어떤가요?",
+    ]
+    analyzer.feed_stream(texts * 3, chunk_size=2)
+    result = analyzer.result(top_k=3)
+
+    assert result["total_comments"] == 12
+    assert result["sentiment"]["positive_count"] == 3
+    assert result["sentiment"]["negative_count"] == 3
+    assert result["sentiment"]["neutral_count"] == 3
+    assert result["pain_points"] == ["피부 고민이 많아요 어떤가요?"]
+    assert result["questions"] == ["피부 고민이 많아요 어떤가요?"]
+    assert result["top_keywords"][0] == {"word": "배송", "count": 9}
+    assert {"word": "배송 빨라서", "count": 3} in result["top_bigrams"]
+    assert result["top_trigrams"][0]["count"] == 3
@@ -0,0 +1,81 @@
+import services.ctr_predictor as ctr_predictor
+from core.models.product import ProductCategory
+from infrastructure.storage.competitor_title_index import CompetitorTitleStore
+from services.ctr_predictor import CTRPredictor
+from services.hook_service import HookService
+from utils.minhash import MinHasher, char_shingles
+
+TITLES = [
+    "바퀴벌레 완벽 퇴치 방법 총정리",
+    "싱크대 바퀴벌레 없애는 꿀팁",
+    "여름철 초파리 트랩 만들기",
+    "쥐 퇴치기 솔직 후기 비교",
+]
+
+
+def test_minhash_similarity_tracks_ngram_jaccard():
+    hasher = MinHasher(num_perm=128)
+    a = "바퀴벌레 완벽 퇴치 방법 총정리"
+    b = "바퀴벌레 완벽 퇴치 방법 정리"
+    estimate = (hasher.signature(a) == hasher.signature(b)).mean()
+    sa, sb = char_shingles(a), char_shingles(b)
+    exact = len(sa & sb) / len(sa | sb)
+    assert abs(estimate - exact) < 0.15
+    assert hasher.signature("   ") is None
+
+
+def test_store_is_incremental_and_persisted(tmp_path):
+    store = CompetitorTitleStore(tmp_path)
+    assert store.add_titles(ProductCategory.COCKROACH, TITLES[:2], source="youtube") == 2
+    # 대소문자/공백만 다른 중복은 무시
+    duplicate = " 바퀴벌레  완벽 퇴치 방법 총정리"
+    assert store.add_titles("바퀴벌레", [duplicate, *TITLES[2:]], "naver") == 2
+
+    reloaded = CompetitorTitleStore(tmp_path)
+    index = reloaded.get(ProductCategory.COCKROACH)
+    assert index.titles == TITLES
+    assert index.sources == ["youtube", "youtube", "naver", "naver"]
+
+    nearest = reloaded.nearest("바퀴벌레", "바퀴벌레 완벽 퇴치 방법 정리", k=2)
+    assert nearest[0]["title"] == TITLES[0]
+    assert nearest[0]["similarity"] > 0.5
+    assert reloaded.nearest("바퀴벌레", "자동차 보험 비교") == []
+    assert reloaded.differentiation("트랩", ["아무 제목"]) is None
+
+
+def test_ctr_predictor_uses_index_without_explicit_competitors(tmp_path, monkeypatch):
+    class NullEvaluator:
+        def log_prediction(self, *args, **kwargs):
+            pass
+
+        def log_predictions(self, *args, **kwargs):
+            pass
+
+    monkeypatch.setattr(ctr_predictor, "ModelEvaluator", NullEvaluator)
+    store = CompetitorTitleStore(tmp_path)
+    store.add_titles("바퀴벌레", TITLES, source="youtube")
+    predictor = CTRPredictor(competitor_index=store)
+
+    copied = predictor.predict_ctr(TITLES[1], category="바퀴벌레")
+    fresh = predictor.predict_ctr("고양이 장난감 언박싱", category="바퀴벌레")
+    assert copied["breakdown"]["differentiation"] < fresh["breakdown"]["differentiation"]
+    assert copied["nearest_competitors"][0]["title"] == TITLES[1]
+    # 경쟁 제목을 직접 주면 기존 단어 Jaccard 규칙 그대로
+    explicit = predictor.predict_ctr(TITLES[1], competitor_titles=["전혀 다른 제목"])
+    assert explicit["breakdown"]["differentiation"] == 100.0
+    assert "nearest_competitors" not in explicit
+
+    batch = predictor.predict_batch([TITLES[1], "고양이 장난감 언박싱"], category="바퀴벌레")
+    by_title = {r["title"]: r["breakdown"]["differentiation"] for r in batch}
+    assert by_title[TITLES[1]] == copied["breakdown"]["differentiation"]
+
+
+def test_hook_service_checks_differentiation(tmp_path):
+    store = CompetitorTitleStore(tmp_path)
+    store.add_titles("바퀴벌레", TITLES, source="youtube")
+    service = HookService(competitor_index=store)
+
+    checks = service.check_differentiation([TITLES[0], "처음 보는 문구"], "바퀴벌레")
+    assert checks[0]["nearest_competitor"]["title"] == TITLES[0]
+    assert checks[0]["differentiation"] < checks[1]["differentiation"]
+    assert HookService().check_differentiation(["훅"], "바퀴벌레") == []
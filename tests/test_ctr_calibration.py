@@ -0,0 +1,107 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import services.ctr_predictor as ctr_predictor
+from infrastructure.database.models import Base, CTRFeedback
+from services.ctr_calibration import CTRCalibrator
+from services.ctr_feedback_loop import CTRFeedbackLoop
+from services.ctr_predictor import CTRPredictor
+
+# 실제 CTR = 0.5 * 예측 + 1
+PAIRS = [(x, 0.5 * x + 1) for x in (3.0, 5.0, 7.0, 9.0, 11.0, 13.0)]
+
+
+def test_calibrator_fits_online_and_persists(tmp_path):
+    path = tmp_path / "calibration.json"
+    calibrator = CTRCalibrator(path, prior_samples=0)
+    assert calibrator.apply(8.0) == 8.0  # 표본이 없으면 그대로
+
+    for predicted, actual in PAIRS:
+        calibrator.update(predicted, actual)
+    intercept, slope = calibrator.coefficients
+    assert abs(intercept - 1.0) < 1e-9 and abs(slope - 0.5) < 1e-9
+
+    reloaded = CTRCalibrator(path, prior_samples=0)
+    assert reloaded.sample_count == len(PAIRS)
+    assert abs(reloaded.apply(8.0) - 5.0) < 1e-9
+
+
+def test_calibrator_shrinks_small_samples_toward_identity():
+    calibrator = CTRCalibrator(prior_samples=20)
+    calibrator.update_many(PAIRS[:2], save=False)
+    # 표본 2건이면 보정식 비중은 2/22
+    assert 5.0 < calibrator.apply(8.0) < 8.0
+    assert calibrator.apply(8.0) > 8.0 - (8.0 - 5.0) * 0.2
+    # 순서를 뒤집는 음의 기울기는 0으로 제한
+    inverse = CTRCalibrator(prior_samples=0)
+    inverse.update_many([(3.0, 9.0), (9.0, 3.0)], save=False)
+    assert inverse.coefficients[1] == 0.0
+
+
+def test_feedback_loop_updates_calibrator_in_memory():
+    calibrator = CTRCalibrator(prior_samples=0)
+    loop = CTRFeedbackLoop(calibrator=calibrator)
+
+    async def run():
+        for i, (predicted, _) in enumerate(PAIRS):
+            await loop.record_prediction(f"v{i}", predicted)
+        for i, (_, actual) in enumerate(PAIRS):
+            await loop.record_actual(f"v{i}", actual)
+        assert await loop.record_actual("unknown", 1.0) is None
+
+    asyncio.run(run())
+    assert calibrator.sample_count == len(PAIRS)
+    assert abs(calibrator.apply(8.0) - 5.0) < 1e-9
+
+
+def test_backfill_streams_feedback_table(tmp_path):
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'feedback.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+        async with factory() as session:
+            session.add_all(
+                CTRFeedback(video_id=f"v{i}", predicted_ctr=p, actual_ctr=a, error=a - p)
+                for i, (p, a) in enumerate(PAIRS)
+            )
+            session.add(CTRFeedback(video_id="pending", predicted_ctr=6.0))
+            await session.commit()
+
+            calibrator = CTRCalibrator(tmp_path / "calibration.json", prior_samples=0)
+            calibrator.update(100.0, 0.0, save=False)  # reset 대상
+            loop = CTRFeedbackLoop(session, calibrator)
+            count = await loop.backfill_calibration(batch_size=4)
+        await engine.dispose()
+        return count, calibrator
+
+    count, calibrator = asyncio.run(run())
+    assert count == len(PAIRS)
+    assert abs(calibrator.apply(8.0) - 5.0) < 1e-9
+    assert CTRCalibrator(tmp_path / "calibration.json").sample_count == len(PAIRS)
+
+
+def test_predictor_applies_calibration(monkeypatch):
+    class NullEvaluator:
+        def log_prediction(self, *args, **kwargs):
+            pass
+
+        def log_predictions(self, *args, **kwargs):
+            pass
+
+    monkeypatch.setattr(ctr_predictor, "ModelEvaluator", NullEvaluator)
+    title = "바퀴벌레 퇴치 꿀팁 3가지"
+    raw = CTRPredictor().predict_ctr(title)
+    assert "raw_predicted_ctr" not in raw
+
+    calibrator = CTRCalibrator(prior_samples=0)
+    calibrator.update_many(PAIRS, save=False)
+    predictor = CTRPredictor(calibrator=calibrator)
+    result = predictor.predict_ctr(title)
+    assert result["raw_predicted_ctr"] == raw["predicted_ctr"]
+    assert abs(result["predicted_ctr"] - (0.5 * raw["predicted_ctr"] + 1)) <= 0.01
+
+    batch = predictor.predict_batch([title])
+    assert batch[0]["predicted_ctr"] == result["predicted_ctr"]
+    assert batch[0]["raw_predicted_ctr"] == raw["predicted_ctr"]
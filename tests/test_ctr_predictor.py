@@ -1,4 +1,10 @@
+import asyncio
+from types import SimpleNamespace
+
+import api.v1.endpoints.pipeline as pipeline
 import services.ctr_predictor as ctr_predictor
+from core.state import PIPELINE_RESULTS, PIPELINE_STATUS
+from schemas.requests import CTRPredictRequest
 from services.ctr_predictor import CTRPredictor
 
 
@@ -51,3 +57,85 @@ def test_predict_ctr_logs(monkeypatch):
     predictor = CTRPredictor()
     predictor.predict_ctr(title="로그 테스트")
     assert evaluator.logged
+
+
+class NullEvaluator:
+    def log_prediction(self, model_name, input_data, output, ground_truth=None):
+        pass
+
+    def log_predictions(self, model_name, records):
+        self.batch = records
+
+
+def test_predict_batch_matches_single_predictions(monkeypatch):
+    evaluator = NullEvaluator()
+    monkeypatch.setattr(ctr_predictor, "ModelEvaluator", lambda: evaluator)
+    predictor = CTRPredictor()
+    competitors = ["제품 소개 리뷰", "3가지 비교 리뷰", "솔직 후기", "", "충격 반전 결과"]
+    titles = [
+        "충격! 3가지 방법으로 개선하는 비결",
+        "제품 소개 리뷰",
+        "😀 매일 쓰는 꿀팁 공개 😀 이거 모르면 손해? 필수 체크 리스트 총정리 영상입니다",
+        "",
+        "비밀 비밀 비밀",
+        "🔥" * 7 + " 경고 긴급 주의 반전 충격",
+    ]
+
+    batch = predictor.predict_batch(
+        titles, competitor_titles=competitors, thumbnail_description="밝은 얼굴 텍스트"
+    )
+
+    assert [r["rank"] for r in batch] == list(range(1, len(titles) + 1))
+    assert [r["predicted_ctr"] for r in batch] == sorted(
+        (r["predicted_ctr"] for r in batch), reverse=True
+    )
+    assert len(evaluator.batch) == len(titles)
+    for row in batch:
+        single = predictor.predict_ctr(
+            row["title"], "밝은 얼굴 텍스트", competitor_titles=competitors
+        )
+        assert row["title"] == titles[row["variation_id"] - 1]
+        assert row["predicted_ctr"] == single["predicted_ctr"]
+        assert row["total_score"] == single["total_score"]
+        assert row["breakdown"] == single["breakdown"]
+        assert row["recommendations"] == single["recommendations"]
+
+
+def test_compare_variations_ranks_with_top_k(monkeypatch):
+    monkeypatch.setattr(ctr_predictor, "ModelEvaluator", NullEvaluator)
+    predictor = CTRPredictor()
+    variations = [{"title": "소개"}, {"title": "충격 반전 꿀팁 3가지 방법, 모르면 손해인 이유?"}]
+
+    ranked = predictor.compare_variations(variations)
+    assert [r["variation_id"] for r in ranked] == [2, 1]
+    assert predictor.predict_batch(variations, top_k=1)[0]["variation_id"] == 2
+
+
+def test_ctr_endpoint_batch_uses_shared_thumbnail_description(monkeypatch):
+    monkeypatch.setattr(ctr_predictor, "ModelEvaluator", NullEvaluator)
+    predictor = CTRPredictor()
+    monkeypatch.setattr(
+        pipeline, "get_services", lambda: SimpleNamespace(ctr_predictor=predictor)
+    )
+    monkeypatch.setitem(PIPELINE_STATUS, "task-ctr", {"status": "completed"})
+    monkeypatch.setitem(PIPELINE_RESULTS, "task-ctr", {"product_name": ""})
+
+    title = "충격! 3가지 방법으로 개선하는 비결"
+    request = CTRPredictRequest(
+        task_id="task-ctr",
+        thumbnail_description="밝은 배경, 큰 텍스트, 얼굴 강조",
+        variations=[
+            {"title": title},
+            {"title": title, "thumbnail_description": "어두운 배경"},
+        ],
+    )
+    response = asyncio.run(pipeline.predict_ctr(request))
+
+    by_id = {row["variation_id"]: row for row in response["predictions"]}
+    shared = predictor.predict_batch(
+        [title], thumbnail_description="밝은 배경, 큰 텍스트, 얼굴 강조"
+    )
+    own = predictor.predict_batch([title], thumbnail_description="어두운 배경")
+    assert by_id[1]["breakdown"]["thumbnail"] == shared[0]["breakdown"]["thumbnail"]
+    assert by_id[2]["breakdown"]["thumbnail"] == own[0]["breakdown"]["thumbnail"]
+    assert by_id[1]["breakdown"]["thumbnail"] != by_id[2]["breakdown"]["thumbnail"]
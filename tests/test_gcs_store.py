@@ -0,0 +1,99 @@
+import base64
+import hashlib
+import io
+
+import pytest
+
+from core.exceptions import GCSDownloadError
+from utils.gcs_store import parse_gcs_uri, stream_blob_to_file, transfer_video
+
+
+class TrackingReader(io.BytesIO):
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.max_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = super().read(size)
+        self.max_read = max(self.max_read, len(chunk))
+        return chunk
+
+
+class FakeBlob:
+    def __init__(self, data: bytes, md5_hash: str | None = None) -> None:
+        self.name = "videos/sample.mp4"
+        self.data = data
+        self.md5_hash = md5_hash
+        self.reader: TrackingReader | None = None
+
+    def reload(self) -> None:
+        pass
+
+    def open(self, mode: str, chunk_size: int | None = None) -> TrackingReader:
+        self.reader = TrackingReader(self.data)
+        return self.reader
+
+
+class FakeStorage:
+    def __init__(self, copy_ok: bool = True) -> None:
+        self.copy_ok = copy_ok
+        self.calls: list[tuple] = []
+
+    def copy(self, source_path: str, dest_path: str, source_bucket: str | None = None) -> bool:
+        self.calls.append(("copy", source_bucket, source_path, dest_path))
+        return self.copy_ok
+
+    def upload_file(self, local_path, path: str, content_type: str = "video/mp4") -> bool:
+        self.calls.append(("upload_file", str(local_path), path))
+        return True
+
+
+def _md5(data: bytes) -> str:
+    return base64.b64encode(hashlib.md5(data).digest()).decode("ascii")
+
+
+def test_stream_blob_to_file_writes_in_chunks_and_verifies(tmp_path):
+    data = bytes(range(256)) * 1000
+    blob = FakeBlob(data, md5_hash=_md5(data))
+    dest = tmp_path / "out" / "video.mp4"
+
+    size, md5_hash = stream_blob_to_file(blob, dest, chunk_size=4096)
+
+    assert dest.read_bytes() == data
+    assert size == len(data)
+    assert md5_hash == blob.md5_hash
+    assert blob.reader.max_read == 4096
+
+
+def test_stream_blob_to_file_rejects_checksum_mismatch(tmp_path):
+    blob = FakeBlob(b"x" * 5000, md5_hash=_md5(b"other"))
+    dest = tmp_path / "video.mp4"
+
+    with pytest.raises(GCSDownloadError):
+        stream_blob_to_file(blob, dest, chunk_size=1024)
+
+    assert not dest.exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_transfer_video_prefers_server_side_copy(tmp_path):
+    storage = FakeStorage()
+    transfer_video(storage, "dest/video.mp4", gcs_uri="gs://veo-out/videos/a.mp4")
+    assert storage.calls == [("copy", "veo-out", "videos/a.mp4", "dest/video.mp4")]
+
+
+def test_transfer_video_falls_back_to_file_upload(tmp_path):
+    local = tmp_path / "video.mp4"
+    local.write_bytes(b"data")
+    storage = FakeStorage(copy_ok=False)
+
+    transfer_video(
+        storage, "dest/video.mp4", gcs_uri="gs://veo-out/a.mp4", local_path=str(local)
+    )
+
+    assert storage.calls[-1] == ("upload_file", str(local), "dest/video.mp4")
+
+
+def test_parse_gcs_uri():
+    assert parse_gcs_uri("gs://bucket/a/b.mp4") == ("bucket", "a/b.mp4")
+    assert parse_gcs_uri("gs://bucket") == ("bucket", "")
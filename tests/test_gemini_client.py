@@ -0,0 +1,81 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from infrastructure.clients.gemini_client import GeminiClient
+from utils.concurrency import shared_limiter
+
+PRODUCT = {"name": "모기 퇴치기", "target": "모기", "category": "해충"}
+IMAGE_MODEL = "test-shared-image-limit"
+IMAGE_LIMIT = 2
+
+
+class GatedImageModels:
+    """client.models.generate_content 스텁: gate가 열릴 때까지 대기 후 프롬프트를 이미지로 반환"""
+
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.active = 0
+        self.peak = 0
+        self._cond = threading.Condition()
+
+    def generate_content(self, model, contents, config):
+        with self._cond:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self._cond.notify_all()
+        try:
+            self.gate.wait(timeout=5)
+        finally:
+            with self._cond:
+                self.active -= 1
+        part = SimpleNamespace(inline_data=SimpleNamespace(data=contents.encode("utf-8")))
+        return SimpleNamespace(
+            candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))]
+        )
+
+    def wait_active(self, count: int) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self.active >= count, timeout=5)
+
+
+def test_multiple_thumbnails_keep_order_within_shared_limit():
+    models = GatedImageModels()
+    # 같은 이미지 모델을 쓰는 두 클라이언트는 리미터 하나를 공유
+    clients = [
+        GeminiClient(
+            project_id="test",
+            location="test",
+            image_model=IMAGE_MODEL,
+            image_max_concurrency=IMAGE_LIMIT,
+        )
+        for _ in range(2)
+    ]
+    for client in clients:
+        client._get_client = lambda: SimpleNamespace(models=models)
+    hooks = [["훅 A1", "훅 A2", "훅 A3"], ["훅 B1", "훅 B2", "훅 B3"]]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(
+                client.generate_multiple_thumbnails,
+                PRODUCT,
+                hook_texts,
+                styles=["비비드", "누아르"],
+            )
+            for client, hook_texts in zip(clients, hooks, strict=True)
+        ]
+        # 클라이언트별 워커 2개 x 2 = 4개 스레드가 경쟁해도 상한만큼 호출 중이면
+        # 공유 리미터가 모두 점유되어 있어야 함
+        assert models.wait_active(IMAGE_LIMIT)
+        limiter = shared_limiter(f"gemini-image:{IMAGE_MODEL}", IMAGE_LIMIT)
+        assert not limiter.acquire(blocking=False)
+        models.gate.set()
+        results = [future.result() for future in futures]
+
+    for result, hook_texts in zip(results, hooks, strict=True):
+        assert [r["hook_text"] for r in result] == hook_texts
+        assert [r["style"] for r in result] == ["비비드", "누아르", "비비드"]
+        for row in result:
+            assert row["hook_text"].encode("utf-8") in row["image"]
+    assert models.peak == IMAGE_LIMIT
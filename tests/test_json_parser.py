@@ -0,0 +1,34 @@
+from api import validate_json_output
+from utils.json_parser import extract_json, extract_json_text, parse_llm_json
+
+
+def test_extract_json_skips_braces_inside_strings():
+    text = '설명입니다 ```json\n{"a": "x}{", "b": "\\"}"}\n``` 끝'
+    assert extract_json(text) == {"a": "x}{", "b": '"}'}
+
+
+def test_extract_json_removes_trailing_commas_outside_strings():
+    text = '{"items": [1, 2, ], "note": "a, ]",}'
+    assert extract_json(text) == {"items": [1, 2], "note": "a, ]"}
+
+
+def test_extract_json_recovers_truncated_array():
+    text = '{"results": [{"index": 0, "features": {"k": "}"}}, {"index": 1}, {"index": 2, "feat'
+    assert extract_json(text) is None
+    recovered = extract_json(text, allow_partial=True)
+    assert recovered == {"results": [{"index": 0, "features": {"k": "}"}}, {"index": 1}]}
+
+
+def test_extract_json_array_opener():
+    assert extract_json('[{"hook": "a"}, {"hook": "b"', opener="[", allow_partial=True) == [
+        {"hook": "a"}
+    ]
+    assert extract_json_text("no json here") is None
+
+
+def test_parse_llm_json_matches_legacy_contract():
+    assert parse_llm_json("text only")["error"] == "JSON을 찾을 수 없음"
+    assert parse_llm_json('{"a": ')["error"] == "JSON 파싱 실패"
+    result = validate_json_output('{"a": 1}', required_fields=["a", "b"])
+    assert result["a"] == 1
+    assert "_validation_warning" in result
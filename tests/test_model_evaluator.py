@@ -13,3 +13,44 @@ def test_log_and_report():
     report = evaluator.generate_report()
     assert "test_model" in report
     shutil.rmtree(output_dir)
+
+
+def test_partitions_and_incremental_index(tmp_path):
+    evaluator = ModelEvaluator(output_dir=str(tmp_path))
+    evaluator.log_prediction("ctr", {}, {"predicted_ctr": 5.0}, {"actual_ctr": 6.0})
+    evaluator.log_predictions("ctr", [({}, {"predicted_ctr": 7.0}), ({}, {})])
+
+    store = evaluator._store
+    (day,) = store.days("ctr")
+    stats = store.partition_stats("ctr")[day]
+    assert (stats.count, stats.value_count, stats.error_count) == (3, 2, 1)
+    assert stats.mean == 6.0 and stats.mae == 1.0
+    assert (tmp_path / "ctr" / "_index.json").exists()
+
+    # 색인 이후 다른 인스턴스가 추가한 줄과 쓰는 중인 마지막 줄
+    ModelEvaluator(output_dir=str(tmp_path)).log_prediction("ctr", {}, {"score": 1.0})
+    with (tmp_path / "ctr" / f"{day}.jsonl").open("a", encoding="utf-8") as handle:
+        handle.write('{"output":{"score":')
+    stats = store.aggregate("ctr")
+    assert stats.count == 4 and stats.value_sum == 13.0
+    assert store.days("ctr", start="99990101") == []
+
+
+def test_compare_models_and_legacy_migration(tmp_path):
+    legacy = tmp_path / "old_model_20250101.jsonl"
+    legacy.write_text(
+        '{"model":"old_model","output":{"score":0.5},"ground_truth":{"score":1.0}}\n',
+        encoding="utf-8",
+    )
+    evaluator = ModelEvaluator(output_dir=str(tmp_path))
+    assert not legacy.exists()
+    evaluator.log_prediction("new_model", {}, {"score": 0.9}, {"score": 1.0})
+
+    report = evaluator.generate_report()
+    assert "old_model_20250101: 1건" in report
+    comparison = evaluator.compare_models("old_model", "new_model")
+    assert comparison["summary_a"]["mae"] == 0.5
+    assert comparison["better_by_mae"] == "new_model"
+    assert evaluator.compare_models("old_model", "new_model", end="20250101")[
+        "summary_b"
+    ]["count"] == 0
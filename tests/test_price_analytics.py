@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from infrastructure.storage.price_history_store import PriceHistoryStore
+from utils.price_analytics import (
+    label_shares,
+    price_array,
+    price_histogram,
+    summarize_prices,
+)
+
+
+def make_products(prices, brands=None, malls=None):
+    brands = brands or [""] * len(prices)
+    malls = malls or [""] * len(prices)
+    return [
+        {"price": price, "brand": brand, "mall": mall}
+        for price, brand, mall in zip(prices, brands, malls, strict=True)
+    ]
+
+
+def test_summary_matches_legacy_competitor_stats():
+    products = make_products(
+        [0, 9999, 10000, 29999, 30000, 50000, 99999, 100000, 250000],
+        brands=["A", "B", "A", "", "C", "B", "A", "C", "C"],
+        malls=["m1"] * 9,
+    )
+
+    stats = summarize_prices(products)
+
+    assert stats["total_products"] == 9
+    assert stats["min_price"] == 9999
+    assert stats["max_price"] == 250000
+    assert stats["avg_price"] == sum(p["price"] for p in products) // 8
+    assert stats["price_distribution"] == {
+        "0-10000": 1,
+        "10000-30000": 2,
+        "30000-50000": 1,
+        "50000-100000": 2,
+        "100000+": 2,
+    }
+    # 동률(A, C 3개)은 먼저 등장한 브랜드 우선
+    assert stats["top_brands"] == ["A", "C", "B"]
+    assert stats["brand_share"]["A"] == 0.375
+    assert stats["top_malls"] == ["m1"]
+    assert stats["percentiles"]["p50"] == 40000.0
+
+
+def test_histogram_custom_bins_and_large_input():
+    rng = np.random.default_rng(0)
+    prices = rng.integers(1, 200_000, size=200_000)
+
+    histogram = price_histogram(prices, bins=(0, 50_000, 100_000, 200_000))
+
+    assert list(histogram) == ["0-50000", "50000-100000", "100000-200000"]
+    assert sum(histogram.values()) == prices.size
+
+
+def test_empty_and_unlabeled_inputs():
+    assert summarize_prices([])["price_distribution"] == {}
+    assert summarize_prices(make_products([0, 0]))["total_products"] == 2
+    assert label_shares(["", ""]) == []
+    assert price_array(make_products([0, 100])).tolist() == [100]
+
+
+def test_price_history_store_appends_and_reports_drift(tmp_path):
+    store = PriceHistoryStore(tmp_path, max_rows=3)
+    now = datetime.now().astimezone()
+    for days_ago, median in ((40, 5000), (20, 10000), (10, 11000), (0, 12000)):
+        stats = summarize_prices(make_products([median - 1000, median, median + 1000]))
+        store.append("모기 퇴치기", stats, at=now - timedelta(days=days_ago))
+
+    # 상한(3행)을 넘긴 가장 오래된 행은 제거됨
+    assert store.load("모기 퇴치기")["p50"].tolist() == [10000, 11000, 12000]
+
+    drift = store.drift("모기 퇴치기", days=30)
+    assert drift["samples"] == 3
+    assert drift["p50_change"] == 2000
+    assert drift["p50_change_pct"] == 20.0
+    assert drift["p50_slope_per_day"] == 100.0
+
+    assert store.drift("없는 제품")["samples"] == 0
@@ -0,0 +1,66 @@
+import json
+
+from core.prompts import (
+    PromptTemplate,
+    chatbot_prompts,  # noqa: F401
+    compact_json,
+    ctr_prediction_prompts,  # noqa: F401
+    estimate_tokens,
+    hydration_prompts,  # noqa: F401
+    marketing_prompts,  # noqa: F401
+    prompt_registry,
+    social_media_prompts,  # noqa: F401
+    studio_prompts,  # noqa: F401
+    track_prompt_usage,
+)
+
+
+def test_compiled_render_matches_format_map():
+    for name in prompt_registry.usage_report():
+        template = prompt_registry.get(name)
+        values = {field: f"<{field}>" for field in template.fields}
+        assert template.render(**values) == template.template.format_map(values)
+
+
+def test_render_serializes_structured_values_compactly():
+    template = PromptTemplate(name="test.compact", template="data={data} n={n}")
+    text = template.render(data={"a": [1, 2], "b": "한글"}, n=3)
+    assert text == 'data={"a":[1,2],"b":"한글"} n=3'
+
+
+def test_compact_json_respects_budget():
+    data = {"items": [{"title": "x" * 50, "idx": i} for i in range(100)]}
+    text = compact_json(data, max_chars=500)
+    assert len(text) <= 500
+    # 리스트 축소로 예산을 맞추면 여전히 유효한 JSON
+    assert json.loads(text)["items"][0]["idx"] == 0
+
+
+def test_field_json_budget_applies_per_template():
+    template = PromptTemplate(
+        name="test.budget",
+        template="{rows}",
+        json_budgets={"rows": 200},
+    )
+    text = template.render(rows=list(range(1000)))
+    assert len(text) <= 200
+
+
+def test_track_prompt_usage_scopes_per_run():
+    template = PromptTemplate(name="test.usage", template="hello {who}")
+    template.render(who="outside")
+    with track_prompt_usage() as usage:
+        template.render(who="world")
+        template.render(who="세계")
+    snapshot = usage.snapshot()["test.usage"]
+    assert snapshot["renders"] == 2
+    assert snapshot["chars"] == len("hello world") + len("hello 세계")
+    assert snapshot["est_tokens"] == estimate_tokens("hello world") + estimate_tokens(
+        "hello 세계"
+    )
+
+
+def test_estimate_tokens_weights_non_ascii():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd" * 10) == 10
+    assert estimate_tokens("가" * 16) == 10
@@ -0,0 +1,129 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from services.cache_warmer import CacheWarmer, QuotaBudget, WarmTarget
+from utils.cron import KST, next_cron_time
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class FakeSession:
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        return FakeResult(self._rows)
+
+
+class RecordingService:
+    def __init__(self):
+        self.calls = []
+
+    def collect_product_data(self, product, **kwargs):
+        self.calls.append((product["name"], kwargs))
+        return {}
+
+    async def collect_product_data_async(self, product, **kwargs):
+        return self.collect_product_data(product, **kwargs)
+
+    def get_market_trends(self, product):
+        self.calls.append((product["name"], {}))
+        return {}
+
+
+def make_schedule(schedule_id, cron, product="제품A", **config):
+    return SimpleNamespace(
+        id=schedule_id,
+        cron_expression=cron,
+        timezone="Asia/Seoul",
+        product_name=product,
+        config_json=json.dumps({"youtube_count": 3, "naver_count": 10, **config}),
+    )
+
+
+def make_warmer(rows, youtube, naver, trends=None, daily_units=2000):
+    return CacheWarmer(
+        youtube_service=youtube,
+        naver_service=naver,
+        market_trend_service=trends,
+        session_factory=lambda: FakeSession(rows),
+        lead_time=timedelta(minutes=5),
+        youtube_daily_units=daily_units,
+        product_resolver=lambda name: {"name": name},
+    )
+
+
+def test_next_cron_time_daily_and_weekly():
+    after = datetime(2026, 10, 19, 15, 58, tzinfo=KST)  # 월요일
+    assert next_cron_time("0 16 * * *", after) == datetime(2026, 10, 19, 16, 0, tzinfo=KST)
+    assert next_cron_time("0 16 * * 3,5", after) == datetime(2026, 10, 21, 16, 0, tzinfo=KST)
+    assert next_cron_time("*/15 * * * *", after) == datetime(2026, 10, 19, 16, 0, tzinfo=KST)
+
+
+def test_warms_only_schedules_within_lead_time_and_dedupes():
+    now = datetime(2026, 10, 19, 15, 57, tzinfo=KST)
+    rows = [
+        make_schedule(1, "0 16 * * *"),
+        make_schedule(2, "0 16 * * *"),  # 같은 수집 인자 → 한 번만 예열
+        make_schedule(3, "0 18 * * *", product="제품B"),
+    ]
+    youtube, naver, trends = RecordingService(), RecordingService(), RecordingService()
+    warmer = make_warmer(rows, youtube, naver, trends)
+
+    report = asyncio.run(warmer.warm_upcoming(now))
+
+    assert report == [
+        {
+            "schedule_ids": [1, 2],
+            "product_name": "제품A",
+            "run_at": datetime(2026, 10, 19, 16, 0, tzinfo=KST).isoformat(),
+            "status": "warmed",
+        }
+    ]
+    assert youtube.calls == [
+        ("제품A", {"max_results": 3, "include_comments": True})
+    ]
+    assert naver.calls == [("제품A", {"max_results": 10})]
+    assert trends.calls == [("제품A", {})]
+
+    again = asyncio.run(warmer.warm_upcoming(now + timedelta(minutes=1)))
+    assert again[0]["status"] == "already_warmed"
+    assert len(youtube.calls) == 1
+
+
+def test_quota_budget_skips_when_exhausted():
+    now = datetime(2026, 10, 19, 15, 57, tzinfo=KST)
+    rows = [make_schedule(1, "0 16 * * *"), make_schedule(2, "0 16 * * *", product="제품B")]
+    youtube, naver = RecordingService(), RecordingService()
+    units = WarmTarget("x").youtube_units
+    warmer = make_warmer(rows, youtube, naver, daily_units=units)
+
+    report = asyncio.run(warmer.warm_upcoming(now))
+
+    assert [r["status"] for r in report] == ["warmed", "skipped_quota"]
+    assert len(youtube.calls) == 1
+
+
+def test_quota_budget_resets_daily():
+    budget = QuotaBudget(daily_units=100)
+    day = datetime(2026, 10, 19).date()
+    assert budget.try_consume(100, today=day)
+    assert not budget.try_consume(1, today=day)
+    assert budget.try_consume(100, today=day + timedelta(days=1))
@@ -0,0 +1,78 @@
+from services.chatbot_service import ChatbotService
+from utils.json_parser import StreamingFieldDecoder
+
+
+class StubRAGClient:
+    def search(self, query: str, max_results: int = 5, data_store_id: str | None = None) -> list[dict]:
+        return [{"title": "doc", "url": "https://example.com", "snippet": "s"}]
+
+    def upsert_documents(self, documents: list[dict], data_store_id: str | None = None) -> int:
+        return 0
+
+    def is_configured(self) -> bool:
+        return True
+
+
+class StreamingGeminiClient:
+    def __init__(self, chunks: list[str]) -> None:
+        self.chunks = chunks
+
+    def generate_text(self, prompt: str, temperature: float = 0.7, use_grounding: bool = False) -> str:
+        return "".join(self.chunks)
+
+    def generate_text_stream(self, prompt: str, temperature: float = 0.7, use_grounding: bool = False):
+        yield from self.chunks
+
+
+def test_streaming_field_decoder_handles_split_escapes():
+    parser = StreamingFieldDecoder("answer")
+    chunks = ['```json\n{"ans', 'wer": "줄\\', 'n바꿈 \\u00', 'e9 \\"인용\\"', '", "card": {"ti']
+    text = "".join(parser.feed(chunk) for chunk in chunks)
+    assert text == '줄\n바꿈 é "인용"'
+    assert parser.feed('tle": "x"}}') == ""
+
+
+def test_streaming_field_decoder_passes_through_plain_text():
+    parser = StreamingFieldDecoder("answer")
+    assert parser.feed("그냥 ") + parser.feed("텍스트") == "그냥 텍스트"
+
+
+def test_stream_reply_event_order_and_history():
+    chunks = ['{"answer": "안녕', '하세요", "card": {"title": "T", ', '"bullets": ["a"]}}']
+    service = ChatbotService(
+        gemini_client=StreamingGeminiClient(chunks),
+        rag_client=StubRAGClient(),
+    )
+
+    events = list(service.stream_reply("질문", session_id="s1"))
+    names = [e["event"] for e in events]
+
+    assert names[:2] == ["session", "sources"]
+    assert names[-1] == "done"
+    assert "".join(e["data"]["text"] for e in events if e["event"] == "token") == "안녕하세요"
+
+    done = events[-1]["data"]
+    assert done["message"] == "안녕하세요"
+    assert done["card"] == {"title": "T", "bullets": ["a"]}
+
+    session = service._sessions["s1"]
+    assert [(m.role, m.content) for m in session.messages] == [
+        ("user", "질문"),
+        ("ai", "안녕하세요"),
+    ]
+
+
+def test_stream_reply_records_partial_answer_on_disconnect():
+    chunks = ['{"answer": "부분', ' 응답', '", "card": null}']
+    service = ChatbotService(
+        gemini_client=StreamingGeminiClient(chunks),
+        rag_client=StubRAGClient(),
+    )
+
+    stream = service.stream_reply("질문", session_id="s2")
+    for event in stream:
+        if event["event"] == "token":
+            break
+    stream.close()
+
+    assert service._sessions["s2"].messages[-1].content == "부분"
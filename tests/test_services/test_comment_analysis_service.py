@@ -1,3 +1,6 @@
+import asyncio
+import threading
+
 from services.comment_analysis_service import CommentAnalysisService
 
 
@@ -17,3 +20,98 @@ def test_comment_analysis_basic():
     result = service.analyze_comments(comments)
     assert result["total_comments"] == 2
     assert "sentiment" in result
+
+
+class LoopRecordingGemini:
+    def __init__(self) -> None:
+        self.loops = []
+
+    async def generate_text_async(self, prompt: str, temperature: float = 0.7) -> str:
+        self.loops.append(asyncio.get_running_loop())
+        return '{"deep_pain_points": ["비싸요"], "marketing_hooks": ["h"], "executive_summary": "요약"}'
+
+
+class LoopRecordingPipeline:
+    def __init__(self, loops: list) -> None:
+        self.loops = loops
+
+    async def run_pipeline(self, comments):
+        self.loops.append(asyncio.get_running_loop())
+        return {"insights": [{"text": comments[0]["text"]}], "stats": {"total": len(comments)}}
+
+
+def test_analyze_with_ai_async_runs_on_caller_loop():
+    gemini = LoopRecordingGemini()
+    # 실제 파이프라인 단계 생성(설정 로드)을 피하기 위해 스텁을 직접 주입
+    service = CommentAnalysisService(gemini_client=None)
+    service._gemini = gemini
+    service.pipeline = LoopRecordingPipeline(gemini.loops)
+    comments = [{"text": "가격이 너무 비싸요", "likes": 1}]
+
+    async def run():
+        threads_before = threading.active_count()
+        result = await service.analyze_with_ai_async(comments)
+        return result, asyncio.get_running_loop(), threading.active_count() - threads_before
+
+    result, loop, new_threads = asyncio.run(run())
+
+    assert gemini.loops == [loop, loop]
+    assert new_threads == 0
+    assert result["summary"] == "[AI] 요약"
+    assert result["x_algorithm_insights"] == [{"text": "가격이 너무 비싸요"}]
+
+    # 동기 래퍼도 같은 결과
+    assert service.analyze_with_ai(comments)["ai_analysis"]["marketing_hooks"] == ["h"]
+
+
+class MapReduceGemini:
+    def __init__(self) -> None:
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+
+    async def generate_text_async(self, prompt: str, temperature: float = 0.7) -> str:
+        self.prompts.append(prompt)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if "Lead Voice-of-Customer" in prompt:
+            return '{"deep_pain_points": ["가격"], "marketing_hooks": ["훅"], "executive_summary": "통합"}'
+        return '{"pain_points": ["비싸요"], "hook_phrases": ["좋아요"], "summary": "요약"}'
+
+
+def test_plan_deep_analysis_chunks_stratifies_within_budget():
+    from services.comment_analysis_service import plan_deep_analysis_chunks
+
+    comments = (
+        [{"text": f"이거 어디서 사나요 {i}", "likes": i} for i in range(30)]
+        + [{"text": f"완전 최고 제품 {i}", "likes": i} for i in range(90)]
+        + [{"text": "완전 최고 제품 0"}, {"text": "짧음"}]
+    )
+    chunks, total = plan_deep_analysis_chunks(comments, chunk_size=10, max_chunks=4)
+
+    assert total == 120  # 중복/3자 이하 제외
+    assert sum(len(c.texts) for c in chunks) == 40
+    assert chunks[0].strata == ["질문"]
+    assert chunks[0].texts[0] == "이거 어디서 사나요 29"  # 층 안에서는 좋아요 순
+    assert sum(len(c.texts) for c in chunks if c.strata == ["긍정"]) == 30
+
+
+def test_analyze_with_ai_map_reduce_reports_coverage():
+    gemini = MapReduceGemini()
+    service = CommentAnalysisService(gemini_client=None, chunk_size=20, max_chunks=4)
+    service._gemini = gemini
+    comments = [{"text": f"배송이 빠르고 만족해요 {i}번째", "likes": i} for i in range(200)]
+
+    result = asyncio.run(service.analyze_with_ai_async(comments))
+
+    assert len(gemini.prompts) == 5  # map 4회 + reduce 1회
+    assert 1 < gemini.peak <= 5
+    assert result["ai_analysis"]["deep_pain_points"] == ["가격"]
+    assert result["summary"] == "[AI] 통합"
+    coverage = result["ai_coverage"]
+    assert coverage["mode"] == "map_reduce"
+    assert (coverage["comments_seen"], coverage["comments_total"]) == (80, 200)
+    assert coverage["llm_calls"] == 5
+    assert coverage["prompt_tokens"] > 0
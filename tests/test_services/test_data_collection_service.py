@@ -0,0 +1,172 @@
+import asyncio
+import threading
+
+import pytest
+
+from core.exceptions import DataCollectionError
+from core.models import PipelineConfig, PipelineStep
+from services.data_collection_service import DataCollectionService
+
+PRODUCT = {"name": "모기 퇴치기"}
+
+
+class BlockingSource:
+    """
+    수집 소스 스텁 (완료 순서 기록)
+
+    barrier를 주면 모든 소스가 동시에 시작되어야만 통과하고(순차 실행이면 타임아웃),
+    wait_for를 주면 그 이벤트가 설정된 뒤에 끝난다.
+    """
+
+    def __init__(
+        self,
+        events: list,
+        name: str,
+        fail: bool = False,
+        barrier: threading.Barrier | None = None,
+        wait_for: threading.Event | None = None,
+    ) -> None:
+        self.events = events
+        self.name = name
+        self.fail = fail
+        self.barrier = barrier
+        self.wait_for = wait_for
+
+    def _run(self, result):
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        if self.wait_for is not None and not self.wait_for.wait(timeout=5):
+            raise TimeoutError(f"{self.name} waited too long")
+        if self.fail:
+            raise RuntimeError(f"{self.name} down")
+        self.events.append(f"{self.name}_done")
+        return result
+
+    def collect_product_data(self, product, **kwargs):
+        return self._run(
+            {
+                "videos": [{"id": "v1", "comments": [{"text": "여름마다 모기 때문에 잠을 못 자요", "author": "a", "likes": 3}]}],
+                "pain_points": [{"text": "pain"}],
+            }
+        )
+
+    async def collect_product_data_async(self, product, **kwargs):
+        return await asyncio.to_thread(self.collect_product_data, product, **kwargs)
+
+    def get_market_trends(self, product):
+        return self._run({"trend": "up"})
+
+
+class RecordingOrchestrator:
+    def __init__(self, events: list, started: threading.Event | None = None) -> None:
+        self.events = events
+        self.started = started
+
+    async def run_pipeline(self, comments):
+        self.events.append("analysis_started")
+        if self.started is not None:
+            self.started.set()
+        return {"insights": [{"text": c["text"]} for c in comments]}
+
+
+def make_service(events, barrier=None, analysis_started=None, **fail):
+    return DataCollectionService(
+        youtube_service=BlockingSource(events, "youtube", fail.get("youtube", False), barrier),
+        naver_service=BlockingSource(
+            events, "naver", fail.get("naver", False), barrier, wait_for=analysis_started
+        ),
+        pipeline_orchestrator=RecordingOrchestrator(events, analysis_started),
+        market_trend_service=BlockingSource(events, "trend", fail.get("trend", False), barrier),
+    )
+
+
+def test_sources_run_concurrently_and_analysis_starts_after_youtube():
+    events: list[str] = []
+    progress: list[PipelineStep] = []
+    # 세 소스가 모두 시작해야 배리어를 통과, 네이버는 댓글 분석이 시작된 뒤에야 끝남
+    # -> 소스가 순차 실행되거나 분석이 모든 소스를 기다리면 타임아웃으로 실패
+    service = make_service(
+        events, barrier=threading.Barrier(3), analysis_started=threading.Event()
+    )
+
+    data = asyncio.run(
+        service.collect_all_data_async(
+            PRODUCT, PipelineConfig(), lambda step, message: progress.append(step)
+        )
+    )
+
+    assert data.source_errors == {}
+    assert events.index("analysis_started") < events.index("naver_done")
+    assert data.top_insights == [{"text": "여름마다 모기 때문에 잠을 못 자요"}]
+    assert data.naver_data and data.market_trends == {"trend": "up"}
+    # 완료 순서와 무관하게 진행 단계는 되돌아가지 않음
+    order = [list(PipelineStep).index(step) for step in progress]
+    assert order == sorted(order)
+    assert progress[-1] == PipelineStep.COMMENT_ANALYSIS
+
+
+def test_failed_source_degrades_and_both_failing_raises():
+    events: list[str] = []
+    data = make_service(events, trend=True, naver=True).collect_all_data(PRODUCT, PipelineConfig())
+
+    assert set(data.source_errors) == {"naver", "market_trend"}
+    assert data.youtube_videos and data.naver_data is None
+
+    with pytest.raises(DataCollectionError):
+        make_service(events, youtube=True, naver=True).collect_all_data(PRODUCT, PipelineConfig())
+
+
+class CommentsYouTube:
+    def __init__(self, texts: list[str]) -> None:
+        self.texts = texts
+
+    def collect_product_data(self, product, **kwargs):
+        return {
+            "videos": [
+                {"id": "v1", "comments": [{"text": t, "author": "a", "likes": 1} for t in self.texts]}
+            ]
+        }
+
+
+class ScoringOrchestrator:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    async def run_pipeline(self, comments):
+        self.batches.append([c["text"] for c in comments])
+        return {
+            "insights": [
+                {"rank": i + 1, "content": c["text"], "score": len(c["text"])}
+                for i, c in enumerate(comments)
+            ],
+            "stats": {},
+        }
+
+
+class EmptyNaver:
+    def collect_product_data(self, product, **kwargs):
+        return {"products": []}
+
+
+def test_delta_collection_analyzes_only_new_comments():
+    old = ["여름마다 모기 때문에 잠을 못 자요", "소리가 조용해서 아기방에 두기 좋아요"]
+    new = "배터리가 오래 가서 캠핑 갈 때 꼭 챙겨요 정말 최고"
+    youtube = CommentsYouTube(old)
+    orchestrator = ScoringOrchestrator()
+    service = DataCollectionService(youtube, EmptyNaver(), orchestrator)
+
+    first = service.collect_all_data(PRODUCT, PipelineConfig())
+    assert len(first.analyzed_comment_keys) == 2
+
+    youtube.texts = [*old, new]
+    second = service.collect_all_data(PRODUCT, PipelineConfig(), previous=first)
+
+    assert orchestrator.batches[-1] == [new]
+    assert next(i["content"] for i in second.top_insights) == new
+    assert [i["rank"] for i in second.top_insights] == [1, 2]
+    assert len(second.analyzed_comment_keys) == 3
+
+    # 새 댓글이 없으면 분석 없이 이전 인사이트 유지
+    third = service.collect_all_data(PRODUCT, PipelineConfig(), previous=second)
+    assert len(orchestrator.batches) == 2
+    assert third.top_insights == second.top_insights
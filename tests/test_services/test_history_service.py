@@ -0,0 +1,93 @@
+import json
+import os
+from datetime import date
+
+import pytest
+
+from api.v1.endpoints.pipeline import _matches_history_filter
+from core.models.pipeline import PipelineResult
+from services.history_service import HistoryService
+
+
+def _write_meta(meta_dir, name, product, executed_at, success, mtime):
+    path = meta_dir / f"{name}.json"
+    path.write_text(
+        json.dumps(
+            {
+                "product_name": product,
+                "executed_at": executed_at,
+                "success": success,
+                "collected_data": {"top_insights": [{}, {}]},
+                "generated_content": {"video_url": "gs://v.mp4"} if success else {},
+            }
+        ),
+        encoding="utf-8",
+    )
+    os.utime(path, (mtime, mtime))
+
+
+def test_backfill_filters_and_cursor_pagination(tmp_path):
+    meta_dir = tmp_path / "metadata"
+    meta_dir.mkdir()
+    _write_meta(meta_dir, "meta_1", "벅스델타", "2026-01-01T10:00:00", True, 1000)
+    _write_meta(meta_dir, "meta_2", "버그킬러", "2026-01-02T10:00:00", False, 2000)
+    _write_meta(meta_dir, "meta_3", "벅스델타", "2026-01-03T10:00:00", True, 3000)
+    (meta_dir / "meta_broken.json").write_text("{", encoding="utf-8")
+
+    service = HistoryService(base_dir=tmp_path)
+    items = service.get_history_list()
+    assert [item["id"] for item in items] == ["meta_3", "meta_2", "meta_1"]
+    assert items[0]["top_insight_count"] == 2 and items[0]["has_video"] is True
+
+    first, cursor = service.query_history(limit=2)
+    second, last = service.query_history(cursor=cursor, limit=2)
+    assert [i["id"] for i in first + second] == ["meta_3", "meta_2", "meta_1"]
+    assert last is None
+
+    assert [i["id"] for i in service.query_history(product="벅스델타")[0]] == [
+        "meta_3",
+        "meta_1",
+    ]
+    assert [i["id"] for i in service.query_history(success=False)[0]] == ["meta_2"]
+    ranged, _ = service.query_history(
+        date_from=date(2026, 1, 2), date_to=date(2026, 1, 2)
+    )
+    assert [i["id"] for i in ranged] == ["meta_2"]
+    with pytest.raises(ValueError):
+        service.query_history(cursor="not-a-cursor")
+
+
+def test_save_and_delete_keep_index_in_sync(tmp_path):
+    service = HistoryService(base_dir=tmp_path)
+    assert service.get_history_list() == []
+
+    saved = service.save_result(PipelineResult(product_name="벅스델타", success=True))
+    history_id = os.path.splitext(os.path.basename(saved))[0]
+    items = service.get_history_list()
+    assert [i["id"] for i in items] == [history_id]
+    assert service.load_history(history_id).product_name == "벅스델타"
+
+    # 새 인스턴스는 backfill 없이 같은 색인을 재사용
+    assert [i["id"] for i in HistoryService(base_dir=tmp_path).get_history_list()] == [
+        history_id
+    ]
+    assert service.delete_history(history_id) is True
+    assert service.get_history_list() == []
+
+
+def test_in_memory_tasks_filter_by_terminal_status():
+    tasks = [
+        {"product": "벅스델타", "status": status, "created_at": "2026-10-18T09:00:00"}
+        for status in ("queued", "running", "success", "failed")
+    ]
+
+    def statuses(success):
+        return [
+            t["status"]
+            for t in tasks
+            if _matches_history_filter(t, None, success, None, date(2026, 10, 18))
+        ]
+
+    assert statuses(None) == ["queued", "running", "success", "failed"]
+    assert statuses(True) == ["success"]
+    assert statuses(False) == ["failed"]
@@ -1,6 +1,11 @@
+import asyncio
+
+import httpx
 import pytest
 
 from core.exceptions import DataCollectionError
+from infrastructure.clients.async_naver_client import AsyncNaverClient
+from infrastructure.storage.price_history_store import PriceHistoryStore
 from services.naver_service import NaverService
 from utils.cache import clear_all_api_cache
 
@@ -31,3 +36,114 @@ def test_naver_service_collect_product_data_error(sample_product):
     service = NaverService(client=FailingClient())
     with pytest.raises(DataCollectionError):
         service.collect_product_data(product=sample_product, max_results=1)
+
+
+def naver_transport(total: int, fail_path: str | None = None):
+    """start/display에 맞춰 total개 중 일부를 돌려주는 MockTransport"""
+    calls: list[tuple[str, int, int]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        start = int(request.url.params.get("start", 1))
+        display = int(request.url.params["display"])
+        calls.append((path, start, display))
+        if path == fail_path:
+            return httpx.Response(500)
+        end = min(start + display - 1, total)
+        items = [
+            {"title": f"<b>{i}</b>", "lprice": str(i * 100), "description": ""}
+            for i in range(start, end + 1)
+        ]
+        return httpx.Response(200, json={"total": total, "items": items})
+
+    return httpx.MockTransport(handler), calls
+
+
+def test_async_client_paginates_with_start_offset():
+    transport, calls = naver_transport(total=250)
+    client = AsyncNaverClient("id", "secret", transport=transport)
+
+    items = asyncio.run(client.collect("shop", "모기", limit=1000))
+
+    assert len(items) == 250
+    assert items[0]["title"] == "1"
+    assert [(start, display) for _, start, display in calls] == [(1, 100), (101, 100), (201, 100)]
+
+
+def test_async_client_stops_at_start_limit():
+    transport, calls = naver_transport(total=5000)
+    client = AsyncNaverClient("id", "secret", transport=transport)
+
+    items = asyncio.run(client.collect("blog", "모기", limit=5000))
+
+    assert len(items) == 1000
+    assert calls[-1][1] == 901
+
+
+def test_naver_service_search_all_runs_verticals_concurrently(mock_naver_client):
+    clear_all_api_cache()
+    transport, calls = naver_transport(total=3, fail_path="/v1/search/news.json")
+    service = NaverService(
+        client=mock_naver_client,
+        async_client=AsyncNaverClient("id", "secret", transport=transport),
+    )
+
+    result = asyncio.run(
+        service.search_all("모기 퇴치", 3, ("shop", "blog", "news"), raise_on_error=False)
+    )
+
+    assert [p["price"] for p in result["products"]] == [100, 200, 300]
+    assert len(result["blogs"]) == 3
+    assert result["news"] == []
+    assert {path for path, _, _ in calls} == {
+        "/v1/search/shop.json",
+        "/v1/search/blog.json",
+        "/v1/search/news.json",
+    }
+
+    with pytest.raises(DataCollectionError):
+        asyncio.run(service.search_all("모기 퇴치 실패", 3, ("news",)))
+
+
+def test_naver_service_search_all_falls_back_to_sync_client(mock_naver_client):
+    clear_all_api_cache()
+    service = NaverService(client=mock_naver_client)
+
+    result = asyncio.run(service.search_all("모기", 1, ("shop", "blog")))
+
+    assert set(result) == {"products", "blogs"}
+    assert len(result["products"]) == 1
+
+
+def test_collect_product_data_async_uses_cached_concurrent_search(tmp_path, sample_product):
+    clear_all_api_cache()
+    transport, calls = naver_transport(total=3)
+    history = PriceHistoryStore(tmp_path)
+
+    class SummaryClient:
+        def analyze_competitors(self, products):
+            prices = [p["price"] for p in products]
+            return {
+                "total_products": len(prices),
+                "min_price": min(prices),
+                "max_price": max(prices),
+                "avg_price": sum(prices) // len(prices),
+            }
+
+    service = NaverService(
+        client=SummaryClient(),
+        async_client=AsyncNaverClient("id", "secret", transport=transport),
+        price_history=history,
+    )
+
+    result = asyncio.run(service.collect_product_data_async(sample_product, max_results=3))
+    assert result["total_count"] == 3
+    assert result["competitor_stats"]["min_price"] == 100
+    assert len(result["blogs"]) == 3 and len(result["news"]) == 3
+    assert len(calls) == 3
+    assert history.load(sample_product["name"])["ts"].size == 1
+
+    # 예열과 예약 실행이 같은 인자로 부르면 search_all 캐시를 그대로 재사용
+    asyncio.run(service.collect_product_data_async(sample_product, max_results=3))
+    assert len(calls) == 3
+    clear_all_api_cache()
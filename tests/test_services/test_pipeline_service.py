@@ -1,6 +1,9 @@
+import asyncio
+
 import pytest
 
-from core.models import PipelineConfig
+from core.models import CollectedData, PipelineConfig
+from infrastructure.storage.collection_snapshot_store import CollectionSnapshotStore
 from services.data_collection_service import DataCollectionService
 from services.marketing_service import MarketingService
 from services.naver_service import NaverService
@@ -52,3 +55,62 @@ async def test_pipeline_service_execute_minimal(
     assert result.success is True
     assert result.product_name == sample_product["name"]
     assert result.collected_data is not None
+
+
+class CountingCollector:
+    def __init__(self) -> None:
+        self.calls: list[CollectedData | None] = []
+
+    async def collect_all_data_async(self, product, config, progress_callback=None, previous=None):
+        self.calls.append(previous)
+        return CollectedData(top_insights=[{"content": "c", "score": 1.0}])
+
+
+def make_snapshot_pipeline(collector, store):
+    return PipelineService(
+        data_collection_service=collector,
+        marketing_service=None,
+        thumbnail_service=None,
+        video_service=None,
+        storage_service=None,
+        history_service=None,
+        social_media_service=None,
+        snapshot_store=store,
+    )
+
+
+def test_reuse_collection_skips_step_one_when_snapshot_is_fresh(tmp_path, sample_product):
+    collector = CountingCollector()
+    store = CollectionSnapshotStore(tmp_path, ttl_seconds=600)
+    service = make_snapshot_pipeline(collector, store)
+    noop = lambda step, message="": None  # noqa: E731
+
+    config = PipelineConfig(reuse_collection="fresh")
+    _, first = asyncio.run(service._collect(sample_product, config, noop))
+    data, second = asyncio.run(service._collect(sample_product, config, noop))
+
+    assert first["status"] == "miss"
+    assert second["status"] == "hit"
+    assert len(collector.calls) == 1
+    assert data.top_insights == [{"content": "c", "score": 1.0}]
+    # 생성 설정만 다르면 같은 스냅샷, 수집 설정이 다르면 별도 스냅샷
+    other = config.model_copy(update={"generate_video": False})
+    assert asyncio.run(service._collect(sample_product, other, noop))[1]["status"] == "hit"
+    changed = config.model_copy(update={"youtube_count": 5})
+    assert asyncio.run(service._collect(sample_product, changed, noop))[1]["status"] == "miss"
+    assert store.stats()["fresh_hits"] == 2
+
+
+def test_reuse_collection_delta_passes_stale_snapshot(tmp_path, sample_product):
+    collector = CountingCollector()
+    store = CollectionSnapshotStore(tmp_path, ttl_seconds=0)
+    service = make_snapshot_pipeline(collector, store)
+    noop = lambda step, message="": None  # noqa: E731
+
+    config = PipelineConfig(reuse_collection="delta")
+    asyncio.run(service._collect(sample_product, config, noop))
+    _, info = asyncio.run(service._collect(sample_product, config, noop))
+
+    assert info["status"] == "delta"
+    assert collector.calls[0] is None
+    assert collector.calls[1].top_insights == [{"content": "c", "score": 1.0}]
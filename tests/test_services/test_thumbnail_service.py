@@ -0,0 +1,88 @@
+import threading
+import time
+
+from services.thumbnail_service import ThumbnailService
+
+
+class SlowImageClient:
+    """스타일별 지연을 두고 이미지 바이트를 반환하는 스텁"""
+
+    def __init__(
+        self,
+        delay: float = 0.1,
+        fail_marker: str | None = None,
+        barrier: threading.Barrier | None = None,
+    ) -> None:
+        self.delay = delay
+        self.fail_marker = fail_marker
+        # 지정하면 parties개 호출이 동시에 들어와야만 통과 (겹치지 않으면 타임아웃으로 실패)
+        self.barrier = barrier
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate_image(self, prompt: str, aspect_ratio: str = "16:9") -> bytes:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            if self.barrier is not None:
+                self.barrier.wait(timeout=5)
+            time.sleep(self.delay)
+            if self.fail_marker and self.fail_marker in prompt:
+                raise RuntimeError("image model error")
+            return prompt[-40:].encode("utf-8")
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+PRODUCT = {"name": "테스트 제품", "description": "설명"}
+
+
+def test_generate_multiple_runs_concurrently_and_preserves_order():
+    client = SlowImageClient(delay=0, barrier=threading.Barrier(4))
+    service = ThumbnailService(client, max_concurrency=4)
+    hooks = ["훅1", "훅2", "훅3", "훅4"]
+    styles = ["neobrutalism", "raw_authentic", "hand_grip", "social_proof"]
+
+    results = service.generate_multiple(PRODUCT, hooks, styles=styles)
+
+    assert [r["hook_text"] for r in results] == hooks
+    assert [r["style"] for r in results] == styles
+    assert all(r.get("image") for r in results)
+    assert client.peak == 4
+
+
+def test_generate_multiple_respects_concurrency_cap():
+    client = SlowImageClient(delay=0.05)
+    service = ThumbnailService(client, max_concurrency=2)
+    service.generate_multiple(PRODUCT, [f"훅{i}" for i in range(6)])
+    assert client.peak == 2
+
+
+def test_ab_test_set_tolerates_per_image_failure():
+    client = SlowImageClient(delay=0.01, fail_marker="first-person")
+    service = ThumbnailService(client)
+
+    results = service.generate_ab_test_set(
+        PRODUCT, "훅", styles=["neobrutalism", "hand_grip", "raw_authentic"]
+    )
+
+    assert [r["style"] for r in results] == ["neobrutalism", "raw_authentic"]
+
+
+def test_progress_callback_is_monotonic_and_completes():
+    client = SlowImageClient(delay=0.01)
+    service = ThumbnailService(client, max_concurrency=3)
+    updates: list[int] = []
+
+    service.generate_multiple(
+        PRODUCT,
+        ["a", "b", "c"],
+        progress_callback=lambda message, progress: updates.append(progress),
+    )
+
+    assert updates == sorted(updates)
+    assert updates[0] == 0
+    assert updates[-1] == 100
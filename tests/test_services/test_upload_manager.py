@@ -0,0 +1,125 @@
+import asyncio
+import gzip
+import json
+import threading
+import time
+
+import pytest
+
+from core.models import UploadStatus
+from services.upload_manager import UploadManager
+from utils.gcs_store import encode_json_gzip
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"0" * 16
+
+
+class SlowStorage:
+    """업로드마다 지연을 두고 동시 실행 수를 기록하는 스텁"""
+
+    bucket_name = "bucket"
+
+    def __init__(
+        self,
+        delay: float = 0.1,
+        fail_paths: tuple[str, ...] = (),
+        barrier: threading.Barrier | None = None,
+    ) -> None:
+        self.delay = delay
+        self.fail_paths = fail_paths
+        # 지정하면 parties개 업로드가 동시에 진행 중이어야만 통과 (아니면 타임아웃 실패)
+        self.barrier = barrier
+        self.uploaded: list[str] = []
+        self.json_uploads: dict[str, bytes] = {}
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _enter(self, path: str) -> None:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            if self.barrier is not None:
+                self.barrier.wait(timeout=5)
+            time.sleep(self.delay)
+            if any(marker in path for marker in self.fail_paths):
+                raise RuntimeError("upload error")
+            self.uploaded.append(path)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def upload(self, data, path: str, content_type: str = "application/json") -> bool:
+        self._enter(path)
+        return True
+
+    def upload_json(self, data, path: str) -> bool:
+        self._enter(path)
+        self.json_uploads[path] = encode_json_gzip(data)
+        return True
+
+    def get_signed_url(self, path: str) -> str:
+        return f"https://example.com/{path}"
+
+
+def test_uploads_run_concurrently_with_bounded_pool():
+    # 2개씩 짝지어 만나야 통과하므로 업로드가 겹치지 않으면 실패
+    storage = SlowStorage(delay=0, barrier=threading.Barrier(2))
+
+    async def run():
+        manager = UploadManager(storage, "prefix", max_concurrency=2)
+        for i in range(4):
+            manager.submit_image(f"thumb_{i}", PNG)
+        return await manager.finish()
+
+    report = asyncio.run(run())
+
+    assert report.status == UploadStatus.SUCCESS
+    assert storage.peak == 2
+    assert set(report.timings) == {f"thumb_{i}.png" for i in range(4)}
+
+
+def test_upload_starts_before_finish_and_metadata_sees_urls():
+    storage = SlowStorage(delay=0.01)
+    target: dict[str, str] = {}
+
+    async def run():
+        manager = UploadManager(storage, "prefix")
+        manager.submit_image("thumbnail", PNG, on_uploaded=lambda url: target.update(url=url))
+        await asyncio.sleep(0.1)
+        # finish() 이전에 이미 업로드가 끝나 있어야 함
+        assert storage.uploaded == ["prefix/thumbnail.png"]
+        return await manager.finish(metadata=lambda: {"thumbnail_url": target.get("url")})
+
+    report = asyncio.run(run())
+
+    assert storage.uploaded[-1] == "prefix/metadata.json"
+    metadata = json.loads(gzip.decompress(storage.json_uploads["prefix/metadata.json"]))
+    assert metadata == {"thumbnail_url": "https://example.com/prefix/thumbnail.png"}
+    assert report.status == UploadStatus.SUCCESS
+
+
+@pytest.mark.parametrize(
+    ("fail_paths", "expected"),
+    [(("a.json",), UploadStatus.PARTIAL), (("json",), UploadStatus.FAILED)],
+)
+def test_upload_failures_are_reported(fail_paths, expected):
+    storage = SlowStorage(delay=0, fail_paths=fail_paths)
+
+    async def run():
+        manager = UploadManager(storage, "prefix")
+        manager.submit_json("a.json", {"x": 1})
+        manager.submit_json("b.json", {"y": 2})
+        return await manager.finish()
+
+    report = asyncio.run(run())
+
+    assert report.status == expected
+    assert report.errors and all(": upload error" in e for e in report.errors)
+    assert set(report.timings) == {"a.json", "b.json"}
+
+
+def test_encode_json_gzip_is_compact():
+    payload = {"제품": "테스트", "items": [1, 2]}
+    text = gzip.decompress(encode_json_gzip(payload)).decode("utf-8")
+    assert text == '{"제품":"테스트","items":[1,2]}'
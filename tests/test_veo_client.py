@@ -0,0 +1,43 @@
+import asyncio
+
+from core.models import VideoArtifact
+from infrastructure.clients.veo_client import VeoClient
+
+
+class StubVeoClient(VeoClient):
+    """오퍼레이션 제출/대기를 스텁으로 대체해 어떤 경로로 시작했는지만 기록"""
+
+    def __init__(self) -> None:
+        super().__init__(
+            project_id="test", location="test", gcs_bucket_name="bucket", model_id="veo"
+        )
+        self.started: list[tuple[str, object]] = []
+
+    def _start_text_video(self, prompt, duration_seconds, resolution, progress_callback):
+        self.started.append(("text", prompt))
+        return f"op-{prompt}", "gs://bucket/videos/"
+
+    def _start_image_video(self, image_bytes, prompt, duration_seconds, progress_callback):
+        self.started.append(("image", image_bytes))
+        return f"op-{prompt}", "gs://bucket/videos_i2v/"
+
+    async def _handle_operation_async(
+        self, operation, duration_seconds, progress_callback, output_gcs_uri
+    ):
+        return VideoArtifact(gcs_uri=f"gs://bucket/{operation}.mp4")
+
+
+def test_async_fallback_starts_phase2_from_image():
+    client = StubVeoClient()
+
+    result = asyncio.run(
+        client.generate_video_with_fallback_async(
+            "phase1", "phase2", phase2_image_bytes=b"thumbnail"
+        )
+    )
+
+    assert sorted(client.started, key=lambda s: s[0]) == [
+        ("image", b"thumbnail"),
+        ("text", "phase1"),
+    ]
+    assert result == VideoArtifact(gcs_uri="gs://bucket/op-phase2.mp4")
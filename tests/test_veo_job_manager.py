@@ -0,0 +1,96 @@
+import asyncio
+import itertools
+import time
+
+from infrastructure.clients.veo_jobs import VeoJobManager
+
+
+class FakeOperation:
+    def __init__(self, name: str, polls_needed: int) -> None:
+        self.name = name
+        self.polls_needed = polls_needed
+        self.done = False
+        self.result = None
+
+
+class FakePoller:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, float]] = []
+
+    def __call__(self, operation: FakeOperation) -> FakeOperation:
+        self.calls.append((operation.name, time.monotonic()))
+        operation.polls_needed -= 1
+        if operation.polls_needed <= 0:
+            operation.done = True
+            operation.result = f"{operation.name}-result"
+        return operation
+
+
+def make_manager(poller: FakePoller) -> VeoJobManager:
+    return VeoJobManager(poll=poller, initial_interval=0.01, max_interval=0.04, backoff=2.0)
+
+
+def test_many_concurrent_jobs_resolve_in_one_polling_loop():
+    poller = FakePoller()
+    manager = make_manager(poller)
+    try:
+        futures = [
+            manager.submit(FakeOperation(f"op{i}", polls_needed=i % 3 + 1), timeout=5)
+            for i in range(20)
+        ]
+        results = [f.result(timeout=5) for f in futures]
+        assert [op.result for op in results] == [f"op{i}-result" for i in range(20)]
+        assert len(poller.calls) == sum(i % 3 + 1 for i in range(20))
+    finally:
+        manager.shutdown()
+
+
+def test_poll_interval_backs_off():
+    poller = FakePoller()
+    manager = make_manager(poller)
+    try:
+        manager.wait_sync(FakeOperation("slow", polls_needed=5), timeout=5)
+        times = [t for _, t in poller.calls]
+        gaps = [b - a for a, b in itertools.pairwise(times)]
+        assert gaps[-1] > gaps[0]
+    finally:
+        manager.shutdown()
+
+
+def test_timeout_resolves_with_unfinished_operation_and_reports_progress():
+    poller = FakePoller()
+    manager = make_manager(poller)
+    updates: list[int] = []
+    try:
+        op = manager.wait_sync(
+            FakeOperation("never", polls_needed=10_000),
+            timeout=0.2,
+            progress_callback=lambda message, progress: updates.append(progress),
+        )
+        assert op.done is False
+        assert updates[0] == 20
+        assert updates == sorted(updates)
+    finally:
+        manager.shutdown()
+
+
+def test_async_wait_and_done_callback():
+    poller = FakePoller()
+    manager = make_manager(poller)
+    seen: list[str] = []
+    try:
+        manager.submit(
+            FakeOperation("cb", polls_needed=1), timeout=5, on_done=lambda op: seen.append(op.name)
+        ).result(timeout=5)
+
+        async def run():
+            return await asyncio.gather(
+                manager.wait(FakeOperation("a", polls_needed=2), timeout=5),
+                manager.wait(FakeOperation("b", polls_needed=1), timeout=5),
+            )
+
+        a, b = asyncio.run(run())
+        assert (a.result, b.result) == ("a-result", "b-result")
+        assert seen == ["cb"]
+    finally:
+        manager.shutdown()
@@ -0,0 +1,237 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import infrastructure.clients.youtube_client as youtube_client
+from core.exceptions import YouTubeAPIError
+from infrastructure.clients.youtube_client import YouTubeClient
+from infrastructure.storage.comment_archive import CommentArchive
+
+PRODUCT = {"name": "모기 퇴치기", "target": "모기", "category": "해충"}
+DELAY = 0.1
+
+
+class SlowYouTubeClient(YouTubeClient):
+    """네트워크 호출을 지연 스텁으로 대체 (캐시 데코레이터 우회)"""
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        failing_keyword: str | None = None,
+        barriers: dict[str, threading.Barrier] | None = None,
+    ) -> None:
+        super().__init__(api_key="test", max_workers=max_workers)
+        self.failing_keyword = failing_keyword
+        # 단계("search"/"detail")별 배리어: 해당 단계 호출이 모두 동시에 진행 중이어야 통과
+        self.barriers = barriers or {}
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _call(self, stage: str = "detail"):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            barrier = self.barriers.get(stage)
+            if barrier is not None:
+                barrier.wait(timeout=5)
+            else:
+                time.sleep(DELAY)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def search(self, query: str, max_results: int = 3) -> list[dict]:
+        self._call("search")
+        if query == self.failing_keyword:
+            raise YouTubeAPIError("quota")
+        # 두 키워드 결과가 v1을 공유 → 중복 제거 대상
+        ids = ["v1", f"{query}-a", f"{query}-b"][:max_results]
+        return [
+            {"id": vid, "title": vid, "description": f"desc {vid}", "thumbnail": "", "channel": "c"}
+            for vid in ids
+        ]
+
+    def get_transcript(self, video_id: str) -> str | None:
+        self._call()
+        return None if video_id.endswith("-b") else f"transcript {video_id}"
+
+    def get_video_comments(self, video_id: str, max_results: int = 20) -> list[dict]:
+        self._call()
+        return [{"text": f"{video_id} 별로", "likes": 1, "author": "a"}]
+
+
+def test_collect_video_data_fans_out_and_preserves_order():
+    # 키워드 검색 2건, 영상 5개 x (자막, 댓글) 10건이 각각 한꺼번에 실행되어야 통과
+    client = SlowYouTubeClient(
+        max_workers=16,
+        barriers={"search": threading.Barrier(2), "detail": threading.Barrier(10)},
+    )
+
+    data = client.collect_video_data(PRODUCT, max_results=3)
+
+    ids = [v["video_id"] for v in data["videos"]]
+    assert ids == ["v1", "모기 퇴치기-a", "모기 퇴치기-b", "모기 퇴치-a", "모기 퇴치-b"]
+    assert data["videos"][2]["transcript"] == "desc 모기 퇴치기-b"
+    assert data["comments_total"] == 5
+    assert next(c["text"] for c in data["top_comments"]) == "v1 별로"
+    assert set(data) == {"product", "videos", "comments_total", "pain_points", "gain_points", "top_comments"}
+    assert client.peak == 10
+
+
+def test_collect_video_data_respects_worker_cap_and_skips_failed_search():
+    client = SlowYouTubeClient(max_workers=2, failing_keyword="모기 퇴치")
+
+    data = client.collect_video_data(PRODUCT, max_results=3, include_comments=False)
+
+    assert [v["video_id"] for v in data["videos"]] == ["v1", "모기 퇴치기-a", "모기 퇴치기-b"]
+    assert data["comments_total"] == 0
+    assert client.peak == 2
+
+
+class FakeCommentThreads:
+    """commentThreads().list(...).execute() 페이지 스텁 (최신순)"""
+
+    def __init__(self, comments: list[dict], page_size: int = 2) -> None:
+        self.comments = comments
+        self.page_size = page_size
+        self.requests: list[dict] = []
+
+    def commentThreads(self):  # noqa: N802
+        return self
+
+    def list(self, **params):
+        self.requests.append(params)
+        start = int(params.get("pageToken", 0))
+        end = start + self.page_size
+        response = {
+            "items": [
+                {
+                    "id": c["id"],
+                    "snippet": {
+                        "topLevelComment": {
+                            "snippet": {
+                                "textDisplay": c["id"],
+                                "likeCount": c["likes"],
+                                "publishedAt": c["published_at"],
+                            }
+                        }
+                    },
+                }
+                for c in self.comments[start:end]
+            ]
+        }
+        if end < len(self.comments):
+            response["nextPageToken"] = str(end)
+        return SimpleNamespace(execute=lambda: response)
+
+
+def make_comments(*specs):
+    return [
+        {"id": cid, "likes": likes, "published_at": f"2026-10-{day:02d}T00:00:00Z"}
+        for cid, likes, day in specs
+    ]
+
+
+def test_incremental_comments_stop_at_watermark(tmp_path):
+    archive = CommentArchive(tmp_path)
+    client = YouTubeClient(api_key="test", comment_archive=archive)
+    fake = FakeCommentThreads(make_comments(("c3", 5, 3), ("c2", 9, 2), ("c1", 1, 1)))
+    client._get_client = lambda: fake
+
+    first = client.fetch_new_comments("vid")
+    assert [c["id"] for c in first] == ["c3", "c2", "c1"]
+    assert "pageToken" not in fake.requests[0]
+    assert fake.requests[1]["pageToken"] == "2"
+    assert fake.requests[0]["order"] == "time"
+    assert archive.watermark("vid") == {"id": "c3", "published_at": "2026-10-03T00:00:00Z"}
+
+    # 새 댓글 2개 후 워터마크(c3)를 만나면 다음 페이지를 요청하지 않음
+    fake.comments = make_comments(("c5", 2, 5), ("c4", 7, 4)) + fake.comments
+    fake.requests.clear()
+    second = client.fetch_new_comments("vid")
+    assert [c["id"] for c in second] == ["c5", "c4"]
+    assert len(fake.requests) == 2
+    assert [c["id"] for c in archive.load("vid")] == ["c5", "c4", "c3", "c2", "c1"]
+
+    top = client.get_archived_comments("vid", max_results=2)
+    assert [c["id"] for c in top] == ["c2", "c4"]
+
+
+def test_watermark_kept_until_gap_is_filled(tmp_path):
+    archive = CommentArchive(tmp_path)
+    client = YouTubeClient(api_key="test", comment_archive=archive)
+    fake = FakeCommentThreads(make_comments(("c1", 0, 1)))
+    client._get_client = lambda: fake
+    client.fetch_new_comments("vid")
+    old_watermark = archive.watermark("vid")
+
+    # 새 댓글 5개 > 페이지 상한 2 x 페이지 크기 2: c6~c3만 받고 c2는 아직 못 받음
+    fake.comments = make_comments(*[(f"c{i}", 0, i) for i in range(6, 1, -1)]) + fake.comments
+    first = client.fetch_new_comments("vid", max_pages=2)
+    assert [c["id"] for c in first] == ["c6", "c5", "c4", "c3"]
+    assert archive.watermark("vid") == old_watermark
+
+    # 다음 수집에서 예전 워터마크(c1)까지 내려가 빈 구간(c2)을 채운 뒤에야 워터마크 이동
+    second = client.fetch_new_comments("vid", max_pages=3)
+    assert "c2" in [c["id"] for c in second]
+    assert [c["id"] for c in archive.load("vid")] == [f"c{i}" for i in range(6, 0, -1)]
+    assert archive.watermark("vid")["id"] == "c6"
+
+
+def test_comment_pages_respect_max_pages():
+    client = YouTubeClient(api_key="test")
+    fake = FakeCommentThreads(make_comments(*[(f"c{i}", 0, i) for i in range(1, 10)]))
+    client._get_client = lambda: fake
+
+    comments = client.fetch_new_comments("vid", max_pages=2)
+
+    assert len(comments) == 4
+    assert len(fake.requests) == 2
+
+
+class FakeVideos:
+    def __init__(self) -> None:
+        self.requests: list[list[str]] = []
+
+    def videos(self):
+        return self
+
+    def list(self, **params):
+        ids = params["id"].split(",")
+        self.requests.append(ids)
+        items = [
+            {
+                "id": vid,
+                "snippet": {
+                    "title": vid,
+                    "description": "",
+                    "channelTitle": "c",
+                    "publishedAt": "2026-10-01T00:00:00Z",
+                },
+                "statistics": {"viewCount": "10"},
+            }
+            for vid in ids
+            if vid != "deleted"
+        ]
+        return SimpleNamespace(execute=lambda: {"items": items})
+
+
+def test_get_videos_details_batches_fifty_ids_per_request():
+    client = YouTubeClient(api_key="test")
+    fake = FakeVideos()
+    client._get_client = lambda: fake
+    ids = [f"v{i}" for i in range(120)] + ["v0", "deleted"]
+
+    details = client.get_videos_details(ids)
+
+    assert [len(batch) for batch in fake.requests] == [50, 50, 21]
+    assert len(details) == 120
+    assert details["v7"]["view_count"] == 10
+
+
+def test_client_builds_from_shared_static_discovery_doc():
+    client = YouTubeClient(api_key="test")
+    assert client._get_client().videos() is not None
+    assert youtube_client._youtube_discovery_doc() is youtube_client._youtube_discovery_doc()